@@ -0,0 +1,290 @@
+# Standard library imports.
+import hashlib
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Standard library from imports.
+from datetime import datetime, timedelta
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _jsonx.backup_json_handler import BackupJsonHandler
+from _storage.backup_restorer import BackupRestorer
+from _storage.delta_chain import DeltaChain
+
+
+class DeltaChainBenchmark:
+    """
+
+    DeltaChainBenchmark measures the delta storage mode against full copies, within a temporary backup directory.
+
+    It backs up a series of versions of a file, each of which overwrites a few scattered blocks and appends a few bytes, and reports:
+        The bytes written and stored per version, next to what full copies would take,
+        The average restore latency by chain depth.
+
+    Developers can run it from the project root directory with:
+        python3 -m _benchmark.delta_chain_benchmark [FILE SIZE] [VERSION COUNT] [KEYFRAME INTERVAL]
+
+    """
+
+
+    @staticmethod
+    def run(file_size: int, version_count: int, keyframe_interval: int) -> None:
+        """
+
+        Description:
+            Creates a temporary backup directory and a file of the file size, filled with random bytes.
+            Edits and backs up the file version after version, in the delta storage mode, reporting the bytes written and stored.
+            Restores every version, verifying its content, and reports the average restore latency by chain depth.
+            Deletes the temporary backup directory.
+
+        Args:
+            file_size(int): Size of the file (in bytes).
+            version_count(int): Number of versions to back up.
+            keyframe_interval(int): Number of consecutive versions after which a version is kept as a full keyframe.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of string literals.
+        BACKUP_FILE_EXTENSION = String.BACKUP_FILE_EXTENSION
+        FILE_MODE_WRITE_BINARY = String.FILE_MODE_WRITE_BINARY
+        FORMAT_LAST_MODIFIED_TIME = String.FORMAT_LAST_MODIFIED_TIME
+
+        # Create the dictionary for the json entry of the target.
+        json_entry = {
+                String.LITERAL_STORAGE_MODE : String.BACKUP_STORAGE_MODE_DELTA,
+                String.LITERAL_KEYFRAME_INTERVAL : keyframe_interval
+            }
+
+        # Create the random number generator; Seeded, so that runs are comparable.
+        generator = random.Random(0)
+
+        # Create the temporary directory.
+        directory_path = tempfile.mkdtemp()
+
+        # Construct the path for the target file.
+        target_file_path = directory_path + os.path.sep + 'target.bin'
+
+        # Variable for the storage of the digests of the versions, keyed by the paths for their backup files.
+        digest_dict = {}
+
+        # Variable for the storage of the timestamp of the first version.
+        timestamp = datetime.now()
+
+        # Print the header of the report.
+        print(String.BENCHMARK_DELTA_CHAIN_HEADER % (file_size, version_count, keyframe_interval))
+
+        # Attempt to:
+        try:
+            # Open the target file with the file mode write binary.
+            with open(target_file_path, FILE_MODE_WRITE_BINARY) as file:
+                # Fill the target file with random bytes.
+                file.write(generator.randbytes(file_size))
+
+            # Variables for the storage of the bytes stored so far, and of the bytes full copies would take.
+            stored_size = 0
+            full_stored_size = 0
+
+            # For every version:
+            for version in range(version_count):
+                # If the version is not the first one:
+                if version > 0:
+                    # Edit the target file.
+                    DeltaChainBenchmark._edit_file(target_file_path, generator)
+
+                # Construct the path for the backup file; File name + Modification timestamp + Backup file extension.
+                backup_file_path = directory_path + os.path.sep + 'target.bin_' + (timestamp + timedelta(seconds=version)).strftime(FORMAT_LAST_MODIFIED_TIME) + BACKUP_FILE_EXTENSION
+
+                # Back up the target file.
+                BackupJsonHandler.create_backup_file(target_file_path, backup_file_path, json_entry)
+
+                # Remember the digest of the version.
+                digest_dict[backup_file_path] = DeltaChainBenchmark._hash_file(target_file_path)
+
+                # Assign the bytes stored before the version, and the bytes stored after it.
+                previous_stored_size, stored_size = stored_size, DeltaChainBenchmark._get_stored_size(digest_dict)
+
+                # Assign the size of the full copy of the version.
+                full_size = os.path.getsize(target_file_path)
+
+                # Account for the size of the full copy of the version.
+                full_stored_size += full_size
+
+                # Print the report of the version; The new full copy, less what the preceding version shrank by.
+                print(String.BENCHMARK_DELTA_CHAIN_VERSION_REPORT % (version, stored_size - previous_stored_size, full_size, stored_size, full_stored_size))
+
+            # Variable for the storage of the restore latencies, keyed by chain depth.
+            latency_dict = {}
+
+            # For every version:
+            for backup_file_path, digest in digest_dict.items():
+                # Assign the depth of the version.
+                depth = len(DeltaChain.resolve_chain(backup_file_path)) - 1
+
+                # Construct the path for the restored file.
+                restored_file_path = directory_path + os.path.sep + 'restored.bin'
+
+                # Assign the start time.
+                start_time = time.perf_counter()
+
+                # Restore the version.
+                BackupRestorer.restore_backup_file(backup_file_path, restored_file_path)
+
+                # Account for the restore latency (in milliseconds).
+                latency_dict.setdefault(depth, []).append((time.perf_counter() - start_time) * 1000)
+
+                # If the restored content does not match the version:
+                if DeltaChainBenchmark._hash_file(restored_file_path) != digest:
+                    # Raise the respective error.
+                    raise ValueError(String.EXCEPTION_MESSAGE_DIGEST_MISMATCH_ERROR + ' ' + backup_file_path)
+
+            # For every chain depth:
+            for depth in sorted(latency_dict):
+                # Print the report of the chain depth.
+                print(String.BENCHMARK_DELTA_CHAIN_DEPTH_REPORT % (depth, sum(latency_dict[depth]) / len(latency_dict[depth]), len(latency_dict[depth])))
+
+        # Finally:
+        finally:
+            # Delete the temporary directory.
+            shutil.rmtree(directory_path)
+
+
+    @staticmethod
+    def _edit_file(file_path: str, generator: random.Random) -> None:
+        """
+
+        Description:
+            Edits a few randomly placed ranges of the file specified by the file path, each of which is randomly overwritten, inserted or deleted, and appends a range to it.
+            Inserted and deleted ranges shift the content following them, as edits of frequently edited files usually do.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            file_path(str): Path for the file.
+            generator(random.Random): Random number generator.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of the size of an edited range (in bytes).
+        BENCHMARK_DELTA_CHAIN_EDIT_SIZE = Integer.BENCHMARK_DELTA_CHAIN_EDIT_SIZE
+
+        # Open the file with the file mode read binary.
+        with open(file_path, String.FILE_MODE_READ_BINARY) as file:
+            # Read and assign the content of the file.
+            content = bytearray(file.read())
+
+        # For every edited range:
+        for _ in range(Integer.BENCHMARK_DELTA_CHAIN_EDIT_COUNT):
+            # Assign a random offset.
+            offset = generator.randrange(max(len(content) - BENCHMARK_DELTA_CHAIN_EDIT_SIZE, 1))
+
+            # Assign a random kind of edit.
+            edit_index = generator.randrange(3)
+
+            # If the range is overwritten:
+            if edit_index == 0:
+                # Overwrite the range with random bytes.
+                content[offset:offset + BENCHMARK_DELTA_CHAIN_EDIT_SIZE] = generator.randbytes(BENCHMARK_DELTA_CHAIN_EDIT_SIZE)
+
+            # If the range is inserted:
+            elif edit_index == 1:
+                # Insert a range of random bytes at the offset.
+                content[offset:offset] = generator.randbytes(BENCHMARK_DELTA_CHAIN_EDIT_SIZE)
+
+            # If the range is deleted:
+            else:
+                # Delete the range.
+                del content[offset:offset + BENCHMARK_DELTA_CHAIN_EDIT_SIZE]
+
+        # Append a range of random bytes.
+        content += generator.randbytes(BENCHMARK_DELTA_CHAIN_EDIT_SIZE)
+
+        # Open the file with the file mode write binary.
+        with open(file_path, String.FILE_MODE_WRITE_BINARY) as file:
+            # Write the edited content to the file.
+            file.write(content)
+
+
+    @staticmethod
+    def _get_stored_size(digest_dict: dict[str, str]) -> int:
+        """
+
+        Description:
+            Sums up the sizes of the backup files of all versions.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            digest_dict(dict[str, str]): Digests of the versions, keyed by the paths for their backup files.
+
+        Returns:
+            int: Bytes stored for all versions.
+
+        Raises:
+            None
+
+        """
+
+        # Return the sum of the sizes of the backup files.
+        return sum(os.path.getsize(backup_file_path) for backup_file_path in digest_dict)
+
+
+    @staticmethod
+    def _hash_file(file_path: str) -> str:
+        """
+
+        Description:
+            Hashes the content of the file specified by the file path.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            file_path(str): Path for the file.
+
+        Returns:
+            str: Hexadecimal digest of the content of the file.
+
+        Raises:
+            None
+
+        """
+
+        # Create the hash object.
+        hash_object = hashlib.new(String.BACKUP_OBJECT_HASH_ALGORITHM)
+
+        # Open the file with the file mode read binary.
+        with open(file_path, String.FILE_MODE_READ_BINARY) as file:
+            # For every chunk of the file:
+            for chunk in iter(lambda: file.read(Integer.BACKUP_CHUNK_SIZE), b''):
+                # Feed the chunk to the hash object.
+                hash_object.update(chunk)
+
+        # Return the hexadecimal digest.
+        return hash_object.hexdigest()
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Assign the parameters; Defaults apply to the parameters that are not given.
+    parameter_list = [int(argument) for argument in sys.argv[1:4]]
+    parameter_list += [Integer.BENCHMARK_DELTA_CHAIN_FILE_SIZE, Integer.BENCHMARK_DELTA_CHAIN_VERSION_COUNT, Integer.BACKUP_DEFAULT_KEYFRAME_INTERVAL][len(parameter_list):]
+
+    # Run the benchmark.
+    DeltaChainBenchmark.run(*parameter_list)
\ No newline at end of file
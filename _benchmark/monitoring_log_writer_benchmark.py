@@ -0,0 +1,182 @@
+# Standard library imports.
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _log.monitoring_log_writer import MonitoringLogWriter
+
+
+class MonitoringLogWriterBenchmark:
+    """
+
+    MonitoringLogWriterBenchmark measures the monitoring log writer against appending every entry on its own, within a temporary directory.
+
+    It spreads a number of entries over a number of log files, round robin, and reports for every approach:
+        The time taken to write every entry,
+        The number of entries written per second.
+    Appending every entry on its own opens, writes, flushes and closes the log file for every entry, as the monitoring service did before the log writer.
+    The log writer is flushed after every batch of entries (as the monitoring service does after every iteration), once per durability policy.
+
+    Developers can run it from the project root directory with:
+        python3 -m _benchmark.monitoring_log_writer_benchmark [EVENT COUNT] [LOG FILE COUNT] [EVENTS PER FLUSH]
+
+    """
+
+
+    @staticmethod
+    def run(event_count: int, log_count: int, flush_size: int) -> None:
+        """
+
+        Description:
+            Creates a temporary directory for the log files.
+            Writes the number of entries by appending every entry on its own, then with the log writer under every durability policy, reporting the time taken by each.
+            Deletes the temporary directory.
+
+        Args:
+            event_count(int): Number of entries to write.
+            log_count(int): Number of log files to spread the entries over.
+            flush_size(int): Number of entries after which the log writer is flushed.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of a string literal.
+        BENCHMARK_MONITORING_LOG_WRITER_REPORT = String.BENCHMARK_MONITORING_LOG_WRITER_REPORT
+
+        # Create the temporary directory.
+        directory_path = tempfile.mkdtemp()
+
+        # Construct the paths for the log files.
+        log_file_path_list = [directory_path + os.path.sep + 'log_%d' % index + String.MONITORING_LOG_FILE_EXTENSION for index in range(log_count)]
+
+        # Print the header of the report.
+        print(String.BENCHMARK_MONITORING_LOG_WRITER_HEADER % (event_count, log_count, flush_size))
+
+        # Attempt to:
+        try:
+            # Assign the start time.
+            start_time = time.perf_counter()
+
+            # Write the entries by appending every entry on its own.
+            MonitoringLogWriterBenchmark._write_per_entry(log_file_path_list, event_count)
+
+            # Assign the time taken.
+            elapsed_time = time.perf_counter() - start_time
+
+            # Print the report of appending every entry on its own.
+            print(BENCHMARK_MONITORING_LOG_WRITER_REPORT % ('per entry', elapsed_time, event_count / elapsed_time))
+
+            # For every durability policy:
+            for durability in (String.MONITORING_LOG_DURABILITY_NONE, String.MONITORING_LOG_DURABILITY_FLUSH, String.MONITORING_LOG_DURABILITY_FSYNC):
+                # Assign the start time.
+                start_time = time.perf_counter()
+
+                # Write the entries with the log writer.
+                MonitoringLogWriterBenchmark._write_with_log_writer(log_file_path_list, event_count, flush_size, durability)
+
+                # Assign the time taken.
+                elapsed_time = time.perf_counter() - start_time
+
+                # Print the report of the log writer.
+                print(BENCHMARK_MONITORING_LOG_WRITER_REPORT % ('writer ' + durability.lower(), elapsed_time, event_count / elapsed_time))
+
+        # Finally:
+        finally:
+            # Close the pooled handles.
+            MonitoringLogWriter.close()
+
+            # Delete the temporary directory.
+            shutil.rmtree(directory_path)
+
+
+    @staticmethod
+    def _write_per_entry(log_file_path_list: list[str], event_count: int) -> None:
+        """
+
+        Description:
+            Appends the entries to the log files round robin, opening, writing, flushing and closing a log file for every entry.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            log_file_path_list(list[str]): Paths for the log files.
+            event_count(int): Number of entries to write.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # For every entry:
+        for index in range(event_count):
+            # Open the log file with the file mode append.
+            file = open(log_file_path_list[index % len(log_file_path_list)], String.FILE_MODE_APPEND)
+
+            # Write the entry.
+            file.write('\n' + String.LITERAL_TARGET + 'file_%d' % index)
+
+            # Flush the buffer.
+            file.flush()
+
+            # Close the file.
+            file.close()
+
+
+    @staticmethod
+    def _write_with_log_writer(log_file_path_list: list[str], event_count: int, flush_size: int, durability: str) -> None:
+        """
+
+        Description:
+            Appends the entries to the log files round robin with the log writer, flushing it after every batch of entries and after the last entry.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            log_file_path_list(list[str]): Paths for the log files.
+            event_count(int): Number of entries to write.
+            flush_size(int): Number of entries after which the log writer is flushed.
+            durability(str): Durability policy the log writer is flushed with.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # For every entry:
+        for index in range(event_count):
+            # Buffer the entry, along with its time.
+            MonitoringLogWriter.append(log_file_path_list[index % len(log_file_path_list)], '\n' + String.LITERAL_TARGET + 'file_%d' % index, time.time_ns())
+
+            # If the batch is complete:
+            if (index + 1) % flush_size == 0:
+                # Flush the log writer.
+                MonitoringLogWriter.flush(durability)
+
+        # Flush the log writer.
+        MonitoringLogWriter.flush(durability)
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Assign the parameters; Defaults apply to the parameters that are not given.
+    parameter_list = [int(argument) for argument in sys.argv[1:4]]
+    parameter_list += [Integer.BENCHMARK_MONITORING_LOG_WRITER_EVENT_COUNT, Integer.BENCHMARK_MONITORING_LOG_WRITER_LOG_COUNT, Integer.BENCHMARK_MONITORING_LOG_WRITER_FLUSH_SIZE][len(parameter_list):]
+
+    # Run the benchmark.
+    MonitoringLogWriterBenchmark.run(*parameter_list)
\ No newline at end of file
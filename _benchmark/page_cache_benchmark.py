@@ -0,0 +1,265 @@
+# Standard library imports.
+import ctypes
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _path.path_utils import PathUtils
+
+
+class PageCacheBenchmark:
+    """
+
+    PageCacheBenchmark measures the impact of backup copies on the page cache, within a temporary directory, on Linux.
+
+    It creates the hot file of a simulated application, whose pages are cached as its working set, and a target file to back up.
+    Then it copies the target file once without sparing the page cache, and once sparing it, and reports for both:
+        The time taken by the copy,
+        The cache hit rate of the application before and after the copy, as the share of the pages of its hot file that are cached (as told by mincore),
+        The number of bytes the copy left in the page cache, which evict the working sets of applications once the memory runs short.
+    The target file is dropped from the page cache before every copy, so that both copies read it from the disk.
+    The hit rate only drops if the target file does not fit into the free memory; Choose its size accordingly.
+
+    Developers can run it from the project root directory with:
+        python3 -m _benchmark.page_cache_benchmark [TARGET FILE SIZE] [HOT FILE SIZE] [SYNC INTERVAL]
+
+    """
+
+
+    @staticmethod
+    def run(target_size: int, hot_size: int, sync_interval: int) -> None:
+        """
+
+        Description:
+            Creates the hot file and the target file within a temporary directory.
+            Copies the target file without and with sparing the page cache, reporting the impact of each copy.
+            Deletes the temporary directory.
+
+        Args:
+            target_size(int): Size of the target file (in bytes).
+            hot_size(int): Size of the hot file of the simulated application (in bytes).
+            sync_interval(int): Number of bytes after which the copy sparing the page cache syncs the backup file; Zero disables the syncing.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of a string literal.
+        BENCHMARK_PAGE_CACHE_REPORT = String.BENCHMARK_PAGE_CACHE_REPORT
+
+        # Create the temporary directory.
+        directory_path = tempfile.mkdtemp()
+
+        # Construct the paths for the hot file, the target file and the backup file.
+        hot_file_path = directory_path + os.path.sep + 'hot'
+        target_file_path = directory_path + os.path.sep + 'target'
+        backup_file_path = directory_path + os.path.sep + 'backup'
+
+        # Print the header of the report.
+        print(String.BENCHMARK_PAGE_CACHE_HEADER % (target_size, hot_size, sync_interval))
+
+        # Attempt to:
+        try:
+            # Create the hot file and the target file.
+            PageCacheBenchmark._create_file(hot_file_path, hot_size)
+            PageCacheBenchmark._create_file(target_file_path, target_size)
+
+            # For every label and whether the copy spares the page cache:
+            for label, is_cache_spared in (('default', False), ('cache-sparing', True)):
+                # Drop the target file from the page cache, so that it is read from the disk.
+                PageCacheBenchmark._drop_file(target_file_path)
+
+                # Read the hot file, so that its pages are cached as the working set of the application.
+                PageCacheBenchmark._read_file(hot_file_path)
+
+                # Assign the hit rate of the application before the copy.
+                hit_rate_before = PageCacheBenchmark._get_cached_size(hot_file_path) / max(hot_size, 1) * 100
+
+                # Assign the start time.
+                start_time = time.perf_counter()
+
+                # Copy the target file to the backup file.
+                PathUtils.copy_file(target_file_path, backup_file_path, is_cache_spared, sync_interval if is_cache_spared else 0)
+
+                # Assign the time taken.
+                elapsed_time = time.perf_counter() - start_time
+
+                # Assign the hit rate of the application after the copy.
+                hit_rate_after = PageCacheBenchmark._get_cached_size(hot_file_path) / max(hot_size, 1) * 100
+
+                # Assign the number of bytes the copy left in the page cache.
+                cached_size = PageCacheBenchmark._get_cached_size(target_file_path) + PageCacheBenchmark._get_cached_size(backup_file_path)
+
+                # Print the report of the copy.
+                print(BENCHMARK_PAGE_CACHE_REPORT % (label, elapsed_time, hit_rate_before, hit_rate_after, cached_size))
+
+                # Delete the backup file.
+                os.remove(backup_file_path)
+
+        # Finally:
+        finally:
+            # Delete the temporary directory.
+            shutil.rmtree(directory_path)
+
+
+    @staticmethod
+    def _create_file(file_path: str, size: int) -> None:
+        """
+
+        Description:
+            Creates the file with the size, filled with random chunks, and drops it from the page cache.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            file_path(str): Path for the file.
+            size(int): Size of the file (in bytes).
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of an integer literal.
+        BACKUP_CHUNK_SIZE = Integer.BACKUP_CHUNK_SIZE
+
+        # Create a random chunk; Repeated, as the randomness of the content does not matter.
+        chunk = os.urandom(BACKUP_CHUNK_SIZE)
+
+        # Open the file with the file mode write binary.
+        with open(file_path, String.FILE_MODE_WRITE_BINARY) as file:
+            # For every chunk of the file:
+            for offset in range(0, size, BACKUP_CHUNK_SIZE):
+                # Write the chunk, truncated to the size.
+                file.write(chunk[:size - offset])
+
+        # Drop the file from the page cache.
+        PageCacheBenchmark._drop_file(file_path)
+
+
+    @staticmethod
+    def _drop_file(file_path: str) -> None:
+        """
+
+        Description:
+            Syncs the file to the disk, and drops it from the page cache.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            file_path(str): Path for the file.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Open the file with the file mode read binary.
+        with open(file_path, String.FILE_MODE_READ_BINARY) as file:
+            # Sync the file to the disk, so that its pages are clean.
+            os.fsync(file.fileno())
+
+            # Drop the file from the page cache.
+            PathUtils.advise_file_cache(file.fileno(), Integer.FILE_CACHE_ADVICE_DONTNEED)
+
+
+    @staticmethod
+    def _get_cached_size(file_path: str) -> int:
+        """
+
+        Description:
+            Maps the file into memory, and counts its pages cached within the page cache, as told by mincore.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            file_path(str): Path for the file.
+
+        Returns:
+            int: Number of bytes of the file cached within the page cache.
+
+        Raises:
+            None
+
+        """
+
+        # Open the file with the file mode read binary.
+        with open(file_path, String.FILE_MODE_READ_BINARY) as file:
+            # Assign the size of the file.
+            size = os.fstat(file.fileno()).st_size
+
+            # If the file is empty:
+            if size == 0:
+                # Return no cached bytes, as it cannot be mapped.
+                return 0
+
+            # Map the file into memory; Copy-on-write, as mincore requires the address of a writable buffer.
+            with mmap.mmap(file.fileno(), size, access=mmap.ACCESS_COPY) as mapping:
+                # Create the vector receiving the residency of every page.
+                vector = (ctypes.c_ubyte * ((size + mmap.PAGESIZE - 1) // mmap.PAGESIZE))()
+
+                # Assign the address of the mapping.
+                buffer = ctypes.c_char.from_buffer(mapping)
+
+                # Query the residency of the pages.
+                ctypes.CDLL(None).mincore(ctypes.c_void_p(ctypes.addressof(buffer)), ctypes.c_size_t(size), vector)
+
+                # Release the buffer, so that the mapping can be closed.
+                del buffer
+
+        # Return the number of bytes cached; The lowest bit tells whether a page is cached.
+        return sum(page & 1 for page in vector) * mmap.PAGESIZE
+
+
+    @staticmethod
+    def _read_file(file_path: str) -> None:
+        """
+
+        Description:
+            Reads the file entirely, so that its pages are cached.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            file_path(str): Path for the file.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Open the file with the file mode read binary.
+        with open(file_path, String.FILE_MODE_READ_BINARY) as file:
+            # For every chunk of the file:
+            for _ in iter(lambda: file.read(Integer.BACKUP_CHUNK_SIZE), b''):
+                # Continue with the next chunk.
+                continue
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Assign the parameters; Defaults apply to the parameters that are not given.
+    parameter_list = [int(argument) for argument in sys.argv[1:4]]
+    parameter_list += [Integer.BENCHMARK_PAGE_CACHE_TARGET_SIZE, Integer.BENCHMARK_PAGE_CACHE_HOT_SIZE, Integer.BENCHMARK_PAGE_CACHE_SYNC_INTERVAL][len(parameter_list):]
+
+    # Run the benchmark.
+    PageCacheBenchmark.run(*parameter_list)
\ No newline at end of file
@@ -0,0 +1,209 @@
+# Standard library imports.
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Standard library from imports.
+from pathlib import Path
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _resolver.target_resolver import TargetResolver
+from _timestamp.meta_time_handler import MetaTimeHandler
+
+
+class TargetResolverBenchmark:
+    """
+
+    TargetResolverBenchmark measures the target resolver against the iterdir-based listing, within a temporary directory tree.
+
+    It creates a tree of empty files, each directory holding a number of files and sub directories, and reports for both approaches:
+        The time taken to resolve every file of the tree, along with its last modified and last access times,
+        The number of files resolved per second.
+    The iterdir-based listing is applied recursively, so that both approaches resolve the same files.
+
+    Developers can run it from the project root directory with:
+        python3 -m _benchmark.target_resolver_benchmark [FILE COUNT] [FILES PER DIRECTORY] [SUB DIRECTORIES PER DIRECTORY]
+
+    """
+
+
+    @staticmethod
+    def run(file_count: int, file_fanout: int, directory_fanout: int) -> None:
+        """
+
+        Description:
+            Creates a temporary directory tree holding the number of files.
+            Resolves the files of the tree with the iterdir-based listing, then with the target resolver, reporting the time taken by each.
+            Deletes the temporary directory tree.
+
+        Args:
+            file_count(int): Number of files to create.
+            file_fanout(int): Number of files per directory.
+            directory_fanout(int): Number of sub directories per directory.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of a string literal.
+        BENCHMARK_TARGET_RESOLVER_REPORT = String.BENCHMARK_TARGET_RESOLVER_REPORT
+
+        # Create the temporary directory.
+        directory_path = tempfile.mkdtemp()
+
+        # Print the header of the report.
+        print(String.BENCHMARK_TARGET_RESOLVER_HEADER % (file_count, file_fanout, directory_fanout))
+
+        # Attempt to:
+        try:
+            # Create the directory tree.
+            TargetResolverBenchmark._create_tree(directory_path, file_count, file_fanout, directory_fanout)
+
+            # Assign the start time.
+            start_time = time.perf_counter()
+
+            # Resolve the files with the iterdir-based listing.
+            resolved_count = TargetResolverBenchmark._resolve_with_iterdir(Path(directory_path))
+
+            # Assign the time taken.
+            elapsed_time = time.perf_counter() - start_time
+
+            # Print the report of the iterdir-based listing.
+            print(BENCHMARK_TARGET_RESOLVER_REPORT % ('iterdir', elapsed_time, resolved_count / elapsed_time, resolved_count))
+
+            # Assign the start time.
+            start_time = time.perf_counter()
+
+            # Resolve the files with the target resolver.
+            resolved_count = sum(1 for _ in TargetResolver.iterate_files(directory_path, Integer.RESOLVER_DEFAULT_MAX_DEPTH, String.RESOLVER_DEFAULT_SYMLINK_POLICY))
+
+            # Assign the time taken.
+            elapsed_time = time.perf_counter() - start_time
+
+            # Print the report of the target resolver.
+            print(BENCHMARK_TARGET_RESOLVER_REPORT % ('scandir', elapsed_time, resolved_count / elapsed_time, resolved_count))
+
+        # Finally:
+        finally:
+            # Delete the temporary directory.
+            shutil.rmtree(directory_path)
+
+
+    @staticmethod
+    def _create_tree(directory_path: str, file_count: int, file_fanout: int, directory_fanout: int) -> None:
+        """
+
+        Description:
+            Fills the directory breadth first with empty files and sub directories, until the number of files is created.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            directory_path(str): Path for the root directory of the tree.
+            file_count(int): Number of files to create.
+            file_fanout(int): Number of files per directory.
+            directory_fanout(int): Number of sub directories per directory.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Variable for the storage of the directories awaiting their files, breadth first.
+        pending_directory_path_list = [directory_path]
+
+        # Variable for the storage of the number of created files.
+        created_count = 0
+
+        # While files are left to create:
+        while created_count < file_count:
+            # Dequeue the next directory.
+            current_directory_path = pending_directory_path_list.pop(0)
+
+            # For every file of the directory:
+            for index in range(min(file_fanout, file_count - created_count)):
+                # Create the empty file.
+                open(current_directory_path + os.path.sep + 'file_%d' % index, String.FILE_MODE_WRITE_BINARY).close()
+
+            # Account for the created files.
+            created_count += min(file_fanout, file_count - created_count)
+
+            # For every sub directory of the directory:
+            for index in range(directory_fanout):
+                # Construct the path for the sub directory.
+                sub_directory_path = current_directory_path + os.path.sep + 'directory_%d' % index
+
+                # Create the sub directory.
+                os.mkdir(sub_directory_path)
+
+                # Queue the sub directory for its files.
+                pending_directory_path_list.append(sub_directory_path)
+
+
+    @staticmethod
+    def _resolve_with_iterdir(directory_path: Path) -> int:
+        """
+
+        Description:
+            Resolves the files within the directory as the services did before the target resolver, applied recursively:
+                Lists the directory with Path.iterdir, checks the type of every item with is_file and resolves its path,
+                and queries its last modified and last access times with MetaTimeHandler.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            directory_path(Path): Path for the directory.
+
+        Returns:
+            int: Number of resolved files.
+
+        Raises:
+            None
+
+        """
+
+        # Variable for the storage of the number of resolved files.
+        resolved_count = 0
+
+        # For every item in the directory path:
+        for item in directory_path.iterdir():
+            # If the item is a file:
+            if item.is_file():
+                # Resolve the file path.
+                path = item.resolve()
+
+                # Query the last modified and last access times; Raw.
+                MetaTimeHandler.get_last_modified_time_raw(path)
+                MetaTimeHandler.get_last_access_time_raw(path)
+
+                # Account for the resolved file.
+                resolved_count += 1
+
+            # If the item is a directory:
+            elif item.is_dir():
+                # Resolve the files within the sub directory.
+                resolved_count += TargetResolverBenchmark._resolve_with_iterdir(item)
+
+        # Return the number of resolved files.
+        return resolved_count
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Assign the parameters; Defaults apply to the parameters that are not given.
+    parameter_list = [int(argument) for argument in sys.argv[1:4]]
+    parameter_list += [Integer.BENCHMARK_TARGET_RESOLVER_FILE_COUNT, Integer.BENCHMARK_TARGET_RESOLVER_FILE_FANOUT, Integer.BENCHMARK_TARGET_RESOLVER_DIRECTORY_FANOUT][len(parameter_list):]
+
+    # Run the benchmark.
+    TargetResolverBenchmark.run(*parameter_list)
\ No newline at end of file
@@ -17,13 +17,202 @@ class Integer():
     
     # Constant for the storage of the wait time between iterations of the backup service (in seconds).
     BACKUP_SERVICE_ITERATION_WAIT_TIME = 5
+
+    # Constant for the storage of the time the work of an iteration of the backup service may take before it is resumed on the next iteration (in seconds).
+    BACKUP_SERVICE_ITERATION_BUDGET = 2
+
+    # Constants for the storage of the number of backup workers, and of the number of backups each of them can have queued before the backup service waits for it.
+    BACKUP_WORKER_COUNT = 4
+    BACKUP_WORKER_QUEUE_SIZE = 256
+
+    # Constant for the storage of the minimum wait time between two publications of the metrics of a service (in seconds).
+    METRICS_PUBLICATION_INTERVAL = 5
     
     # Constant for the storage of the wait time between iterations of the monitoring service (in seconds).
     MONITORING_SERVICE_ITERATION_WAIT_TIME = 5
+
+    # Constant for the storage of the time the work of an iteration of the monitoring service may take before it is resumed on the next iteration (in seconds).
+    MONITORING_SERVICE_ITERATION_BUDGET = 2
+
+    # Constant for the storage of the time during which bursts of events are coalesced by the monitoring service (in seconds).
+    MONITORING_SERVICE_EVENT_COALESCING_TIME = 1
+
+    # Constant for the storage of the number of monitoring log files the log writer keeps open.
+    MONITORING_LOG_HANDLE_POOL_SIZE = 64
+
+    # Constants for the storage of the default rotation of monitoring log files; Maximum size (in bytes) and maximum age (in seconds) of a log file, zero disables either, and compression level of rotated segments (0-9).
+    MONITORING_LOG_DEFAULT_COMPRESSION_LEVEL = 6
+    MONITORING_LOG_DEFAULT_MAX_AGE = 0
+    MONITORING_LOG_DEFAULT_MAX_SIZE = 16777216
+
+    # Constants for the storage of the intervals between records of the time indexes of monitoring log files; Number of bytes and of entries after which an entry is indexed.
+    MONITORING_LOG_INDEX_BYTE_INTERVAL = 65536
+    MONITORING_LOG_INDEX_ENTRY_INTERVAL = 1000
+
+    # Constants for the storage of the monitoring log viewer; Size of the chunks in which log files are read backwards (in bytes), wait time between checks of the size of a followed log file (in seconds), and number of entries per page.
+    MONITORING_LOG_VIEWER_CHUNK_SIZE = 65536
+    MONITORING_LOG_VIEWER_FOLLOW_INTERVAL = 1
+    MONITORING_LOG_VIEWER_PAGE_SIZE = 20
     
+    # Constant for the storage of the size of the chunks in which backup files are streamed (in bytes).
+    BACKUP_CHUNK_SIZE = 1048576
+
+    # Constant for the storage of the size of the chunk that is compressed to probe whether a file is worth compressing (in bytes).
+    BACKUP_COMPRESSION_PROBE_SIZE = 65536
+
+    # Constant for the storage of the compressed-to-original size ratio below which a file is worth compressing (in percent).
+    BACKUP_COMPRESSION_WORTHWHILE_RATIO = 90
+
+    # Constants for the storage of the number of attempts at copying a target file that is modified meanwhile, and of the backoff before the second attempt, doubling with every further attempt (in seconds).
+    BACKUP_COPY_ATTEMPT_COUNT = 4
+    BACKUP_COPY_RETRY_BACKOFF_TIME = 0.5
+
+    # Constants for the storage of the default throttle of backup copies; Number of bytes and of files copied per second, zero means unlimited.
+    BACKUP_DEFAULT_BYTES_PER_SECOND = 0
+    BACKUP_DEFAULT_FILES_PER_SECOND = 0
+
+    # Constant for the storage of the default compression level of backup files (0-9).
+    BACKUP_DEFAULT_COMPRESSION_LEVEL = 6
+
+    # Constants for the storage of the default idle-only mode of backup copies; Whether copies wait while the disks are busy, the utilization above which a disk is busy (in percent), and the maximum wait (in seconds).
+    BACKUP_DEFAULT_IDLE_MAX_WAIT = 300
+    BACKUP_DEFAULT_IDLE_ONLY = False
+    BACKUP_DEFAULT_IDLE_THRESHOLD = 50
+
+    # Constant for the storage of the default number of consecutive versions within a delta chain, after which a version is kept as a full keyframe.
+    BACKUP_DEFAULT_KEYFRAME_INTERVAL = 8
+
+    # Constant for the storage of the default maximum time the backup of a modified file is deferred while it keeps changing (in seconds).
+    BACKUP_DEFAULT_MAX_DELAY = 300
+
+    # Constant for the storage of the default time during which a modified file must be left as is before it is backed up (in seconds).
+    BACKUP_DEFAULT_SETTLE_TIME = 2
+
+    # Constant for the storage of the default number of bytes after which backup files are synced to the disk while being copied, so that they can be dropped from the page cache; Zero disables the syncing.
+    BACKUP_DEFAULT_SYNC_INTERVAL = 0
+
+    # Constant for the storage of whether the content of modified target files is compared against their newest backups by default, to skip backups of unchanged content; Off, as it hashes every modified file of an unchanged size.
+    BACKUP_DEFAULT_VERIFY_CONTENT = False
+
+    # Constant for the storage of the size of the digests of the blocks matched by delta chains (in bytes).
+    BACKUP_DELTA_BLOCK_DIGEST_SIZE = 16
+
+    # Constant for the storage of the size of the blocks matched by delta chains (in bytes).
+    BACKUP_DELTA_BLOCK_SIZE = 8192
+
+    # Constant for the storage of the modulus of the weak rolling checksum (Adler-32) of the blocks matched by delta chains.
+    BACKUP_DELTA_CHECKSUM_MODULUS = 65521
+
+    # Constant for the storage of the size of the header field that holds the length of a backup manifest (in bytes).
+    BACKUP_MANIFEST_LENGTH_SIZE = 4
+
+    # Constant for the storage of the age below which unreferenced objects are spared by the garbage collection of the object store, as their backup manifests may be underway (in seconds).
+    BACKUP_OBJECT_GARBAGE_GRACE_TIME = 3600
+
+    # Constants for the storage of the default retention policy; Keep all versions younger than the first age, the newest version per hour up to the second, and per day up to the third (in seconds).
+    BACKUP_RETENTION_DAILY_TIME = 7776000
+    BACKUP_RETENTION_HOURLY_TIME = 604800
+    BACKUP_RETENTION_KEEP_ALL_TIME = 86400
+
+    # Constants for the storage of the default retention limits on the number of versions and on their total size (in bytes); Zero means unlimited.
+    BACKUP_RETENTION_MAX_BYTES = 0
+    BACKUP_RETENTION_MAX_VERSIONS = 0
+
+    # Constant for the storage of the number of backup directories the retention pruner processes per step.
+    BACKUP_RETENTION_DIRECTORIES_PER_STEP = 16
+
+    # Constant for the storage of the wait time between passes of the retention pruner over the central backup directory (in seconds).
+    BACKUP_RETENTION_PASS_WAIT_TIME = 600
+
+    # Constant for the storage of the wait time between steps of the retention pruner (in seconds).
+    BACKUP_RETENTION_STEP_WAIT_TIME = 1
+
+    # Constant for the storage of the time worth of tokens a throttle bucket can hold, which bounds the bursts of backup copies (in seconds).
+    BACKUP_THROTTLE_BURST_TIME = 1
+
+    # Constant for the storage of the interval between samples of the disk utilization, and of the longest single wait of a throttled backup copy (in seconds).
+    BACKUP_THROTTLE_POLL_TIME = 1
+
+    # Constant for the storage of the age above which temporary backup files are deemed left behind by a crash, and deleted by the retention pruner (in seconds).
+    BACKUP_TEMPORARY_FILE_GRACE_TIME = 3600
+
+    # Constants for the storage of the default parameters of the delta chain benchmark.
+    BENCHMARK_DELTA_CHAIN_EDIT_COUNT = 16
+    BENCHMARK_DELTA_CHAIN_EDIT_SIZE = 4096
+    BENCHMARK_DELTA_CHAIN_FILE_SIZE = 67108864
+    BENCHMARK_DELTA_CHAIN_VERSION_COUNT = 20
+
+    # Constants for the storage of the default parameters of the monitoring log writer benchmark; Number of events, number of log files, and number of events per flush.
+    BENCHMARK_MONITORING_LOG_WRITER_EVENT_COUNT = 100000
+    BENCHMARK_MONITORING_LOG_WRITER_FLUSH_SIZE = 1000
+    BENCHMARK_MONITORING_LOG_WRITER_LOG_COUNT = 16
+
+    # Constants for the storage of the default parameters of the page cache benchmark; Sizes of the target file and of the hot file (in bytes), and sync interval of the copy sparing the page cache (in bytes).
+    BENCHMARK_PAGE_CACHE_HOT_SIZE = 67108864
+    BENCHMARK_PAGE_CACHE_SYNC_INTERVAL = 67108864
+    BENCHMARK_PAGE_CACHE_TARGET_SIZE = 536870912
+
+    # Constants for the storage of the default parameters of the target resolver benchmark; Number of files, and number of files and sub directories per directory.
+    BENCHMARK_TARGET_RESOLVER_DIRECTORY_FANOUT = 10
+    BENCHMARK_TARGET_RESOLVER_FILE_COUNT = 1000000
+    BENCHMARK_TARGET_RESOLVER_FILE_FANOUT = 100
+
+    # Constants for the storage of the posix_fadvise advices; Drop the pages of a range from the page cache, and read a file sequentially (as defined by the Linux kernel in <linux/fadvise.h>).
+    FILE_CACHE_ADVICE_DONTNEED = 4
+    FILE_CACHE_ADVICE_SEQUENTIAL = 2
+
+    # Constant for the storage of the maximum number of bytes a single in-kernel copy system call is asked to copy, while the page cache is spared (in bytes).
+    FILE_COPY_CACHE_SPARING_CHUNK_SIZE = 8388608
+
+    # Constant for the storage of the FICLONE ioctl request, which reflinks a file to another on copy-on-write file systems (as defined by the Linux kernel in <linux/fs.h>).
+    FILE_COPY_FICLONE = 0x40049409
+
+    # Constant for the storage of the maximum number of bytes a single in-kernel copy system call is asked to copy (in bytes).
+    FILE_COPY_KERNEL_CHUNK_SIZE = 1073741824
+
+    # Constant for the storage of the number of nanoseconds per second.
+    NANOSECONDS_PER_SECOND = 1_000_000_000
+
+    # Constant for the storage of the number of consecutive checks finding a target file unchanged, after which the polling scheduler doubles its interval.
+    POLL_BACKOFF_CHECK_COUNT = 3
+
+    # Constant for the storage of the number of due checks carried out between two checks of the time budget of an iteration.
+    POLL_BATCH_SIZE = 256
+
+    # Constants for the storage of the default bounds of the intervals the polling scheduler adapts; Longest and shortest interval between checks of a target file (in seconds).
+    POLL_DEFAULT_MAX_INTERVAL = 60
+    POLL_DEFAULT_MIN_INTERVAL = 1
+
     # Constant for the storage of the number of letters the random string must comprise.
     RANDOM_STRING_LENGTH = 8
 
+    # Constant for the storage of the window after a modification during which a signature is not trusted, as timestamps are coarser than the modifications (in nanoseconds).
+    RECONCILER_RACY_SIGNATURE_WINDOW = 2_000_000_000
+
+    # Constant for the storage of the default number of sub directory levels the target resolver descends into within target directories; Negative means unlimited.
+    RESOLVER_DEFAULT_MAX_DEPTH = -1
+
+    # Constants for the storage of inotify flags and event masks (as defined by the Linux kernel in <sys/inotify.h>).
+    INOTIFY_FLAG_CLOEXEC = 0o2000000
+    INOTIFY_FLAG_NONBLOCK = 0o4000
+    INOTIFY_IN_ACCESS = 0x00000001
+    INOTIFY_IN_MODIFY = 0x00000002
+    INOTIFY_IN_CLOSE_WRITE = 0x00000008
+    INOTIFY_IN_OPEN = 0x00000020
+    INOTIFY_IN_MOVED_FROM = 0x00000040
+    INOTIFY_IN_MOVED_TO = 0x00000080
+    INOTIFY_IN_CREATE = 0x00000100
+    INOTIFY_IN_DELETE = 0x00000200
+    INOTIFY_IN_DELETE_SELF = 0x00000400
+    INOTIFY_IN_MOVE_SELF = 0x00000800
+    INOTIFY_IN_Q_OVERFLOW = 0x00004000
+    INOTIFY_IN_IGNORED = 0x00008000
+    INOTIFY_IN_ONLYDIR = 0x01000000
+    INOTIFY_IN_ISDIR = 0x40000000
+
+    # Constant for the storage of the size of the buffer used to read inotify events (in bytes).
+    INOTIFY_READ_BUFFER_SIZE = 65536
+
 
 # If this module is executed as the main program:
 if __name__ == "__main__":
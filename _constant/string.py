@@ -24,11 +24,50 @@ class String():
     ASCII_YELLOW = '\033[93m'
 
     # Constants for the storage of string literals in relation to the backup service.
+    BACKUP_COMPRESSION_BZ2 = 'BZ2'
+    BACKUP_COMPRESSION_LZMA = 'LZMA'
+    BACKUP_COMPRESSION_NONE = 'NONE'
+    BACKUP_COMPRESSION_ZLIB = 'ZLIB'
+    BACKUP_DEFAULT_COMPRESSION = 'NONE'
+    BACKUP_DEFAULT_STORAGE_MODE = 'FULL'
+    BACKUP_DELTA_COPY_FORMAT = '>QI'
+    BACKUP_DELTA_LITERAL_FORMAT = '>I'
+    BACKUP_DELTA_OPERATION_COPY = b'C'
+    BACKUP_DELTA_OPERATION_LITERAL = b'L'
+    BACKUP_DIGEST_FILE_EXTENSION = '.digest'
+    BACKUP_DIGEST_HASH_ALGORITHM = 'blake2b'
+    BACKUP_DISK_DEVICE_DIRECTORY_PATH = '/sys/block'
+    BACKUP_DISK_DEVICE_LINK_NAME = 'device'
+    BACKUP_DISK_STATS_FILE_PATH = '/proc/diskstats'
     BACKUP_FILE_EXTENSION = '.bak'
     BACKUP_FILENAME = '_.json'
+    BACKUP_INCOMPRESSIBLE_FILE_EXTENSIONS = '.7z .aac .avi .br .bz2 .docx .flac .gif .gz .heic .jar .jpeg .jpg .lz4 .lzma .m4a .mkv .mov .mp3 .mp4 .odt .ogg .pdf .png .pptx .rar .tgz .webm .webp .xlsx .xz .zip .zst'
     BACKUP_LOCK_FILENAME_LINUX = '.BACKUP_ENABLED.lock'
     BACKUP_LOCK_FILENAME_WINDOWS = 'BACKUP_ENABLED.lock'
+    BACKUP_MANIFEST_MAGIC = b'\x00M&B\x00'
+    BACKUP_OBJECT_HASH_ALGORITHM = 'sha256'
+    BACKUP_OBJECT_STORE_DIRNAME = '.objects'
+    BACKUP_RETENTION_THREAD_NAME = 'RETENTION PRUNER'
     BACKUP_SERVICE_FILENAME = 'backup_service.py'
+    BACKUP_STORAGE_MODE_DEDUPLICATED = 'DEDUPLICATED'
+    BACKUP_STORAGE_MODE_DELTA = 'DELTA'
+    BACKUP_STORAGE_MODE_FULL = 'FULL'
+    BACKUP_TEMPORARY_FILE_EXTENSION = '.tmp'
+    BACKUP_THROTTLE_STATE_IDLE_WAIT = 'WAITING_FOR_IDLE_DISK'
+    BACKUP_THROTTLE_STATE_RATE_LIMITED = 'RATE_LIMITED'
+    BACKUP_THROTTLE_STATE_UNTHROTTLED = 'UNTHROTTLED'
+    BACKUP_WORKER_THREAD_NAME = 'BACKUP WORKER %d'
+    
+    # Constants for the storage of report lines of benchmarks.
+    BENCHMARK_DELTA_CHAIN_DEPTH_REPORT = 'chain depth %2d: %9.2f ms average restore latency over %d version(s)'
+    BENCHMARK_DELTA_CHAIN_HEADER = 'delta chain benchmark: %d bytes per version, %d versions, keyframe interval %d'
+    BENCHMARK_DELTA_CHAIN_VERSION_REPORT = 'version %2d: %12d bytes written (full copies: %d), %12d bytes stored in total (full copies: %d)'
+    BENCHMARK_MONITORING_LOG_WRITER_HEADER = 'monitoring log writer benchmark: %d events over %d log files, flushed every %d events'
+    BENCHMARK_MONITORING_LOG_WRITER_REPORT = '%-12s: %8.2f s, %12.0f events/s'
+    BENCHMARK_PAGE_CACHE_HEADER = 'page cache benchmark: %d bytes target file, %d bytes hot file, sync interval %d bytes'
+    BENCHMARK_PAGE_CACHE_REPORT = '%-13s: %8.2f s, hit rate %6.2f%% before and %6.2f%% after the copy, %12d bytes left in the page cache'
+    BENCHMARK_TARGET_RESOLVER_HEADER = 'target resolver benchmark: %d files, %d files and %d sub directories per directory'
+    BENCHMARK_TARGET_RESOLVER_REPORT = '%-8s: %10.2f s, %12.0f files/s, %d files resolved'
     
     # Constants for the storage of PowerShell and shell commands.
     COMMAND_DISABLE_CRONJOB_VIA_SHELL_ON_LINUX = r"""ROOT_PASSWORD=%s; if echo "$ROOT_PASSWORD" | su -c "crontab -l" 2>/dev/null | grep -qF "@reboot cd %s && %s %s"; then echo "$ROOT_PASSWORD" | su -c "crontab -l | grep -vF \"@reboot cd %s && %s %s\" | crontab -"; COMMAND='%s %s'; PIDS=$(pgrep -f "$COMMAND"); if [ -n "$PIDS" ]; then for PID in $PIDS; do echo "$ROOT_PASSWORD" | su -c "kill \"$PID\" 2>/dev/null"; done; else :; fi; else COMMAND='%s %s'; PIDS=$(pgrep -f "$COMMAND"); if [ -n "$PIDS" ]; then for PID in $PIDS; do echo "$ROOT_PASSWORD" | su -c "kill \"$PID\" 2>/dev/null"; done; else :; fi; fi"""
@@ -47,19 +86,32 @@ class String():
     DELIMITER_MONITORING_LOG_FILE = '      '
     
     # Constants for the storage of various error messages.
+    EXCEPTION_MESSAGE_DIGEST_MISMATCH_ERROR = 'CONTENT DOES NOT MATCH ITS DIGEST.'
     EXCEPTION_MESSAGE_FILE_NOT_FOUND_ERROR = 'FILE NOT FOUND.'
     EXCEPTION_MESSAGE_JSON_DECODE_ERROR = 'ERROR DECODING JSON.'
     
+    # Constants for the storage of the methods of the file copy engine, from the fastest to the slowest.
+    FILE_COPY_METHOD_COPY_FILE_RANGE = 'COPY_FILE_RANGE'
+    FILE_COPY_METHOD_REFLINK = 'REFLINK'
+    FILE_COPY_METHOD_SENDFILE = 'SENDFILE'
+    FILE_COPY_METHOD_USERSPACE = 'USERSPACE'
+
     # Constants for the storage of file open modes.
     FILE_MODE_APPEND = 'a'
+    FILE_MODE_APPEND_BINARY = 'ab'
     FILE_MODE_CREATE = 'x'
+    FILE_MODE_CREATE_BINARY = 'xb'
     FILE_MODE_READ = 'r'
+    FILE_MODE_READ_BINARY = 'rb'
+    FILE_MODE_READ_WRITE_BINARY = 'r+b'
     FILE_MODE_WRITE = 'w'
+    FILE_MODE_WRITE_BINARY = 'wb'
     
     # Constants for the storage of various timestamp formats.
     FORMAT_CURRENT_TIME = '%Y-%m-%d_%H-%M-%S'
     FORMAT_LAST_ACCESS_TIME = '%Y-%m-%d_%H-%M-%S'
     FORMAT_LAST_MODIFIED_TIME = '%Y-%m-%d_%H-%M-%S'
+    FORMAT_MONITORING_LOG_TIME = '%Y:%m:%d %H:%M:%S'
     
     # Constants for the storage of language dictionary keys.
     LANGUAGE_KEY_ACCESSED_AT = '#_ACCESSED_AT'
@@ -94,6 +146,7 @@ class String():
     LANGUAGE_KEY_DISABLED = '#_DISABLED'
     LANGUAGE_KEY_ENABLED = '#_ENABLED'
     LANGUAGE_KEY_EXIT = '#_EXIT'
+    LANGUAGE_KEY_FILE_SIZE = '#_FILE_SIZE'
     LANGUAGE_KEY_GO_BACKWARD = '#_GO_BACKWARD'
     LANGUAGE_KEY_ID = '#_ID'
     LANGUAGE_KEY_LANGUAGE = '#_LANGUAGE'
@@ -106,6 +159,8 @@ class String():
     LANGUAGE_KEY_NOTIFY_EMPTINESS_MONITORING_LOG_VIEWER_TWO = '#_NOTIFY_EMPTINESS_MONITORING_LOG_VIEWER_TWO'
     LANGUAGE_KEY_NOTIFY_EMPTINESS_MONITORING_REMOVER_AND_LOG_VIEWER_FOR_DIRECTORY = '#_NOTIFY_EMPTINESS_MONITORING_REMOVER_AND_LOG_VIEWER_FOR_DIRECTORY'
     LANGUAGE_KEY_NOTIFY_EMPTINESS_MONITORING_REMOVER_AND_LOG_VIEWER_FOR_SINGLE_FILE = '#_NOTIFY_EMPTINESS_MONITORING_REMOVER_AND_LOG_VIEWER_FOR_SINGLE_FILE'
+    LANGUAGE_KEY_NOTIFY_END_MONITORING_LOG_VIEWER_TWO = '#_NOTIFY_END_MONITORING_LOG_VIEWER_TWO'
+    LANGUAGE_KEY_NOTIFY_FOLLOW_MONITORING_LOG_VIEWER_TWO = '#_NOTIFY_FOLLOW_MONITORING_LOG_VIEWER_TWO'
     LANGUAGE_KEY_OK = '#_OK'
     LANGUAGE_KEY_OPEN_AUTOSTART_BACKUP = '#_OPEN_AUTOSTART_BACKUP'
     LANGUAGE_KEY_OPEN_AUTOSTART_MONITORING = '#_OPEN_AUTOSTART_MONITORING'
@@ -188,22 +243,76 @@ class String():
     LITERAL_ACCESSED_AT = 'ACCESSED_AT: '
     LITERAL_ADDED_AT = 'ADDED_AT'
     LITERAL_ADDED_BY = 'ADDED_BY'
+    LITERAL_ALGORITHM = 'ALGORITHM'
     LITERAL_AS_DIRECTORY = 'AS_DIRECTORY'
+    LITERAL_BACKUP_COMPLETED_COUNT = 'BACKUP_COMPLETED_COUNT'
+    LITERAL_BACKUP_COPY_RETRY_COUNT = 'BACKUP_COPY_RETRY_COUNT'
     LITERAL_BACKUP = 'BACKUP'
     LITERAL_BACKUP_DIRNAME = 'BACKUP_DIRNAME'
     LITERAL_BACKUP_DIRPATH = 'BACKUP_DIRPATH'
+    LITERAL_BACKUP_FAILED_COUNT = 'BACKUP_FAILED_COUNT'
+    LITERAL_BACKUP_INCONSISTENT_COUNT = 'BACKUP_INCONSISTENT_COUNT'
     LITERAL_BACKUP_PARENT_DIRPATH = 'BACKUP_PARENT_DIRPATH'
+    LITERAL_BACKUP_QUEUE_CAPACITY = 'BACKUP_QUEUE_CAPACITY'
+    LITERAL_BACKUP_QUEUE_DEPTH = 'BACKUP_QUEUE_DEPTH'
+    LITERAL_BACKUP_QUEUE_DEPTH_MAX = 'BACKUP_QUEUE_DEPTH_MAX'
+    LITERAL_BACKUP_SKIPPED_COUNT = 'BACKUP_SKIPPED_COUNT'
+    LITERAL_BACKUP_THROTTLE_STATE = 'BACKUP_THROTTLE_STATE'
+    LITERAL_BACKUP_THROTTLE_WAIT_TIME = 'BACKUP_THROTTLE_WAIT_TIME'
+    LITERAL_BACKUP_THROTTLE_WAITING_COUNT = 'BACKUP_THROTTLE_WAITING_COUNT'
+    LITERAL_BACKUP_WORKER_COUNT = 'BACKUP_WORKER_COUNT'
+    LITERAL_BASE = 'BASE'
+    LITERAL_BYTES_PER_SECOND = 'BYTES_PER_SECOND'
     LITERAL_COMMAND = '-Command'
+    LITERAL_COMPRESSION = 'COMPRESSION'
+    LITERAL_COMPRESSION_LEVEL = 'COMPRESSION_LEVEL'
+    LITERAL_CREATED_AT_NS = 'CREATED_AT_NS'
+    LITERAL_DAILY_TIME = 'DAILY_TIME'
+    LITERAL_DEBOUNCE_COALESCED_COUNT = 'DEBOUNCE_COALESCED_COUNT'
+    LITERAL_DEBOUNCE_PENDING_COUNT = 'DEBOUNCE_PENDING_COUNT'
+    LITERAL_DETECTION_QUEUE_DEPTH = 'DETECTION_QUEUE_DEPTH'
+    LITERAL_DIGEST = 'DIGEST'
     LITERAL_DISABLED = 'DISABLED'
+    LITERAL_DISK_UTILIZATION = 'DISK_UTILIZATION'
     LITERAL_ENABLED = 'ENABLED'
+    LITERAL_EVENT = 'EVENT'
+    LITERAL_FILENAME = 'FILENAME'
+    LITERAL_FILES_PER_SECOND = 'FILES_PER_SECOND'
+    LITERAL_FILE_SIZE = 'FILE_SIZE: '
+    LITERAL_FOLLOW = 'f'
+    LITERAL_HOURLY_TIME = 'HOURLY_TIME'
+    LITERAL_IDLE_MAX_WAIT = 'IDLE_MAX_WAIT'
+    LITERAL_IDLE_ONLY = 'IDLE_ONLY'
+    LITERAL_IDLE_THRESHOLD = 'IDLE_THRESHOLD'
+    LITERAL_INTERVAL = 'INTERVAL'
     LITERAL_IS_DIRECTORY = 'IS_DIRECTORY'
+    LITERAL_JSON_ENTRY = 'JSON_ENTRY'
+    LITERAL_KEEP_ALL_TIME = 'KEEP_ALL_TIME'
+    LITERAL_KEYFRAME_INTERVAL = 'KEYFRAME_INTERVAL'
     LITERAL_LINUX = 'LINUX'
     LITERAL_LOCALE_CODE_ENGLISH = 'EN'
     LITERAL_LOCALE_CODE_FRENCH = 'FR'
     LITERAL_LOG_FILENAME = 'LOG_FILENAME'
     LITERAL_LOG_FILEPATH = 'LOG_FILEPATH'
+    LITERAL_MAX_AGE = 'MAX_AGE'
+    LITERAL_MAX_BYTES = 'MAX_BYTES'
+    LITERAL_MAX_DELAY = 'MAX_DELAY'
+    LITERAL_MAX_DEPTH = 'MAX_DEPTH'
+    LITERAL_MAX_INTERVAL = 'MAX_INTERVAL'
+    LITERAL_MAX_SIZE = 'MAX_SIZE'
+    LITERAL_MAX_VERSIONS = 'MAX_VERSIONS'
+    LITERAL_MIN_INTERVAL = 'MIN_INTERVAL'
     LITERAL_MODIFIED_AT = 'MODIFIED_AT: '
+    LITERAL_MODIFIED_AT_NS = 'MODIFIED_AT_NS'
     LITERAL_MONITORING = 'MONITORING'
+    LITERAL_MONITORING_LOG_COMPRESSED_COUNT = 'MONITORING_LOG_COMPRESSED_COUNT'
+    LITERAL_MONITORING_LOG_COMPRESSION_QUEUE_DEPTH = 'MONITORING_LOG_COMPRESSION_QUEUE_DEPTH'
+    LITERAL_MONITORING_LOG_FAILED_COUNT = 'MONITORING_LOG_FAILED_COUNT'
+    LITERAL_MONITORING_LOG_HANDLE_COUNT = 'MONITORING_LOG_HANDLE_COUNT'
+    LITERAL_MONITORING_LOG_OPEN_COUNT = 'MONITORING_LOG_OPEN_COUNT'
+    LITERAL_MONITORING_LOG_ROTATED_COUNT = 'MONITORING_LOG_ROTATED_COUNT'
+    LITERAL_MONITORING_LOG_WRITTEN_COUNT = 'MONITORING_LOG_WRITTEN_COUNT'
+    LITERAL_MORE = 'm'
     LITERAL_NO = 'n'
     LITERAL_NOT_OK = 'NOT OK'
     LITERAL_OK = 'OK'
@@ -212,30 +321,85 @@ class String():
     LITERAL_PATH = 'PATH'
     LITERAL_PHASE_ONE = 'PHASE_ONE'
     LITERAL_PHASE_TWO = 'PHASE_TWO'
+    LITERAL_POLL_CHECK_COUNT = 'POLL_CHECK_COUNT'
+    LITERAL_POLL_CHECK_RATE = 'POLL_CHECK_RATE'
+    LITERAL_POLL_SCHEDULED_COUNT = 'POLL_SCHEDULED_COUNT'
     LITERAL_POTENTIALLY_BY = 'POTENTIALLY_BY: '
     LITERAL_POWERSHELL = 'powershell'
+    LITERAL_RETENTION = 'RETENTION'
+    LITERAL_ROTATED_AT_NS = 'ROTATED_AT_NS'
+    LITERAL_SEGMENTS = 'SEGMENTS'
+    LITERAL_SETTLE_TIME = 'SETTLE_TIME'
+    LITERAL_SIZE = 'SIZE'
+    LITERAL_SNAPSHOT = 'SNAPSHOT'
+    LITERAL_STORAGE_MODE = 'STORAGE_MODE'
+    LITERAL_SYMLINK_POLICY = 'SYMLINK_POLICY'
+    LITERAL_SYNC_INTERVAL = 'SYNC_INTERVAL'
     LITERAL_TARGET = 'TARGET: '
+    LITERAL_TARGET_PATH = 'TARGET_PATH'
+    LITERAL_THROTTLE = 'THROTTLE'
+    LITERAL_TICK_COUNT = 'TICK_COUNT'
+    LITERAL_TICK_LAG = 'TICK_LAG'
+    LITERAL_TICK_LAG_MAX = 'TICK_LAG_MAX'
+    LITERAL_TICK_OVERRUN_COUNT = 'TICK_OVERRUN_COUNT'
+    LITERAL_TICK_SKIPPED_COUNT = 'TICK_SKIPPED_COUNT'
+    LITERAL_TIMESTAMP_NS = 'TIMESTAMP_NS'
+    LITERAL_UPDATED_AT = 'UPDATED_AT'
+    LITERAL_USERS = 'USERS'
+    LITERAL_VERIFY_CONTENT = 'VERIFY_CONTENT'
     LITERAL_WINDOWS = 'WINDOWS'
     LITERAL_WINDOWS_OS_NAME = 'nt'
     LITERAL_YES = 'y'
     LITERAL_ZERO = '0'
     
+    # Constants for the storage of literals in relation to the metrics files of the services.
+    METRICS_FILENAME = '.metrics.json'
+    METRICS_TEMPORARY_FILENAME = '.metrics.json.tmp'
+
     # Constants for the storage of literals in relation to the monitoring service.
     MONITORING_FILENAME = '_.json'
     MONITORING_LOCK_FILENAME_LINUX = '.MONITORING_ENABLED.lock'
     MONITORING_LOCK_FILENAME_WINDOWS = 'MONITORING_ENABLED.lock'
+    MONITORING_LOG_COMPRESSION_THREAD_NAME = 'MONITORING LOG COMPRESSOR'
+    MONITORING_LOG_CONVERTER_REPORT = '%s: %d entries converted, %d malformed lines skipped'
+    MONITORING_LOG_DEFAULT_COMPRESSION = 'ZLIB'
+    MONITORING_LOG_DEFAULT_DURABILITY = 'FLUSH'
+    MONITORING_LOG_DEFAULT_FORMAT = 'TEXT'
+    MONITORING_LOG_DURABILITY_FLUSH = 'FLUSH'
+    MONITORING_LOG_DURABILITY_FSYNC = 'FSYNC'
+    MONITORING_LOG_DURABILITY_NONE = 'NONE'
+    MONITORING_LOG_EVENT_ACCESSED = 'ACCESSED'
+    MONITORING_LOG_EVENT_MODIFIED = 'MODIFIED'
     MONITORING_LOG_FILE_EXTENSION = '.log'
+    MONITORING_LOG_FORMAT_JSON = 'JSON'
+    MONITORING_LOG_FORMAT_TEXT = 'TEXT'
+    MONITORING_LOG_INDEX_FILE_EXTENSION = '.index'
+    MONITORING_LOG_INDEX_RECORD_FORMAT = '>qQ'
+    MONITORING_LOG_MANIFEST_FILE_EXTENSION = '.manifest.json'
+    MONITORING_LOG_TEMPORARY_FILE_EXTENSION = '.tmp'
     MONITORING_SERVICE_FILENAME = 'monitoring_service.py'
     
     # Constants for the storage of literals in relation to the properties json file.
     PROPERTIES_FILENAME = 'properties.json'
     PROPERTIES_KEY_BACKUP_AUTOSTART_STATUS = 'BACKUP_AUTOSTART_STATUS'
     PROPERTIES_KEY_BACKUP_DIRECTORY = 'BACKUP_DIRECTORY'
+    PROPERTIES_KEY_BACKUP_THROTTLE = 'BACKUP_THROTTLE'
+    PROPERTIES_KEY_BACKUP_VERIFY_CONTENT = 'BACKUP_VERIFY_CONTENT'
     PROPERTIES_KEY_LANGUAGE = 'LANGUAGE'
     PROPERTIES_KEY_MONITORING_AUTOSTART_STATUS = 'MONITORING_AUTOSTART_STATUS'
     PROPERTIES_KEY_MONITORING_DIRECTORY = 'MONITORING_DIRECTORY'
+    PROPERTIES_KEY_MONITORING_LOG_DURABILITY = 'MONITORING_LOG_DURABILITY'
+    PROPERTIES_KEY_MONITORING_LOG_FORMAT = 'MONITORING_LOG_FORMAT'
+    PROPERTIES_KEY_MONITORING_LOG_ROTATION = 'MONITORING_LOG_ROTATION'
     PROPERTIES_KEY_REQUIREMENTS_STATUS = 'REQUIREMENTS_STATUS'
+    PROPERTIES_TEMPORARY_FILENAME = 'properties.json.tmp'
     
+    # Constants for the storage of the symbolic link policies of the target resolver; Follow symbolic links to files only, to files and directories, or to neither.
+    RESOLVER_DEFAULT_SYMLINK_POLICY = 'FILES'
+    RESOLVER_SYMLINK_POLICY_FILES = 'FILES'
+    RESOLVER_SYMLINK_POLICY_FOLLOW = 'FOLLOW'
+    RESOLVER_SYMLINK_POLICY_IGNORE = 'IGNORE'
+
     # Constants for the storage of regular expression.
     REGEX_LINUX_VALID_PATH = r'^(\/)(?:[^<>:"/\n]*(\/)?)*[^<>:"/\n]*$'
     REGEX_WINDOWS_VALID_PATH = r'^(?:[a-zA-Z]:)?(\\|/)(?:[^<>:"/\\|?*\n]+(\\|/)?)*[^<>:"/\\|?*\n]*$'
@@ -251,6 +415,10 @@ class String():
     TASK_NAME_BACKUP = 'BACKUP SERVICE'
     TASK_NAME_MONITORING = 'MONITORING SERVICE'
 
+    # Constants for the storage of usage messages of command-line tools.
+    USAGE_BACKUP_RESTORER = 'Usage: python3 -m _storage.backup_restorer {BACKUP FILE PATH} {DESTINATION FILE PATH | -}'
+    USAGE_MONITORING_LOG_READER = 'Usage: python3 -m _log.monitoring_log_reader {LOG FILE PATH} ["START TIME" ["END TIME"]] (local time, YYYY:MM:DD HH:MM:SS)'
+
 
     @staticmethod
     def generate_random_string() -> str:
@@ -0,0 +1,273 @@
+# Standard library imports.
+import time
+
+# Standard library from imports.
+from pathlib import Path
+from typing import Union
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _debouncer.pending_change import PendingChange
+from _timestamp.meta_time_handler import MetaTimeHandler
+from _timestamp.stat_snapshot import StatSnapshot
+
+
+class ChangeDebouncer:
+    """
+
+    ChangeDebouncer defers the backups of modified target files until they are no longer being written (write quiescence),
+    so that files written over a long time (large exports, database dumps) are not backed up mid-write, and repeatedly.
+
+    The backup service hands every detected modification over to it, and submits the backups of the files it reports as settled:
+        A file is settled once neither its content nor its metadata changed for the settle time,
+        as told by its last modified and last metadata change times, and confirmed by a fresh snapshot.
+        Modifications detected while a file is pending are coalesced into a single backup.
+        A file that keeps changing is backed up anyway, once the maximum delay since the first coalesced modification is exceeded.
+
+    Targets can set within their json entries:
+        "SETTLE_TIME": Time during which a file must be left as is before it is backed up (in seconds); 0 backs it up upon detection.
+        "MAX_DELAY": Maximum time the backup of a file is deferred while it keeps changing (in seconds).
+
+    """
+
+    # Variable for the storage of the number of modifications coalesced with pending ones.
+    _coalesced_count: int = 0
+
+    # Variable for the storage of the modified target files awaiting their backups, keyed by their keys within the metadata dictionary.
+    _pending_change_dict: dict[Union[str, Path], PendingChange] = {}
+
+
+    @staticmethod
+    def clear() -> None:
+        """
+
+        Description:
+            Discards every pending modification (e.g. when the backup service is disabled).
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Discard the pending modifications.
+        ChangeDebouncer._pending_change_dict.clear()
+
+
+    @staticmethod
+    def get_metrics() -> dict:
+        """
+
+        Description:
+            Retrieves the metrics of the debouncer.
+
+        Args:
+            None
+
+        Returns:
+            dict: Number of target files awaiting their backups, and number of modifications coalesced with pending ones.
+
+        Raises:
+            None
+
+        """
+
+        # Return the metrics.
+        return {
+                String.LITERAL_DEBOUNCE_PENDING_COUNT : len(ChangeDebouncer._pending_change_dict),
+                String.LITERAL_DEBOUNCE_COALESCED_COUNT : ChangeDebouncer._coalesced_count
+            }
+
+
+    @staticmethod
+    def get_settings(json_entry: dict) -> tuple[float, float]:
+        """
+
+        Description:
+            Retrieves the settle time and the maximum delay of the target, falling back to the defaults for the settings it does not set.
+
+        Args:
+            json_entry(dict): Json entry of the target.
+
+        Returns:
+            tuple[float, float]: Settle time and maximum delay of the target (in seconds).
+
+        Raises:
+            None
+
+        """
+
+        # Return the settings of the target.
+        return json_entry.get(String.LITERAL_SETTLE_TIME, Integer.BACKUP_DEFAULT_SETTLE_TIME), json_entry.get(String.LITERAL_MAX_DELAY, Integer.BACKUP_DEFAULT_MAX_DELAY)
+
+
+    @staticmethod
+    def get_wait_time(maximum_wait_time: float) -> float:
+        """
+
+        Description:
+            Calculates the time until the next pending target file is due to settle, or to exceed its maximum delay.
+
+        Args:
+            maximum_wait_time(float): Time to return if no target file is due earlier (in seconds).
+
+        Returns:
+            float: Time to wait for before the pending target files are checked again (in seconds).
+
+        Raises:
+            None
+
+        """
+
+        # Assign the current times; Wall-clock, to compare against the timestamps of the files, and monotonic.
+        current_time_ns = time.time_ns()
+        current_monotonic_time = time.monotonic()
+
+        # Return the time until the earliest due target file, capped by the maximum wait time.
+        return max(min([ChangeDebouncer._get_remaining_time(pending_change, current_time_ns, current_monotonic_time) for pending_change in ChangeDebouncer._pending_change_dict.values()] + [maximum_wait_time]), 0)
+
+
+    @staticmethod
+    def observe(key: Union[str, Path], snapshot: StatSnapshot, settle_time: float, max_delay: float) -> None:
+        """
+
+        Description:
+            Queues the modified target file specified by the key until it settles.
+            Coalesces the modification with the pending one, if the target file already awaits its backup.
+
+        Args:
+            key(Union[str, Path]): Key of the target file within the metadata dictionary.
+            snapshot(StatSnapshot): Snapshot of the metadata of the target file, taken upon the detection of the modification.
+            settle_time(float): Time during which the target file must be left as is before it is backed up (in seconds).
+            max_delay(float): Maximum time the backup of the target file is deferred while it keeps changing (in seconds).
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Assign the pending modification of the target file.
+        pending_change = ChangeDebouncer._pending_change_dict.get(key)
+
+        # If the target file does not await its backup yet:
+        if pending_change is None:
+            # Queue the target file.
+            ChangeDebouncer._pending_change_dict[key] = PendingChange(snapshot, time.monotonic(), settle_time, max_delay)
+
+        # If the target file was modified again since its pending modification:
+        elif MetaTimeHandler.is_modified(pending_change.snapshot, snapshot):
+            # Coalesce the modification with the pending one.
+            ChangeDebouncer._pending_change_dict[key] = pending_change._replace(snapshot=snapshot)
+
+            # Count the coalesced modification.
+            ChangeDebouncer._coalesced_count += 1
+
+
+    @staticmethod
+    def pop_settled_snapshots() -> dict[Union[str, Path], StatSnapshot]:
+        """
+
+        Description:
+            Takes a fresh snapshot of every pending target file, and coalesces the modifications made since its last snapshot.
+            Dequeues and returns the target files that settled, or exceeded their maximum delay, along with their latest snapshots.
+
+        Args:
+            None
+
+        Returns:
+            dict[Union[str, Path], StatSnapshot]: Latest snapshots of the target files whose backups are due, keyed by their keys.
+
+        Raises:
+            OSError:
+                If a pending target file vanished or is inaccessible,
+                then discard it; The backup service handles missing targets upon detection.
+
+        """
+
+        # Assign the current times; Wall-clock, to compare against the timestamps of the files, and monotonic.
+        current_time_ns = time.time_ns()
+        current_monotonic_time = time.monotonic()
+
+        # Variable for the storage of the latest snapshots of the target files whose backups are due.
+        settled_snapshot_dict = {}
+
+        # For every pending target file:
+        for key, pending_change in list(ChangeDebouncer._pending_change_dict.items()):
+            # Attempt to:
+            try:
+                # Take and assign the fresh snapshot of the target file.
+                snapshot = MetaTimeHandler.get_snapshot(key)
+
+            # Handle: OSError.
+            except OSError:
+                # Discard the target file.
+                del ChangeDebouncer._pending_change_dict[key]
+
+                # Skip to the next target file.
+                continue
+
+            # If the target file was modified since its last snapshot:
+            if MetaTimeHandler.is_modified(pending_change.snapshot, snapshot):
+                # Coalesce the modification with the pending one.
+                pending_change = pending_change._replace(snapshot=snapshot)
+                ChangeDebouncer._pending_change_dict[key] = pending_change
+
+                # Count the coalesced modification.
+                ChangeDebouncer._coalesced_count += 1
+
+            # If the target file settled, or exceeded its maximum delay:
+            if ChangeDebouncer._get_remaining_time(pending_change, current_time_ns, current_monotonic_time) <= 0:
+                # Dequeue the target file.
+                del ChangeDebouncer._pending_change_dict[key]
+
+                # Report the backup of the target file as due, along with its latest snapshot.
+                settled_snapshot_dict[key] = pending_change.snapshot
+
+        # Return the latest snapshots of the target files whose backups are due.
+        return settled_snapshot_dict
+
+
+    @staticmethod
+    def _get_remaining_time(pending_change: PendingChange, current_time_ns: int, current_monotonic_time: float) -> float:
+        """
+
+        Description:
+            Calculates the time until the pending target file settles, or exceeds its maximum delay, whichever comes first.
+            The target file is considered as left as is since the later of its last modified and last metadata change times;
+            Unlike the former, the latter cannot be set back by applications.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            pending_change(PendingChange): Pending modification of the target file.
+            current_time_ns(int): Current wall-clock time (in nanoseconds).
+            current_monotonic_time(float): Current monotonic time (in seconds).
+
+        Returns:
+            float: Time until the backup of the target file is due (in seconds); Zero or negative if it is due already.
+
+        Raises:
+            None
+
+        """
+
+        # Calculate the time the target file has been left as is (in seconds).
+        quiescent_time = (current_time_ns - max(pending_change.snapshot.modified_at_ns, pending_change.snapshot.changed_at_ns)) / Integer.NANOSECONDS_PER_SECOND
+
+        # Return the time until the target file settles, or exceeds its maximum delay.
+        return min(pending_change.settle_time - quiescent_time, pending_change.detected_at + pending_change.max_delay - current_monotonic_time)
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,31 @@
+# Standard library from imports.
+from typing import NamedTuple
+
+# Project-specific module imports.
+from _timestamp.stat_snapshot import StatSnapshot
+
+
+class PendingChange(NamedTuple):
+    """
+
+    PendingChange is the record of a modified target file awaiting its backup within the ChangeDebouncer.
+
+    """
+
+    # Latest snapshot of the metadata of the file.
+    snapshot: StatSnapshot
+
+    # Monotonic time at which the first of the coalesced modifications was detected (in seconds).
+    detected_at: float
+
+    # Time during which the file must be left as is before it is backed up (in seconds).
+    settle_time: float
+
+    # Maximum time the backup of the file is deferred while it keeps changing (in seconds).
+    max_delay: float
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
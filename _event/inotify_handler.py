@@ -0,0 +1,369 @@
+# Standard library imports.
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _miscellaneous.platform_identifier import PlatformIdentifier
+
+
+class InotifyHandler:
+    """
+
+    InotifyHandler provides bindings to the inotify API of the Linux kernel, using nothing but the standard library (ctypes).
+    It enables the services to subscribe to file system events of directories,
+    instead of repeatedly querying the metadata of every tracked file.
+
+    Operations include the initialization and closure of inotify instances,
+    the addition, removal and synchronization of watches,
+    and the reading and decoding of pending events.
+
+    Be noted, every watch subscribes to the events of a directory and of the files directly within it.
+    Events of a file are therefore reported through the watch of its parent directory, along with the name of the file.
+
+    """
+
+
+    # Constant for the storage of the struct format of the fixed-size part of an inotify event (wd, mask, cookie, len).
+    _EVENT_STRUCT_FORMAT: str = 'iIII'
+
+    # Constant for the storage of the size of the fixed-size part of an inotify event (in bytes).
+    _EVENT_STRUCT_SIZE: int = struct.calcsize('iIII')
+
+    # Variable for the storage of the loaded C standard library.
+    _libc: ctypes.CDLL = None
+
+
+    @staticmethod
+    def add_watch(inotify_fd: int, directory_path: str, mask: int) -> int:
+        """
+
+        Description:
+            Adds a watch for the directory specified by the directory path to the inotify instance.
+            Returns the watch descriptor of the added watch.
+
+        Args:
+            inotify_fd(int): File descriptor of the inotify instance.
+            directory_path(str): Path of the directory to watch.
+            mask(int): Mask of the events to subscribe to.
+
+        Returns:
+            int: Watch descriptor of the added watch.
+
+        Raises:
+            OSError:
+                If the watch cannot be added (e.g. ENOSPC when the watch limit is hit, ENOENT when the directory does not exist),
+                then delegate handling to the caller.
+
+        """
+
+        # Add the watch and assign its watch descriptor.
+        watch_descriptor = InotifyHandler._get_libc().inotify_add_watch(inotify_fd, os.fsencode(directory_path), mask | Integer.INOTIFY_IN_ONLYDIR)
+
+        # If the watch could not be added:
+        if watch_descriptor < 0:
+            # Assign the error number of the failure.
+            error_number = ctypes.get_errno()
+
+            # Raise the respective error.
+            raise OSError(error_number, os.strerror(error_number), directory_path)
+
+        # Return the watch descriptor.
+        return watch_descriptor
+
+
+    @staticmethod
+    def close(inotify_fd: int) -> None:
+        """
+
+        Description:
+            Closes the inotify instance, which implicitly removes all of its watches.
+
+        Args:
+            inotify_fd(int): File descriptor of the inotify instance.
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the file descriptor is already closed,
+                then ignore.
+
+        """
+
+        # Attempt to:
+        try:
+            # Close the file descriptor of the inotify instance.
+            os.close(inotify_fd)
+
+        # Handle: OSError.
+        except OSError:
+            # Ignore.
+            pass
+
+
+    @staticmethod
+    def initialize() -> int:
+        """
+
+        Description:
+            Initializes a non-blocking inotify instance.
+            Returns the file descriptor of the inotify instance.
+
+        Args:
+            None
+
+        Returns:
+            int: File descriptor of the inotify instance.
+
+        Raises:
+            OSError:
+                If the inotify instance cannot be initialized (e.g. EMFILE when the instance limit is hit),
+                then delegate handling to the caller.
+
+        """
+
+        # Initialize the inotify instance and assign its file descriptor.
+        inotify_fd = InotifyHandler._get_libc().inotify_init1(Integer.INOTIFY_FLAG_NONBLOCK | Integer.INOTIFY_FLAG_CLOEXEC)
+
+        # If the inotify instance could not be initialized:
+        if inotify_fd < 0:
+            # Assign the error number of the failure.
+            error_number = ctypes.get_errno()
+
+            # Raise the respective error.
+            raise OSError(error_number, os.strerror(error_number))
+
+        # Return the file descriptor of the inotify instance.
+        return inotify_fd
+
+
+    @staticmethod
+    def is_supported() -> bool:
+        """
+
+        Description:
+            Checks if the inotify API is available on the current platform.
+
+        Args:
+            None
+
+        Returns:
+            bool: Whether the inotify API is available.
+
+        Raises:
+            OSError:
+                If the C standard library cannot be loaded,
+                then assert the inotify API as unavailable.
+
+        """
+
+        # If the current platform is Windows:
+        if PlatformIdentifier.is_windows():
+            # Assert the inotify API as unavailable.
+            return False
+
+        # Attempt to:
+        try:
+            # Assign the C standard library.
+            libc = InotifyHandler._get_libc()
+
+        # Handle: OSError.
+        except OSError:
+            # Assert the inotify API as unavailable.
+            return False
+
+        # Assert if the C standard library exposes the inotify API.
+        return hasattr(libc, 'inotify_init1') and hasattr(libc, 'inotify_add_watch') and hasattr(libc, 'inotify_rm_watch')
+
+
+    @staticmethod
+    def read_events(inotify_fd: int, timeout: float) -> list[tuple[int, int, str]]:
+        """
+
+        Description:
+            Waits until events are pending on the inotify instance or the timeout elapses.
+            Reads and decodes the pending events.
+            Returns the list of decoded events.
+
+        Args:
+            inotify_fd(int): File descriptor of the inotify instance.
+            timeout(float): Maximum time to wait for events (in seconds).
+
+        Returns:
+            list[tuple[int, int, str]]: List of events, each represented by its watch descriptor, its mask and the name of the concerned item.
+
+        Raises:
+            BlockingIOError:
+                If no events are pending after all,
+                then return an empty list.
+
+        """
+
+        # Variable for the storage of the list of decoded events.
+        event_list = []
+
+        # Wait until events are pending or the timeout elapses.
+        readable_fd_list, _, _ = select.select([inotify_fd], [], [], timeout)
+
+        # If no events are pending:
+        if not readable_fd_list:
+            # Return the empty list of events.
+            return event_list
+
+        # Attempt to:
+        try:
+            # Read the pending events.
+            buffer = os.read(inotify_fd, Integer.INOTIFY_READ_BUFFER_SIZE)
+
+        # Handle: BlockingIOError.
+        except BlockingIOError:
+            # Return the empty list of events.
+            return event_list
+
+        # Variable for the storage of the offset of the current event within the buffer.
+        offset = 0
+
+        # While the buffer contains another event:
+        while offset + InotifyHandler._EVENT_STRUCT_SIZE <= len(buffer):
+            # Decode the fixed-size part of the event.
+            watch_descriptor, mask, _, name_length = struct.unpack_from(InotifyHandler._EVENT_STRUCT_FORMAT, buffer, offset)
+            # Move the offset to the name of the event.
+            offset += InotifyHandler._EVENT_STRUCT_SIZE
+            # Decode the null-padded name of the event.
+            name = os.fsdecode(buffer[offset:offset + name_length].rstrip(b'\0'))
+            # Move the offset to the next event.
+            offset += name_length
+
+            # Append the decoded event to the list of events.
+            event_list.append((watch_descriptor, mask, name))
+
+        # Return the list of decoded events.
+        return event_list
+
+
+    @staticmethod
+    def remove_watch(inotify_fd: int, watch_descriptor: int) -> None:
+        """
+
+        Description:
+            Removes the watch specified by the watch descriptor from the inotify instance.
+
+        Args:
+            inotify_fd(int): File descriptor of the inotify instance.
+            watch_descriptor(int): Watch descriptor of the watch to remove.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Remove the watch; Watches of deleted directories are already removed by the kernel, therefore the result is ignored.
+        InotifyHandler._get_libc().inotify_rm_watch(inotify_fd, watch_descriptor)
+
+
+    @staticmethod
+    def synchronize_watches(inotify_fd: int, watch_descriptor_dict: dict[int, str], directory_path_set: set[str], mask: int) -> None:
+        """
+
+        Description:
+            Removes the watches of directories that are no longer in the directory path set.
+            Adds watches for directories of the directory path set that are not watched yet.
+            Updates the watch descriptor dictionary accordingly.
+
+        Args:
+            inotify_fd(int): File descriptor of the inotify instance.
+            watch_descriptor_dict(dict[int, str]): Dictionary of the watched directory paths, keyed by their watch descriptors.
+            directory_path_set(set[str]): Set of the paths of all directories that must be watched.
+            mask(int): Mask of the events to subscribe to.
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If a directory no longer exists,
+                then ignore.
+                If a watch cannot be added otherwise (e.g. ENOSPC when the watch limit is hit),
+                then delegate handling to the caller.
+
+        """
+
+        # For every watch descriptor and directory path in a copy of the watch descriptor dictionary:
+        for watch_descriptor, directory_path in list(watch_descriptor_dict.items()):
+            # If the directory no longer needs to be watched:
+            if directory_path not in directory_path_set:
+                # Forget the watch.
+                del watch_descriptor_dict[watch_descriptor]
+
+                # Remove the watch.
+                InotifyHandler.remove_watch(inotify_fd, watch_descriptor)
+
+        # Assign the set of directory paths that are already watched.
+        watched_directory_path_set = set(watch_descriptor_dict.values())
+
+        # For every directory path that must be watched:
+        for directory_path in directory_path_set:
+            # If the directory is already watched:
+            if directory_path in watched_directory_path_set:
+                # Skip it.
+                continue
+
+            # Attempt to:
+            try:
+                # Add the watch and remember it.
+                watch_descriptor_dict[InotifyHandler.add_watch(inotify_fd, directory_path, mask)] = directory_path
+
+            # Handle: OSError.
+            except OSError as error:
+                # If the directory no longer exists or is not a directory anymore:
+                if error.errno in (errno.ENOENT, errno.ENOTDIR):
+                    # Ignore.
+                    continue
+
+                # Delegate handling to the caller.
+                raise
+
+
+    @staticmethod
+    def _get_libc() -> ctypes.CDLL:
+        """
+
+        Description:
+            Loads the C standard library on the first invocation.
+            Returns the loaded C standard library.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            ctypes.CDLL: Loaded C standard library.
+
+        Raises:
+            None
+
+        """
+
+        # If the C standard library is not loaded yet:
+        if InotifyHandler._libc is None:
+            # Load the C standard library with errno support.
+            InotifyHandler._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+
+        # Return the loaded C standard library.
+        return InotifyHandler._libc
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -1,6 +1,8 @@
 # Standard library imports.
 import json
 import os
+import threading
+import time
 
 # Standard library from imports.
 from pathlib import Path
@@ -10,7 +12,14 @@ from _constant.integer import Integer
 from _constant.string import String
 from _jsonx.properties_json_handler import PropertiesJsonHandler
 from _path.path_utils import PathUtils
+from _storage.backup_manifest import BackupManifest
+from _storage.compression_codec import CompressionCodec
+from _storage.content_digest import ContentDigest
+from _storage.delta_chain import DeltaChain
+from _storage.object_store import ObjectStore
+from _throttle.io_throttle import IoThrottle
 from _timestamp.current_time_handler import CurrentTimeHandler
+from _timestamp.meta_time_handler import MetaTimeHandler
 from _user.current_user_retriever import CurrentUserRetriever
 
 
@@ -25,6 +34,15 @@ class BackupJsonHandler:
     # Constant for the storage of the backup json file name.
     BACKUP_FILENAME: str = String.BACKUP_FILENAME
 
+    # Variable for the storage of the number of backup files whose content was written again, as their target files were modified meanwhile.
+    _copy_retry_count: int = 0
+
+    # Variable for the storage of the number of backup files kept although their target files kept being modified throughout all attempts.
+    _inconsistent_copy_count: int = 0
+
+    # Variable for the storage of the lock guarding the counters; Backup files are created by several worker threads.
+    _lock: threading.Lock = threading.Lock()
+
 
     @staticmethod
     def add_backup_json_entry(path: str) -> None:
@@ -102,39 +120,169 @@ class BackupJsonHandler:
 
 
     @staticmethod
-    def create_backup_file(target_file_path: str, backup_file_path: str) -> None:
+    def create_backup_file(target_file_path: str, backup_file_path: str, json_entry: dict = None) -> bool:
         """
         
         Description:
+            Checks if the content of the target file matches the newest version of its backup, if the verification is turned on (globally, or for the target);
+            If so, skips the backup, as the modification left the content as is.
             Creates the backup file specified by the backup file path.
-            Copies the content of the target file to the backup file.
+            Based on the storage mode of the target:
+                Copies the content of the target file to the backup file (full copy).
+                Stores the content of the target file within the object store, unless already stored, and writes a backup manifest referencing it to the backup file (deduplicated).
+                Copies the content of the target file to the backup file, and turns the preceding backup file into a delta against it (delta).
+            Based on the compression of the target, compresses the content while streaming it, unless the target file is not worth compressing;
+            A compressed full copy is written as a backup manifest followed by the compressed content.
+            Every attempt waits for the throttle (see IoThrottle), so that backup copies do not saturate the disks.
+            The content is written to a temporary file next to the backup file, which is renamed to the backup file atomically once complete,
+            so that a crash never leaves a partially written backup file behind.
+            Compares the snapshots of the target file taken before and after the content is written;
+            If the target file was modified in the meantime, writes the content again, after a backoff that doubles with every attempt.
+            Once the attempts are exhausted, keeps the last attempt, counted as an inconsistent copy.
 
         Args:
             target_file_path(str): Path for the target file (source).
             backup_file_path(str): Path for the backup file (destination).
+            json_entry(dict): Backup json entry of the target, holding its storage settings; Defaults apply to missing settings.
 
         Returns:
-            None
+            bool: Whether the backup file was created, rather than skipped.
 
         Raises:
-            None
+            OSError:
+                If the content cannot be written (e.g. the backup directory is missing),
+                then delete the temporary file and delegate handling to the caller.
                 
         """
-        
-        # Constant for the storage of the file mode create.
-        FILE_MODE_CREATE = String.FILE_MODE_CREATE
-        
-        try:
 
-            # Open the backup file path with file mode create.
-            with open(backup_file_path, FILE_MODE_CREATE) as file:
-                # Close the file.
-                file.close()
-        except FileExistsError:
-            pass
+        # Constants for the storage of string literals.
+        BACKUP_COMPRESSION_NONE = String.BACKUP_COMPRESSION_NONE
+        COMPRESSION = String.LITERAL_COMPRESSION
+        COMPRESSION_LEVEL = String.LITERAL_COMPRESSION_LEVEL
+        KEYFRAME_INTERVAL = String.LITERAL_KEYFRAME_INTERVAL
+        STORAGE_MODE = String.LITERAL_STORAGE_MODE
+
+        # Constant for the storage of an integer literal.
+        BACKUP_COPY_ATTEMPT_COUNT = Integer.BACKUP_COPY_ATTEMPT_COUNT
+
+        # Assign the json entry of the target; Empty if none is given, so that defaults apply.
+        json_entry = json_entry or {}
+
+        # Assign whether the content of the target file is verified; The setting of the target overrides the global setting from the properties json file.
+        is_content_verified = json_entry.get(String.LITERAL_VERIFY_CONTENT, PropertiesJsonHandler.get_backup_verify_content())
+
+        # Variable for the storage of the content digest of the target file; Not to be confused with the digest of its object, if deduplicated.
+        content_digest = None
+
+        # If the content of the target file is verified:
+        if is_content_verified:
+            # Take the snapshot of the target file, before its content is hashed.
+            hashed_snapshot = MetaTimeHandler.get_snapshot(target_file_path)
+
+            # Compare the content of the target file against the newest version; Assign whether it matches, and the digest of the target file.
+            is_content_unchanged, content_digest = ContentDigest.compare(target_file_path, backup_file_path, hashed_snapshot.size)
+
+            # If the content of the target file did not change:
+            if is_content_unchanged:
+                # Skip the backup.
+                return False
+
+        # Assign the storage mode of the target.
+        storage_mode = json_entry.get(STORAGE_MODE, String.BACKUP_DEFAULT_STORAGE_MODE)
+
+        # Assign the compression of the target.
+        compression = json_entry.get(COMPRESSION, String.BACKUP_DEFAULT_COMPRESSION)
+
+        # Assign the compression level of the target.
+        compression_level = json_entry.get(COMPRESSION_LEVEL, Integer.BACKUP_DEFAULT_COMPRESSION_LEVEL)
+
+        # Assign the number of bytes after which the backup file is synced to the disk while being copied.
+        sync_interval = json_entry.get(String.LITERAL_SYNC_INTERVAL, Integer.BACKUP_DEFAULT_SYNC_INTERVAL)
 
-        # Copy the target file to the backup file.
-        PathUtils.copy_file(target_file_path, backup_file_path)
+        # If the storage mode is delta (whose full copies must remain seekable), the compression is not supported, or the target file is not worth compressing:
+        if storage_mode == String.BACKUP_STORAGE_MODE_DELTA or not CompressionCodec.is_supported(compression) or not CompressionCodec.is_worth_compressing(target_file_path, compression, compression_level):
+            # Store the content uncompressed.
+            compression = BACKUP_COMPRESSION_NONE
+
+        # Construct the path for the temporary backup file; Within the backup directory, so that it is renamed to the backup file atomically.
+        temporary_file_path = backup_file_path + String.BACKUP_TEMPORARY_FILE_EXTENSION
+
+        # For every attempt:
+        for attempt in range(BACKUP_COPY_ATTEMPT_COUNT):
+            # Take the snapshot of the target file, before its content is read.
+            snapshot = MetaTimeHandler.get_snapshot(target_file_path)
+
+            # Wait for the throttle to allow the copy of the target file.
+            IoThrottle.acquire(json_entry, snapshot.size)
+
+            # Attempt to:
+            try:
+                # Write the content of the target file to the temporary backup file.
+                BackupJsonHandler._write_backup_content(target_file_path, temporary_file_path, storage_mode, compression, compression_level, sync_interval)
+
+            # Handle: OSError.
+            except OSError:
+                # Attempt to:
+                try:
+                    # Delete the partially written temporary backup file.
+                    os.remove(temporary_file_path)
+
+                # Handle: OSError.
+                except OSError:
+                    # Ignore, as it was not created.
+                    pass
+
+                # Delegate handling to the caller.
+                raise
+
+            # Assign whether the target file was left as is while its content was read.
+            is_consistent = not MetaTimeHandler.is_modified(snapshot, MetaTimeHandler.get_snapshot(target_file_path))
+
+            # If the copy is consistent, or the attempts are exhausted:
+            if is_consistent or attempt == BACKUP_COPY_ATTEMPT_COUNT - 1:
+                # Stop the attempts.
+                break
+
+            # Count the retry.
+            with BackupJsonHandler._lock:
+                BackupJsonHandler._copy_retry_count += 1
+
+            # Wait for the backoff of the attempt, so that the writer of the target file can finish.
+            time.sleep(Integer.BACKUP_COPY_RETRY_BACKOFF_TIME * 2 ** attempt)
+
+        # If the target file kept being modified throughout the attempts:
+        if not is_consistent:
+            # Count the inconsistent copy; The last attempt is kept, as a backup of a constantly changing file is better than none.
+            with BackupJsonHandler._lock:
+                BackupJsonHandler._inconsistent_copy_count += 1
+
+        # If the storage mode is delta, and the backup file already exists (e.g. backed up within the same second):
+        if storage_mode == String.BACKUP_STORAGE_MODE_DELTA and PathUtils.is_path_exist(backup_file_path):
+            # Make the delta against the backup file independent of it, before its content is replaced.
+            DeltaChain.release_version(backup_file_path)
+
+        # Rename the temporary backup file to the backup file atomically.
+        os.replace(temporary_file_path, backup_file_path)
+
+        # If the storage mode is delta:
+        if storage_mode == String.BACKUP_STORAGE_MODE_DELTA:
+            # Turn the preceding backup file into a delta against the backup file.
+            DeltaChain.append_version(backup_file_path, json_entry.get(KEYFRAME_INTERVAL, Integer.BACKUP_DEFAULT_KEYFRAME_INTERVAL))
+
+        # If the content of the target file is verified:
+        if is_content_verified:
+            # If the copy is consistent, and the target file was left as is since it was hashed:
+            if is_consistent and not MetaTimeHandler.is_modified(hashed_snapshot, snapshot):
+                # Record the size and the digest of the newest version; The digest is derived later on if the target file was not hashed.
+                ContentDigest.record(backup_file_path, snapshot.size, content_digest)
+
+            # If the target file was modified while being backed up:
+            else:
+                # Record the newest version as unknown; Its record is rebuilt from the backup file when required.
+                ContentDigest.record(backup_file_path, None, None)
+
+        # Assert the backup file as created.
+        return True
 
 
     @staticmethod
@@ -189,6 +337,33 @@ class BackupJsonHandler:
         PathUtils.create_directory_tree(target_directory_path)
 
 
+    @staticmethod
+    def get_copy_metrics() -> dict:
+        """
+        
+        Description:
+            Retrieves the counters of the copies of target files whose content was written again, and of the inconsistent copies.
+
+        Args:
+            None
+        
+        Returns:
+            dict: Number of retries, and number of backup files kept although their target files kept being modified.
+
+        Raises:
+            None
+                
+        """
+
+        # With the lock acquired:
+        with BackupJsonHandler._lock:
+            # Return the counters.
+            return {
+                    String.LITERAL_BACKUP_COPY_RETRY_COUNT : BackupJsonHandler._copy_retry_count,
+                    String.LITERAL_BACKUP_INCONSISTENT_COUNT : BackupJsonHandler._inconsistent_copy_count
+                }
+
+
     @staticmethod
     def prepare_backup_dirname(path: str, random_string: str) -> str:
         """
@@ -287,7 +462,7 @@ class BackupJsonHandler:
                 PathUtils.create_directory_tree(backup_directory_path)
 
                 # Create the backup file.
-                BackupJsonHandler.create_backup_file(source_file_path, backup_file_path) 
+                BackupJsonHandler.create_backup_file(source_file_path, backup_file_path, json_entry)
 
 
     @staticmethod
@@ -327,7 +502,7 @@ class BackupJsonHandler:
         PathUtils.create_directory_tree(backup_directory_path)
 
         # Create the backup file.
-        BackupJsonHandler.create_backup_file(path, backup_file_path) 
+        BackupJsonHandler.create_backup_file(path, backup_file_path, json_entry)
 
 
     @staticmethod
@@ -358,6 +533,10 @@ class BackupJsonHandler:
         IS_DIRECTORY = String.LITERAL_IS_DIRECTORY
         ADDED_BY = String.LITERAL_ADDED_BY
         ADDED_AT =  String.LITERAL_ADDED_AT
+        STORAGE_MODE = String.LITERAL_STORAGE_MODE
+        COMPRESSION = String.LITERAL_COMPRESSION
+        COMPRESSION_LEVEL = String.LITERAL_COMPRESSION_LEVEL
+        KEYFRAME_INTERVAL = String.LITERAL_KEYFRAME_INTERVAL
 
         # Variables for the storage of attribute values.
         backup_dirname = PathUtils.get_filename(path)
@@ -371,7 +550,11 @@ class BackupJsonHandler:
                         BACKUP_DIRNAME : backup_dirname,
                         IS_DIRECTORY : is_directory,
                         ADDED_BY : username,
-                        ADDED_AT : current_time_formatted
+                        ADDED_AT : current_time_formatted,
+                        STORAGE_MODE : String.BACKUP_DEFAULT_STORAGE_MODE,
+                        COMPRESSION : String.BACKUP_DEFAULT_COMPRESSION,
+                        COMPRESSION_LEVEL : Integer.BACKUP_DEFAULT_COMPRESSION_LEVEL,
+                        KEYFRAME_INTERVAL : Integer.BACKUP_DEFAULT_KEYFRAME_INTERVAL
                      }
         
         # Return the dictionary for the json entry.
@@ -410,6 +593,90 @@ class BackupJsonHandler:
             file.close()
 
 
+    @staticmethod
+    def _write_backup_content(target_file_path: str, temporary_file_path: str, storage_mode: str, compression: str, compression_level: int, sync_interval: int) -> None:
+        """
+        
+        Description:
+            Writes the content of the target file to the temporary backup file, based on the storage mode and the compression.
+            Preserves the last modified time of the target file, as a full copy would.
+            Spares the page cache while copying or streaming the content, so that backups do not evict the working sets of other applications.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            target_file_path(str): Path for the target file (source).
+            temporary_file_path(str): Path for the temporary backup file (destination).
+            storage_mode(str): Storage mode of the target.
+            compression(str): Compression of the content; BACKUP_COMPRESSION_NONE if the content is stored uncompressed.
+            compression_level(int): Compression level of the content.
+            sync_interval(int): Number of bytes after which the temporary backup file is synced to the disk while being copied; Zero disables the syncing.
+
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Constants for the storage of string literals.
+        ALGORITHM = String.LITERAL_ALGORITHM
+        COMPRESSION = String.LITERAL_COMPRESSION
+        COMPRESSION_LEVEL = String.LITERAL_COMPRESSION_LEVEL
+        DIGEST = String.LITERAL_DIGEST
+        MODIFIED_AT_NS = String.LITERAL_MODIFIED_AT_NS
+        SIZE = String.LITERAL_SIZE
+        STORAGE_MODE = String.LITERAL_STORAGE_MODE
+
+        # If the storage mode is deduplicated:
+        if storage_mode == String.BACKUP_STORAGE_MODE_DEDUPLICATED:
+            # Assign the last modified time of the target file, before its content is read.
+            modified_at_ns = os.stat(target_file_path).st_mtime_ns
+
+            # Store the content of the target file within the object store; Assign its digest, size and the compression of the object holding it.
+            digest, size, compression = ObjectStore.store_file(PropertiesJsonHandler.get_backup_directory() + os.path.sep + String.BACKUP_OBJECT_STORE_DIRNAME, target_file_path, compression, compression_level)
+
+            # Write the backup manifest referencing the stored content to the temporary backup file.
+            BackupManifest.write(temporary_file_path, {
+                    STORAGE_MODE : storage_mode,
+                    ALGORITHM : String.BACKUP_OBJECT_HASH_ALGORITHM,
+                    DIGEST : digest,
+                    SIZE : size,
+                    COMPRESSION : compression,
+                    MODIFIED_AT_NS : modified_at_ns
+                }, modified_at_ns)
+
+        # If the content is stored uncompressed (full copy, or the full copy a delta chain ends with):
+        elif compression == String.BACKUP_COMPRESSION_NONE:
+            # Copy the target file to the temporary backup file, sparing the page cache.
+            PathUtils.copy_file(target_file_path, temporary_file_path, True, sync_interval)
+
+        # If the storage mode is full, and the content is compressed:
+        else:
+            # Assign the last modified time of the target file, before its content is read.
+            modified_at_ns = os.stat(target_file_path).st_mtime_ns
+
+            # Open the target file with the file mode read binary, and the temporary backup file with the file mode write binary.
+            with open(target_file_path, String.FILE_MODE_READ_BINARY) as target_file, open(temporary_file_path, String.FILE_MODE_WRITE_BINARY) as backup_file:
+                # Write the header of the backup manifest describing the payload.
+                BackupManifest.write_header(backup_file, {
+                        STORAGE_MODE : storage_mode,
+                        COMPRESSION : compression,
+                        COMPRESSION_LEVEL : compression_level,
+                        MODIFIED_AT_NS : modified_at_ns
+                    })
+
+                # Advise the kernel that the target file is read sequentially.
+                PathUtils.advise_file_cache(target_file.fileno(), Integer.FILE_CACHE_ADVICE_SEQUENTIAL)
+
+                # Stream and compress the target file as the payload, dropping both files from the page cache chunk by chunk.
+                CompressionCodec.compress_stream(target_file, backup_file, compression, compression_level, None, True, sync_interval)
+
+            # Assign the last modified time of the target file to the temporary backup file, as a full copy would preserve it.
+            os.utime(temporary_file_path, ns=(modified_at_ns, modified_at_ns))
+
+
 # If this module is executed as the main program:
 if __name__ == "__main__":
     # Ignore.
@@ -1,9 +1,11 @@
 # Standard library imports.
 import json
+import os
 
 # Project-specific module imports.
 from _constant.integer import Integer
 from _constant.string import String
+from _reconciler.metadata_reconciler import MetadataReconciler
 
 
 class PropertiesJsonHandler():
@@ -14,9 +16,19 @@ class PropertiesJsonHandler():
     the assignment of values to individual attributes,
     and the checking of whether individual attributes are set.
 
+    The serialized properties json data is cached in memory, and only re-read once the stat signature (modification time, size and inode) of the properties file changes.
+    Writes replace the properties file atomically and go through the same cache, so that the screens and the services observe consistent values.
+
     """
 
 
+    # Variable for the storage of the cached properties json data.
+    _cached_properties_json: dict = None
+
+    # Variable for the storage of the stat signature of the properties file the cached properties json data was read from.
+    _cached_signature: tuple[int, int, int] = None
+
+
     @staticmethod
     def get_backup_autostart_status() -> str:
         """
@@ -61,6 +73,50 @@ class PropertiesJsonHandler():
         return PropertiesJsonHandler._get_attribute(String.PROPERTIES_KEY_BACKUP_DIRECTORY)
 
 
+    @staticmethod
+    def get_backup_throttle() -> dict:
+        """
+        
+        Description:
+            Returns the value of the backup throttle attribute, which is optional.
+
+        Args:
+            None
+
+        Returns:
+            dict: Value of the backup throttle attribute; Empty if it is not set, or the properties json data cannot be read.
+
+        Raises:
+            None
+                
+        """
+        
+        # Return the value of the backup throttle attribute, if set.
+        return (PropertiesJsonHandler._read() or {}).get(String.PROPERTIES_KEY_BACKUP_THROTTLE, {})
+
+
+    @staticmethod
+    def get_backup_verify_content() -> bool:
+        """
+        
+        Description:
+            Returns the value of the backup verify content attribute, which is optional.
+
+        Args:
+            None
+
+        Returns:
+            bool: Value of the backup verify content attribute; The default (off) if it is not set, or the properties json data cannot be read.
+
+        Raises:
+            None
+                
+        """
+        
+        # Return the value of the backup verify content attribute, if set.
+        return (PropertiesJsonHandler._read() or {}).get(String.PROPERTIES_KEY_BACKUP_VERIFY_CONTENT, Integer.BACKUP_DEFAULT_VERIFY_CONTENT)
+
+
     @staticmethod
     def get_language() -> str:
         """
@@ -127,6 +183,72 @@ class PropertiesJsonHandler():
         return PropertiesJsonHandler._get_attribute(String.PROPERTIES_KEY_MONITORING_DIRECTORY)
 
 
+    @staticmethod
+    def get_monitoring_log_durability() -> str:
+        """
+        
+        Description:
+            Returns the value of the monitoring log durability attribute, which is optional.
+
+        Args:
+            None
+
+        Returns:
+            str: Value of the monitoring log durability attribute; The default durability policy if it is not set, or the properties json data cannot be read.
+
+        Raises:
+            None
+                
+        """
+        
+        # Return the value of the monitoring log durability attribute, if set.
+        return (PropertiesJsonHandler._read() or {}).get(String.PROPERTIES_KEY_MONITORING_LOG_DURABILITY, String.MONITORING_LOG_DEFAULT_DURABILITY)
+
+
+    @staticmethod
+    def get_monitoring_log_format() -> str:
+        """
+        
+        Description:
+            Returns the value of the monitoring log format attribute, which is optional.
+
+        Args:
+            None
+
+        Returns:
+            str: Value of the monitoring log format attribute; The default log format if it is not set, or the properties json data cannot be read.
+
+        Raises:
+            None
+                
+        """
+        
+        # Return the value of the monitoring log format attribute, if set.
+        return (PropertiesJsonHandler._read() or {}).get(String.PROPERTIES_KEY_MONITORING_LOG_FORMAT, String.MONITORING_LOG_DEFAULT_FORMAT)
+
+
+    @staticmethod
+    def get_monitoring_log_rotation() -> dict:
+        """
+        
+        Description:
+            Returns the value of the monitoring log rotation attribute, which is optional.
+
+        Args:
+            None
+
+        Returns:
+            dict: Value of the monitoring log rotation attribute; Empty if it is not set, or the properties json data cannot be read.
+
+        Raises:
+            None
+                
+        """
+        
+        # Return the value of the monitoring log rotation attribute, if set.
+        return (PropertiesJsonHandler._read() or {}).get(String.PROPERTIES_KEY_MONITORING_LOG_ROTATION, {})
+
+
     @staticmethod
     def get_requirements_status() -> str:
         """
@@ -573,6 +695,35 @@ class PropertiesJsonHandler():
         return properties_json[attribute]
 
 
+    @staticmethod
+    def _get_signature() -> tuple[int, int, int]:
+        """
+        
+        Description:
+            Retrieves the stat signature of the properties file.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            tuple[int, int, int]: Last modified time (in nanoseconds), size and inode of the properties file.
+
+        Raises:
+            FileNotFoundError:
+                If the properties file is not found,
+                then delegate handling to the caller.
+                
+        """
+
+        # Assign the stat result of the properties file.
+        stat_result = os.stat(String.PROPERTIES_FILENAME)
+
+        # Return the last modified time, size and inode of the properties file.
+        return stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino
+
+
     @staticmethod
     def _is_attribute_set(attribute: str) -> bool:
         """
@@ -606,10 +757,13 @@ class PropertiesJsonHandler():
         """
         
         Description:
-            Reads the properties json data from the properties file.
-            Serializes the properties json data.
+            Returns the cached properties json data, if the stat signature of the properties file is unchanged.
+            Otherwise, reads the properties json data from the properties file.
+            Serializes and caches the properties json data.
             Returns the serialized properties json data.
 
+            Be noted, the returned properties json data is shared with the cache, therefore it must not be modified in place.
+
             Note: This method is not meant to be accessed from outside this class.
 
         Args:
@@ -641,12 +795,23 @@ class PropertiesJsonHandler():
 
         # Attempt to:
         try:
+            # Assign the current signature of the properties file.
+            signature = PropertiesJsonHandler._get_signature()
+
+            # If the properties file is unchanged since it was cached:
+            if PropertiesJsonHandler._cached_properties_json is not None and signature == PropertiesJsonHandler._cached_signature:
+                # Return the cached json data.
+                return PropertiesJsonHandler._cached_properties_json
+
             # Open the properties file with the file mode read.
             with open(PROPERTIES_FILENAME, FILE_MODE_READ) as file:
                 # Assign the json data.
                 json_data = json.load(file)
                 # Close the file.
                 file.close()
+
+            # Cache the json data.
+            PropertiesJsonHandler._update_cache(json_data, signature)
             
             # Return the json data.
             return json_data
@@ -685,8 +850,8 @@ class PropertiesJsonHandler():
                 
         """
         
-        # Read and assign the json data from the properties file.
-        properties_json = PropertiesJsonHandler._read()
+        # Read and assign a copy of the json data from the properties file; The cached json data must not be modified in place.
+        properties_json = dict(PropertiesJsonHandler._read())
         
         # Assign the value to the attribute.
         properties_json[attribute] = value
@@ -717,8 +882,8 @@ class PropertiesJsonHandler():
                 
         """
         
-        # Read and assign the json data from the properties file.
-        properties_json = PropertiesJsonHandler._read()
+        # Read and assign a copy of the json data from the properties file; The cached json data must not be modified in place.
+        properties_json = dict(PropertiesJsonHandler._read())
         
         # Clear the value of the attribute.
         properties_json[attribute] = ''
@@ -727,13 +892,50 @@ class PropertiesJsonHandler():
         PropertiesJsonHandler._write(properties_json)
 
 
+    @staticmethod
+    def _update_cache(properties_json: dict, signature: tuple[int, int, int]) -> None:
+        """
+        
+        Description:
+            Caches the properties json data along with the stat signature of the properties file it corresponds to.
+            Signatures modified within the racy window are not remembered, so that the properties file is re-read next time.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            properties_json(dict): Properties json data to cache.
+            signature(tuple[int, int, int]): Stat signature of the properties file.
+        
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Cache the properties json data.
+        PropertiesJsonHandler._cached_properties_json = properties_json
+
+        # If the signature is settled:
+        if MetadataReconciler.is_signature_settled(signature):
+            # Remember the signature.
+            PropertiesJsonHandler._cached_signature = signature
+
+        # If the signature is not settled:
+        else:
+            # Forget the signature.
+            PropertiesJsonHandler._cached_signature = None
+
+
     @staticmethod
     def _write(properties_json: str) -> None:
         """
         
         Description:
-            Attempts to open the properties file,
-            and write the specified properties json data to the properties file.
+            Attempts to write the specified properties json data to a temporary file next to the properties file,
+            and atomically replace the properties file with it, so that readers never observe a partially written properties file.
+            Updates the cache with the written properties json data.
 
             Note: This method is not meant to be accessed from outside this class.
 
@@ -750,8 +952,9 @@ class PropertiesJsonHandler():
                 
         """
         
-        # Constant for the storage of the properties file name.
+        # Constants for the storage of the properties file name and the temporary properties file name.
         PROPERTIES_FILENAME = String.PROPERTIES_FILENAME
+        PROPERTIES_TEMPORARY_FILENAME = String.PROPERTIES_TEMPORARY_FILENAME
 
         # Constant for the storage of the file mode write.
         FILE_MODE_WRITE = String.FILE_MODE_WRITE
@@ -764,13 +967,19 @@ class PropertiesJsonHandler():
 
         # Attempt to:
         try:
-            # Open the properties file with the file mode write.
-            with open(PROPERTIES_FILENAME, FILE_MODE_WRITE) as file:
+            # Open the temporary properties file with the file mode write.
+            with open(PROPERTIES_TEMPORARY_FILENAME, FILE_MODE_WRITE) as file:
                 # Write the properties json data to the file.
                 json.dump(properties_json, file, indent=JSON_INDENT)
                 # Close the file.
                 file.close()
 
+            # Replace the properties file with the temporary properties file.
+            os.replace(PROPERTIES_TEMPORARY_FILENAME, PROPERTIES_FILENAME)
+
+            # Cache the written json data.
+            PropertiesJsonHandler._update_cache(properties_json, PropertiesJsonHandler._get_signature())
+
         # Handle: FileNotFoundError.
         except FileNotFoundError:
             # Print the file not found error message.
@@ -159,8 +159,13 @@ class English():
 		'#_DESCRIBE_MONITORING_LOG_VIEWER_FOR_DIRECTORY_TWO': f"""{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE FOLLOWING ARE THE MONITORING LOGS FOR THE SELECTED DIRECTORY.{Color.ENC}
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE FIRST COLUMN SPECIFIES THE FILENAME OF THE IMPACTED FILE.{Color.ENC}
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE SECOND COLUMN SPECIFIES THE TIMESTAMPED ACCESS OR MODIFICATION.{Color.ENC}
-{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE THIRD COLUMN SPECIFIES THE LIST OF LOGGED ON USERS AT THE TIME OF ACCESS OR MODIFICATION.{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE THIRD COLUMN SPECIFIES THE LIST OF LOGGED ON USERS AT THE TIME OF ACCESS OR MODIFICATION.{Color.ENC}
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}ENTRIES ARE DISPLAYED IN PAGES, FROM THE NEWEST TO THE OLDEST.{Color.ENC}\n
 {Color.PURPLE}{Separator.draw()}{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}IF YOU CHOOSE (M):{Color.ENC}
+    {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE NEXT PAGE OF OLDER ENTRIES IS DISPLAYED.{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}IF YOU CHOOSE (F):{Color.ENC}
+    {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}NEW ENTRIES ARE DISPLAYED AS THEY ARE LOGGED, UNTIL (CTRL+C) IS PRESSED.{Color.ENC}\n
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}IF YOU CHOOSE (Y):{Color.ENC}
     {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}DIRECTORY MONITORING LOG VIEWER IS NAVIGATED TO.{Color.ENC}\n
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}IF YOU CHOOSE (N):{Color.ENC}
@@ -175,8 +180,13 @@ class English():
 		'#_DESCRIBE_MONITORING_LOG_VIEWER_FOR_SINGLE_FILE_TWO': f"""{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE FOLLOWING ARE THE MONITORING LOGS FOR THE SELECTED FILE.{Color.ENC}
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE FIRST COLUMN SPECIFIES THE FILENAME.{Color.ENC}
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE SECOND COLUMN SPECIFIES THE TIMESTAMPED ACCESS OR MODIFICATION.{Color.ENC}
-{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE THIRD COLUMN SPECIFIES THE LIST OF LOGGED ON USERS AT THE TIME OF ACCESS OR MODIFICATION.{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE THIRD COLUMN SPECIFIES THE LIST OF LOGGED ON USERS AT THE TIME OF ACCESS OR MODIFICATION.{Color.ENC}
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}ENTRIES ARE DISPLAYED IN PAGES, FROM THE NEWEST TO THE OLDEST.{Color.ENC}\n
 {Color.PURPLE}{Separator.draw()}{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}IF YOU CHOOSE (M):{Color.ENC}
+    {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}THE NEXT PAGE OF OLDER ENTRIES IS DISPLAYED.{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}IF YOU CHOOSE (F):{Color.ENC}
+    {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}NEW ENTRIES ARE DISPLAYED AS THEY ARE LOGGED, UNTIL (CTRL+C) IS PRESSED.{Color.ENC}\n
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}IF YOU CHOOSE (Y):{Color.ENC}
     {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}FILE MONITORING LOG VIEWER IS NAVIGATED TO.{Color.ENC}\n
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}IF YOU CHOOSE (N):{Color.ENC}
@@ -246,6 +256,8 @@ class English():
 		'#_NOTIFY_EMPTINESS_MONITORING_LOG_VIEWER_TWO': '[!] NOTICE: MONITORING LOG FILE OF THE SELECTED TARGET IS EMPTY.',
 		'#_NOTIFY_EMPTINESS_MONITORING_REMOVER_AND_LOG_VIEWER_FOR_DIRECTORY': '[!] NOTICE: NO DIRECTORIES ARE CONFIGURED TO BE MONITORED.',
 		'#_NOTIFY_EMPTINESS_MONITORING_REMOVER_AND_LOG_VIEWER_FOR_SINGLE_FILE': '[!] NOTICE: NO FILES ARE CONFIGURED TO BE MONITORED.',
+		'#_NOTIFY_END_MONITORING_LOG_VIEWER_TWO': '[!] NOTICE: NO OLDER MONITORING LOG ENTRIES ARE LEFT.',
+		'#_NOTIFY_FOLLOW_MONITORING_LOG_VIEWER_TWO': '[*] FOLLOWING NEW MONITORING LOG ENTRIES; PRESS (CTRL+C) TO STOP.',
 		'#_NOT_OK': 'UNFULFILLED',
 		'#_OK': 'FULFILLED',
 		'#_OPEN_AUTOSTART_BACKUP': 'OPEN: AUTOSTART BACKUP',
@@ -287,9 +299,9 @@ class English():
 		'#_PROMPT_MONITORING_CONFIGURATOR_FOR_SINGLE_FILE': 'ENTER ABSOLUTE PATH FOR THE FILE TO MONITOR (0 - GO: BACKWARDS): ',
 		'#_PROMPT_MONITORING_LOG_VIEWER': 'SELECT YOUR NAVIGATION OPTION (0 - 2): ',
 		'#_PROMPT_MONITORING_LOG_VIEWER_FOR_DIRECTORY_ONE': 'ENTER THE DIRECTORY ID TO VIEW ITS MONITORING LOGS (0 - GO: BACKWARDS): ',
-		'#_PROMPT_MONITORING_LOG_VIEWER_FOR_DIRECTORY_TWO': 'VIEW MONITORING LOGS FOR ANOTHER DIRECTORY? (Y/N): ',
+		'#_PROMPT_MONITORING_LOG_VIEWER_FOR_DIRECTORY_TWO': 'OLDER ENTRIES (M), FOLLOW (F), OR VIEW MONITORING LOGS FOR ANOTHER DIRECTORY? (M/F/Y/N): ',
 		'#_PROMPT_MONITORING_LOG_VIEWER_FOR_SINGLE_FILE_ONE': 'ENTER THE FILE ID TO VIEW ITS MONITORING LOGS (0 - GO: BACKWARDS): ',
-		'#_PROMPT_MONITORING_LOG_VIEWER_FOR_SINGLE_FILE_TWO': 'VIEW MONITORING LOGS FOR ANOTHER FILE? (Y/N): ',
+		'#_PROMPT_MONITORING_LOG_VIEWER_FOR_SINGLE_FILE_TWO': 'OLDER ENTRIES (M), FOLLOW (F), OR VIEW MONITORING LOGS FOR ANOTHER FILE? (M/F/Y/N): ',
 		'#_PROMPT_MONITORING_REMOVER_FOR_DIRECTORY_ONE': 'ENTER THE DIRECTORY ID TO REMOVE FROM MONITORING (0 - GO: BACKWARDS): ',
 		'#_PROMPT_MONITORING_REMOVER_FOR_DIRECTORY_TWO': 'REMOVE MORE DIRECTORIES FROM MONITORING? (Y/N): ',
 		'#_PROMPT_MONITORING_REMOVER_FOR_SINGLE_FILE_ONE': 'ENTER THE FILE ID TO REMOVE FROM MONITORING (0 - GO: BACKWARDS): ',
@@ -331,7 +343,8 @@ class English():
 		'#_TARGET': '[*] TARGET: ',
 		'#_ACCESSED_AT': '[-] ACCESSED AT: ',
 		'#_MODIFIED_AT': '[+] MODIFIED AT: ',
-		'#_POTENTIALLY_BY': '[*] POTENTIALLY BY: '
+		'#_POTENTIALLY_BY': '[*] POTENTIALLY BY: ',
+		'#_FILE_SIZE': '[*] FILE SIZE: '
 
 	}
 
@@ -159,8 +159,13 @@ class French():
         '#_DESCRIBE_MONITORING_LOG_VIEWER_FOR_DIRECTORY_TWO': f"""{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LES SUIVANTS SONT LES JOURNAUX DE SURVEILLANCE POUR LE RÉPERTOIRE SÉLECTIONNÉ.{Color.ENC}
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LA PREMIÈRE COLONNE SPÉCIFIE LE NOM DU FICHIER DE RÉPERTOIRE IMPACTÉE.{Color.ENC}
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LA DEUXIÈME COLONNE SPÉCIFIE L'ACCÈS OU LA MODIFICATION HORODATÉE.{Color.ENC}
-{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LA TROISIÈME COLONNE SPÉCIFIE LA LISTE DES UTILISATEURS CONNECTÉS AU MOMENT DE L'ACCÈS OU DE LA MODIFICATION.{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LA TROISIÈME COLONNE SPÉCIFIE LA LISTE DES UTILISATEURS CONNECTÉS AU MOMENT DE L'ACCÈS OU DE LA MODIFICATION.{Color.ENC}
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LES ENTRÉES SONT AFFICHÉES PAR PAGES, DES PLUS RÉCENTES AUX PLUS ANCIENNES.{Color.ENC}\n
 {Color.PURPLE}{Separator.draw()}{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}SI VOUS CHOISISSEZ (M):{Color.ENC}
+    {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LA PAGE SUIVANTE D'ENTRÉES PLUS ANCIENNES EST AFFICHÉE.{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}SI VOUS CHOISISSEZ (F):{Color.ENC}
+    {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LES NOUVELLES ENTRÉES SONT AFFICHÉES AU FUR ET À MESURE, JUSQU'À CE QUE (CTRL+C) SOIT APPUYÉ.{Color.ENC}\n
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}SI VOUS CHOISISSEZ (Y):{Color.ENC}
     {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LE VUEUR DE JOURNAL DE SURVEILLANCE DE RÉPERTOIRE EST NAVIGUÉ.{Color.ENC}\n
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}SI VOUS CHOISISSEZ (N):{Color.ENC}
@@ -175,8 +180,13 @@ class French():
         '#_DESCRIBE_MONITORING_LOG_VIEWER_FOR_SINGLE_FILE_TWO': f"""{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LES SUIVANTS SONT LES JOURNAUX DE SURVEILLANCE POUR LE FICHIER SÉLECTIONNÉ.{Color.ENC}
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LA PREMIÈRE COLONNE SPÉCIFIE LE NOM DU FICHIER.{Color.ENC}
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LA DEUXIÈME COLONNE SPÉCIFIE L'ACCÈS OU LA MODIFICATION HORODATÉE.{Color.ENC}
-{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LA TROISIÈME COLONNE SPÉCIFIE LA LISTE DES UTILISATEURS CONNECTÉS AU MOMENT DE L'ACCÈS OU DE LA MODIFICATION.{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LA TROISIÈME COLONNE SPÉCIFIE LA LISTE DES UTILISATEURS CONNECTÉS AU MOMENT DE L'ACCÈS OU DE LA MODIFICATION.{Color.ENC}
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LES ENTRÉES SONT AFFICHÉES PAR PAGES, DES PLUS RÉCENTES AUX PLUS ANCIENNES.{Color.ENC}\n
 {Color.PURPLE}{Separator.draw()}{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}SI VOUS CHOISISSEZ (M):{Color.ENC}
+    {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LA PAGE SUIVANTE D'ENTRÉES PLUS ANCIENNES EST AFFICHÉE.{Color.ENC}\n
+{Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}SI VOUS CHOISISSEZ (F):{Color.ENC}
+    {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LES NOUVELLES ENTRÉES SONT AFFICHÉES AU FUR ET À MESURE, JUSQU'À CE QUE (CTRL+C) SOIT APPUYÉ.{Color.ENC}\n
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}SI VOUS CHOISISSEZ (Y):{Color.ENC}
     {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}LE VUEUR DE JOURNAL DE SURVEILLANCE DE FICHIER EST NAVIGUÉ.{Color.ENC}\n
 {Color.PURPLE}[*]{Color.ENC} {Color.YELLOW}SI VOUS CHOISISSEZ (N):{Color.ENC}
@@ -246,6 +256,8 @@ class French():
         '#_NOTIFY_EMPTINESS_MONITORING_LOG_VIEWER_TWO': '[!] AVIS: LE FICHIER DE JOURNAL DE SURVEILLANCE DU CIBLE SÉLECTIONNÉ EST VIDE.',
         '#_NOTIFY_EMPTINESS_MONITORING_REMOVER_AND_LOG_VIEWER_FOR_DIRECTORY': '[!] AVIS: AUCUN RÉPERTOIRE N\'EST CONFIGURÉ POUR ÊTRE SURVEILLÉ.',
         '#_NOTIFY_EMPTINESS_MONITORING_REMOVER_AND_LOG_VIEWER_FOR_SINGLE_FILE': '[!] AVIS: AUCUN FICHIER N\'EST CONFIGURÉ POUR ÊTRE SURVEILLÉ.',
+        '#_NOTIFY_END_MONITORING_LOG_VIEWER_TWO': '[!] AVIS: IL NE RESTE AUCUNE ENTRÉE PLUS ANCIENNE DANS LE JOURNAL DE SURVEILLANCE.',
+        '#_NOTIFY_FOLLOW_MONITORING_LOG_VIEWER_TWO': '[*] SUIVI DES NOUVELLES ENTRÉES DU JOURNAL DE SURVEILLANCE; APPUYEZ SUR (CTRL+C) POUR ARRÊTER.',
         '#_NOT_OK': 'NON REMPLI',
         '#_OK': 'REMPLI',
         '#_OPEN_AUTOSTART_BACKUP': 'OUVRIR: SAUVEGARDE AU DÉMARRAGE',
@@ -287,9 +299,9 @@ class French():
         '#_PROMPT_MONITORING_CONFIGURATOR_FOR_SINGLE_FILE': 'ENTREZ LE CHEMIN ABSOLU DU FICHIER À SURVEILLER (0 - RETOURNER): ',
         '#_PROMPT_MONITORING_LOG_VIEWER': 'SÉLECTIONNEZ VOTRE OPTION DE NAVIGATION (0 - 2): ',
         '#_PROMPT_MONITORING_LOG_VIEWER_FOR_DIRECTORY_ONE': 'ENTREZ L\'ID DU RÉPERTOIRE POUR VOIR SES JOURNAUX DE SURVEILLANCE (0 - RETOURNER): ',
-        '#_PROMPT_MONITORING_LOG_VIEWER_FOR_DIRECTORY_TWO': 'VOIR LES JOURNAUX DE SURVEILLANCE D\'UN AUTRE RÉPERTOIRE? (Y/N): ',
+        '#_PROMPT_MONITORING_LOG_VIEWER_FOR_DIRECTORY_TWO': 'ENTRÉES PLUS ANCIENNES (M), SUIVRE (F), OU VOIR LES JOURNAUX DE SURVEILLANCE D\'UN AUTRE RÉPERTOIRE? (M/F/Y/N): ',
         '#_PROMPT_MONITORING_LOG_VIEWER_FOR_SINGLE_FILE_ONE': 'ENTREZ L\'ID DU FICHIER POUR VOIR SES JOURNAUX DE SURVEILLANCE (0 - RETOURNER): ',
-        '#_PROMPT_MONITORING_LOG_VIEWER_FOR_SINGLE_FILE_TWO': 'VOIR LES JOURNAUX DE SURVEILLANCE D\'UN AUTRE FICHIER? (Y/N): ',
+        '#_PROMPT_MONITORING_LOG_VIEWER_FOR_SINGLE_FILE_TWO': 'ENTRÉES PLUS ANCIENNES (M), SUIVRE (F), OU VOIR LES JOURNAUX DE SURVEILLANCE D\'UN AUTRE FICHIER? (M/F/Y/N): ',
         '#_PROMPT_MONITORING_REMOVER_FOR_DIRECTORY_ONE': 'ENTREZ L\'ID DU RÉPERTOIRE À SUPPRIMER DE LA SURVEILLANCE (0 - RETOURNER): ',
         '#_PROMPT_MONITORING_REMOVER_FOR_DIRECTORY_TWO': 'SUPPRIMER D\'AUTRES RÉPERTOIRES DE LA SURVEILLANCE? (Y/N): ',
         '#_PROMPT_MONITORING_REMOVER_FOR_SINGLE_FILE_ONE': 'ENTREZ L\'ID DU FICHIER À SUPPRIMER DE LA SURVEILLANCE (0 - RETOURNER): ',
@@ -332,7 +344,8 @@ class French():
         '#_TARGET': '[*] CIBLE: ',
         '#_ACCESSED_AT': '[-] ACCÉDÉ À: ',
         '#_MODIFIED_AT': '[+] MODIFIÉ À: ',
-        '#_POTENTIALLY_BY': '[*] PROBABLEMENT PAR: '
+        '#_POTENTIALLY_BY': '[*] PROBABLEMENT PAR: ',
+        '#_FILE_SIZE': '[*] TAILLE DU FICHIER: '
 
     }
 
@@ -0,0 +1,163 @@
+# Standard library imports.
+import json
+import os
+
+# Standard library from imports.
+from typing import Optional
+
+# Project-specific module imports.
+from _constant.string import String
+from _jsonx.monitoring_json_handler import MonitoringJsonHandler
+from _jsonx.properties_json_handler import PropertiesJsonHandler
+from _log.monitoring_log_format import MonitoringLogFormat
+from _log.monitoring_log_index import MonitoringLogIndex
+
+
+class MonitoringLogConverter:
+    """
+
+    MonitoringLogConverter converts existing monitoring log files to the JSON format (see MonitoringLogFormat).
+
+    Every log file is rewritten into a temporary file, which then replaces it, so that a log file is never left half converted.
+    JSON entries are kept as they are; Malformed lines (e.g. cut off by a crash) are skipped.
+    Text entries only hold the name of the target file; The log file of a single file target resolves it to the path of the target,
+    whereas the log file of a directory target keeps the name, as the sub directory of the file is not recorded.
+
+    Sysadmins can convert every monitoring log file from the project root directory, while the monitoring service is disabled, with:
+        python3 -m _log.monitoring_log_converter
+    and set the "MONITORING_LOG_FORMAT" attribute of the properties json file to "JSON", so that new entries are written in the JSON format as well.
+
+    """
+
+
+    @staticmethod
+    def convert_log_file(log_file_path: str, target_path: Optional[str] = None) -> tuple[int, int]:
+        """
+
+        Description:
+            Converts the entries of the log file specified by the log file path to the JSON format, and rebuilds its time index.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+            target_path(Optional[str]): Path for the target file, to record instead of the name held by text entries; Optional.
+
+        Returns:
+            tuple[int, int]: Numbers of converted entries and skipped malformed lines.
+
+        Raises:
+            FileNotFoundError:
+                If the log file is not found,
+                then delegate handling to the caller.
+
+        """
+
+        # Constant for the storage of a string literal.
+        TARGET_PATH = String.LITERAL_TARGET_PATH
+
+        # Assign the path for the temporary file.
+        temporary_file_path = log_file_path + String.MONITORING_LOG_TEMPORARY_FILE_EXTENSION
+
+        # Variables for the storage of the numbers of converted entries and skipped lines.
+        converted_count = 0
+        skipped_count = 0
+
+        # Open the log file with the file mode read, and the temporary file with the file mode write.
+        with open(log_file_path, String.FILE_MODE_READ) as log_file, open(temporary_file_path, String.FILE_MODE_WRITE) as temporary_file:
+            # For every line of the log file:
+            for line in log_file:
+                # Strip the line feed of the line.
+                line = line.rstrip('\n')
+
+                # If the line is empty:
+                if not line:
+                    # Skip to the next line.
+                    continue
+
+                # Assign the record of the event.
+                record = MonitoringLogFormat.parse_entry(line)
+
+                # If the line is malformed:
+                if record is None:
+                    # Count the line as skipped.
+                    skipped_count += 1
+
+                    # Skip to the next line.
+                    continue
+
+                # If the entry is a text entry and the path for the target file is given:
+                if not line.startswith('{') and target_path is not None:
+                    # Record the path for the target file, instead of its name.
+                    record[TARGET_PATH] = target_path
+
+                # Write the JSON entry; Preceded by a line feed, as written by the monitoring service.
+                temporary_file.write('\n' + json.dumps(record, separators=(',', ':')))
+
+                # Count the entry as converted.
+                converted_count += 1
+
+        # Replace the log file with the temporary file.
+        os.replace(temporary_file_path, log_file_path)
+
+        # Rebuild the time index of the log file, as the offsets of its entries changed.
+        MonitoringLogIndex.rebuild(log_file_path)
+
+        # Return the numbers of converted entries and skipped lines.
+        return converted_count, skipped_count
+
+
+    @staticmethod
+    def run() -> None:
+        """
+
+        Description:
+            Converts the log file of every target within the monitoring json file to the JSON format, and reports the outcome of every conversion.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            FileNotFoundError:
+                If the log file of a target is not found,
+                then skip it.
+
+        """
+
+        # Constants for the storage of string literals.
+        IS_DIRECTORY = String.LITERAL_IS_DIRECTORY
+        LOG_FILENAME = String.LITERAL_LOG_FILENAME
+        PATH = String.LITERAL_PATH
+
+        # Assign the path for the monitoring directory.
+        monitoring_directory_path = PropertiesJsonHandler.get_monitoring_directory()
+
+        # Open the monitoring json file with the file mode read.
+        with open(monitoring_directory_path + os.path.sep + MonitoringJsonHandler.MONITORING_FILENAME, String.FILE_MODE_READ) as file:
+            # Assign the json data.
+            data = json.load(file)
+
+        # For every json entry:
+        for json_entry in data.values():
+            # Assign the path for the log file of the target.
+            log_file_path = monitoring_directory_path + os.path.sep + json_entry[LOG_FILENAME]
+
+            # Attempt to:
+            try:
+                # Convert the log file; Only the log file of a single file target can resolve the path for its target file.
+                converted_count, skipped_count = MonitoringLogConverter.convert_log_file(log_file_path, None if json_entry[IS_DIRECTORY] else json_entry[PATH])
+
+            # Handle: FileNotFoundError.
+            except FileNotFoundError:
+                # Skip to the next json entry.
+                continue
+
+            # Report the outcome of the conversion.
+            print(String.MONITORING_LOG_CONVERTER_REPORT % (log_file_path, converted_count, skipped_count))
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Convert every monitoring log file.
+    MonitoringLogConverter.run()
\ No newline at end of file
@@ -0,0 +1,211 @@
+# Standard library imports.
+import json
+
+# Standard library from imports.
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+
+
+class MonitoringLogFormat:
+    """
+
+    MonitoringLogFormat creates and parses the entries of the monitoring log files.
+
+    The format of new entries is set by the "MONITORING_LOG_FORMAT" attribute of the properties json file:
+        "TEXT": Human-readable lines, holding the name of the target file, the local time of the event and the logged-on users (default).
+        "JSON": JSON Lines records, holding the time of the event in nanoseconds since the epoch, the event type, the path and size of the target file and the logged-on users;
+                Records are parsed with a single json.loads call, and can be stream-parsed by other tools line by line.
+
+    Every entry takes up a line of its own, and is preceded by a line feed, so that log files holding entries of both formats (e.g. after the format is switched) remain readable.
+    Parsed entries of both formats are records holding the keys "TIMESTAMP_NS", "EVENT", "TARGET_PATH", "USERS" and "SIZE";
+    Text entries hold neither the path of the target file (only its name) nor its size ("SIZE" is null).
+
+    """
+
+
+    @staticmethod
+    def create_entry(log_format: str, timestamp_ns: int, event_type: str, target_path: str, user_list: list[str], size: Optional[int]) -> str:
+        """
+
+        Description:
+            Creates the entry of the event in the log format.
+
+        Args:
+            log_format(str): Log format; "TEXT" or "JSON".
+            timestamp_ns(int): Time of the event (in nanoseconds since the epoch).
+            event_type(str): Event type; "ACCESSED" or "MODIFIED".
+            target_path(str): Path for the target file.
+            user_list(list[str]): Currently logged-on users.
+            size(Optional[int]): Size of the target file (in bytes); None if it is unknown.
+
+        Returns:
+            str: Entry of the event, preceded by a line feed.
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of the delimiter of text entries.
+        DELIMITER = String.DELIMITER_MONITORING_LOG_FILE
+
+        # If the log format is JSON:
+        if log_format == String.MONITORING_LOG_FORMAT_JSON:
+            # Return the record of the event; Serialized compactly.
+            return '\n' + json.dumps(MonitoringLogFormat.create_record(timestamp_ns, event_type, target_path, user_list, size), separators=(',', ':'))
+
+        # Assign the label of the event type.
+        event_label = String.LITERAL_MODIFIED_AT if event_type == String.MONITORING_LOG_EVENT_MODIFIED else String.LITERAL_ACCESSED_AT
+
+        # Return the text entry of the event.
+        return '\n' + String.LITERAL_TARGET + Path(target_path).name + DELIMITER + event_label + MonitoringLogFormat.format_time(timestamp_ns) + DELIMITER + String.LITERAL_POTENTIALLY_BY + '[' + ', '.join(user_list) + ']'
+
+
+    @staticmethod
+    def create_record(timestamp_ns: int, event_type: str, target_path: str, user_list: list[str], size: Optional[int]) -> dict:
+        """
+
+        Description:
+            Creates the record of an event, as held by JSON entries.
+
+        Args:
+            timestamp_ns(int): Time of the event (in nanoseconds since the epoch).
+            event_type(str): Event type; "ACCESSED" or "MODIFIED".
+            target_path(str): Path for the target file.
+            user_list(list[str]): Logged-on users at the time of the event.
+            size(Optional[int]): Size of the target file (in bytes); None if it is unknown.
+
+        Returns:
+            dict: Record of the event.
+
+        Raises:
+            None
+
+        """
+
+        # Return the record of the event.
+        return {
+                String.LITERAL_TIMESTAMP_NS : timestamp_ns,
+                String.LITERAL_EVENT : event_type,
+                String.LITERAL_TARGET_PATH : target_path,
+                String.LITERAL_USERS : user_list,
+                String.LITERAL_SIZE : size
+            }
+
+
+    @staticmethod
+    def format_time(timestamp_ns: int) -> str:
+        """
+
+        Description:
+            Formats the time, as displayed within text entries (local time).
+
+        Args:
+            timestamp_ns(int): Time (in nanoseconds since the epoch).
+
+        Returns:
+            str: Formatted time.
+
+        Raises:
+            None
+
+        """
+
+        # Return the formatted time.
+        return datetime.fromtimestamp(timestamp_ns // Integer.NANOSECONDS_PER_SECOND).strftime(String.FORMAT_MONITORING_LOG_TIME)
+
+
+    @staticmethod
+    def parse_entry(line: str) -> Optional[dict]:
+        """
+
+        Description:
+            Parses the line of a monitoring log file into the record of its event, regardless of its format.
+
+        Args:
+            line(str): Line of the monitoring log file, without its line feed.
+
+        Returns:
+            Optional[dict]: Record of the event; None if the line is empty or malformed.
+
+        Raises:
+            ValueError:
+                If the line cannot be parsed (e.g. it was cut off by a crash),
+                then return None.
+
+        """
+
+        # Constants for the storage of string literals.
+        ACCESSED_AT = String.LITERAL_ACCESSED_AT
+        DELIMITER = String.DELIMITER_MONITORING_LOG_FILE
+        MODIFIED_AT = String.LITERAL_MODIFIED_AT
+        POTENTIALLY_BY = String.LITERAL_POTENTIALLY_BY
+        TARGET = String.LITERAL_TARGET
+
+        # Attempt to:
+        try:
+            # If the line is a JSON entry:
+            if line.startswith('{'):
+                # Assign the record of the event.
+                record = json.loads(line)
+
+                # Return the record, if it is one.
+                return record if isinstance(record, dict) and String.LITERAL_TIMESTAMP_NS in record else None
+
+            # Split the text entry into the target, time and users fields.
+            target_field, time_field, users_field = line.split(DELIMITER)
+
+            # If a field lacks its label:
+            if not target_field.startswith(TARGET) or not users_field.startswith(POTENTIALLY_BY) or not time_field.startswith((ACCESSED_AT, MODIFIED_AT)):
+                # Assert the line as malformed.
+                return None
+
+            # Assign the event type and the formatted time.
+            event_type, formatted_time = (String.MONITORING_LOG_EVENT_MODIFIED, time_field[len(MODIFIED_AT):]) if time_field.startswith(MODIFIED_AT) else (String.MONITORING_LOG_EVENT_ACCESSED, time_field[len(ACCESSED_AT):])
+
+            # Assign the users; Listed within brackets, separated by commas.
+            users = users_field[len(POTENTIALLY_BY):].strip('[]')
+
+            # Return the record of the event; Text entries hold the time to the second.
+            return MonitoringLogFormat.create_record(MonitoringLogFormat.parse_time(formatted_time), event_type, target_field[len(TARGET):], users.split(', ') if users else [], None)
+
+        # Handle: ValueError.
+        except ValueError:
+            # Assert the line as malformed.
+            return None
+
+
+
+    @staticmethod
+    def parse_time(formatted_time: str) -> int:
+        """
+
+        Description:
+            Parses the time, as displayed within text entries (local time).
+
+        Args:
+            formatted_time(str): Formatted time; "YYYY:MM:DD HH:MM:SS".
+
+        Returns:
+            int: Time (in nanoseconds since the epoch).
+
+        Raises:
+            ValueError:
+                If the time is malformed,
+                then delegate handling to the caller.
+
+        """
+
+        # Return the time; To the second.
+        return int(datetime.strptime(formatted_time, String.FORMAT_MONITORING_LOG_TIME).timestamp()) * Integer.NANOSECONDS_PER_SECOND
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,307 @@
+# Standard library imports.
+import bisect
+import os
+import struct
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _log.monitoring_log_format import MonitoringLogFormat
+
+
+class MonitoringLogIndex:
+    """
+
+    MonitoringLogIndex maintains the time index sidecars of the monitoring log files, so that time ranges are read without scanning log files from their start.
+
+    The time index of a log file ("file.txt_abc.log.index") is sparse; It holds a record (time of an entry, byte offset of the entry) for every 1000 entries or 64 KB of the log file.
+    Records are fixed-size binary records (a signed and an unsigned 64 bit integer, big-endian), appended by the log writer along with the entries.
+    To read from a time on, the records are bisected to the last entry before that time, from which on the log file is read (see MonitoringLogReader).
+
+    Offsets of the log writer are counted in characters, which never exceed the bytes they take up, so that an offset never lies past its entry;
+    Readers skip the (partial) line an offset points into, which precedes the entry anyway.
+    Time indexes are optional: A missing time index is rebuilt from its log file once it is read, and an outdated one (e.g. pointing past the end of its log file) as well.
+
+    """
+
+    # Variable for the storage of the indexing state of the log files (entries and offset since their last records), keyed by their paths.
+    _state_dict: dict[str, tuple[int, int]] = {}
+
+
+    @staticmethod
+    def find_offset(record_list: list[tuple[int, int]], start_ns: int) -> int:
+        """
+
+        Description:
+            Bisects the records to the offset of the last indexed entry older than the start time, from which on the log file is to be read.
+
+        Args:
+            record_list(list[tuple[int, int]]): Records of the time index, ordered by their offsets.
+            start_ns(int): Start time (in nanoseconds since the epoch).
+
+        Returns:
+            int: Offset to read the log file from; Zero if no indexed entry is older than the start time.
+
+        Raises:
+            None
+
+        """
+
+        # Assign the position of the first record at or after the start time; Entries are appended in chronological order.
+        position = bisect.bisect_left([record[0] for record in record_list], start_ns)
+
+        # Return the offset of the preceding record, if any.
+        return record_list[position - 1][1] if position > 0 else 0
+
+
+    @staticmethod
+    def forget(log_file_path: str) -> None:
+        """
+
+        Description:
+            Forgets the indexing state of the log file specified by the log file path (e.g. once it is rotated), so that its next entry is indexed.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Forget the indexing state of the log file, if any.
+        MonitoringLogIndex._state_dict.pop(log_file_path, None)
+
+
+    @staticmethod
+    def get_index_file_path(file_path: str) -> str:
+        """
+
+        Description:
+            Retrieves the path of the time index of the log file or uncompressed segment specified by the file path.
+
+        Args:
+            file_path(str): Path for the monitoring log file or segment.
+
+        Returns:
+            str: Path for the time index.
+
+        Raises:
+            None
+
+        """
+
+        # Return the path for the time index.
+        return file_path + String.MONITORING_LOG_INDEX_FILE_EXTENSION
+
+
+    @staticmethod
+    def read(file_path: str) -> list[tuple[int, int]]:
+        """
+
+        Description:
+            Reads the time index of the log file or uncompressed segment specified by the file path, ordered by the offsets of its records.
+            Rebuilds it if it is missing or outdated.
+
+        Args:
+            file_path(str): Path for the monitoring log file or segment.
+
+        Returns:
+            list[tuple[int, int]]: Records of the time index; Times (in nanoseconds since the epoch) and byte offsets of the indexed entries.
+
+        Raises:
+            FileNotFoundError:
+                If the time index is not found,
+                then rebuild it.
+            OSError:
+                If the log file or segment cannot be read,
+                then delegate handling to the caller.
+
+        """
+
+        # Attempt to:
+        try:
+            # Open the time index with the file mode read binary.
+            with open(MonitoringLogIndex.get_index_file_path(file_path), String.FILE_MODE_READ_BINARY) as file:
+                # Assign the content of the time index.
+                content = file.read()
+
+        # Handle: FileNotFoundError.
+        except FileNotFoundError:
+            # Rebuild and return the time index.
+            return MonitoringLogIndex.rebuild(file_path)
+
+        # Assign the size of a record.
+        record_size = struct.calcsize(String.MONITORING_LOG_INDEX_RECORD_FORMAT)
+
+        # Unpack the records, ordered by their offsets; A record cut off by a crash is left out.
+        record_list = sorted(struct.iter_unpack(String.MONITORING_LOG_INDEX_RECORD_FORMAT, content[:len(content) - len(content) % record_size]), key=lambda record: record[1])
+
+        # If a record points past the end of the log file (e.g. the log file was replaced):
+        if record_list and record_list[-1][1] > os.path.getsize(file_path):
+            # Rebuild and return the time index.
+            return MonitoringLogIndex.rebuild(file_path)
+
+        # Return the records.
+        return record_list
+
+
+    @staticmethod
+    def rebuild(file_path: str) -> list[tuple[int, int]]:
+        """
+
+        Description:
+            Rebuilds the time index of the log file or uncompressed segment specified by the file path by scanning it, and writes it into a temporary file, which then replaces it.
+
+        Args:
+            file_path(str): Path for the monitoring log file or segment.
+
+        Returns:
+            list[tuple[int, int]]: Records of the rebuilt time index.
+
+        Raises:
+            OSError:
+                If the log file or segment cannot be read,
+                then delegate handling to the caller.
+                If the time index cannot be written,
+                then return its records nonetheless.
+
+        """
+
+        # Constants for the storage of the intervals between records.
+        MONITORING_LOG_INDEX_BYTE_INTERVAL = Integer.MONITORING_LOG_INDEX_BYTE_INTERVAL
+        MONITORING_LOG_INDEX_ENTRY_INTERVAL = Integer.MONITORING_LOG_INDEX_ENTRY_INTERVAL
+
+        # Variable for the storage of the records.
+        record_list = []
+
+        # Variables for the storage of the offset of the current line, and of the offset of and the entries since the last record.
+        offset = 0
+        last_offset = None
+        entry_count = 0
+
+        # Open the log file with the file mode read binary.
+        with open(file_path, String.FILE_MODE_READ_BINARY) as file:
+            # For every line of the log file:
+            for line in file:
+                # Assign the record of the entry.
+                record = MonitoringLogFormat.parse_entry(line.rstrip(b'\r\n').decode(errors='replace'))
+
+                # If the line is an entry:
+                if record is not None:
+                    # If the entry is the first one, or an interval has passed since the last record:
+                    if last_offset is None or entry_count >= MONITORING_LOG_INDEX_ENTRY_INTERVAL or offset - last_offset >= MONITORING_LOG_INDEX_BYTE_INTERVAL:
+                        # Record the entry; Pointing at the line feed preceding it, as the log writer does.
+                        record_list.append((record[String.LITERAL_TIMESTAMP_NS], max(offset - 1, 0)))
+
+                        # Reset the interval.
+                        last_offset = offset
+                        entry_count = 0
+
+                    # Count the entry.
+                    entry_count += 1
+
+                # Advance the offset past the line.
+                offset += len(line)
+
+        # Assign the path for the time index.
+        index_file_path = MonitoringLogIndex.get_index_file_path(file_path)
+
+        # Attempt to:
+        try:
+            # Open the temporary file with the file mode write binary.
+            with open(index_file_path + String.MONITORING_LOG_TEMPORARY_FILE_EXTENSION, String.FILE_MODE_WRITE_BINARY) as index_file:
+                # Write the records.
+                index_file.write(b''.join(struct.pack(String.MONITORING_LOG_INDEX_RECORD_FORMAT, *record) for record in record_list))
+
+            # Replace the time index with the temporary file.
+            os.replace(index_file_path + String.MONITORING_LOG_TEMPORARY_FILE_EXTENSION, index_file_path)
+
+        # Handle: OSError.
+        except OSError:
+            # Ignore; The records serve the current read nonetheless.
+            pass
+
+        # Return the records.
+        return record_list
+
+
+    @staticmethod
+    def update(log_file_path: str, offset: int, entry_list: list[str], timestamp_list: list[int]) -> None:
+        """
+
+        Description:
+            Appends the records of the written entries that are due for indexing to the time index of the log file specified by the log file path;
+            An entry is due once 1000 entries or 64 KB were written since the last record, or if it is the first one written since the log file was rotated or the service started.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+            offset(int): Offset the entries were written at.
+            entry_list(list[str]): Written entries.
+            timestamp_list(list[int]): Times of the written entries (in nanoseconds since the epoch).
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the time index cannot be written,
+                then ignore it; Missing records only widen the ranges read.
+
+        """
+
+        # Constants for the storage of the intervals between records.
+        MONITORING_LOG_INDEX_BYTE_INTERVAL = Integer.MONITORING_LOG_INDEX_BYTE_INTERVAL
+        MONITORING_LOG_INDEX_ENTRY_INTERVAL = Integer.MONITORING_LOG_INDEX_ENTRY_INTERVAL
+
+        # Assign the indexing state of the log file; None, unless an entry was indexed since the log file was rotated or the service started.
+        entry_count, last_offset = MonitoringLogIndex._state_dict.get(log_file_path, (0, None))
+
+        # Variable for the storage of the packed records.
+        packed_record_list = []
+
+        # For every entry and its time:
+        for entry, timestamp_ns in zip(entry_list, timestamp_list):
+            # If the entry is the first one, or an interval has passed since the last record:
+            if last_offset is None or entry_count >= MONITORING_LOG_INDEX_ENTRY_INTERVAL or offset - last_offset >= MONITORING_LOG_INDEX_BYTE_INTERVAL:
+                # Record the entry.
+                packed_record_list.append(struct.pack(String.MONITORING_LOG_INDEX_RECORD_FORMAT, timestamp_ns, offset))
+
+                # Reset the interval.
+                last_offset = offset
+                entry_count = 0
+
+            # Count the entry.
+            entry_count += 1
+
+            # Advance the offset past the entry.
+            offset += len(entry)
+
+        # Remember the indexing state of the log file.
+        MonitoringLogIndex._state_dict[log_file_path] = (entry_count, last_offset)
+
+        # If no entry is due for indexing:
+        if not packed_record_list:
+            # Stop the update.
+            return
+
+        # Attempt to:
+        try:
+            # Open the time index with the file mode append binary.
+            with open(MonitoringLogIndex.get_index_file_path(log_file_path), String.FILE_MODE_APPEND_BINARY) as file:
+                # Append the records.
+                file.write(b''.join(packed_record_list))
+
+        # Handle: OSError.
+        except OSError:
+            # Ignore.
+            pass
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,538 @@
+# Standard library imports.
+import os
+import sys
+import time
+
+# Standard library from imports.
+from typing import BinaryIO, Iterator, Optional
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _event.inotify_handler import InotifyHandler
+from _log.monitoring_log_format import MonitoringLogFormat
+from _log.monitoring_log_index import MonitoringLogIndex
+from _log.monitoring_log_rotator import MonitoringLogRotator
+from _storage.compression_codec import CompressionCodec
+
+
+class MonitoringLogReader:
+    """
+
+    MonitoringLogReader reads the entries of the monitoring log files across their segments (see MonitoringLogRotator), as if they were a single file.
+
+    Segments are read from the oldest to the newest, as recorded within the segment manifest, followed by the log file itself.
+    Compressed segments are decompressed while being streamed, chunk by chunk, without any temporary uncompressed file.
+    A segment that is compressed meanwhile is read from its compressed file instead.
+
+    Reads can be limited to a time range:
+        Segments rotated before the start time are skipped, and reading stops at the first entry after the end time.
+        The log file and uncompressed segments are read from the offset their time indexes bisect to (see MonitoringLogIndex), rather than from their start.
+
+    Viewers can also read a log file from the newest entry to the oldest, across its segments, seeking backwards through the log file and uncompressed segments chunk by chunk,
+    and follow a log file like "tail -f": New entries are read once the size of the log file grows, woken up by inotify where it is supported, or by polling otherwise.
+
+    Sysadmins can query a log file for a time range (local time, "YYYY:MM:DD HH:MM:SS") from the project root directory with:
+        python3 -m _log.monitoring_log_reader {LOG FILE PATH} [START TIME [END TIME]]
+
+    """
+
+
+    @staticmethod
+    def follow(log_file_path: str) -> Iterator[str]:
+        """
+
+        Description:
+            Yields the lines appended to the log file specified by the log file path from now on, indefinitely (like "tail -f").
+            Reads the log file only once its size grows, rather than re-reading it; Waits for the events of the monitoring directory through inotify, where it is supported, or polls the size otherwise.
+            Follows the log file across rotations: The rotated file is read to its end, before the new log file is read from its start.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+
+        Returns:
+            Iterator[str]: Appended lines of the monitoring log file, without their line feeds.
+
+        Raises:
+            OSError:
+                If inotify cannot be initialized, or the log file cannot be opened (e.g. it was not created yet),
+                then poll instead, or retry on the next wake-up, respectively.
+
+        """
+
+        # Constant for the storage of the wait time between checks of the size of the log file (in seconds).
+        MONITORING_LOG_VIEWER_FOLLOW_INTERVAL = Integer.MONITORING_LOG_VIEWER_FOLLOW_INTERVAL
+
+        # Variables for the storage of the handle of the log file, and of the file descriptor of the inotify instance.
+        file = None
+        inotify_fd = None
+
+        # Variable for the storage of the incomplete line left by the previous read.
+        remainder = b''
+
+        # Attempt to:
+        try:
+            # If inotify is supported:
+            if InotifyHandler.is_supported():
+                # Attempt to:
+                try:
+                    # Initialize the inotify instance.
+                    inotify_fd = InotifyHandler.initialize()
+
+                    # Watch the monitoring directory for modifications and renames of its files.
+                    InotifyHandler.add_watch(inotify_fd, os.path.dirname(os.path.abspath(log_file_path)), Integer.INOTIFY_IN_MODIFY | Integer.INOTIFY_IN_CREATE | Integer.INOTIFY_IN_MOVED_TO)
+
+                # Handle: OSError.
+                except OSError:
+                    # If the inotify instance was initialized:
+                    if inotify_fd is not None:
+                        # Close the inotify instance.
+                        InotifyHandler.close(inotify_fd)
+
+                    # Poll instead.
+                    inotify_fd = None
+
+            # Attempt to:
+            try:
+                # Open the log file with the file mode read binary.
+                file = open(log_file_path, String.FILE_MODE_READ_BINARY)
+
+                # Seek to the end of the log file, so that only lines appended from now on are read.
+                file.seek(0, os.SEEK_END)
+
+            # Handle: OSError.
+            except OSError:
+                # Open the log file once it is created.
+                file = None
+
+            # Loop indefinitely.
+            while True:
+                # If the log file is open and its size grew beyond the read part:
+                if file is not None and os.fstat(file.fileno()).st_size > file.tell():
+                    # Split the appended part into lines.
+                    line_list = (remainder + file.read()).split(b'\n')
+
+                    # Keep the incomplete last line for the next read.
+                    remainder = line_list.pop()
+
+                    # For every complete line:
+                    for line in line_list:
+                        # Yield the decoded line.
+                        yield line.rstrip(b'\r').decode(errors='replace')
+
+                    # Check the size again, before waiting.
+                    continue
+
+                # Attempt to:
+                try:
+                    # Assign the stat result of the path.
+                    stat_result = os.stat(log_file_path)
+
+                # Handle: FileNotFoundError.
+                except FileNotFoundError:
+                    # Assign no stat result; The log file is being rotated, or was moved to the orphanage.
+                    stat_result = None
+
+                # If the path refers to a log file other than the open one (e.g. it was rotated):
+                if stat_result is not None and (file is None or not os.path.samestat(stat_result, os.fstat(file.fileno()))):
+                    # If a log file is open:
+                    if file is not None:
+                        # For every line written to the rotated log file since its size was checked, including its incomplete last line:
+                        for line in (remainder + file.read()).split(b'\n'):
+                            # If the line is not empty:
+                            if line:
+                                # Yield the decoded line.
+                                yield line.rstrip(b'\r').decode(errors='replace')
+
+                        # Close the rotated log file.
+                        file.close()
+
+                    # Reset the incomplete line, as the rotated log file was read to its end.
+                    remainder = b''
+
+                    # Attempt to:
+                    try:
+                        # Open the new log file with the file mode read binary; Read from its start.
+                        file = open(log_file_path, String.FILE_MODE_READ_BINARY)
+
+                        # Check the size of the new log file, before waiting.
+                        continue
+
+                    # Handle: OSError.
+                    except OSError:
+                        # Retry on the next wake-up.
+                        file = None
+
+                # If inotify is used:
+                if inotify_fd is not None:
+                    # Wait for the events of the monitoring directory; Bounded, so that missed events are made up for.
+                    InotifyHandler.read_events(inotify_fd, MONITORING_LOG_VIEWER_FOLLOW_INTERVAL)
+
+                # If polling is used:
+                else:
+                    # Wait before checking the size again.
+                    time.sleep(MONITORING_LOG_VIEWER_FOLLOW_INTERVAL)
+
+        # Finally:
+        finally:
+            # If a log file is open:
+            if file is not None:
+                # Close the log file.
+                file.close()
+
+            # If inotify is used:
+            if inotify_fd is not None:
+                # Close the inotify instance.
+                InotifyHandler.close(inotify_fd)
+
+
+    @staticmethod
+    def iterate_lines(log_file_path: str, start_ns: Optional[int] = None, end_ns: Optional[int] = None) -> Iterator[str]:
+        """
+
+        Description:
+            Yields the lines of the log file specified by the log file path, across its segments, from the oldest to the newest.
+            Yields only the entries within the time range, if a start or end time is given.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+            start_ns(Optional[int]): Start time of the time range (in nanoseconds since the epoch); Optional.
+            end_ns(Optional[int]): End time of the time range (in nanoseconds since the epoch); Optional.
+
+        Returns:
+            Iterator[str]: Lines of the monitoring log file, without their line feeds.
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of a string literal.
+        TIMESTAMP_NS = String.LITERAL_TIMESTAMP_NS
+
+        # If no time range is given:
+        if start_ns is None and end_ns is None:
+            # Yield every line.
+            yield from MonitoringLogReader._iterate_set_lines(log_file_path, None)
+
+            # Stop the iteration.
+            return
+
+        # For every line from the start time on:
+        for line in MonitoringLogReader._iterate_set_lines(log_file_path, start_ns):
+            # Assign the record of the entry.
+            record = MonitoringLogFormat.parse_entry(line)
+
+            # If the line is not an entry:
+            if record is None:
+                # Skip to the next line.
+                continue
+
+            # If the entry is after the end time:
+            if end_ns is not None and record[TIMESTAMP_NS] > end_ns:
+                # Stop the iteration; Every later entry is after the end time as well.
+                return
+
+            # If the entry is not before the start time:
+            if start_ns is None or record[TIMESTAMP_NS] >= start_ns:
+                # Yield the line.
+                yield line
+
+
+    @staticmethod
+    def iterate_lines_backward(log_file_path: str) -> Iterator[str]:
+        """
+
+        Description:
+            Yields the lines of the log file specified by the log file path, across its segments, from the newest to the oldest.
+            Reads the log file and uncompressed segments backwards from their ends, chunk by chunk, so that only the consumed lines are read;
+            Compressed segments cannot be read backwards, and are decompressed as a whole once reached.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+
+        Returns:
+            Iterator[str]: Lines of the monitoring log file, without their line feeds.
+
+        Raises:
+            FileNotFoundError:
+                If a segment or the log file is not found (e.g. it was moved to the orphanage meanwhile),
+                then skip it.
+
+        """
+
+        # Attempt to:
+        try:
+            # Open the log file with the file mode read binary.
+            with open(log_file_path, String.FILE_MODE_READ_BINARY) as file:
+                # Yield the lines of the log file, from the newest to the oldest.
+                yield from MonitoringLogReader._iterate_file_lines_backward(file)
+
+        # Handle: FileNotFoundError.
+        except FileNotFoundError:
+            # Ignore.
+            pass
+
+        # For every segment of the log file, from the newest to the oldest:
+        for segment_entry in reversed(MonitoringLogRotator.read_manifest(log_file_path)[String.LITERAL_SEGMENTS]):
+            # Attempt to:
+            try:
+                # Assign the path for the segment, as it currently exists.
+                segment_file_path = MonitoringLogRotator.get_segment_file_path(log_file_path, segment_entry)
+
+                # If the segment is uncompressed:
+                if segment_file_path.endswith(segment_entry[String.LITERAL_FILENAME]):
+                    # Open the segment with the file mode read binary.
+                    with open(segment_file_path, String.FILE_MODE_READ_BINARY) as file:
+                        # Yield the lines of the segment, from the newest to the oldest.
+                        yield from MonitoringLogReader._iterate_file_lines_backward(file)
+
+                # If the segment is compressed:
+                else:
+                    # Yield the lines of the decompressed segment, from the newest to the oldest.
+                    yield from reversed(list(MonitoringLogReader._iterate_segment_lines(log_file_path, segment_entry, None)))
+
+            # Handle: FileNotFoundError.
+            except FileNotFoundError:
+                # Skip to the next segment.
+                continue
+
+
+    @staticmethod
+    def _iterate_file_lines(file: BinaryIO, file_path: str, start_ns: Optional[int]) -> Iterator[str]:
+        """
+
+        Description:
+            Yields the lines of the opened log file or uncompressed segment specified by the file path.
+            Seeks to the offset its time index bisects to beforehand, if a start time is given.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            file(BinaryIO): Handle of the log file or uncompressed segment, opened with the file mode read binary.
+            file_path(str): Path for the log file or uncompressed segment.
+            start_ns(Optional[int]): Start time (in nanoseconds since the epoch); Optional.
+
+        Returns:
+            Iterator[str]: Lines of the log file or uncompressed segment, without their line feeds.
+
+        Raises:
+            OSError:
+                If the time index cannot be read nor rebuilt,
+                then read from the start.
+
+        """
+
+        # If a start time is given:
+        if start_ns is not None:
+            # Attempt to:
+            try:
+                # Assign the offset to read from.
+                offset = MonitoringLogIndex.find_offset(MonitoringLogIndex.read(file_path), start_ns)
+
+            # Handle: OSError.
+            except OSError:
+                # Read from the start.
+                offset = 0
+
+            # If the offset is not the start:
+            if offset > 0:
+                # Seek to the offset.
+                file.seek(offset)
+
+                # Skip the line the offset points into, which precedes the indexed entry.
+                file.readline()
+
+        # For every line:
+        for line in file:
+            # Yield the decoded line without its line feed.
+            yield line.rstrip(b'\r\n').decode(errors='replace')
+
+
+    @staticmethod
+    def _iterate_file_lines_backward(file: BinaryIO) -> Iterator[str]:
+        """
+
+        Description:
+            Yields the lines of the opened log file or uncompressed segment, from the newest to the oldest.
+            Seeks backwards from the end of the file, chunk by chunk, so that only the consumed lines are read.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            file(BinaryIO): Handle of the log file or uncompressed segment, opened with the file mode read binary.
+
+        Returns:
+            Iterator[str]: Lines of the log file or uncompressed segment, without their line feeds.
+
+        Raises:
+            None
+
+        """
+
+        # Assign the position of the end of the file; Lines appended meanwhile are left out.
+        position = file.seek(0, os.SEEK_END)
+
+        # Variable for the storage of the incomplete first line left by the previous chunk.
+        remainder = b''
+
+        # While the start of the file is not reached:
+        while position > 0:
+            # Assign the size of the chunk preceding the position.
+            chunk_size = min(Integer.MONITORING_LOG_VIEWER_CHUNK_SIZE, position)
+
+            # Move the position to the start of the chunk.
+            position -= chunk_size
+
+            # Seek to the start of the chunk.
+            file.seek(position)
+
+            # Split the chunk, along with the incomplete line following it, into lines.
+            line_list = (file.read(chunk_size) + remainder).split(b'\n')
+
+            # Keep the incomplete first line for the next chunk.
+            remainder = line_list.pop(0)
+
+            # For every complete line, from the newest to the oldest:
+            for line in reversed(line_list):
+                # Yield the decoded line.
+                yield line.rstrip(b'\r').decode(errors='replace')
+
+        # Yield the first line of the file.
+        yield remainder.rstrip(b'\r').decode(errors='replace')
+
+
+    @staticmethod
+    def _iterate_segment_lines(log_file_path: str, segment_entry: dict, start_ns: Optional[int]) -> Iterator[str]:
+        """
+
+        Description:
+            Yields the lines of the segment of the log file specified by the log file path; Decompressed, if the segment is compressed.
+            Uncompressed segments are read from the offset their time indexes bisect to, if a start time is given.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+            segment_entry(dict): Entry of the segment within the segment manifest.
+            start_ns(Optional[int]): Start time (in nanoseconds since the epoch); Optional.
+
+        Returns:
+            Iterator[str]: Lines of the segment, without their line feeds.
+
+        Raises:
+            FileNotFoundError:
+                If the segment is not found,
+                then delegate handling to the caller.
+
+        """
+
+        # Assign the path for the segment, as it currently exists.
+        segment_file_path = MonitoringLogRotator.get_segment_file_path(log_file_path, segment_entry)
+
+        # If the segment is uncompressed:
+        if segment_file_path.endswith(segment_entry[String.LITERAL_FILENAME]):
+            # Open the segment with the file mode read binary.
+            with open(segment_file_path, String.FILE_MODE_READ_BINARY) as file:
+                # Yield the lines of the segment.
+                yield from MonitoringLogReader._iterate_file_lines(file, segment_file_path, start_ns)
+
+            # Stop the iteration.
+            return
+
+        # Create the decompressor.
+        decompressor = CompressionCodec.create_decompressor(segment_entry[String.LITERAL_COMPRESSION])
+
+        # Variable for the storage of the incomplete line left by the previous chunk.
+        remainder = b''
+
+        # Open the segment with the file mode read binary.
+        with open(segment_file_path, String.FILE_MODE_READ_BINARY) as file:
+            # For every chunk of the segment:
+            for chunk in iter(lambda: file.read(Integer.BACKUP_CHUNK_SIZE), b''):
+                # Split the decompressed chunk into lines.
+                line_list = (remainder + decompressor.decompress(chunk)).split(b'\n')
+
+                # Keep the incomplete last line for the next chunk.
+                remainder = line_list.pop()
+
+                # For every complete line:
+                for line in line_list:
+                    # Yield the decoded line.
+                    yield line.rstrip(b'\r').decode(errors='replace')
+
+        # If an incomplete last line is left:
+        if remainder:
+            # Yield the decoded line.
+            yield remainder.rstrip(b'\r').decode(errors='replace')
+
+
+    @staticmethod
+    def _iterate_set_lines(log_file_path: str, start_ns: Optional[int]) -> Iterator[str]:
+        """
+
+        Description:
+            Yields the lines of the segment set of the log file specified by the log file path; The segments from the oldest to the newest, followed by the log file.
+            Skips the segments rotated before the start time, and reads the rest from the offsets their time indexes bisect to, if a start time is given.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+            start_ns(Optional[int]): Start time (in nanoseconds since the epoch); Optional.
+
+        Returns:
+            Iterator[str]: Lines of the segment set, without their line feeds.
+
+        Raises:
+            FileNotFoundError:
+                If a segment or the log file is not found (e.g. it was moved to the orphanage meanwhile),
+                then skip it.
+
+        """
+
+        # For every segment of the log file:
+        for segment_entry in MonitoringLogRotator.read_manifest(log_file_path)[String.LITERAL_SEGMENTS]:
+            # If the segment was rotated before the start time; Segments of rebuilt segment manifests lack their rotation times, and are read.
+            if start_ns is not None and segment_entry.get(String.LITERAL_ROTATED_AT_NS, start_ns) < start_ns:
+                # Skip to the next segment.
+                continue
+
+            # Attempt to:
+            try:
+                # Yield the lines of the segment.
+                yield from MonitoringLogReader._iterate_segment_lines(log_file_path, segment_entry, start_ns)
+
+            # Handle: FileNotFoundError.
+            except FileNotFoundError:
+                # Skip to the next segment.
+                continue
+
+        # Attempt to:
+        try:
+            # Open the log file with the file mode read binary.
+            with open(log_file_path, String.FILE_MODE_READ_BINARY) as file:
+                # Yield the lines of the log file.
+                yield from MonitoringLogReader._iterate_file_lines(file, log_file_path, start_ns)
+
+        # Handle: FileNotFoundError.
+        except FileNotFoundError:
+            # Ignore.
+            pass
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # If the log file path is not given, or too many arguments are:
+    if not 2 <= len(sys.argv) <= 4:
+        # Print the usage message.
+        print(String.USAGE_MONITORING_LOG_READER)
+
+    # If the log file is to be queried:
+    else:
+        # For every line within the time range:
+        for line in MonitoringLogReader.iterate_lines(sys.argv[1], MonitoringLogFormat.parse_time(sys.argv[2]) if len(sys.argv) > 2 else None, MonitoringLogFormat.parse_time(sys.argv[3]) if len(sys.argv) > 3 else None):
+            # If the line is not empty:
+            if line:
+                # Print the line.
+                print(line)
\ No newline at end of file
@@ -0,0 +1,79 @@
+# Project-specific module imports.
+from _constant.string import String
+from _log.monitoring_log_format import MonitoringLogFormat
+from _miscellaneous.color import Color
+
+
+class MonitoringLogRenderer:
+    """
+
+    MonitoringLogRenderer renders the lines of the monitoring log files for the monitoring log viewer, regardless of their format (see MonitoringLogFormat).
+
+    Text entries are rendered by replacing their labels with the localized, colored ones.
+    JSON entries are parsed with a single json.loads call, and rendered from their fields with the same labels, along with the full path and the size of the target file.
+
+    """
+
+
+    @staticmethod
+    def render_line(line: str, label_dict: dict[str, str]) -> str:
+        """
+
+        Description:
+            Renders the line of a monitoring log file for display.
+
+        Args:
+            line(str): Line of the monitoring log file, without its line feed.
+            label_dict(dict[str, str]): Localized, colored labels, keyed by the labels of text entries ("TARGET: ", "ACCESSED_AT: ", "MODIFIED_AT: ", "POTENTIALLY_BY: ", "FILE_SIZE: ").
+
+        Returns:
+            str: Rendered line.
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of string literals.
+        ACCESSED_AT = String.LITERAL_ACCESSED_AT
+        DELIMITER = String.DELIMITER_MONITORING_LOG_FILE
+        FILE_SIZE = String.LITERAL_FILE_SIZE
+        MODIFIED_AT = String.LITERAL_MODIFIED_AT
+        POTENTIALLY_BY = String.LITERAL_POTENTIALLY_BY
+        SIZE = String.LITERAL_SIZE
+        TARGET = String.LITERAL_TARGET
+
+        # If the line is a JSON entry:
+        if line.startswith('{'):
+            # Assign the record of the event.
+            record = MonitoringLogFormat.parse_entry(line)
+
+            # If the record is parsed:
+            if record is not None:
+                # Assign the label of the event type.
+                event_label = label_dict[MODIFIED_AT] if record.get(String.LITERAL_EVENT) == String.MONITORING_LOG_EVENT_MODIFIED else label_dict[ACCESSED_AT]
+
+                # Assign the rendered line.
+                rendered_line = label_dict[TARGET] + str(record.get(String.LITERAL_TARGET_PATH)) + DELIMITER + event_label + MonitoringLogFormat.format_time(record[String.LITERAL_TIMESTAMP_NS]) + DELIMITER + label_dict[POTENTIALLY_BY] + '[' + ', '.join(record.get(String.LITERAL_USERS) or []) + ']'
+
+                # If the size of the target file is known:
+                if record.get(SIZE) is not None:
+                    # Append the size of the target file.
+                    rendered_line += DELIMITER + label_dict[FILE_SIZE] + str(record[SIZE])
+
+                # Return the rendered line.
+                return rendered_line + Color.ENC
+
+        # For every label and its replacement:
+        for label, replacement in label_dict.items():
+            # Replace the label with its replacement.
+            line = line.replace(label, replacement)
+
+        # Return the rendered line.
+        return line
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,804 @@
+# Standard library imports.
+import json
+import os
+import queue
+import threading
+import time
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _jsonx.properties_json_handler import PropertiesJsonHandler
+from _log.monitoring_log_index import MonitoringLogIndex
+from _path.path_utils import PathUtils
+from _storage.compression_codec import CompressionCodec
+
+
+class MonitoringLogRotator:
+    """
+
+    MonitoringLogRotator rotates the monitoring log files, so that they do not grow forever.
+
+    Once the log writer has written to a log file, the log file is rotated if it exceeds the maximum size, or its oldest entry exceeds the maximum age:
+        The log file is renamed to a segment, named after it and suffixed with its sequence number (e.g. "file.txt_abc.log.3"); Writing goes on in a new, empty log file.
+        The segment is recorded within the segment manifest of the log file ("file.txt_abc.log.manifest.json"), from the oldest to the newest.
+        The segment is compressed by a background thread (e.g. "file.txt_abc.log.3.zlib"), so that the monitoring service is not held up by it.
+        The time index of the log file (see MonitoringLogIndex) is renamed along with it, and deleted once the segment is compressed; Compressed segments are streamed instead.
+    A log file, its segments, their time indexes and its segment manifest make up the segment set of the log file, which is moved to the orphanage as a whole.
+    Segment manifests that are missing are rebuilt from the segments found next to their log files.
+
+    The rotation is set by the "MONITORING_LOG_ROTATION" attribute of the properties json file, whose settings default to:
+        "MAX_SIZE": 16777216 (in bytes; 0 disables the size-based rotation).
+        "MAX_AGE": 0 (in seconds; 0 disables the time-based rotation).
+        "COMPRESSION": "ZLIB" ("NONE", "ZLIB", "LZMA" or "BZ2").
+        "COMPRESSION_LEVEL": 6 (0-9).
+
+    """
+
+    # Variable for the storage of the number of compressed segments.
+    _compressed_count: int = 0
+
+    # Variable for the storage of the creation times of the log files (in nanoseconds since the epoch), keyed by their paths.
+    _created_at_ns_dict: dict[str, int] = {}
+
+    # Variable for the storage of the lock guarding the pending segments and the counters.
+    _lock: threading.Lock = threading.Lock()
+
+    # Variable for the storage of the paths of the segments whose compressions are queued.
+    _pending_path_set: set[str] = set()
+
+    # Variable for the storage of the queue of the compressions.
+    _queue: queue.Queue = queue.Queue()
+
+    # Variable for the storage of the number of rotated log files.
+    _rotated_count: int = 0
+
+    # Variable for the storage of the compression thread; Started along with the first compression.
+    _thread: threading.Thread = None
+
+
+    @staticmethod
+    def forget(log_file_path: str) -> None:
+        """
+
+        Description:
+            Forgets the creation time and the indexing state of the log file specified by the log file path (e.g. once it is moved to the orphanage).
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Forget the creation time of the log file, if remembered.
+        MonitoringLogRotator._created_at_ns_dict.pop(log_file_path, None)
+
+        # Forget the indexing state of the log file.
+        MonitoringLogIndex.forget(log_file_path)
+
+
+    @staticmethod
+    def get_log_file_path(file_path: str) -> str:
+        """
+
+        Description:
+            Retrieves the path of the log file the file specified by the file path belongs to; The log file itself, one of its segments, or its segment manifest.
+
+        Args:
+            file_path(str): Path for the file within the monitoring directory.
+
+        Returns:
+            str: Path for the log file; The file path itself, if it does not belong to a log file.
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of the file extension of log files.
+        MONITORING_LOG_FILE_EXTENSION = String.MONITORING_LOG_FILE_EXTENSION
+
+        # Assign the directory path and the name of the file.
+        directory_path, filename = os.path.split(file_path)
+
+        # Assign the position of the last file extension of log files within the name.
+        index = filename.rfind(MONITORING_LOG_FILE_EXTENSION)
+
+        # While the file extension of log files is found within the name:
+        while index >= 0:
+            # Assign the end of the file extension.
+            end = index + len(MONITORING_LOG_FILE_EXTENSION)
+
+            # If the file extension ends the name, or is followed by a suffix of the segment set:
+            if end == len(filename) or filename[end] == '.':
+                # Return the path for the log file.
+                return os.path.join(directory_path, filename[:end])
+
+            # Assign the position of the preceding file extension of log files within the name.
+            index = filename.rfind(MONITORING_LOG_FILE_EXTENSION, 0, index)
+
+        # Return the file path itself.
+        return file_path
+
+
+    @staticmethod
+    def get_manifest_file_path(log_file_path: str) -> str:
+        """
+
+        Description:
+            Retrieves the path of the segment manifest of the log file specified by the log file path.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+
+        Returns:
+            str: Path for the segment manifest.
+
+        Raises:
+            None
+
+        """
+
+        # Return the path for the segment manifest.
+        return log_file_path + String.MONITORING_LOG_MANIFEST_FILE_EXTENSION
+
+
+    @staticmethod
+    def get_metrics() -> dict:
+        """
+
+        Description:
+            Retrieves the metrics of the log rotator.
+
+        Args:
+            None
+
+        Returns:
+            dict: Numbers of rotated log files and of compressed segments, and number of queued compressions.
+
+        Raises:
+            None
+
+        """
+
+        # With the lock acquired:
+        with MonitoringLogRotator._lock:
+            # Return the metrics.
+            return {
+                    String.LITERAL_MONITORING_LOG_ROTATED_COUNT : MonitoringLogRotator._rotated_count,
+                    String.LITERAL_MONITORING_LOG_COMPRESSED_COUNT : MonitoringLogRotator._compressed_count,
+                    String.LITERAL_MONITORING_LOG_COMPRESSION_QUEUE_DEPTH : len(MonitoringLogRotator._pending_path_set)
+                }
+
+
+    @staticmethod
+    def get_policy() -> dict:
+        """
+
+        Description:
+            Merges the rotation settings from the properties json file into the default policy.
+
+        Args:
+            None
+
+        Returns:
+            dict: Rotation policy; Maximum size (in bytes), maximum age (in seconds), compression and compression level of the segments.
+
+        Raises:
+            None
+
+        """
+
+        # Create the dictionary for the default policy.
+        policy_dict = {
+                String.LITERAL_MAX_SIZE : Integer.MONITORING_LOG_DEFAULT_MAX_SIZE,
+                String.LITERAL_MAX_AGE : Integer.MONITORING_LOG_DEFAULT_MAX_AGE,
+                String.LITERAL_COMPRESSION : String.MONITORING_LOG_DEFAULT_COMPRESSION,
+                String.LITERAL_COMPRESSION_LEVEL : Integer.MONITORING_LOG_DEFAULT_COMPRESSION_LEVEL
+            }
+
+        # Override the default policy with the rotation settings, if any.
+        policy_dict.update(PropertiesJsonHandler.get_monitoring_log_rotation())
+
+        # Return the rotation policy.
+        return policy_dict
+
+
+    @staticmethod
+    def get_segment_file_path(log_file_path: str, segment_entry: dict) -> str:
+        """
+
+        Description:
+            Retrieves the path of the segment of the log file specified by the log file path, as it currently exists;
+            Compressed, once the compression thread replaced the uncompressed segment.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+            segment_entry(dict): Entry of the segment within the segment manifest.
+
+        Returns:
+            str: Path for the segment.
+
+        Raises:
+            None
+
+        """
+
+        # Assign the path for the uncompressed segment.
+        segment_file_path = os.path.join(os.path.dirname(log_file_path), segment_entry[String.LITERAL_FILENAME])
+
+        # Return the path for the uncompressed segment if it exists, otherwise the path for the compressed one.
+        return segment_file_path if PathUtils.is_path_exist(segment_file_path) else segment_file_path + CompressionCodec.get_file_extension(segment_entry[String.LITERAL_COMPRESSION])
+
+
+    @staticmethod
+    def is_rotation_due(log_file_path: str, size: int, policy_dict: dict) -> bool:
+        """
+
+        Description:
+            Checks if the log file specified by the log file path exceeds the maximum size or the maximum age of the rotation policy.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+            size(int): Current size of the log file (in bytes).
+            policy_dict(dict): Rotation policy.
+
+        Returns:
+            bool: Whether the log file is to be rotated.
+
+        Raises:
+            None
+
+        """
+
+        # Assign the maximum size and the maximum age.
+        max_size = policy_dict[String.LITERAL_MAX_SIZE]
+        max_age = policy_dict[String.LITERAL_MAX_AGE]
+
+        # If the log file exceeds the maximum size:
+        if 0 < max_size <= size:
+            # Assert the rotation as due.
+            return True
+
+        # If the time-based rotation is disabled:
+        if max_age <= 0:
+            # Assert the rotation as not due.
+            return False
+
+        # If the creation time of the log file is not remembered:
+        if log_file_path not in MonitoringLogRotator._created_at_ns_dict:
+            # Remember the creation time recorded within its segment manifest; Derived from the log file, if none is recorded.
+            MonitoringLogRotator._created_at_ns_dict[log_file_path] = MonitoringLogRotator._read_created_at_ns(log_file_path)
+
+        # Assert whether the log file exceeds the maximum age.
+        return time.time_ns() - MonitoringLogRotator._created_at_ns_dict[log_file_path] >= max_age * Integer.NANOSECONDS_PER_SECOND
+
+
+    @staticmethod
+    def move_segment_set(log_file_path: str, directory_path: str) -> None:
+        """
+
+        Description:
+            Moves the segment set of the log file specified by the log file path to the directory specified by the directory path;
+            The log file first, then its segments, the time indexes and its segment manifest.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+            directory_path(str): Path for the directory to move the segment set to.
+
+        Returns:
+            None
+
+        Raises:
+            FileNotFoundError:
+                If the log file is not found,
+                then delegate handling to the caller.
+                If a segment, a time index or the segment manifest is not found (e.g. a segment was compressed meanwhile),
+                then skip it.
+
+        """
+
+        # Move the log file.
+        PathUtils.move_file(log_file_path, directory_path)
+
+        # Forget the creation time and the indexing state of the log file.
+        MonitoringLogRotator.forget(log_file_path)
+
+        # Assign the segments of the log file.
+        segment_entry_list = MonitoringLogRotator.read_manifest(log_file_path)[String.LITERAL_SEGMENTS]
+
+        # For every segment of the log file:
+        for segment_entry in segment_entry_list:
+            # Attempt to:
+            try:
+                # Move the segment.
+                PathUtils.move_file(MonitoringLogRotator.get_segment_file_path(log_file_path, segment_entry), directory_path)
+
+            # Handle: FileNotFoundError.
+            except FileNotFoundError:
+                # Skip to the next segment.
+                continue
+
+        # For every path of the log file or an uncompressed segment, whose time index may exist:
+        for file_path in [log_file_path] + [os.path.join(os.path.dirname(log_file_path), segment_entry[String.LITERAL_FILENAME]) for segment_entry in segment_entry_list]:
+            # Attempt to:
+            try:
+                # Move the time index.
+                PathUtils.move_file(MonitoringLogIndex.get_index_file_path(file_path), directory_path)
+
+            # Handle: FileNotFoundError.
+            except FileNotFoundError:
+                # Skip to the next time index.
+                continue
+
+        # Attempt to:
+        try:
+            # Move the segment manifest.
+            PathUtils.move_file(MonitoringLogRotator.get_manifest_file_path(log_file_path), directory_path)
+
+        # Handle: FileNotFoundError.
+        except FileNotFoundError:
+            # Ignore.
+            pass
+
+
+    @staticmethod
+    def read_manifest(log_file_path: str) -> dict:
+        """
+
+        Description:
+            Reads the segment manifest of the log file specified by the log file path.
+            Rebuilds it from the segments found next to the log file, if it is missing or unreadable.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+
+        Returns:
+            dict: Segment manifest; Creation time of the log file (in nanoseconds since the epoch), and entries of its segments, from the oldest to the newest.
+
+        Raises:
+            OSError | ValueError:
+                If the segment manifest cannot be read,
+                then rebuild it.
+
+        """
+
+        # Attempt to:
+        try:
+            # Open the segment manifest with the file mode read.
+            with open(MonitoringLogRotator.get_manifest_file_path(log_file_path), String.FILE_MODE_READ) as file:
+                # Return the segment manifest.
+                return json.load(file)
+
+        # Handle: OSError, ValueError.
+        except (OSError, ValueError):
+            # Rebuild the segment manifest.
+            return MonitoringLogRotator._rebuild_manifest(log_file_path)
+
+
+    @staticmethod
+    def rotate(log_file_path: str, policy_dict: dict) -> None:
+        """
+
+        Description:
+            Renames the log file specified by the log file path to its next segment, along with its time index, and creates a new, empty log file.
+            Records the segment within the segment manifest, and queues its compression (along with any earlier segment left uncompressed, e.g. by a restart).
+
+        Args:
+            log_file_path(str): Path for the monitoring log file; Its handle must be closed.
+            policy_dict(dict): Rotation policy.
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the log file cannot be rotated (e.g. the monitoring directory is unavailable),
+                then skip the rotation; It is retried after the next write.
+
+        """
+
+        # Constants for the storage of string literals.
+        COMPRESSION = String.LITERAL_COMPRESSION
+        CREATED_AT_NS = String.LITERAL_CREATED_AT_NS
+        FILENAME = String.LITERAL_FILENAME
+        SEGMENTS = String.LITERAL_SEGMENTS
+
+        # Assign the segment manifest.
+        manifest_dict = MonitoringLogRotator.read_manifest(log_file_path)
+
+        # Assign the compression of the segment; Unsupported compressions leave it uncompressed.
+        compression = policy_dict[COMPRESSION] if CompressionCodec.is_supported(policy_dict[COMPRESSION]) else String.BACKUP_COMPRESSION_NONE
+
+        # Assign the sequence number of the segment; Following the newest segment.
+        sequence = max((int(segment_entry[FILENAME].rsplit('.', 1)[-1]) for segment_entry in manifest_dict[SEGMENTS]), default=0) + 1
+
+        # While a segment with the sequence number exists (e.g. left out of a rebuilt segment manifest):
+        while any(PathUtils.is_path_exist(log_file_path + '.' + str(sequence) + CompressionCodec.get_file_extension(candidate)) for candidate in (String.BACKUP_COMPRESSION_NONE, compression)):
+            # Skip the sequence number.
+            sequence += 1
+
+        # Assign the path for the segment.
+        segment_file_path = log_file_path + '.' + str(sequence)
+
+        # Assign the current time (in nanoseconds since the epoch).
+        current_time_ns = time.time_ns()
+
+        # Attempt to:
+        try:
+            # Rename the log file to the segment.
+            os.replace(log_file_path, segment_file_path)
+
+            # Attempt to:
+            try:
+                # Rename the time index of the log file to the one of the segment.
+                os.replace(MonitoringLogIndex.get_index_file_path(log_file_path), MonitoringLogIndex.get_index_file_path(segment_file_path))
+
+            # Handle: FileNotFoundError.
+            except FileNotFoundError:
+                # Ignore; It is rebuilt once read.
+                pass
+
+            # Forget the indexing state of the log file, so that the first entry of the new log file is indexed.
+            MonitoringLogIndex.forget(log_file_path)
+
+            # Create the new, empty log file, so that the log file exists until it is written again.
+            open(log_file_path, String.FILE_MODE_APPEND).close()
+
+            # Record the segment within the segment manifest.
+            manifest_dict[SEGMENTS].append({
+                    FILENAME : os.path.basename(segment_file_path),
+                    COMPRESSION : compression,
+                    CREATED_AT_NS : manifest_dict.get(CREATED_AT_NS, current_time_ns),
+                    String.LITERAL_ROTATED_AT_NS : current_time_ns
+                })
+
+            # Record the creation time of the new log file.
+            manifest_dict[CREATED_AT_NS] = current_time_ns
+
+            # Write the segment manifest.
+            MonitoringLogRotator._write_manifest(log_file_path, manifest_dict)
+
+        # Handle: OSError.
+        except OSError:
+            # Skip the rotation.
+            return
+
+        # Remember the creation time of the new log file.
+        MonitoringLogRotator._created_at_ns_dict[log_file_path] = current_time_ns
+
+        # With the lock acquired:
+        with MonitoringLogRotator._lock:
+            # Account for the rotated log file.
+            MonitoringLogRotator._rotated_count += 1
+
+        # For every segment of the log file:
+        for segment_entry in manifest_dict[SEGMENTS]:
+            # Assign the path for the uncompressed segment.
+            segment_file_path = os.path.join(os.path.dirname(log_file_path), segment_entry[FILENAME])
+
+            # If the segment is to be compressed and is still uncompressed:
+            if segment_entry[COMPRESSION] != String.BACKUP_COMPRESSION_NONE and PathUtils.is_path_exist(segment_file_path):
+                # Queue the compression of the segment.
+                MonitoringLogRotator._submit(segment_file_path, segment_entry[COMPRESSION], policy_dict[String.LITERAL_COMPRESSION_LEVEL])
+
+
+    @staticmethod
+    def _compress_segment(segment_file_path: str, compression: str, compression_level: int) -> None:
+        """
+
+        Description:
+            Compresses the segment specified by the segment file path into a temporary file, which then replaces the compressed segment.
+            Deletes the uncompressed segment, so that readers switch over to the compressed one.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            segment_file_path(str): Path for the uncompressed segment.
+            compression(str): Compression (zlib, lzma or bz2).
+            compression_level(int): Compression level (0-9).
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the segment cannot be compressed (e.g. it was moved to the orphanage meanwhile),
+                then delete the temporary file and keep the segment uncompressed.
+
+        """
+
+        # Assign the path for the compressed segment.
+        compressed_file_path = segment_file_path + CompressionCodec.get_file_extension(compression)
+
+        # Assign the path for the temporary file.
+        temporary_file_path = compressed_file_path + String.MONITORING_LOG_TEMPORARY_FILE_EXTENSION
+
+        # Attempt to:
+        try:
+            # Open the segment with the file mode read binary, and the temporary file with the file mode write binary.
+            with open(segment_file_path, String.FILE_MODE_READ_BINARY) as source_file, open(temporary_file_path, String.FILE_MODE_WRITE_BINARY) as destination_file:
+                # Stream and compress the segment to the temporary file.
+                CompressionCodec.compress_stream(source_file, destination_file, compression, compression_level)
+
+            # Replace the compressed segment with the temporary file.
+            os.replace(temporary_file_path, compressed_file_path)
+
+            # Delete the uncompressed segment.
+            os.remove(segment_file_path)
+
+            # Attempt to:
+            try:
+                # Delete the time index of the uncompressed segment, as its offsets do not apply to the compressed one.
+                os.remove(MonitoringLogIndex.get_index_file_path(segment_file_path))
+
+            # Handle: FileNotFoundError.
+            except FileNotFoundError:
+                # Ignore.
+                pass
+
+            # With the lock acquired:
+            with MonitoringLogRotator._lock:
+                # Account for the compressed segment.
+                MonitoringLogRotator._compressed_count += 1
+
+        # Handle: OSError.
+        except OSError:
+            # Attempt to:
+            try:
+                # Delete the temporary file.
+                os.remove(temporary_file_path)
+
+            # Handle: OSError.
+            except OSError:
+                # Ignore.
+                pass
+
+
+    @staticmethod
+    def _read_created_at_ns(log_file_path: str) -> int:
+        """
+
+        Description:
+            Reads the creation time of the log file specified by the log file path from its segment manifest, without rebuilding it.
+            If none is recorded (e.g. the log file was never rotated), derives it from the time of its first entry, as recorded by its time index,
+            or else from its last modified time (e.g. it holds no entry yet), so that it does not restart along with the service.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+
+        Returns:
+            int: Creation time of the log file (in nanoseconds since the epoch); The current time, if the log file does not exist.
+
+        Raises:
+            OSError | ValueError:
+                If the segment manifest cannot be read (e.g. the log file was never rotated),
+                then derive the creation time from the log file.
+                If the log file cannot be read (e.g. it does not exist yet),
+                then return the current time.
+
+        """
+
+        # Attempt to:
+        try:
+            # Open the segment manifest with the file mode read.
+            with open(MonitoringLogRotator.get_manifest_file_path(log_file_path), String.FILE_MODE_READ) as file:
+                # Return the recorded creation time.
+                return json.load(file)[String.LITERAL_CREATED_AT_NS]
+
+        # Handle: OSError, ValueError, KeyError.
+        except (OSError, ValueError, KeyError):
+            # Derive the creation time from the log file below.
+            pass
+
+        # Attempt to:
+        try:
+            # Read and assign the records of the time index of the log file.
+            record_list = MonitoringLogIndex.read(log_file_path)
+
+            # Return the time of the first entry, if indexed; The last modified time of the log file otherwise.
+            return record_list[0][0] if record_list else os.stat(log_file_path).st_mtime_ns
+
+        # Handle: OSError.
+        except OSError:
+            # Return the current time.
+            return time.time_ns()
+
+
+    @staticmethod
+    def _rebuild_manifest(log_file_path: str) -> dict:
+        """
+
+        Description:
+            Rebuilds the segment manifest of the log file specified by the log file path from the segments found next to it, ordered by their sequence numbers.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+
+        Returns:
+            dict: Rebuilt segment manifest; Not written, until the log file is rotated.
+
+        Raises:
+            OSError:
+                If the monitoring directory cannot be listed,
+                then return an empty segment manifest.
+
+        """
+
+        # Assign the directory path and the name of the log file.
+        directory_path, log_filename = os.path.split(log_file_path)
+
+        # Create the dictionary mapping the file extensions of compressed segments to their compressions.
+        compression_dict = {CompressionCodec.get_file_extension(compression) : compression for compression in (String.BACKUP_COMPRESSION_NONE, String.BACKUP_COMPRESSION_ZLIB, String.BACKUP_COMPRESSION_LZMA, String.BACKUP_COMPRESSION_BZ2)}
+
+        # Variable for the storage of the found segments, keyed by their sequence numbers.
+        segment_entry_dict = {}
+
+        # Attempt to:
+        try:
+            # Assign the names of the files within the monitoring directory.
+            filename_list = os.listdir(directory_path or '.')
+
+        # Handle: OSError.
+        except OSError:
+            # Assign no names.
+            filename_list = []
+
+        # For every name:
+        for filename in filename_list:
+            # If the file is not a segment of the log file:
+            if not filename.startswith(log_filename + '.'):
+                # Skip to the next name.
+                continue
+
+            # Split the suffix of the file into the sequence number and the file extension of the compression.
+            sequence, separator, extension = filename[len(log_filename) + 1:].partition('.')
+
+            # Restore the separator of the file extension, if any.
+            extension = separator + extension
+
+            # If the file is a segment:
+            if sequence.isdigit() and extension in compression_dict:
+                # Assign the compression of the segment.
+                compression = compression_dict[extension]
+
+                # Record the segment, unless already recorded.
+                segment_entry = segment_entry_dict.setdefault(int(sequence), {String.LITERAL_FILENAME : log_filename + '.' + sequence, String.LITERAL_COMPRESSION : compression})
+
+                # If the segment is compressed:
+                if extension:
+                    # Record its compression; Its uncompressed segment, if found as well, is being compressed.
+                    segment_entry[String.LITERAL_COMPRESSION] = compression
+
+        # Return the rebuilt segment manifest.
+        return {
+                String.LITERAL_CREATED_AT_NS : MonitoringLogRotator._created_at_ns_dict[log_file_path] if log_file_path in MonitoringLogRotator._created_at_ns_dict else MonitoringLogRotator._read_created_at_ns(log_file_path),
+                String.LITERAL_SEGMENTS : [segment_entry_dict[sequence] for sequence in sorted(segment_entry_dict)]
+            }
+
+
+    @staticmethod
+    def _run() -> None:
+        """
+
+        Description:
+            Dequeues and carries out the compressions of segments, one after the other, indefinitely.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Loop indefinitely.
+        while True:
+            # Dequeue the next compression; Waits while the queue is empty.
+            segment_file_path, compression, compression_level = MonitoringLogRotator._queue.get()
+
+            # Compress the segment.
+            MonitoringLogRotator._compress_segment(segment_file_path, compression, compression_level)
+
+            # With the lock acquired:
+            with MonitoringLogRotator._lock:
+                # Forget the segment as pending.
+                MonitoringLogRotator._pending_path_set.discard(segment_file_path)
+
+
+    @staticmethod
+    def _submit(segment_file_path: str, compression: str, compression_level: int) -> None:
+        """
+
+        Description:
+            Queues the compression of the segment specified by the segment file path, unless it is already queued.
+            Starts the compression thread, unless it is already started.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            segment_file_path(str): Path for the uncompressed segment.
+            compression(str): Compression (zlib, lzma or bz2).
+            compression_level(int): Compression level (0-9).
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # With the lock acquired:
+        with MonitoringLogRotator._lock:
+            # If the compression of the segment is already queued:
+            if segment_file_path in MonitoringLogRotator._pending_path_set:
+                # Stop the submission.
+                return
+
+            # Remember the segment as pending.
+            MonitoringLogRotator._pending_path_set.add(segment_file_path)
+
+        # If the compression thread is not started:
+        if MonitoringLogRotator._thread is None:
+            # Create and start the compression thread; Daemonic, so that it ends along with the monitoring service.
+            MonitoringLogRotator._thread = threading.Thread(target=MonitoringLogRotator._run, name=String.MONITORING_LOG_COMPRESSION_THREAD_NAME, daemon=True)
+            MonitoringLogRotator._thread.start()
+
+        # Queue the compression of the segment.
+        MonitoringLogRotator._queue.put((segment_file_path, compression, compression_level))
+
+
+    @staticmethod
+    def _write_manifest(log_file_path: str, manifest_dict: dict) -> None:
+        """
+
+        Description:
+            Writes the segment manifest of the log file specified by the log file path into a temporary file, which then replaces it.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+            manifest_dict(dict): Segment manifest.
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the segment manifest cannot be written,
+                then delegate handling to the caller.
+
+        """
+
+        # Assign the path for the segment manifest.
+        manifest_file_path = MonitoringLogRotator.get_manifest_file_path(log_file_path)
+
+        # Open the temporary file with the file mode write.
+        with open(manifest_file_path + String.MONITORING_LOG_TEMPORARY_FILE_EXTENSION, String.FILE_MODE_WRITE) as file:
+            # Write the segment manifest.
+            json.dump(manifest_dict, file, indent=Integer.JSON_INDENT)
+
+        # Replace the segment manifest with the temporary file.
+        os.replace(manifest_file_path + String.MONITORING_LOG_TEMPORARY_FILE_EXTENSION, manifest_file_path)
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,381 @@
+# Standard library imports.
+import os
+
+# Standard library from imports.
+from collections import OrderedDict
+from typing import TextIO
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _log.monitoring_log_index import MonitoringLogIndex
+from _log.monitoring_log_rotator import MonitoringLogRotator
+
+
+class MonitoringLogWriter:
+    """
+
+    MonitoringLogWriter appends the entries of the monitoring service to the monitoring log files in batches,
+    instead of opening, writing, flushing and closing a log file for every single entry.
+
+    The monitoring service buffers the entries of an iteration, and flushes them once the iteration is done:
+        The buffered entries of every log file are written with a single write call.
+        Log files are written through a pool of open append handles, of which the least recently used are closed once the pool is full.
+        A pooled handle is reopened if its path no longer refers to the file it holds (e.g. the log file was moved to the orphanage).
+
+    Along with the entries, the time index of every log file is updated, so that time ranges can be read without scanning the log file (see MonitoringLogIndex).
+    Once written, log files that exceed the maximum size or age are rotated (see MonitoringLogRotator).
+
+    How durable the entries are once flushed is set by the "MONITORING_LOG_DURABILITY" attribute of the properties json file:
+        "NONE": Entries are handed to the handles, which write them once their buffers fill up, or once they are closed.
+        "FLUSH": Entries are written to the log files on every iteration, so that they are visible to readers and survive a crash of the service (default).
+        "FSYNC": Entries are additionally synced to the disk on every iteration, so that they survive a crash of the system.
+
+    """
+
+    # Variable for the storage of the buffered entries, keyed by the paths of their log files.
+    _entry_list_dict: dict[str, list[str]] = {}
+
+    # Variable for the storage of the number of entries that could not be written.
+    _failed_count: int = 0
+
+    # Variable for the storage of the pool of open handles, along with the identities (device and inode numbers) of their files, keyed by the paths of the log files; Least recently used first.
+    _handle_dict: OrderedDict = OrderedDict()
+
+    # Variable for the storage of the number of log files opened.
+    _open_count: int = 0
+
+    # Variable for the storage of the positions at the ends of the log files (in bytes), as written through their handles, keyed by the paths of the log files.
+    _position_dict: dict[str, int] = {}
+
+    # Variable for the storage of the times of the buffered entries (in nanoseconds since the epoch), keyed by the paths of their log files.
+    _timestamp_list_dict: dict[str, list[int]] = {}
+
+    # Variable for the storage of the number of written entries.
+    _written_count: int = 0
+
+
+    @staticmethod
+    def append(log_file_path: str, entry: str, timestamp_ns: int) -> None:
+        """
+
+        Description:
+            Buffers the entry for the log file specified by the log file path, along with its time, until the next flush.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+            entry(str): Entry to append to the monitoring log file.
+            timestamp_ns(int): Time of the entry (in nanoseconds since the epoch).
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Buffer the entry.
+        MonitoringLogWriter._entry_list_dict.setdefault(log_file_path, []).append(entry)
+
+        # Buffer the time of the entry.
+        MonitoringLogWriter._timestamp_list_dict.setdefault(log_file_path, []).append(timestamp_ns)
+
+
+    @staticmethod
+    def close(log_file_path: str = None) -> None:
+        """
+
+        Description:
+            Writes the buffered entries of the log file specified by the log file path, and closes its handle, if pooled (e.g. before the log file is moved).
+            Writes the buffered entries of every log file, and closes every pooled handle, if no log file path is given.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file; Optional.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of a string literal.
+        MONITORING_LOG_DURABILITY_FLUSH = String.MONITORING_LOG_DURABILITY_FLUSH
+
+        # Assign the paths of the log files to close.
+        log_file_path_list = list(MonitoringLogWriter._handle_dict.keys() | MonitoringLogWriter._entry_list_dict.keys()) if log_file_path is None else [log_file_path]
+
+        # For every log file path:
+        for path in log_file_path_list:
+            # If entries are buffered for the log file:
+            if path in MonitoringLogWriter._entry_list_dict:
+                # Write the buffered entries.
+                MonitoringLogWriter._write(path, MonitoringLogWriter._entry_list_dict.pop(path), MonitoringLogWriter._timestamp_list_dict.pop(path), MONITORING_LOG_DURABILITY_FLUSH)
+
+            # Close the handle of the log file, if pooled.
+            MonitoringLogWriter._close_handle(path)
+
+
+    @staticmethod
+    def flush(durability: str, rotation_policy_dict: dict = None) -> None:
+        """
+
+        Description:
+            Writes the buffered entries of every log file with a single write call per log file, according to the durability policy.
+            Rotates the written log files that are due for rotation, according to the rotation policy, if given (see MonitoringLogRotator).
+
+        Args:
+            durability(str): Durability policy; "NONE", "FLUSH" or "FSYNC".
+            rotation_policy_dict(dict): Rotation policy; Optional.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # For every log file path and buffered entries:
+        for log_file_path, entry_list in MonitoringLogWriter._entry_list_dict.items():
+            # Write the buffered entries.
+            MonitoringLogWriter._write(log_file_path, entry_list, MonitoringLogWriter._timestamp_list_dict[log_file_path], durability, rotation_policy_dict)
+
+        # Discard the written entries and their times.
+        MonitoringLogWriter._entry_list_dict.clear()
+        MonitoringLogWriter._timestamp_list_dict.clear()
+
+
+    @staticmethod
+    def get_metrics() -> dict:
+        """
+
+        Description:
+            Retrieves the metrics of the log writer.
+
+        Args:
+            None
+
+        Returns:
+            dict: Number of pooled handles, number of log files opened, and numbers of written and failed entries.
+
+        Raises:
+            None
+
+        """
+
+        # Return the metrics.
+        return {
+                String.LITERAL_MONITORING_LOG_HANDLE_COUNT : len(MonitoringLogWriter._handle_dict),
+                String.LITERAL_MONITORING_LOG_OPEN_COUNT : MonitoringLogWriter._open_count,
+                String.LITERAL_MONITORING_LOG_WRITTEN_COUNT : MonitoringLogWriter._written_count,
+                String.LITERAL_MONITORING_LOG_FAILED_COUNT : MonitoringLogWriter._failed_count
+            }
+
+
+    @staticmethod
+    def _close_handle(log_file_path: str) -> None:
+        """
+
+        Description:
+            Removes the handle of the log file specified by the log file path from the pool and closes it, if pooled.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the handle cannot be closed (e.g. its remaining buffer cannot be written),
+                then ignore it, as the handle is discarded anyway.
+
+        """
+
+        # Remove the handle from the pool; Assign it along with the identity of its file.
+        file, _ = MonitoringLogWriter._handle_dict.pop(log_file_path, (None, None))
+
+        # Forget the position of the log file.
+        MonitoringLogWriter._position_dict.pop(log_file_path, None)
+
+        # If the handle was not pooled:
+        if file is None:
+            # Stop the closing.
+            return
+
+        # Attempt to:
+        try:
+            # Close the handle.
+            file.close()
+
+        # Handle: OSError.
+        except OSError:
+            # Ignore.
+            pass
+
+
+    @staticmethod
+    def _get_handle(log_file_path: str) -> TextIO:
+        """
+
+        Description:
+            Retrieves the pooled handle of the log file specified by the log file path, and marks it as the most recently used.
+            Reopens it if the path no longer refers to the file it holds; Opens it with the file mode append if it is not pooled,
+            closing the least recently used handles once the pool is full.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+
+        Returns:
+            TextIO: Handle of the log file.
+
+        Raises:
+            FileNotFoundError:
+                If the path no longer refers to a file,
+                then reopen the handle, which creates the log file anew.
+            OSError:
+                If the log file cannot be opened,
+                then delegate handling to the caller.
+
+        """
+
+        # If the handle of the log file is pooled:
+        if log_file_path in MonitoringLogWriter._handle_dict:
+            # Assign the handle along with the identity of its file.
+            file, identity = MonitoringLogWriter._handle_dict[log_file_path]
+
+            # Attempt to:
+            try:
+                # Assign the stat result of the path.
+                stat_result = os.stat(log_file_path)
+
+                # If the path still refers to the file of the handle:
+                if (stat_result.st_dev, stat_result.st_ino) == identity:
+                    # Mark the handle as the most recently used.
+                    MonitoringLogWriter._handle_dict.move_to_end(log_file_path)
+
+                    # Return the handle.
+                    return file
+
+            # Handle: FileNotFoundError.
+            except FileNotFoundError:
+                # Reopen the handle below.
+                pass
+
+            # Close the outdated handle.
+            MonitoringLogWriter._close_handle(log_file_path)
+
+        # Open the log file with the file mode append.
+        file = open(log_file_path, String.FILE_MODE_APPEND)
+
+        # Account for the opened log file.
+        MonitoringLogWriter._open_count += 1
+
+        # Assign the stat result of the opened file.
+        stat_result = os.fstat(file.fileno())
+
+        # Pool the handle along with the identity of its file.
+        MonitoringLogWriter._handle_dict[log_file_path] = (file, (stat_result.st_dev, stat_result.st_ino))
+
+        # Seed the position of the log file with its size, as the handle appends to its end.
+        MonitoringLogWriter._position_dict[log_file_path] = stat_result.st_size
+
+        # While the pool is overfull:
+        while len(MonitoringLogWriter._handle_dict) > Integer.MONITORING_LOG_HANDLE_POOL_SIZE:
+            # Close the least recently used handle.
+            MonitoringLogWriter._close_handle(next(iter(MonitoringLogWriter._handle_dict)))
+
+        # Return the handle.
+        return file
+
+
+    @staticmethod
+    def _write(log_file_path: str, entry_list: list[str], timestamp_list: list[int], durability: str, rotation_policy_dict: dict = None) -> None:
+        """
+
+        Description:
+            Writes the entries to the log file specified by the log file path with a single write call, through its pooled handle.
+            Flushes the handle, and syncs the log file to the disk, as the durability policy requires.
+            Updates the time index of the log file with the entries due for indexing.
+            Closes the handle and rotates the log file, if it is due for rotation according to the rotation policy, if given.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            log_file_path(str): Path for the monitoring log file.
+            entry_list(list[str]): Entries to write.
+            timestamp_list(list[int]): Times of the entries (in nanoseconds since the epoch).
+            durability(str): Durability policy; "NONE", "FLUSH" or "FSYNC".
+            rotation_policy_dict(dict): Rotation policy; Optional.
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the entries cannot be written (e.g. the monitoring directory is unavailable),
+                then count them as failed and discard the handle, so that the log file is reopened next time.
+
+        """
+
+        # Attempt to:
+        try:
+            # Assign the handle of the log file.
+            file = MonitoringLogWriter._get_handle(log_file_path)
+
+            # Join the entries, so that they are written at once.
+            text = ''.join(entry_list)
+
+            # Assign the offset the entries are written at; Tracked, as telling the position of the handle would flush its buffer.
+            offset = MonitoringLogWriter._position_dict[log_file_path]
+
+            # Write the entries at once.
+            file.write(text)
+
+            # Advance the position of the log file by the length of the encoded entries, whose line endings are translated to those of the platform.
+            MonitoringLogWriter._position_dict[log_file_path] = offset + len(text.encode(file.encoding)) + text.count('\n') * (len(os.linesep) - 1)
+
+            # If the durability policy requires the entries to be written to the log file:
+            if durability != String.MONITORING_LOG_DURABILITY_NONE:
+                # Flush the buffer of the handle.
+                file.flush()
+
+            # If the durability policy requires the entries to be synced to the disk:
+            if durability == String.MONITORING_LOG_DURABILITY_FSYNC:
+                # Sync the log file to the disk.
+                os.fsync(file.fileno())
+
+            # Account for the written entries.
+            MonitoringLogWriter._written_count += len(entry_list)
+
+            # Update the time index of the log file.
+            MonitoringLogIndex.update(log_file_path, offset, entry_list, timestamp_list)
+
+            # If the rotation policy is given and the log file is due for rotation:
+            if rotation_policy_dict is not None and MonitoringLogRotator.is_rotation_due(log_file_path, MonitoringLogWriter._position_dict[log_file_path], rotation_policy_dict):
+                # Close the handle, which writes its remaining buffer, so that the log file is complete once rotated.
+                MonitoringLogWriter._close_handle(log_file_path)
+
+                # Rotate the log file.
+                MonitoringLogRotator.rotate(log_file_path, rotation_policy_dict)
+
+        # Handle: OSError.
+        except OSError:
+            # Count the entries as failed.
+            MonitoringLogWriter._failed_count += len(entry_list)
+
+            # Discard the handle.
+            MonitoringLogWriter._close_handle(log_file_path)
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
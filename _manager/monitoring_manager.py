@@ -1,9 +1,10 @@
 # Standard library imports.
+import itertools
 import json
 import os
 
 # Standard library from imports.
-from typing import Union
+from typing import Iterator, Union
 
 # Project-specific module imports.
 from _constant.integer import Integer
@@ -11,6 +12,8 @@ from _constant.string import String
 from _jsonx.monitoring_json_handler import MonitoringJsonHandler
 from _jsonx.properties_json_handler import PropertiesJsonHandler
 from _language.language_selector import LanguageSelector
+from _log.monitoring_log_reader import MonitoringLogReader
+from _log.monitoring_log_renderer import MonitoringLogRenderer
 from _miscellaneous.color import Color
 
 
@@ -28,6 +31,18 @@ class MonitoringManager:
     # Constant for the retrieval of screen text.
     _LOCALE: dict[str, str] = None
 
+    # Variable for the storage of the iterator over the entries of the displayed log file, from the newest to the oldest.
+    _page_iterator: Iterator[str] = None
+
+    # Variable for the storage of the entries of the displayed page, from the newest to the oldest.
+    _page_line_list: list[str] = []
+
+    # Variable for the storage of the number of the displayed page.
+    _page_number: int = 0
+
+    # Variable for the storage of the id of the target item whose log file is displayed.
+    _page_target_id: Union[int, str] = None
+
 
     @staticmethod
     def delete_monitoring_json_entry(target_id_to_delete: Union[int, str]) -> None:
@@ -243,16 +258,73 @@ class MonitoringManager:
 
 
     @staticmethod
-    def format_and_display_log_file(target_id_to_format_and_display: Union[int, str]) -> None:
+    def follow_log_file(target_id_to_follow: Union[int, str]) -> None:
+        """
+
+        Description:
+            Follows the log file of the target item (like "tail -f"); Formats and displays the entries appended to it (see MonitoringLogReader), until the user presses (Ctrl+C).
+
+        Args:
+            target_id_to_follow(Union[int, str]): Id of the target item whose log file is to be followed.
+
+        Returns:
+            None
+
+        Raises:
+            KeyboardInterrupt:
+                If the user presses (Ctrl+C),
+                then stop following the log file.
+
+        """
+
+        # Refresh the locale dictionary.
+        MonitoringManager._refresh_locale()
+
+        # Constant for the storage of a string literal based on the selected locale.
+        NOTIFY_FOLLOW_MONITORING_LOG_VIEWER_TWO = MonitoringManager._LOCALE[String.LANGUAGE_KEY_NOTIFY_FOLLOW_MONITORING_LOG_VIEWER_TWO]
+
+        # Constants for the storage of colors.
+        COLOR_ENC = Color.ENC
+        COLOR_YELLOW = Color.YELLOW
+
+        # Constant dictionary for the storage of old string literals and their replacements.
+        REMPLACEMENT_DICT = MonitoringManager._create_replacement_dict()
+
+        # Print the notification for the following of the log file.
+        print(f'\n{COLOR_YELLOW}{NOTIFY_FOLLOW_MONITORING_LOG_VIEWER_TWO}{COLOR_ENC}', end='\n\n')
+
+        # Attempt to:
+        try:
+            # For every line appended to the log file:
+            for line in MonitoringLogReader.follow(MonitoringManager._search_for_log_file_path(target_id_to_follow)):
+                # If the line is empty:
+                if not line:
+                    # Skip to the next line.
+                    continue
+
+                # Render the line, regardless of its format, and print it.
+                print(MonitoringLogRenderer.render_line(line, REMPLACEMENT_DICT), end='\n\n')
+
+        # Handle: KeyboardInterrupt.
+        except KeyboardInterrupt:
+            # Stop following the log file.
+            pass
+
+
+    @staticmethod
+    def format_and_display_log_file(target_id_to_format_and_display: Union[int, str], page_number: int = 0) -> None:
         """
         
         Description:
-            Opens the log file of the target item.
-            Formats and displays entries of the log file to the user.
-            Notifies the user if there are no monitoring log entries to display.
+            Reads a page of entries from the log file of the target item, across its rotated segments, from the newest to the oldest (see MonitoringLogReader);
+            The first page holds the newest entries, and every following page the entries preceding it.
+            The log file is read backwards, only as far as the page reaches, and the reading of a following page resumes where the previous page ended.
+            Formats and displays the entries of the page to the user, from the oldest to the newest, regardless of their format (see MonitoringLogRenderer).
+            Notifies the user if there are no monitoring log entries to display, or no older ones.
 
         Args:
             target_id_to_format_and_display(Union[int, str]): Id of the target item whose log file is to be formatted and displayed.
+            page_number(int): Number of the page to display, starting at 0 for the newest entries.
         
         Returns:
             None
@@ -265,68 +337,51 @@ class MonitoringManager:
         # Refresh the locale dictionary.
         MonitoringManager._refresh_locale()
 
-        # Constants for the storage of string literals.
-        TARGET = String.LITERAL_TARGET
-        ACCESSED_AT = String.LITERAL_ACCESSED_AT
-        MODIFIED_AT = String.LITERAL_MODIFIED_AT
-        POTENTIALLY_BY = String.LITERAL_POTENTIALLY_BY
-        FILE_MODE_READ = String.FILE_MODE_READ
+        # Constant for the storage of the number of entries per page.
+        MONITORING_LOG_VIEWER_PAGE_SIZE = Integer.MONITORING_LOG_VIEWER_PAGE_SIZE
 
         # Constants for the storage of string literals based on the selected locale.
         NOTIFY_EMPTINESS_MONITORING_LOG_VIEWER_TWO = MonitoringManager._LOCALE[String.LANGUAGE_KEY_NOTIFY_EMPTINESS_MONITORING_LOG_VIEWER_TWO]
-        __TARGET = MonitoringManager._LOCALE[String.LANGUAGE_KEY_TARGET]
-        __ACCESSED_AT = MonitoringManager._LOCALE[String.LANGUAGE_KEY_ACCESSED_AT]
-        __MODIFIED_AT = MonitoringManager._LOCALE[String.LANGUAGE_KEY_MODIFIED_AT]
-        __POTENTIALLY_BY = MonitoringManager._LOCALE[String.LANGUAGE_KEY_POTENTIALLY_BY]
+        NOTIFY_END_MONITORING_LOG_VIEWER_TWO = MonitoringManager._LOCALE[String.LANGUAGE_KEY_NOTIFY_END_MONITORING_LOG_VIEWER_TWO]
 
         # Constants for the storage of colors.
-        COLOR_GREEN = Color.GREEN
         COLOR_ENC = Color.ENC
         COLOR_YELLOW = Color.YELLOW
 
         # Constant dictionary for the storage of old string literals and their replacements.
-        REMPLACEMENT_DICT = {
-            TARGET : f'{COLOR_GREEN}{__TARGET}{COLOR_ENC}{COLOR_YELLOW}',
-            ACCESSED_AT : f'{COLOR_ENC}{COLOR_GREEN}{__ACCESSED_AT}{COLOR_ENC}{COLOR_YELLOW}',
-            MODIFIED_AT : f'{COLOR_ENC}{COLOR_GREEN}{__MODIFIED_AT}{COLOR_ENC}{COLOR_YELLOW}',
-            POTENTIALLY_BY : f'{COLOR_ENC}{COLOR_GREEN}{__POTENTIALLY_BY}{COLOR_ENC}{COLOR_YELLOW}',
-            '\n' : f'{COLOR_ENC}\n'
-        }
+        REMPLACEMENT_DICT = MonitoringManager._create_replacement_dict()
 
-        # Variable for the storage of the path of the log file to display.
-        target_log_file_path = MonitoringManager._search_for_log_file_path(target_id_to_format_and_display)
+        # If the page is not the displayed one (e.g. displayed again after invalid input), unless it is the first page, which is read anew to hold the newest entries:
+        if page_number == 0 or (target_id_to_format_and_display, page_number) != (MonitoringManager._page_target_id, MonitoringManager._page_number):
+            # If the page does not follow the displayed one:
+            if page_number == 0 or (target_id_to_format_and_display, page_number - 1) != (MonitoringManager._page_target_id, MonitoringManager._page_number):
+                # Create the iterator over the entries of the log file, from the newest to the oldest; Empty lines are left out.
+                MonitoringManager._page_iterator = filter(None, MonitoringLogReader.iterate_lines_backward(MonitoringManager._search_for_log_file_path(target_id_to_format_and_display)))
 
-        # Attempt to:
-        try:
-            # Open the target log file with file mode read.
-            with open(target_log_file_path, FILE_MODE_READ) as file:
-                # Read the content of the log file.
-                file_content = file.read()
-                
-                # If the log file is not empty:
-                if len(file_content) > 0:
-                    # For every line in the list of lines of the log file:
-                    for line in file_content.splitlines():
-                        # For every old string literal and its replacement in the replacement dictionary:
-                        for old_string, new_string in REMPLACEMENT_DICT.items():
-                            # Replace the old string with its replacement and assign it.
-                            line = line.replace(old_string, new_string)
-                        
-                        # Print the modified line.
-                        print(line, end='\n\n')
-
-                # If the log file is empty:
-                else:
-                    # Print the notification for an empty log file.
-                    print(f'\n\n{COLOR_YELLOW}{NOTIFY_EMPTINESS_MONITORING_LOG_VIEWER_TWO}{COLOR_ENC}', end='\n\n')
-
-                # Close the file.
-                file.close()
-
-        # Handle: FileNotFoundError.
-        except FileNotFoundError:
-            # Print the notification for an empty log file.
-            print(f'\n\n{COLOR_YELLOW}{NOTIFY_EMPTINESS_MONITORING_LOG_VIEWER_TWO}{COLOR_ENC}', end='\n\n')
+                # For every entry of the pages preceding the page:
+                for _ in itertools.islice(MonitoringManager._page_iterator, page_number * MONITORING_LOG_VIEWER_PAGE_SIZE):
+                    # Skip the entry.
+                    pass
+
+            # Read the entries of the page; Resumes where the preceding page ended.
+            MonitoringManager._page_line_list = list(itertools.islice(MonitoringManager._page_iterator, MONITORING_LOG_VIEWER_PAGE_SIZE))
+
+            # Remember the displayed page.
+            MonitoringManager._page_target_id = target_id_to_format_and_display
+            MonitoringManager._page_number = page_number
+
+        # If the page holds no entries:
+        if not MonitoringManager._page_line_list:
+            # Print the notification for an empty log file, or for the end of the log file.
+            print(f'\n\n{COLOR_YELLOW}{NOTIFY_EMPTINESS_MONITORING_LOG_VIEWER_TWO if page_number == 0 else NOTIFY_END_MONITORING_LOG_VIEWER_TWO}{COLOR_ENC}', end='\n\n')
+
+            # Stop the display.
+            return
+
+        # For every entry of the page, from the oldest to the newest:
+        for line in reversed(MonitoringManager._page_line_list):
+            # Render the line, regardless of its format, and print it.
+            print(MonitoringLogRenderer.render_line(line, REMPLACEMENT_DICT), end='\n\n')
 
 
     @staticmethod
@@ -377,6 +432,56 @@ class MonitoringManager:
         return [int(key) for key in MonitoringManager._get_monitored_files().keys()]
 
 
+    @staticmethod
+    def _create_replacement_dict() -> dict[str, str]:
+        """
+
+        Description:
+            Creates the dictionary of the labels of monitoring log entries and their colored replacements, based on the selected locale.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            dict[str, str]: Labels and their replacements.
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of string literals.
+        TARGET = String.LITERAL_TARGET
+        ACCESSED_AT = String.LITERAL_ACCESSED_AT
+        MODIFIED_AT = String.LITERAL_MODIFIED_AT
+        POTENTIALLY_BY = String.LITERAL_POTENTIALLY_BY
+        FILE_SIZE = String.LITERAL_FILE_SIZE
+
+        # Constants for the storage of string literals based on the selected locale.
+        __TARGET = MonitoringManager._LOCALE[String.LANGUAGE_KEY_TARGET]
+        __ACCESSED_AT = MonitoringManager._LOCALE[String.LANGUAGE_KEY_ACCESSED_AT]
+        __MODIFIED_AT = MonitoringManager._LOCALE[String.LANGUAGE_KEY_MODIFIED_AT]
+        __POTENTIALLY_BY = MonitoringManager._LOCALE[String.LANGUAGE_KEY_POTENTIALLY_BY]
+        __FILE_SIZE = MonitoringManager._LOCALE[String.LANGUAGE_KEY_FILE_SIZE]
+
+        # Constants for the storage of colors.
+        COLOR_GREEN = Color.GREEN
+        COLOR_ENC = Color.ENC
+        COLOR_YELLOW = Color.YELLOW
+
+        # Return the dictionary of old string literals and their replacements.
+        return {
+            TARGET : f'{COLOR_GREEN}{__TARGET}{COLOR_ENC}{COLOR_YELLOW}',
+            ACCESSED_AT : f'{COLOR_ENC}{COLOR_GREEN}{__ACCESSED_AT}{COLOR_ENC}{COLOR_YELLOW}',
+            MODIFIED_AT : f'{COLOR_ENC}{COLOR_GREEN}{__MODIFIED_AT}{COLOR_ENC}{COLOR_YELLOW}',
+            POTENTIALLY_BY : f'{COLOR_ENC}{COLOR_GREEN}{__POTENTIALLY_BY}{COLOR_ENC}{COLOR_YELLOW}',
+            FILE_SIZE : f'{COLOR_ENC}{COLOR_GREEN}{__FILE_SIZE}{COLOR_ENC}{COLOR_YELLOW}',
+            '\n' : f'{COLOR_ENC}\n'
+        }
+
+
     @staticmethod
     def _get_monitored_directories() -> dict:
         """
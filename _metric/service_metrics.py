@@ -0,0 +1,92 @@
+# Standard library imports.
+import json
+import os
+import time
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _timestamp.current_time_handler import CurrentTimeHandler
+
+
+class ServiceMetrics:
+    """
+
+    ServiceMetrics publishes the metrics of the services to a metrics file (.metrics.json) within their central directories,
+    so that sysadmins can see at a glance whether a service falls behind (e.g. the depth of the backup queue).
+
+    Publications are rate-limited per metrics file, as services call for them on every iteration.
+    The metrics file is replaced atomically, so that readers never see a partially written file.
+
+    """
+
+    # Variable for the storage of the monotonic times of the last publications, keyed by the metrics file paths.
+    _published_at_dict: dict[str, float] = {}
+
+
+    @staticmethod
+    def publish(directory_path: str, metrics_dict: dict, is_forced: bool = False) -> bool:
+        """
+
+        Description:
+            Checks if the metrics were published to the metrics file within the directory less than the publication interval ago.
+            Otherwise, stamps the metrics with the current time and writes them to the metrics file.
+
+        Args:
+            directory_path(str): Path for the central directory of the service.
+            metrics_dict(dict): Metrics of the service.
+            is_forced(bool): Whether the publication interval is disregarded.
+
+        Returns:
+            bool: Whether the metrics were published.
+
+        Raises:
+            OSError:
+                If the metrics file cannot be written (e.g. the central directory is unavailable),
+                then skip the publication, as metrics are informative only.
+
+        """
+
+        # Constants for the storage of string literals.
+        FILE_MODE_WRITE = String.FILE_MODE_WRITE
+
+        # Construct the path for the metrics file.
+        metrics_file_path = directory_path + os.path.sep + String.METRICS_FILENAME
+
+        # Assign the current monotonic time.
+        current_time = time.monotonic()
+
+        # If the metrics were published less than the publication interval ago:
+        if not is_forced and current_time - ServiceMetrics._published_at_dict.get(metrics_file_path, float('-inf')) < Integer.METRICS_PUBLICATION_INTERVAL:
+            # Skip the publication.
+            return False
+
+        # Construct the path for the temporary metrics file.
+        temporary_file_path = directory_path + os.path.sep + String.METRICS_TEMPORARY_FILENAME
+
+        # Attempt to:
+        try:
+            # Open the temporary metrics file with the file mode write.
+            with open(temporary_file_path, FILE_MODE_WRITE) as file:
+                # Write the metrics, stamped with the current time.
+                json.dump(dict(metrics_dict, **{String.LITERAL_UPDATED_AT : CurrentTimeHandler.get_current_time_formatted()}), file, indent=Integer.JSON_INDENT)
+
+            # Move the temporary metrics file in place.
+            os.replace(temporary_file_path, metrics_file_path)
+
+        # Handle: OSError.
+        except OSError:
+            # Skip the publication.
+            return False
+
+        # Remember the time of the publication.
+        ServiceMetrics._published_at_dict[metrics_file_path] = current_time
+
+        # Assert the metrics as published.
+        return True
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
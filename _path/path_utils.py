@@ -1,4 +1,5 @@
 # Standard library imports.
+import errno
 import os
 import shutil
 
@@ -7,9 +8,15 @@ from pathlib import Path
 from typing import Union
 
 # Project-specific module imports.
+from _constant.integer import Integer
 from _constant.string import String
 from _miscellaneous.platform_identifier import PlatformIdentifier
 
+# If the current platform is not Windows:
+if not PlatformIdentifier.is_windows():
+    # Standard library imports; Only available on POSIX platforms.
+    import fcntl
+
 
 class PathUtils:
     """
@@ -19,8 +26,21 @@ class PathUtils:
     checking of path representation, checking for emptiness, hiding, 
     and the retrieval of names.
 
+    Files are copied by a copy engine that tries the fastest method first, on platforms other than Windows:
+        Reflinks (FICLONE), which share the data blocks on copy-on-write file systems (e.g. btrfs, XFS), so that copies are instant,
+        In-kernel copies (copy_file_range, then sendfile), which spare the pulling of data through userspace buffers,
+        Userspace copies, as a fallback.
+    The fastest method that works is remembered per pair of source and target file systems, so that unsupported methods are tried only once.
+    Copies can spare the page cache (posix_fadvise), so that copying large files does not evict the working sets of other applications.
+
     """
 
+    # Constant for the storage of the error numbers denoting that a copy method is not supported by the file systems involved.
+    _UNSUPPORTED_COPY_ERROR_NUMBER_SET: frozenset[int] = frozenset({errno.EBADF, errno.EINVAL, errno.ENOSYS, errno.ENOTSUP, errno.ENOTTY, errno.EOPNOTSUPP, errno.EPERM, errno.ETXTBSY, errno.EXDEV})
+
+    # Variable for the storage of the fastest working copy methods, keyed by the device numbers of the source and target file systems.
+    _copy_method_dict: dict[tuple[int, int], str] = {}
+
 
     @staticmethod
     def copy_directory(source_directory_path: Union[str, Path], target_directory_path: Union[str, Path]) -> None:
@@ -57,26 +77,149 @@ class PathUtils:
 
 
     @staticmethod
-    def copy_file(source_file_path: Union[str, Path], target_file_path: Union[str, Path]) -> None:
+    def copy_file(source_file_path: Union[str, Path], target_file_path: Union[str, Path], is_cache_spared: bool = False, sync_interval: int = 0) -> None:
         """
         
         Description:
-            Copies the content of the source file to the target file.
+            Copies the content and the metadata (e.g. permissions, timestamps) of the source file to the target file, as shutil.copy2 does.
+            If the target file path is a directory, copies the source file into it under the same name.
+            Employs the fastest copy method known to work for the source and target file systems, detecting it upon the first copy between them.
+            A copy method that copies fewer bytes than the size of the source file (e.g. copy_file_range stopping early on procfs, FUSE or overlay file systems) is not known to work,
+            hence the copy falls back to the next copy method, rather than leaving a truncated target file.
+            If the page cache is spared (e.g. for backup copies), copies the content in chunks, and drops the chunks of both files from the page cache once copied,
+            so that the copy does not evict the working sets of other applications (see _copy_file_content).
 
         Args:
             source_file_path(Union[str, Path]): File path of the source file.
             target_file_path(Union[str, Path]): File path of the target file.
+            is_cache_spared(bool): Whether the copy spares the page cache.
+            sync_interval(int): Number of bytes after which the target file is synced to the disk, so that its chunks can be dropped from the page cache; Zero disables the syncing.
 
         Returns:
             None
 
         Raises:
-            None
+            OSError:
+                If a copy method is not supported by the file systems involved,
+                then rewind both files and fall back to the next copy method, as upon a short copy; Other errors are delegated to the caller.
                 
         """
+
+        # Constants for the storage of string literals.
+        FILE_MODE_READ_BINARY = String.FILE_MODE_READ_BINARY
+        FILE_MODE_WRITE_BINARY = String.FILE_MODE_WRITE_BINARY
+        FILE_COPY_METHOD_USERSPACE = String.FILE_COPY_METHOD_USERSPACE
+
+        # If the current platform is Windows:
+        if PlatformIdentifier.is_windows():
+            # Copy the source file to the target file path.
+            shutil.copy2(source_file_path, target_file_path)
+
+            # Stop the copying.
+            return
+
+        # If the target file path is a directory:
+        if os.path.isdir(target_file_path):
+            # Construct the path for the target file within the directory.
+            target_file_path = os.path.join(target_file_path, os.path.basename(source_file_path))
+
+        # Open the source file with the file mode read binary, and the target file with the file mode write binary.
+        with open(source_file_path, FILE_MODE_READ_BINARY) as source_file, open(target_file_path, FILE_MODE_WRITE_BINARY) as target_file:
+            # Assign the file descriptors of both files.
+            source_fd = source_file.fileno()
+            target_fd = target_file.fileno()
+
+            # If the page cache is spared:
+            if is_cache_spared:
+                # Advise the kernel that the source file is read sequentially, so that it reads ahead aggressively.
+                PathUtils.advise_file_cache(source_fd, Integer.FILE_CACHE_ADVICE_SEQUENTIAL)
+
+            # Assign the stat result of the source file.
+            source_stat_result = os.fstat(source_fd)
+
+            # Assign the key of the pair of file systems; Device numbers of the source and target file systems.
+            key = (source_stat_result.st_dev, os.fstat(target_fd).st_dev)
+
+            # Assign the copy methods available on the current platform, from the fastest to the slowest.
+            copy_method_list = PathUtils._get_copy_method_list()
+
+            # If a working copy method is known for the pair of file systems:
+            if PathUtils._copy_method_dict.get(key) in copy_method_list:
+                # Skip the faster copy methods, which are known not to work.
+                copy_method_list = copy_method_list[copy_method_list.index(PathUtils._copy_method_dict[key]):]
+
+            # For every copy method:
+            for copy_method in copy_method_list:
+                # Attempt to:
+                try:
+                    # Copy the content of the source file to the target file; Assign the number of bytes copied.
+                    copied_size = PathUtils._copy_file_content(copy_method, source_fd, target_fd, is_cache_spared, sync_interval)
+
+                # Handle: OSError.
+                except OSError as error:
+                    # If the error does not denote an unsupported copy method, or no copy method is left:
+                    if error.errno not in PathUtils._UNSUPPORTED_COPY_ERROR_NUMBER_SET or copy_method == FILE_COPY_METHOD_USERSPACE:
+                        # Delegate handling to the caller.
+                        raise
+
+                    # Assert the copy as failed.
+                    copied_size = -1
+
+                # If the whole source file is copied, or no copy method is left (e.g. the source file shrank while being copied):
+                if copied_size >= source_stat_result.st_size or copy_method == FILE_COPY_METHOD_USERSPACE:
+                    # Remember the copy method as working for the pair of file systems.
+                    PathUtils._copy_method_dict[key] = copy_method
+
+                    # Stop the trying of copy methods.
+                    break
+
+                # Rewind the source file, and discard what was copied to the target file so far.
+                os.lseek(source_fd, 0, os.SEEK_SET)
+                os.ftruncate(target_fd, 0)
+                os.lseek(target_fd, 0, os.SEEK_SET)
+
+        # Copy the metadata of the source file to the target file.
+        shutil.copystat(source_file_path, target_file_path)
+
+
+    @staticmethod
+    def advise_file_cache(fd: int, advice: int, offset: int = 0, length: int = 0) -> None:
+        """
         
-        # Copy the source file to the target file path.
-        shutil.copy2(source_file_path, target_file_path)
+        Description:
+            Advises the kernel about the use of the range of the file specified by the file descriptor (e.g. to drop its pages from the page cache), as posix_fadvise does.
+            Does nothing on platforms without posix_fadvise, as the advice is a mere optimization.
+
+        Args:
+            fd(int): File descriptor of the file.
+            advice(int): Advice (e.g. FILE_CACHE_ADVICE_DONTNEED).
+            offset(int): Offset of the range (in bytes).
+            length(int): Length of the range (in bytes); Zero extends the range to the end of the file.
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the advice is not supported by the file system,
+                then ignore.
+                
+        """
+
+        # If the current platform does not support posix_fadvise:
+        if not hasattr(os, 'posix_fadvise'):
+            # Stop the advising.
+            return
+
+        # Attempt to:
+        try:
+            # Advise the kernel about the use of the range.
+            os.posix_fadvise(fd, offset, length, advice)
+
+        # Handle: OSError.
+        except OSError:
+            # Ignore.
+            pass
 
 
     @staticmethod
@@ -325,6 +468,99 @@ class PathUtils:
         return Path(path).exists()
 
 
+    @staticmethod
+    def move_directory(source_directory_path: Union[str, Path], target_directory_path: Union[str, Path]) -> None:
+        """
+        
+        Description:
+            Moves the source directory into the target directory under the same name, as copy_directory followed by delete_directory_tree would,
+            but without rewriting the content of its files, so that moving a large directory tree takes a single rename:
+                If the target directory does not hold a directory of the same name yet, renames the source directory into it.
+                Otherwise, merges the items of the source directory into that directory, one by one, and deletes the emptied source directory.
+            Falls back to copying and deleting the items, if the source and target directories are on different file systems.
+            Does nothing if the source directory is not found (e.g. it was moved already).
+
+        Args:
+            source_directory_path(Union[str, Path]): Path for the source directory.
+            target_directory_path(Union[str, Path]): Path for the target directory.
+            
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Constant for the storage of the path for the moved directory.
+        MOVED_DIRECTORY_PATH = str(target_directory_path) + os.path.sep + Path(source_directory_path).name
+
+        # If the source directory is not found:
+        if not os.path.isdir(source_directory_path):
+            # Stop the moving, as there is nothing left to move.
+            return
+
+        # Create the directory tree for the target directory.
+        PathUtils.create_directory_tree(target_directory_path)
+
+        # If the target directory does not hold a directory of the same name yet:
+        if not os.path.isdir(MOVED_DIRECTORY_PATH):
+            # Move the source directory; Renamed if both directories are on the same file system, otherwise copied and deleted.
+            shutil.move(str(source_directory_path), MOVED_DIRECTORY_PATH, copy_function=PathUtils.copy_file)
+
+            # Stop the moving.
+            return
+
+        # For every item within the source directory; Listed upfront, as the items are moved away meanwhile:
+        for entry in list(os.scandir(source_directory_path)):
+            # If the item is a directory:
+            if entry.is_dir(follow_symlinks=False):
+                # Merge the sub directory into the moved directory.
+                PathUtils.move_directory(entry.path, MOVED_DIRECTORY_PATH)
+
+            # If the item is a file:
+            else:
+                # Move the file into the moved directory.
+                PathUtils.move_file(entry.path, MOVED_DIRECTORY_PATH)
+
+        # Delete the emptied source directory.
+        os.rmdir(source_directory_path)
+
+
+    @staticmethod
+    def move_file(source_file_path: Union[str, Path], target_directory_path: Union[str, Path]) -> None:
+        """
+        
+        Description:
+            Moves the source file into the target directory under the same name, as copy_file followed by delete_file would,
+            but without rewriting its content: Renames the source file, replacing a file of the same name.
+            Falls back to copying and deleting the source file, if the source file and the target directory are on different file systems.
+            Does nothing if the source file is not found (e.g. it was moved already).
+
+        Args:
+            source_file_path(Union[str, Path]): Path for the source file.
+            target_directory_path(Union[str, Path]): Path for the target directory.
+            
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # If the source file is not found:
+        if not os.path.lexists(source_file_path):
+            # Stop the moving, as there is nothing left to move.
+            return
+
+        # Create the directory tree for the target directory.
+        PathUtils.create_directory_tree(target_directory_path)
+
+        # Move the source file; Renamed if the source file and the target directory are on the same file system, otherwise copied and deleted.
+        shutil.move(str(source_file_path), str(target_directory_path) + os.path.sep + Path(source_file_path).name, copy_function=PathUtils.copy_file)
+
+
     @staticmethod
     def remove_trailing_slash_from_path(path: str)  -> str:
         """
@@ -364,6 +600,217 @@ class PathUtils:
             return path
 
 
+    @staticmethod
+    def sync_file_data(fd: int) -> None:
+        """
+        
+        Description:
+            Syncs the content of the file specified by the file descriptor to the disk, as fdatasync does.
+            Falls back to fsync on platforms without fdatasync (e.g. macOS, Windows), which syncs the metadata of the file as well.
+
+        Args:
+            fd(int): File descriptor of the file.
+        
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the syncing fails,
+                then delegate handling to the caller.
+                
+        """
+
+        # If the current platform supports fdatasync:
+        if hasattr(os, 'fdatasync'):
+            # Sync the content of the file to the disk.
+            os.fdatasync(fd)
+
+        # If the current platform does not support fdatasync:
+        else:
+            # Sync the content and the metadata of the file to the disk.
+            os.fsync(fd)
+
+
+    @staticmethod
+    def _copy_file_content(copy_method: str, source_fd: int, target_fd: int, is_cache_spared: bool, sync_interval: int) -> int:
+        """
+        
+        Description:
+            Copies the content of the source file to the target file, from the start of both files, employing the copy method.
+            If the page cache is spared, copies the content in smaller chunks, and once a chunk is copied:
+                Drops the chunk of the source file from the page cache.
+                Drops the chunk of the target file from the page cache; Dirty pages are only dropped once written back,
+                hence, if a sync interval is given, syncs the target file whenever the interval worth of chunks is copied, then drops them.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            copy_method(str): Copy method to employ.
+            source_fd(int): File descriptor of the source file.
+            target_fd(int): File descriptor of the target file.
+            is_cache_spared(bool): Whether the copy spares the page cache.
+            sync_interval(int): Number of bytes after which the target file is synced to the disk; Zero disables the syncing.
+        
+        Returns:
+            int: Number of bytes copied.
+
+        Raises:
+            OSError:
+                If the copy method is not supported by the file systems involved, or the copying fails,
+                then delegate handling to the caller.
+                
+        """
+
+        # Constant for the storage of the advice to drop pages from the page cache.
+        FILE_CACHE_ADVICE_DONTNEED = Integer.FILE_CACHE_ADVICE_DONTNEED
+
+        # Constant for the storage of the maximum number of bytes a single in-kernel copy system call is asked to copy; Smaller if the page cache is spared.
+        FILE_COPY_KERNEL_CHUNK_SIZE = Integer.FILE_COPY_CACHE_SPARING_CHUNK_SIZE if is_cache_spared else Integer.FILE_COPY_KERNEL_CHUNK_SIZE
+
+        # If the copy method is reflinking:
+        if copy_method == String.FILE_COPY_METHOD_REFLINK:
+            # Reflink the target file to the source file; Shares the data blocks of the source file, without reading them.
+            fcntl.ioctl(target_fd, Integer.FILE_COPY_FICLONE, source_fd)
+
+            # Return the size of the target file, which shares all of the data blocks of the source file.
+            return os.fstat(target_fd).st_size
+
+        # If the copy method is copy_file_range:
+        if copy_method == String.FILE_COPY_METHOD_COPY_FILE_RANGE:
+            # Assign the function copying a chunk within the kernel.
+            copy_chunk = lambda: os.copy_file_range(source_fd, target_fd, FILE_COPY_KERNEL_CHUNK_SIZE)
+
+        # If the copy method is sendfile:
+        elif copy_method == String.FILE_COPY_METHOD_SENDFILE:
+            # Assign the function copying a chunk within the kernel.
+            copy_chunk = lambda: os.sendfile(target_fd, source_fd, None, FILE_COPY_KERNEL_CHUNK_SIZE)
+
+        # If the copy method is the userspace copy:
+        else:
+            # Assign the function copying a chunk through userspace.
+            copy_chunk = lambda: PathUtils._copy_chunk_in_userspace(source_fd, target_fd, Integer.BACKUP_CHUNK_SIZE)
+
+        # Variable for the storage of the number of bytes copied so far.
+        copied_size = 0
+
+        # Variable for the storage of the number of bytes copied since the target file was last synced, or its chunks were last dropped.
+        pending_size = 0
+
+        # Loop until the end of the source file is reached.
+        while True:
+            # Copy the next chunk; Assign the number of bytes copied.
+            chunk_size = copy_chunk()
+
+            # If the end of the source file is reached:
+            if chunk_size <= 0:
+                # Stop the copying.
+                break
+
+            # If the page cache is spared:
+            if is_cache_spared:
+                # Drop the chunk of the source file from the page cache.
+                PathUtils.advise_file_cache(source_fd, FILE_CACHE_ADVICE_DONTNEED, copied_size, chunk_size)
+
+                # Account for the chunk as pending.
+                pending_size += chunk_size
+
+                # If the target file is not synced, or the sync interval worth of chunks is pending:
+                if sync_interval <= 0 or pending_size >= sync_interval:
+                    # If the target file is synced:
+                    if sync_interval > 0:
+                        # Sync the content of the target file to the disk, so that its pending chunks are clean.
+                        PathUtils.sync_file_data(target_fd)
+
+                    # Drop the pending chunks of the target file from the page cache.
+                    PathUtils.advise_file_cache(target_fd, FILE_CACHE_ADVICE_DONTNEED, copied_size + chunk_size - pending_size, pending_size)
+
+                    # Reset the pending chunks.
+                    pending_size = 0
+
+            # Account for the chunk as copied.
+            copied_size += chunk_size
+
+        # If chunks of a synced target file are pending:
+        if pending_size > 0:
+            # Sync the content of the target file to the disk.
+            PathUtils.sync_file_data(target_fd)
+
+            # Drop the pending chunks of the target file from the page cache.
+            PathUtils.advise_file_cache(target_fd, FILE_CACHE_ADVICE_DONTNEED, copied_size - pending_size, pending_size)
+
+        # Return the number of bytes copied.
+        return copied_size
+
+
+    @staticmethod
+    def _copy_chunk_in_userspace(source_fd: int, target_fd: int, chunk_size: int) -> int:
+        """
+        
+        Description:
+            Reads the next chunk of the source file, and writes it to the target file entirely.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            source_fd(int): File descriptor of the source file.
+            target_fd(int): File descriptor of the target file.
+            chunk_size(int): Maximum number of bytes to read.
+        
+        Returns:
+            int: Number of bytes copied; Zero once the end of the source file is reached.
+
+        Raises:
+            OSError:
+                If the copying fails,
+                then delegate handling to the caller.
+                
+        """
+
+        # Read the next chunk of the source file; Assign a view on it, so that partial writes are resumed without copying it.
+        chunk_view = memoryview(os.read(source_fd, chunk_size))
+
+        # Assign the number of bytes read.
+        chunk_size = len(chunk_view)
+
+        # While the chunk is not written entirely:
+        while chunk_view:
+            # Write the rest of the chunk to the target file.
+            chunk_view = chunk_view[os.write(target_fd, chunk_view):]
+
+        # Return the number of bytes copied.
+        return chunk_size
+
+
+    @staticmethod
+    def _get_copy_method_list() -> list[str]:
+        """
+        
+        Description:
+            Retrieves the copy methods available on the current platform, from the fastest to the slowest.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+        
+        Returns:
+            list[str]: Available copy methods; The userspace copy is always available.
+
+        Raises:
+            None
+                
+        """
+
+        # Return the available copy methods; In-kernel copies depend on the Python version and the platform.
+        return [copy_method for copy_method, is_available in (
+                (String.FILE_COPY_METHOD_REFLINK, True),
+                (String.FILE_COPY_METHOD_COPY_FILE_RANGE, hasattr(os, 'copy_file_range')),
+                (String.FILE_COPY_METHOD_SENDFILE, hasattr(os, 'sendfile')),
+                (String.FILE_COPY_METHOD_USERSPACE, True)
+            ) if is_available]
+
+
     @staticmethod
     def _is_directory_empty(directory_path: Union[str, Path]) -> bool:
         """
@@ -0,0 +1,201 @@
+# Standard library imports.
+import json
+import os
+import time
+
+# Standard library from imports.
+from pathlib import Path
+from typing import Union
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _resolver.resolved_file import ResolvedFile
+from _resolver.target_resolver import TargetResolver
+
+
+class MetadataReconciler:
+    """
+
+    MetadataReconciler enables the services to keep their metadata dictionaries alive across iterations,
+    instead of clearing and rebuilding them from scratch every iteration.
+
+    It relies on stat signatures (modification time in nanoseconds and size):
+        The json file of a service is only re-read when its signature changes.
+        A target directory is only re-walked when the signature of itself or of a walked sub directory changes, which happens whenever a file within them is created, deleted or renamed.
+    Re-walked directories are compared with their previous listing, so that the services only apply the difference (added and removed files).
+
+    Be noted, the services own the state (signatures and listings), which MetadataReconciler reads and updates on their behalf.
+    Signatures of items modified within the racy window are not remembered, as coarse timestamps could hide a subsequent modification.
+
+    """
+
+
+    @staticmethod
+    def get_signature(path: Union[str, Path]) -> tuple[int, int]:
+        """
+
+        Description:
+            Retrieves the stat signature of the item specified by the path.
+
+        Args:
+            path(Union[str, Path]): Path of the item.
+
+        Returns:
+            tuple[int, int]: Last modified time (in nanoseconds) and size of the item, or None if the item does not exist.
+
+        Raises:
+            FileNotFoundError:
+                If the item does not exist,
+                then return None.
+
+        """
+
+        # Attempt to:
+        try:
+            # Assign the stat result of the item.
+            stat_result = os.stat(path)
+
+        # Handle: FileNotFoundError.
+        except FileNotFoundError:
+            # Return no signature.
+            return None
+
+        # Return the last modified time and size of the item.
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+
+    @staticmethod
+    def is_signature_settled(signature: tuple[int, int]) -> bool:
+        """
+
+        Description:
+            Checks if the last modification time of the signature is older than the racy window.
+            Only settled signatures can be trusted to change upon the next modification.
+
+        Args:
+            signature(tuple[int, int]): Stat signature of an item.
+
+        Returns:
+            bool: Whether the signature is settled.
+
+        Raises:
+            None
+
+        """
+
+        # Assert if the last modification is older than the racy window.
+        return signature is not None and time.time_ns() - signature[0] > Integer.RECONCILER_RACY_SIGNATURE_WINDOW
+
+
+    @staticmethod
+    def read_json_if_changed(json_file_path: Union[str, Path], signature: tuple[int, int]) -> tuple[tuple[int, int], dict]:
+        """
+
+        Description:
+            Compares the current stat signature of the json file with the previous one.
+            Opens and serializes the json file only if its signature changed.
+
+        Args:
+            json_file_path(Union[str, Path]): Path of the json file.
+            signature(tuple[int, int]): Previous stat signature of the json file, or None if it must be read regardless.
+
+        Returns:
+            tuple[tuple[int, int], dict]: Signature to remember (None if not settled) and the serialized json data (None if the json file is unchanged).
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of a string literal.
+        FILE_MODE_READ = String.FILE_MODE_READ
+
+        # Assign the current signature of the json file.
+        current_signature = MetadataReconciler.get_signature(json_file_path)
+
+        # If the json file is unchanged:
+        if signature is not None and current_signature == signature:
+            # Return the previous signature without data.
+            return signature, None
+
+        # Open the json file path with the file mode read.
+        with open(json_file_path, FILE_MODE_READ) as file:
+            # Assign the json data.
+            data = json.load(file)
+            # Close the file.
+            file.close()
+
+        # If the current signature is not settled:
+        if not MetadataReconciler.is_signature_settled(current_signature):
+            # Do not remember it, so that the json file is read again next time.
+            current_signature = None
+
+        # Return the signature to remember and the json data.
+        return current_signature, data
+
+
+    @staticmethod
+    def reconcile_directory(directory_path: str,
+                            directory_signature_dict: dict[str, dict[str, tuple[int, int]]],
+                            directory_file_path_dict: dict[str, set[str]],
+                            max_depth: int,
+                            symlink_policy: str,
+                            excluded_directory_path_set: set[str]) -> tuple[list[ResolvedFile], set[str]]:
+        """
+
+        Description:
+            Compares the current stat signatures of the directory and of its walked sub directories with the previous ones.
+            If any changed, re-walks the directory tree with the target resolver and compares the files with the previous listing.
+            Updates the signature and listing dictionaries accordingly.
+
+        Args:
+            directory_path(str): Path of the target directory.
+            directory_signature_dict(dict[str, dict[str, tuple[int, int]]]): Dictionary of the previous signatures of the walked directories (None if not settled), keyed by the target directory paths.
+            directory_file_path_dict(dict[str, set[str]]): Dictionary of the previous listings (resolved file paths), keyed by the target directory paths.
+            max_depth(int): Number of sub directory levels to descend into; Negative means unlimited.
+            symlink_policy(str): Symbolic link policy of the target directory.
+            excluded_directory_path_set(set[str]): Resolved paths of the directories to skip.
+
+        Returns:
+            tuple[list[ResolvedFile], set[str]]: Records of the added files and resolved paths of the removed files, or None if the directory tree is unchanged.
+
+        Raises:
+            None
+
+        """
+
+        # Assign the previous signatures of the walked directories.
+        previous_signature_dict = directory_signature_dict.get(directory_path)
+
+        # If the directory tree is unchanged; Every walked directory still has its settled signature:
+        if previous_signature_dict is not None and all(signature is not None and MetadataReconciler.get_signature(path) == signature for path, signature in previous_signature_dict.items()):
+            # Return no difference.
+            return None
+
+        # Assign the previous listing of the directory tree.
+        previous_file_path_set = directory_file_path_dict.get(directory_path, set())
+
+        # Variable for the storage of the current signatures of the walked directories.
+        current_signature_dict = {}
+
+        # Walk the directory tree and assign the records of its files, keyed by their resolved paths.
+        record_dict = {record.path : record for record in TargetResolver.iterate_files(directory_path, max_depth, symlink_policy, excluded_directory_path_set, current_signature_dict)}
+
+        # Assign the current listing of the directory tree.
+        current_file_path_set = set(record_dict)
+
+        # Remember the current listing of the directory tree.
+        directory_file_path_dict[directory_path] = current_file_path_set
+
+        # Remember the current signatures; Unsettled ones are replaced by None, so that the directory tree is re-walked next time.
+        directory_signature_dict[directory_path] = {path : (signature if MetadataReconciler.is_signature_settled(signature) else None) for path, signature in current_signature_dict.items()}
+
+        # Return the added and removed files.
+        return [record_dict[path] for path in current_file_path_set - previous_file_path_set], previous_file_path_set - current_file_path_set
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
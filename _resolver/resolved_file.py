@@ -0,0 +1,29 @@
+# Standard library from imports.
+from typing import NamedTuple
+
+# Project-specific module imports.
+from _timestamp.stat_snapshot import StatSnapshot
+
+
+class ResolvedFile(NamedTuple):
+    """
+
+    ResolvedFile is the compact record of a file found within a target directory by the TargetResolver.
+    It carries the stat data gathered during the walk, so that the services do not query the file system for it again.
+
+    """
+
+    # Resolved path of the file.
+    path: str
+
+    # Path of the directory holding the file, relative to the target directory; Empty for files directly within it.
+    relative_directory_path: str
+
+    # Snapshot of the metadata of the file.
+    snapshot: StatSnapshot
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
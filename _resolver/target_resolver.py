@@ -0,0 +1,186 @@
+# Standard library imports.
+import os
+
+# Standard library from imports.
+from typing import Iterator
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _resolver.resolved_file import ResolvedFile
+from _timestamp.meta_time_handler import MetaTimeHandler
+
+
+class TargetResolver:
+    """
+
+    TargetResolver resolves the files within target directories for both services.
+
+    It walks target directories recursively with os.scandir, which reports the type of every entry along with its name,
+    so that only files and followed directories cost a stat call, whose data is handed over within compact records (ResolvedFile).
+    The walk is iterative, so that deep trees do not hit the recursion limit.
+
+    Targets can set within their json entries:
+        "MAX_DEPTH": Number of sub directory levels to descend into; 0 resolves the files directly within the target directory only, a negative number is unlimited.
+        "SYMLINK_POLICY": "FILES" follows symbolic links to files only, "FOLLOW" to files and directories (loops are skipped), "IGNORE" to neither.
+
+    Paths of resolved files are resolved as well, so that they match the paths the services watch and key their metadata by.
+
+    """
+
+
+    @staticmethod
+    def get_walk_settings(json_entry: dict) -> tuple[int, str]:
+        """
+
+        Description:
+            Retrieves the maximum depth and the symbolic link policy of the target, falling back to the defaults for the settings it does not set.
+
+        Args:
+            json_entry(dict): Json entry of the target.
+
+        Returns:
+            tuple[int, str]: Maximum depth and symbolic link policy of the target.
+
+        Raises:
+            None
+
+        """
+
+        # Return the settings of the target.
+        return json_entry.get(String.LITERAL_MAX_DEPTH, Integer.RESOLVER_DEFAULT_MAX_DEPTH), json_entry.get(String.LITERAL_SYMLINK_POLICY, String.RESOLVER_DEFAULT_SYMLINK_POLICY)
+
+
+    @staticmethod
+    def iterate_files(directory_path: str, max_depth: int, symlink_policy: str, excluded_directory_path_set: set[str] = frozenset(), directory_signature_dict: dict[str, tuple[int, int]] = None) -> Iterator[ResolvedFile]:
+        """
+
+        Description:
+            Walks the directory specified by the directory path, and its sub directories down to the maximum depth.
+            Yields the record of every file, according to the symbolic link policy.
+            Skips the excluded directories (e.g. the central directory of a service within a target directory), and sub directories that vanish or are inaccessible.
+
+        Args:
+            directory_path(str): Path for the target directory.
+            max_depth(int): Number of sub directory levels to descend into; Negative means unlimited.
+            symlink_policy(str): Symbolic link policy.
+            excluded_directory_path_set(set[str]): Resolved paths of the directories to skip.
+            directory_signature_dict(dict[str, tuple[int, int]]): Dictionary to fill with the stat signatures of the walked directories, keyed by their resolved paths; Optional.
+
+        Returns:
+            Iterator[ResolvedFile]: Records of the files.
+
+        Raises:
+            OSError:
+                If an entry vanishes or is inaccessible while it is resolved,
+                then skip it; Errors on the target directory itself are delegated to the caller.
+
+        """
+
+        # Constants for the storage of the symbolic link policies.
+        RESOLVER_SYMLINK_POLICY_FOLLOW = String.RESOLVER_SYMLINK_POLICY_FOLLOW
+        RESOLVER_SYMLINK_POLICY_IGNORE = String.RESOLVER_SYMLINK_POLICY_IGNORE
+
+        # Resolve the directory path, so that the paths of the entries within it are resolved as well.
+        directory_path = os.path.realpath(directory_path)
+
+        # Assign the stat result of the target directory.
+        stat_result = os.stat(directory_path)
+
+        # If the stat signatures of the walked directories are desired:
+        if directory_signature_dict is not None:
+            # Remember the stat signature of the target directory.
+            directory_signature_dict[directory_path] = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        # Variable for the storage of the identities (device and inode numbers) of the walked directories, to skip loops of followed symbolic links.
+        visited_identity_set = {(stat_result.st_dev, stat_result.st_ino)}
+
+        # Variable for the storage of the directories awaiting their walk; Path, path relative to the target directory and depth.
+        stack = [(directory_path, '', 0)]
+
+        # While directories await their walk:
+        while stack:
+            # Assign the next directory to walk.
+            current_directory_path, relative_directory_path, depth = stack.pop()
+
+            # Attempt to:
+            try:
+                # Assign the iterator over the entries of the directory.
+                iterator = os.scandir(current_directory_path)
+
+            # Handle: OSError.
+            except OSError:
+                # If the directory is the target directory:
+                if current_directory_path == directory_path:
+                    # Delegate handling to the caller.
+                    raise
+
+                # Skip the vanished or inaccessible sub directory.
+                continue
+
+            # With the iterator:
+            with iterator:
+                # For every entry within the directory:
+                for entry in iterator:
+                    # Attempt to:
+                    try:
+                        # Assign whether the entry is a symbolic link; Known from the walk, no stat call required.
+                        is_symlink = entry.is_symlink()
+
+                        # If the entry is a symbolic link to be ignored:
+                        if is_symlink and symlink_policy == RESOLVER_SYMLINK_POLICY_IGNORE:
+                            # Skip to the next entry.
+                            continue
+
+                        # If the entry is a directory to descend into:
+                        if entry.is_dir(follow_symlinks=symlink_policy == RESOLVER_SYMLINK_POLICY_FOLLOW):
+                            # If the maximum depth is reached:
+                            if 0 <= max_depth <= depth:
+                                # Skip to the next entry.
+                                continue
+
+                            # Assign the resolved path of the sub directory; Only followed symbolic links require the resolution.
+                            sub_directory_path = os.path.realpath(entry.path) if is_symlink else entry.path
+
+                            # If the sub directory is excluded:
+                            if sub_directory_path in excluded_directory_path_set:
+                                # Skip to the next entry.
+                                continue
+
+                            # Assign the stat result of the sub directory.
+                            stat_result = entry.stat()
+
+                            # If the sub directory was already walked (a loop of followed symbolic links):
+                            if (stat_result.st_dev, stat_result.st_ino) in visited_identity_set:
+                                # Skip to the next entry.
+                                continue
+
+                            # Remember the identity of the sub directory.
+                            visited_identity_set.add((stat_result.st_dev, stat_result.st_ino))
+
+                            # If the stat signatures of the walked directories are desired:
+                            if directory_signature_dict is not None:
+                                # Remember the stat signature of the sub directory; Taken before its walk, so that later changes are detected.
+                                directory_signature_dict[sub_directory_path] = (stat_result.st_mtime_ns, stat_result.st_size)
+
+                            # Queue the sub directory for its walk.
+                            stack.append((sub_directory_path, os.path.join(relative_directory_path, entry.name), depth + 1))
+
+                        # If the entry is a file:
+                        elif entry.is_file():
+                            # Assign the stat result of the file.
+                            stat_result = entry.stat()
+
+                            # Yield the record of the file; Symbolic links are resolved to the file they point to.
+                            yield ResolvedFile(os.path.realpath(entry.path) if is_symlink else entry.path, relative_directory_path, MetaTimeHandler.create_snapshot(stat_result))
+
+                    # Handle: OSError.
+                    except OSError:
+                        # Skip the vanished or inaccessible entry.
+                        continue
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,379 @@
+# Standard library imports.
+import heapq
+import time
+
+# Standard library from imports.
+from pathlib import Path
+from typing import Union
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _scheduler.poll_state import PollState
+
+
+class PollScheduler:
+    """
+
+    PollScheduler schedules the checks of the target files of a polling service, so that every file is checked at its own interval,
+    instead of every file being checked on every iteration.
+
+    Scheduled checks are kept within a heap ordered by their due times, so that the service only takes the snapshots of the files that are due.
+    Rescheduling a file leaves its previous entry within the heap, which is told apart by its sequence number and skipped once it surfaces.
+
+    The interval of every file adapts to how often it changes, within the bounds of its target:
+        A check that finds the file changed halves its interval (starting from the interval of its target, at most), down to the minimum interval.
+        Every few consecutive checks that find the file unchanged double its interval, up to the maximum interval.
+    Hot files are thus checked more often than their targets require, and files that sit still (e.g. archives) ever more rarely.
+
+    Targets can set within their json entries:
+        "INTERVAL": Interval between checks of the files of the target (in seconds); Defaults to the iteration wait time of the service.
+        "MIN_INTERVAL": Shortest interval the files of the target are checked at while they change often (in seconds).
+        "MAX_INTERVAL": Longest interval the files of the target are checked at while they do not change (in seconds).
+
+    """
+
+
+    def __init__(self, default_interval: float) -> None:
+        """
+
+        Description:
+            Creates an empty scheduler.
+
+        Args:
+            default_interval(float): Interval between checks of the files of targets that do not set it (in seconds).
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Variable for the storage of the number of checks carried out.
+        self.check_count = 0
+
+        # Variable for the storage of the interval between checks of the files of targets that do not set it (in seconds).
+        self.default_interval = default_interval
+
+        # Variable for the storage of the heap of scheduled checks; Due time, sequence number and key within the metadata dictionary.
+        self.heap = []
+
+        # Variable for the storage of the sequence number of the last scheduled check.
+        self.sequence = 0
+
+        # Variable for the storage of the polling schedules of the files, keyed by their keys within the metadata dictionary.
+        self.state_dict = {}
+
+
+    def add(self, key: Union[str, Path], json_entry: dict) -> None:
+        """
+
+        Description:
+            Schedules the file specified by the key for an immediate check, at the interval of its target.
+            Replaces the polling schedule of the file, if it is already scheduled (e.g. its target was re-added).
+
+        Args:
+            key(Union[str, Path]): Key of the file within the metadata dictionary.
+            json_entry(dict): Json entry of the target of the file.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Assign the interval and the bounds of the target.
+        base_interval, min_interval, max_interval = self.get_settings(json_entry)
+
+        # Schedule the check of the file.
+        self._schedule(key, PollState(base_interval, min_interval, max_interval, base_interval, 0, 0), time.monotonic())
+
+
+    def clear(self) -> None:
+        """
+
+        Description:
+            Discards every scheduled check (e.g. when the service becomes event-driven).
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Discard the scheduled checks and the polling schedules.
+        self.heap.clear()
+        self.state_dict.clear()
+
+
+    def get_metrics(self) -> dict:
+        """
+
+        Description:
+            Retrieves the metrics of the scheduler.
+
+        Args:
+            None
+
+        Returns:
+            dict: Number of scheduled files, number of checks carried out, and number of checks per second the current intervals amount to.
+
+        Raises:
+            None
+
+        """
+
+        # Return the metrics.
+        return {
+                String.LITERAL_POLL_SCHEDULED_COUNT : len(self.state_dict),
+                String.LITERAL_POLL_CHECK_COUNT : self.check_count,
+                String.LITERAL_POLL_CHECK_RATE : round(sum(1 / poll_state.interval for poll_state in self.state_dict.values()), 3)
+            }
+
+
+    def get_settings(self, json_entry: dict) -> tuple[float, float, float]:
+        """
+
+        Description:
+            Retrieves the interval and the bounds of the target, falling back to the defaults for the settings it does not set.
+            Widens the bounds to include the interval, so that a target set to a long interval (e.g. an archive) is not checked more often than set.
+
+        Args:
+            json_entry(dict): Json entry of the target.
+
+        Returns:
+            tuple[float, float, float]: Interval, minimum interval and maximum interval of the target (in seconds).
+
+        Raises:
+            None
+
+        """
+
+        # Assign the interval of the target.
+        base_interval = json_entry.get(String.LITERAL_INTERVAL, self.default_interval)
+
+        # Return the settings of the target.
+        return base_interval, min(json_entry.get(String.LITERAL_MIN_INTERVAL, Integer.POLL_DEFAULT_MIN_INTERVAL), base_interval), max(json_entry.get(String.LITERAL_MAX_INTERVAL, Integer.POLL_DEFAULT_MAX_INTERVAL), base_interval)
+
+
+    def get_wait_time(self, maximum_wait_time: float) -> float:
+        """
+
+        Description:
+            Calculates the time until the next scheduled check is due.
+
+        Args:
+            maximum_wait_time(float): Time to return if no check is due earlier (in seconds).
+
+        Returns:
+            float: Time to wait for before the due checks are carried out (in seconds).
+
+        Raises:
+            None
+
+        """
+
+        # If no check is scheduled:
+        if not self.heap:
+            # Return the maximum wait time.
+            return maximum_wait_time
+
+        # Return the time until the earliest check, capped by the maximum wait time; An outdated entry merely wakes the service early.
+        return max(min(self.heap[0][0] - time.monotonic(), maximum_wait_time), 0)
+
+
+    def is_check_due(self) -> bool:
+        """
+
+        Description:
+            Discards the outdated entries atop the heap, and checks if the earliest scheduled check is due.
+
+        Args:
+            None
+
+        Returns:
+            bool: Whether a check is due.
+
+        Raises:
+            None
+
+        """
+
+        # While the earliest entry is outdated:
+        while self.heap and (self.heap[0][2] not in self.state_dict or self.state_dict[self.heap[0][2]].sequence != self.heap[0][1]):
+            # Discard it.
+            heapq.heappop(self.heap)
+
+        # Return whether the earliest check is due.
+        return bool(self.heap) and self.heap[0][0] <= time.monotonic()
+
+
+    def pop_due_keys(self, metadata_dict: dict, maximum_count: int) -> list[Union[str, Path]]:
+        """
+
+        Description:
+            Removes up to the maximum count of checks that are due from the heap, earliest first, and returns the keys of their files.
+            Skips outdated entries, and forgets the files that are no longer tracked within the metadata dictionary.
+            The caller must report the outcome of the check of every returned file, so that it is rescheduled;
+            Checks left due remain within the heap, so that the caller resumes from them once it pops again (e.g. on its next tick).
+
+        Args:
+            metadata_dict(dict): Metadata dictionary of the service.
+            maximum_count(int): Maximum number of checks to remove.
+
+        Returns:
+            list[Union[str, Path]]: Keys of the files whose checks are due.
+
+        Raises:
+            None
+
+        """
+
+        # Assign the current monotonic time.
+        current_time = time.monotonic()
+
+        # Variable for the storage of the keys of the files whose checks are due.
+        due_key_list = []
+
+        # While the earliest check is due and the maximum count is not reached:
+        while self.heap and self.heap[0][0] <= current_time and len(due_key_list) < maximum_count:
+            # Remove the earliest check from the heap.
+            _, sequence, key = heapq.heappop(self.heap)
+
+            # Assign the polling schedule of the file.
+            poll_state = self.state_dict.get(key)
+
+            # If the check is outdated (the file was rescheduled or forgotten meanwhile):
+            if poll_state is None or poll_state.sequence != sequence:
+                # Skip it.
+                continue
+
+            # If the file is no longer tracked:
+            if key not in metadata_dict:
+                # Forget its polling schedule.
+                del self.state_dict[key]
+
+                # Skip it.
+                continue
+
+            # Remember the key of the file.
+            due_key_list.append(key)
+
+        # Account for the checks.
+        self.check_count += len(due_key_list)
+
+        # Return the keys of the files.
+        return due_key_list
+
+
+    def remove(self, key: Union[str, Path]) -> None:
+        """
+
+        Description:
+            Forgets the polling schedule of the file specified by the key (e.g. once it is not found), so that it is not checked again until it is added anew;
+            Its scheduled check is left within the heap as outdated, and discarded once it comes up.
+
+        Args:
+            key(Union[str, Path]): Key of the file within the metadata dictionary.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Forget the polling schedule of the file, if any.
+        self.state_dict.pop(key, None)
+
+
+    def report(self, key: Union[str, Path], is_changed: bool) -> None:
+        """
+
+        Description:
+            Adapts the interval of the file specified by the key to the outcome of its check, and schedules its next check.
+
+        Args:
+            key(Union[str, Path]): Key of the file within the metadata dictionary.
+            is_changed(bool): Whether the check found the file changed.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Assign the polling schedule of the file.
+        poll_state = self.state_dict.get(key)
+
+        # If the file is not scheduled:
+        if poll_state is None:
+            # Stop the reporting.
+            return
+
+        # If the file changed:
+        if is_changed:
+            # Halve the interval, starting from the interval of the target at most, down to the minimum interval.
+            poll_state = poll_state._replace(interval=max(min(poll_state.interval, poll_state.base_interval) / 2, poll_state.min_interval), unchanged_count=0)
+
+        # If the file was found unchanged as many consecutive times as back off requires:
+        elif poll_state.unchanged_count + 1 >= Integer.POLL_BACKOFF_CHECK_COUNT:
+            # Double the interval, up to the maximum interval.
+            poll_state = poll_state._replace(interval=min(poll_state.interval * 2, poll_state.max_interval), unchanged_count=0)
+
+        # If the file was found unchanged fewer times:
+        else:
+            # Count the unchanged check.
+            poll_state = poll_state._replace(unchanged_count=poll_state.unchanged_count + 1)
+
+        # Schedule the next check of the file.
+        self._schedule(key, poll_state, time.monotonic() + poll_state.interval)
+
+
+    def _schedule(self, key: Union[str, Path], poll_state: PollState, due_at: float) -> None:
+        """
+
+        Description:
+            Stores the polling schedule of the file specified by the key under a new sequence number, and pushes its check onto the heap.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            key(Union[str, Path]): Key of the file within the metadata dictionary.
+            poll_state(PollState): Polling schedule of the file.
+            due_at(float): Monotonic time at which the check is due.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Increment the sequence number.
+        self.sequence += 1
+
+        # Store the polling schedule of the file under the sequence number.
+        self.state_dict[key] = poll_state._replace(sequence=self.sequence)
+
+        # Push the check onto the heap; The sequence number breaks ties, so that keys are never compared.
+        heapq.heappush(self.heap, (due_at, self.sequence, key))
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,34 @@
+# Standard library from imports.
+from typing import NamedTuple
+
+
+class PollState(NamedTuple):
+    """
+
+    PollState is the record of the polling schedule of a target file within the PollScheduler.
+
+    """
+
+    # Interval set for the target (in seconds), around which the interval of the file adapts.
+    base_interval: float
+
+    # Shortest interval the file is checked at while it changes often (in seconds).
+    min_interval: float
+
+    # Longest interval the file is checked at while it does not change (in seconds).
+    max_interval: float
+
+    # Current interval between checks of the file (in seconds).
+    interval: float
+
+    # Number of consecutive checks that found the file unchanged since the interval was last adapted.
+    unchanged_count: int
+
+    # Sequence number of the scheduled check, which tells the current entry of the file within the heap from outdated ones.
+    sequence: int
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
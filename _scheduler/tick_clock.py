@@ -0,0 +1,220 @@
+# Standard library imports.
+import time
+
+# Project-specific module imports.
+from _constant.string import String
+
+
+class TickClock:
+    """
+
+    TickClock paces the iterations of a service on fixed-rate ticks of the monotonic clock, and bounds the work of every iteration by a time budget.
+
+    Ticks are due at whole multiples of the period since the clock was created, regardless of how long the work of an iteration takes,
+    so that the period of the service does not drift with the size of its targets.
+    Ticks that pass while an iteration is still working are skipped rather than caught up on, and counted.
+
+    Every iteration is granted the time budget from its start on; Work that is left once the budget is exhausted is resumed on the next tick,
+    from where it was interrupted (e.g. the heap of the poll scheduler, or the queue of the targets awaiting preparation), which is counted as an overrun.
+    The lag of the ticks (how late an iteration started after its tick was due), the overruns and the skipped ticks are exposed for the metrics of the service,
+    so that intervals and budgets can be sized from data.
+
+    """
+
+
+    def __init__(self, period: float, budget: float) -> None:
+        """
+
+        Description:
+            Creates a clock whose first tick is due immediately.
+
+        Args:
+            period(float): Time between two ticks (in seconds).
+            budget(float): Time the work of an iteration may take (in seconds).
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Variable for the storage of the time the work of an iteration may take (in seconds).
+        self.budget = budget
+
+        # Variable for the storage of the monotonic time at which the time budget of the current iteration is exhausted.
+        self.deadline = float('inf')
+
+        # Variable for the storage of how late the last tick was started after it was due (in seconds).
+        self.lag = 0.0
+
+        # Variable for the storage of the maximum lag of the ticks since the metrics were last retrieved (in seconds).
+        self.maximum_lag = 0.0
+
+        # Variable for the storage of the monotonic time at which the next tick is due.
+        self.next_tick_at = time.monotonic()
+
+        # Variable for the storage of the number of iterations whose time budget was exhausted before their work was done.
+        self.overrun_count = 0
+
+        # Variable for the storage of the time between two ticks (in seconds).
+        self.period = period
+
+        # Variable for the storage of the number of ticks skipped, as they passed while an iteration was working.
+        self.skipped_count = 0
+
+        # Variable for the storage of the number of ticks.
+        self.tick_count = 0
+
+
+    def begin_iteration(self) -> bool:
+        """
+
+        Description:
+            Grants the time budget to the iteration starting now.
+            Checks if a tick is due; If so, records its lag, skips the ticks that passed meanwhile, and schedules the next tick.
+
+        Args:
+            None
+
+        Returns:
+            bool: Whether a tick is due, so that the periodic work of the service is carried out.
+
+        Raises:
+            None
+
+        """
+
+        # Assign the current monotonic time.
+        current_time = time.monotonic()
+
+        # Grant the time budget to the iteration.
+        self.deadline = current_time + self.budget
+
+        # If no tick is due:
+        if current_time < self.next_tick_at:
+            # Assert the tick as not due.
+            return False
+
+        # Record the lag of the tick.
+        self.lag = current_time - self.next_tick_at
+        self.maximum_lag = max(self.maximum_lag, self.lag)
+
+        # Assign the number of ticks that passed meanwhile.
+        skipped_count = int(self.lag // self.period)
+
+        # Count the tick and the skipped ticks.
+        self.tick_count += 1
+        self.skipped_count += skipped_count
+
+        # Schedule the next tick, on the fixed rate.
+        self.next_tick_at += (skipped_count + 1) * self.period
+
+        # Assert the tick as due.
+        return True
+
+
+    def end_iteration(self, is_overrun: bool) -> None:
+        """
+
+        Description:
+            Counts the iteration as an overrun, if work was left once its time budget was exhausted.
+
+        Args:
+            is_overrun(bool): Whether work is left to be resumed on the next tick.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # If work is left:
+        if is_overrun:
+            # Count the overrun.
+            self.overrun_count += 1
+
+
+    def get_metrics(self) -> dict:
+        """
+
+        Description:
+            Retrieves the metrics of the clock.
+            Resets the maximum lag, so that it covers the span between two retrievals.
+
+        Args:
+            None
+
+        Returns:
+            dict: Numbers of ticks, of overruns and of skipped ticks, and the last and maximum lag of the ticks (in seconds).
+
+        Raises:
+            None
+
+        """
+
+        # Create the dictionary for the metrics.
+        metrics_dict = {
+                String.LITERAL_TICK_COUNT : self.tick_count,
+                String.LITERAL_TICK_OVERRUN_COUNT : self.overrun_count,
+                String.LITERAL_TICK_SKIPPED_COUNT : self.skipped_count,
+                String.LITERAL_TICK_LAG : round(self.lag, 3),
+                String.LITERAL_TICK_LAG_MAX : round(self.maximum_lag, 3)
+            }
+
+        # Reset the maximum lag.
+        self.maximum_lag = self.lag
+
+        # Return the metrics.
+        return metrics_dict
+
+
+    def get_wait_time(self, maximum_wait_time: float) -> float:
+        """
+
+        Description:
+            Calculates the time until the next tick is due.
+
+        Args:
+            maximum_wait_time(float): Time to return if the next tick is not due earlier (in seconds).
+
+        Returns:
+            float: Time to wait for before the next tick (in seconds).
+
+        Raises:
+            None
+
+        """
+
+        # Return the time until the next tick, capped by the maximum wait time.
+        return max(min(self.next_tick_at - time.monotonic(), maximum_wait_time), 0)
+
+
+    def is_budget_exhausted(self) -> bool:
+        """
+
+        Description:
+            Checks if the time budget of the current iteration is exhausted.
+
+        Args:
+            None
+
+        Returns:
+            bool: Whether the time budget is exhausted.
+
+        Raises:
+            None
+
+        """
+
+        # Return whether the deadline of the iteration is reached.
+        return time.monotonic() >= self.deadline
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
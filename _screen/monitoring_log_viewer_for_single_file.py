@@ -18,6 +18,7 @@ class MonitoringLogViewerForSingleFile(RootScreen):
     
     MonitoringLogViewerForSingleFile is a screen that lists all single files that are tracked by the monitoring service.
     Upon selection, It formats and displays the monitoring log entries for the target file. 
+    Entries are displayed in pages, from the newest to the oldest, and new entries can be followed as they are logged.
 
     """
 
@@ -25,6 +26,9 @@ class MonitoringLogViewerForSingleFile(RootScreen):
     # Constant for the retrieval of screen text.
     _LOCALE = None
 
+    # Variable for the storage of the page number to view.
+    page_number_to_view = 0
+
     # Variable for the storage of the target id to view.
     target_id_to_view = None
 
@@ -122,8 +126,8 @@ class MonitoringLogViewerForSingleFile(RootScreen):
             print(f'\n{COLOR_YELLOW}{DESCRIBE_MONITORING_LOG_VIEWER_FOR_SINGLE_FILE_TWO}{COLOR_END}', end='\n\n')
             print(f'{COLOR_PURPLE}{SEPARATOR}{COLOR_END}', end='')
             
-            # Format and display the log file based on the selected target id.
-            MonitoringManager.format_and_display_log_file(MonitoringLogViewerForSingleFile.target_id_to_view)
+            # Format and display the page of the log file based on the selected target id and page number.
+            MonitoringManager.format_and_display_log_file(MonitoringLogViewerForSingleFile.target_id_to_view, MonitoringLogViewerForSingleFile.page_number_to_view)
             
             # Print the bottom separator.
             print(f'{COLOR_PURPLE}{SEPARATOR}{COLOR_END}', end='')
@@ -157,8 +161,8 @@ class MonitoringLogViewerForSingleFile(RootScreen):
         
         # If phase is not equal to phase one:
         else:
-            # Assert if user input is equal to yes or no.
-            return user_input.lower() == String.LITERAL_YES or user_input.lower() == String.LITERAL_NO
+            # Assert if user input is equal to more, follow, yes or no.
+            return user_input.lower() in (String.LITERAL_MORE, String.LITERAL_FOLLOW, String.LITERAL_YES, String.LITERAL_NO)
 
 
     @staticmethod
@@ -236,15 +240,31 @@ class MonitoringLogViewerForSingleFile(RootScreen):
             else:
                 # Assign user input to the target id to view.
                 MonitoringLogViewerForSingleFile.target_id_to_view = user_input
+
+                # Reset the page number to view to the newest page.
+                MonitoringLogViewerForSingleFile.page_number_to_view = 0
         
         # If phase is not equal to phase one:
         else:
+            # If user input is equal to more:
+            if user_input.lower() == String.LITERAL_MORE:
+                # Advance the page number to view to the page of older entries.
+                MonitoringLogViewerForSingleFile.page_number_to_view += 1
+
+            # If user input is equal to follow:
+            elif user_input.lower() == String.LITERAL_FOLLOW:
+                # Follow the log file until the user presses (Ctrl+C).
+                MonitoringManager.follow_log_file(MonitoringLogViewerForSingleFile.target_id_to_view)
+
+                # Reset the page number to view to the newest page, which holds the followed entries.
+                MonitoringLogViewerForSingleFile.page_number_to_view = 0
+
             # If user input is equal to yes:
-            if user_input.lower() == String.LITERAL_YES:
+            elif user_input.lower() == String.LITERAL_YES:
                # Restart the current screen.
                MonitoringLogViewerForSingleFile.execute()
             
-            # If user input is not equal to yes:
+            # If user input is equal to no:
             else:
                 # Import the respective screen module.
                 from _screen.main_menu import MainMenu
@@ -318,8 +338,11 @@ class MonitoringLogViewerForSingleFile(RootScreen):
                         if MonitoringLogViewerForSingleFile._is_input_valid(String.LITERAL_PHASE_TWO, user_input):
                             # Process user input; for phase two.
                             MonitoringLogViewerForSingleFile._process_input(String.LITERAL_PHASE_TWO, user_input)
-                            # Break the infinite loop; for phase two.
-                            break
+
+                            # If user input navigated away from the log file (yes or no):
+                            if user_input.lower() == String.LITERAL_YES or user_input.lower() == String.LITERAL_NO:
+                                # Break the infinite loop; for phase two.
+                                break
                     
                     # Break the infinite loop; for phase one.
                     break
@@ -0,0 +1,199 @@
+# Standard library imports.
+import json
+import os
+
+# Standard library from imports.
+from pathlib import Path
+from typing import BinaryIO, Union
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+
+
+class BackupManifest:
+    """
+
+    BackupManifest provides methods for the management of backup manifests.
+
+    A backup manifest takes the place of a full copy within a backup directory (under the usual {NAME}_{TIMESTAMP}.bak name),
+    whenever a backup is not stored as a full copy, but as a reference to its content (e.g. an object of the object store).
+
+    A backup manifest consists of:
+        The magic bytes, which tell backup manifests apart from full copies,
+        The length of the json data (big-endian),
+        The json data describing how the content of the backup is stored,
+        Optionally, the payload (e.g. the compressed content of the backup).
+
+    """
+
+
+    @staticmethod
+    def is_manifest(file_path: Union[str, Path]) -> bool:
+        """
+
+        Description:
+            Checks if the file specified by the file path is a backup manifest.
+
+        Args:
+            file_path(Union[str, Path]): Path for the backup file.
+
+        Returns:
+            bool: Whether the file is a backup manifest or not.
+
+        Raises:
+            None
+
+        """
+
+        # Assert if the backup file can be read as a backup manifest.
+        return BackupManifest.read(file_path) is not None
+
+
+    @staticmethod
+    def read(file_path: Union[str, Path]) -> dict:
+        """
+
+        Description:
+            Opens the file specified by the file path.
+            Reads and serializes the json data, if the header denotes a backup manifest.
+
+        Args:
+            file_path(Union[str, Path]): Path for the backup file.
+
+        Returns:
+            dict: Json data of the backup manifest, or None if the file is not a backup manifest.
+
+        Raises:
+            None
+
+        """
+
+        # Open the backup file with the file mode read binary.
+        with open(file_path, String.FILE_MODE_READ_BINARY) as file:
+            # Return the json data of the backup manifest.
+            return BackupManifest.read_header(file)
+
+
+    @staticmethod
+    def read_header(file: BinaryIO) -> dict:
+        """
+
+        Description:
+            Reads the header of the opened file.
+            Reads and serializes the json data, if the header denotes a backup manifest.
+            Leaves the opened file positioned at the start of the payload.
+
+        Args:
+            file(BinaryIO): Backup file opened with the file mode read binary.
+
+        Returns:
+            dict: Json data of the backup manifest, or None if the file is not a backup manifest.
+
+        Raises:
+            ValueError:
+                If the json data is malformed,
+                then assert the file as not a backup manifest.
+
+        """
+
+        # Constant for the storage of the magic bytes.
+        BACKUP_MANIFEST_MAGIC = String.BACKUP_MANIFEST_MAGIC
+
+        # Constant for the storage of the size of the length field.
+        BACKUP_MANIFEST_LENGTH_SIZE = Integer.BACKUP_MANIFEST_LENGTH_SIZE
+
+        # Read the header of the backup file.
+        header = file.read(len(BACKUP_MANIFEST_MAGIC) + BACKUP_MANIFEST_LENGTH_SIZE)
+
+        # If the header does not start with the magic bytes:
+        if len(header) != len(BACKUP_MANIFEST_MAGIC) + BACKUP_MANIFEST_LENGTH_SIZE or not header.startswith(BACKUP_MANIFEST_MAGIC):
+            # Assert the file as not a backup manifest.
+            return None
+
+        # Decode the length of the json data.
+        length = int.from_bytes(header[len(BACKUP_MANIFEST_MAGIC):], 'big')
+
+        # Read the json data.
+        data = file.read(length)
+
+        # If the json data is truncated:
+        if len(data) != length:
+            # Assert the file as not a backup manifest.
+            return None
+
+        # Attempt to:
+        try:
+            # Serialize the json data.
+            manifest_dict = json.loads(data)
+
+        # Handle: ValueError.
+        except ValueError:
+            # Assert the file as not a backup manifest.
+            return None
+
+        # Return the json data if it is a dictionary.
+        return manifest_dict if isinstance(manifest_dict, dict) else None
+
+
+    @staticmethod
+    def write(file_path: Union[str, Path], manifest_dict: dict, modified_at_ns: int) -> None:
+        """
+
+        Description:
+            Writes the backup manifest, without payload, to the file specified by the file path.
+            Assigns the last modified time of the backed up file to the backup manifest, as a full copy would preserve it.
+
+        Args:
+            file_path(Union[str, Path]): Path for the backup file.
+            manifest_dict(dict): Json data describing how the content of the backup is stored.
+            modified_at_ns(int): Last modified time of the backed up file (in nanoseconds).
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Open the backup file with the file mode write binary.
+        with open(file_path, String.FILE_MODE_WRITE_BINARY) as file:
+            # Write the header of the backup manifest.
+            BackupManifest.write_header(file, manifest_dict)
+
+        # Assign the last modified time of the backed up file to the backup manifest.
+        os.utime(file_path, ns=(modified_at_ns, modified_at_ns))
+
+
+    @staticmethod
+    def write_header(file: BinaryIO, manifest_dict: dict) -> None:
+        """
+
+        Description:
+            Writes the magic bytes, the length of the json data and the json data to the opened file.
+            The payload, if any, is meant to be written right after.
+
+        Args:
+            file(BinaryIO): Backup file opened with the file mode write binary.
+            manifest_dict(dict): Json data describing how the content of the backup is stored.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Encode the json data.
+        data = json.dumps(manifest_dict).encode()
+
+        # Write the magic bytes, the length of the json data and the json data.
+        file.write(String.BACKUP_MANIFEST_MAGIC + len(data).to_bytes(Integer.BACKUP_MANIFEST_LENGTH_SIZE, 'big') + data)
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,210 @@
+# Standard library imports.
+import hashlib
+import os
+import sys
+
+# Standard library from imports.
+from pathlib import Path
+from typing import BinaryIO, Union
+
+# Project-specific module imports.
+from _constant.string import String
+from _path.path_utils import PathUtils
+from _storage.backup_manifest import BackupManifest
+from _storage.compression_codec import CompressionCodec
+from _storage.delta_chain import DeltaChain
+from _storage.object_store import ObjectStore
+
+
+class BackupRestorer:
+    """
+
+    BackupRestorer materializes backup files, regardless of how their content is stored.
+
+    A full copy is copied as is.
+    A compressed copy is decompressed from the payload of its backup manifest.
+    A deduplicated backup manifest is resolved to the object it references, which is decompressed and verified against its digest while being copied.
+    A delta is resolved to its chain, whose deltas are applied on top of the full copy ending it, and verified against its digest.
+
+    Sysadmins can restore a backup file from the project root directory with:
+        python3 -m _storage.backup_restorer {BACKUP FILE PATH} {DESTINATION FILE PATH}
+    and inspect it, by passing '-' as the destination file path to print its content.
+
+    """
+
+
+    @staticmethod
+    def restore_backup_file(backup_file_path: Union[str, Path], destination_file_path: Union[str, Path]) -> None:
+        """
+
+        Description:
+            Checks if the backup file specified by the backup file path is a backup manifest.
+            Copies the full copy as is, or writes the content described by the backup manifest to the destination file.
+            Preserves the last modified time of the backed up file.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for the backup file.
+            destination_file_path(Union[str, Path]): Path for the materialized file.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of string literals.
+        FILE_MODE_WRITE_BINARY = String.FILE_MODE_WRITE_BINARY
+        MODIFIED_AT_NS = String.LITERAL_MODIFIED_AT_NS
+
+        # Read and assign the backup manifest.
+        manifest_dict = BackupManifest.read(backup_file_path)
+
+        # If the backup file is a full copy:
+        if manifest_dict is None:
+            # Copy the full copy to the destination file.
+            PathUtils.copy_file(backup_file_path, destination_file_path)
+
+            # Stop the restoration.
+            return
+
+        # Open the destination file with the file mode write binary.
+        with open(destination_file_path, FILE_MODE_WRITE_BINARY) as destination_file:
+            # Write the content of the backup file to the destination file.
+            BackupRestorer.write_backup_content(backup_file_path, destination_file)
+
+        # Assign the last modified time of the backed up file to the destination file.
+        os.utime(destination_file_path, ns=(manifest_dict[MODIFIED_AT_NS], manifest_dict[MODIFIED_AT_NS]))
+
+
+    @staticmethod
+    def write_backup_content(backup_file_path: Union[str, Path], destination_file: BinaryIO) -> None:
+        """
+
+        Description:
+            Writes the content of the backup file specified by the backup file path to the opened destination file, transparently:
+                A full copy is streamed as is.
+                A compressed copy is streamed from the payload of its backup manifest, decompressing it.
+                A deduplicated backup is streamed from the object it references, decompressing and verifying it.
+                A delta is rebuilt from its chain, verifying it.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for the backup file.
+            destination_file(BinaryIO): Destination file opened with the file mode write binary (e.g. the standard output).
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of string literals.
+        COMPRESSION = String.LITERAL_COMPRESSION
+        STORAGE_MODE = String.LITERAL_STORAGE_MODE
+
+        # Open the backup file with the file mode read binary.
+        with open(backup_file_path, String.FILE_MODE_READ_BINARY) as backup_file:
+            # Read and assign the backup manifest; The backup file is left positioned at the start of the payload.
+            manifest_dict = BackupManifest.read_header(backup_file)
+
+            # If the backup file is a full copy:
+            if manifest_dict is None:
+                # Rewind the backup file.
+                backup_file.seek(0)
+
+                # Stream the full copy as is.
+                CompressionCodec.decompress_stream(backup_file, destination_file, String.BACKUP_COMPRESSION_NONE)
+
+            # If the content is stored within the object store:
+            elif manifest_dict[STORAGE_MODE] == String.BACKUP_STORAGE_MODE_DEDUPLICATED:
+                # Stream the referenced object.
+                BackupRestorer._write_object_content(backup_file_path, manifest_dict, destination_file)
+
+            # If the content is stored as a delta against its successor:
+            elif manifest_dict[STORAGE_MODE] == String.BACKUP_STORAGE_MODE_DELTA:
+                # Rebuild the version from its chain.
+                DeltaChain.write_content(backup_file_path, destination_file)
+
+            # If the content is stored as the payload of the backup manifest:
+            else:
+                # Stream and decompress the payload.
+                CompressionCodec.decompress_stream(backup_file, destination_file, manifest_dict.get(COMPRESSION, String.BACKUP_COMPRESSION_NONE))
+
+
+    @staticmethod
+    def _write_object_content(backup_file_path: Union[str, Path], manifest_dict: dict, destination_file: BinaryIO) -> None:
+        """
+
+        Description:
+            Locates the object store the backup manifest belongs to.
+            Streams and decompresses the referenced object to the destination file, while verifying its digest.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for the backup manifest.
+            manifest_dict(dict): Json data of the backup manifest.
+            destination_file(BinaryIO): Destination file opened with the file mode write binary.
+
+        Returns:
+            None
+
+        Raises:
+            FileNotFoundError:
+                If the object store or the object is not found,
+                then delegate handling to the caller.
+            ValueError:
+                If the digest of the object does not match the backup manifest,
+                then delegate handling to the caller.
+
+        """
+
+        # Constants for the storage of string literals.
+        ALGORITHM = String.LITERAL_ALGORITHM
+        COMPRESSION = String.LITERAL_COMPRESSION
+        DIGEST = String.LITERAL_DIGEST
+
+        # Locate the object store directory.
+        object_store_directory_path = ObjectStore.find_object_store_directory(backup_file_path)
+
+        # If no object store is found:
+        if object_store_directory_path is None:
+            # Raise the respective error.
+            raise FileNotFoundError(String.BACKUP_OBJECT_STORE_DIRNAME)
+
+        # Assign the compression of the object.
+        compression = manifest_dict.get(COMPRESSION, String.BACKUP_COMPRESSION_NONE)
+
+        # Create the hash object.
+        hash_object = hashlib.new(manifest_dict[ALGORITHM])
+
+        # Open the object with the file mode read binary.
+        with open(ObjectStore.get_object_path(object_store_directory_path, manifest_dict[DIGEST], compression), String.FILE_MODE_READ_BINARY) as object_file:
+            # Stream, decompress and hash the object to the destination file.
+            CompressionCodec.decompress_stream(object_file, destination_file, compression, hash_object)
+
+        # If the digest of the object does not match the backup manifest:
+        if hash_object.hexdigest() != manifest_dict[DIGEST]:
+            # Raise the respective error.
+            raise ValueError(String.EXCEPTION_MESSAGE_DIGEST_MISMATCH_ERROR + ' ' + manifest_dict[DIGEST])
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # If the backup file path and the destination file path are not given:
+    if len(sys.argv) != 3:
+        # Print the usage message.
+        print(String.USAGE_BACKUP_RESTORER)
+
+    # If the content of the backup file is to be inspected:
+    elif sys.argv[2] == '-':
+        # Write the content of the backup file to the standard output.
+        BackupRestorer.write_backup_content(sys.argv[1], sys.stdout.buffer)
+
+    # If the backup file is to be restored:
+    else:
+        # Restore the backup file to the destination file.
+        BackupRestorer.restore_backup_file(sys.argv[1], sys.argv[2])
\ No newline at end of file
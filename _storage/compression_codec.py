@@ -0,0 +1,391 @@
+# Standard library imports.
+import bz2
+import lzma
+import os
+import zlib
+
+# Standard library from imports.
+from pathlib import Path
+from typing import BinaryIO, Iterator, Union
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _path.path_utils import PathUtils
+
+
+class CompressionCodec:
+    """
+
+    CompressionCodec provides streaming compressors and decompressors for backup files, using nothing but the standard library.
+
+    Supported compressions are zlib, lzma and bz2, each with a compression level (0-9; bz2 starts at 1).
+    Compressors and decompressors are incremental, so that backup files are compressed while being streamed, without any temporary uncompressed file.
+
+    Additionally, it probes whether a file is worth compressing:
+        Files of already-compressed formats (archives, images, audio, video) are skipped by their extension,
+        Other files are skipped if their first chunk barely shrinks.
+
+    """
+
+
+    # Constant for the storage of the file extensions of already-compressed formats.
+    _INCOMPRESSIBLE_FILE_EXTENSION_SET: set[str] = set(String.BACKUP_INCOMPRESSIBLE_FILE_EXTENSIONS.split())
+
+
+    @staticmethod
+    def compress_stream(source_file: BinaryIO, destination_file: BinaryIO, compression: str, compression_level: int, hash_object: object = None, is_cache_spared: bool = False, sync_interval: int = 0) -> int:
+        """
+
+        Description:
+            Streams the content of the source file to the destination file chunk by chunk, compressing it on the fly.
+            Feeds the uncompressed content to the hash object, if any.
+            If the page cache is spared, once a chunk is streamed:
+                Drops the chunk of the source file from the page cache.
+                Drops the written chunk of the destination file from the page cache; Dirty pages are only dropped once written back,
+                hence, if a sync interval is given, syncs the destination file whenever the interval worth of chunks is written, then drops them.
+
+        Args:
+            source_file(BinaryIO): Source file opened with the file mode read binary, positioned at its start.
+            destination_file(BinaryIO): Destination file opened with the file mode write binary.
+            compression(str): Compression (none, zlib, lzma or bz2).
+            compression_level(int): Compression level (0-9).
+            hash_object(object): Hash object to feed the uncompressed content to.
+            is_cache_spared(bool): Whether the streaming spares the page cache.
+            sync_interval(int): Number of bytes after which the destination file is synced to the disk; Zero disables the syncing.
+
+        Returns:
+            int: Size of the uncompressed content (in bytes).
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of the advice to drop pages from the page cache.
+        FILE_CACHE_ADVICE_DONTNEED = Integer.FILE_CACHE_ADVICE_DONTNEED
+
+        # Create the compressor, unless the content is stored uncompressed.
+        compressor = None if compression == String.BACKUP_COMPRESSION_NONE else CompressionCodec.create_compressor(compression, compression_level)
+
+        # Variable for the storage of the size of the uncompressed content.
+        size = 0
+
+        # Variable for the storage of the offset of the destination file from which written chunks are pending (not dropped yet).
+        pending_offset = destination_file.tell()
+
+        # For every chunk of the source file:
+        for chunk in iter(lambda: source_file.read(Integer.BACKUP_CHUNK_SIZE), b''):
+            # If a hash object is given:
+            if hash_object is not None:
+                # Feed the chunk to the hash object.
+                hash_object.update(chunk)
+
+            # Write the (compressed) chunk to the destination file.
+            destination_file.write(chunk if compressor is None else compressor.compress(chunk))
+
+            # If the page cache is spared:
+            if is_cache_spared:
+                # Drop the chunk of the source file from the page cache.
+                PathUtils.advise_file_cache(source_file.fileno(), FILE_CACHE_ADVICE_DONTNEED, size, len(chunk))
+
+                # Assign the offset up to which the destination file is written.
+                written_offset = destination_file.tell()
+
+                # If the destination file is not synced, or the sync interval worth of chunks is pending:
+                if sync_interval <= 0 or written_offset - pending_offset >= sync_interval:
+                    # Flush the buffered chunks to the destination file.
+                    destination_file.flush()
+
+                    # If the destination file is synced:
+                    if sync_interval > 0:
+                        # Sync the content of the destination file to the disk, so that its pending chunks are clean.
+                        PathUtils.sync_file_data(destination_file.fileno())
+
+                    # Drop the pending chunks of the destination file from the page cache.
+                    PathUtils.advise_file_cache(destination_file.fileno(), FILE_CACHE_ADVICE_DONTNEED, pending_offset, written_offset - pending_offset)
+
+                    # Reset the pending chunks.
+                    pending_offset = written_offset
+
+            # Account for the size of the chunk.
+            size += len(chunk)
+
+        # If the content is compressed:
+        if compressor is not None:
+            # Write the remainder of the compressed content.
+            destination_file.write(compressor.flush())
+
+        # If the page cache is spared:
+        if is_cache_spared:
+            # Flush the buffered chunks to the destination file.
+            destination_file.flush()
+
+            # If the destination file is synced:
+            if sync_interval > 0:
+                # Sync the content of the destination file to the disk.
+                PathUtils.sync_file_data(destination_file.fileno())
+
+            # Drop the pending chunks of the destination file from the page cache.
+            PathUtils.advise_file_cache(destination_file.fileno(), FILE_CACHE_ADVICE_DONTNEED, pending_offset, 0)
+
+        # Return the size of the uncompressed content.
+        return size
+
+
+    @staticmethod
+    def create_compressor(compression: str, compression_level: int) -> object:
+        """
+
+        Description:
+            Creates an incremental compressor for the compression at the compression level.
+
+        Args:
+            compression(str): Compression (zlib, lzma or bz2).
+            compression_level(int): Compression level (0-9).
+
+        Returns:
+            object: Incremental compressor, exposing compress(data) and flush().
+
+        Raises:
+            ValueError:
+                If the compression is not supported,
+                then delegate handling to the caller.
+
+        """
+
+        # If the compression is zlib:
+        if compression == String.BACKUP_COMPRESSION_ZLIB:
+            # Return a zlib compressor.
+            return zlib.compressobj(compression_level)
+
+        # If the compression is lzma:
+        elif compression == String.BACKUP_COMPRESSION_LZMA:
+            # Return a lzma compressor.
+            return lzma.LZMACompressor(preset=compression_level)
+
+        # If the compression is bz2:
+        elif compression == String.BACKUP_COMPRESSION_BZ2:
+            # Return a bz2 compressor; Level 0 is not supported by bz2.
+            return bz2.BZ2Compressor(max(compression_level, 1))
+
+        # Raise the respective error.
+        raise ValueError(compression)
+
+
+    @staticmethod
+    def create_decompressor(compression: str) -> object:
+        """
+
+        Description:
+            Creates an incremental decompressor for the compression.
+
+        Args:
+            compression(str): Compression (zlib, lzma or bz2).
+
+        Returns:
+            object: Incremental decompressor, exposing decompress(data).
+
+        Raises:
+            ValueError:
+                If the compression is not supported,
+                then delegate handling to the caller.
+
+        """
+
+        # If the compression is zlib:
+        if compression == String.BACKUP_COMPRESSION_ZLIB:
+            # Return a zlib decompressor.
+            return zlib.decompressobj()
+
+        # If the compression is lzma:
+        elif compression == String.BACKUP_COMPRESSION_LZMA:
+            # Return a lzma decompressor.
+            return lzma.LZMADecompressor()
+
+        # If the compression is bz2:
+        elif compression == String.BACKUP_COMPRESSION_BZ2:
+            # Return a bz2 decompressor.
+            return bz2.BZ2Decompressor()
+
+        # Raise the respective error.
+        raise ValueError(compression)
+
+
+    @staticmethod
+    def decompress_stream(source_file: BinaryIO, destination_file: BinaryIO, compression: str, hash_object: object = None) -> None:
+        """
+
+        Description:
+            Streams the content of the source file to the destination file chunk by chunk, decompressing it on the fly.
+            Feeds the decompressed content to the hash object, if any.
+
+        Args:
+            source_file(BinaryIO): Source file opened with the file mode read binary (positioned at the start of the content).
+            destination_file(BinaryIO): Destination file opened with the file mode write binary.
+            compression(str): Compression (none, zlib, lzma or bz2).
+            hash_object(object): Hash object to feed the decompressed content to.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Create the decompressor, unless the content is stored uncompressed.
+        decompressor = None if compression == String.BACKUP_COMPRESSION_NONE else CompressionCodec.create_decompressor(compression)
+
+        # For every chunk of the source file:
+        for chunk in iter(lambda: source_file.read(Integer.BACKUP_CHUNK_SIZE), b''):
+            # For every decompressed chunk of the chunk (or the chunk itself if the content is stored uncompressed):
+            for decompressed_chunk in ([chunk] if decompressor is None else CompressionCodec._decompress_chunk(decompressor, chunk)):
+                # If a hash object is given:
+                if hash_object is not None:
+                    # Feed the decompressed chunk to the hash object.
+                    hash_object.update(decompressed_chunk)
+
+                # Write the decompressed chunk to the destination file.
+                destination_file.write(decompressed_chunk)
+
+
+    @staticmethod
+    def get_file_extension(compression: str) -> str:
+        """
+
+        Description:
+            Returns the file extension denoting content compressed with the compression.
+
+        Args:
+            compression(str): Compression (none, zlib, lzma or bz2).
+
+        Returns:
+            str: File extension; Empty for uncompressed content.
+
+        Raises:
+            None
+
+        """
+
+        # Return the file extension.
+        return '' if compression == String.BACKUP_COMPRESSION_NONE else '.' + compression.lower()
+
+
+    @staticmethod
+    def is_supported(compression: str) -> bool:
+        """
+
+        Description:
+            Checks if the compression is supported.
+
+        Args:
+            compression(str): Compression.
+
+        Returns:
+            bool: Whether the compression is supported or not.
+
+        Raises:
+            None
+
+        """
+
+        # Assert if the compression is one of the supported compressions.
+        return compression in (String.BACKUP_COMPRESSION_ZLIB, String.BACKUP_COMPRESSION_LZMA, String.BACKUP_COMPRESSION_BZ2)
+
+
+    @staticmethod
+    def is_worth_compressing(file_path: Union[str, Path], compression: str, compression_level: int) -> bool:
+        """
+
+        Description:
+            Checks if the file specified by the file path is of an already-compressed format, judging by its extension.
+            Otherwise, compresses the first chunk of the file and checks if it shrinks enough.
+
+        Args:
+            file_path(Union[str, Path]): Path for the file.
+            compression(str): Compression (zlib, lzma or bz2).
+            compression_level(int): Compression level (0-9).
+
+        Returns:
+            bool: Whether the file is worth compressing or not.
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of the file mode read binary.
+        FILE_MODE_READ_BINARY = String.FILE_MODE_READ_BINARY
+
+        # If the file is of an already-compressed format:
+        if os.path.splitext(str(file_path))[1].lower() in CompressionCodec._INCOMPRESSIBLE_FILE_EXTENSION_SET:
+            # Assert the file as not worth compressing.
+            return False
+
+        # Open the file with the file mode read binary.
+        with open(file_path, FILE_MODE_READ_BINARY) as file:
+            # Read the probe.
+            probe = file.read(Integer.BACKUP_COMPRESSION_PROBE_SIZE)
+
+        # If the file is empty:
+        if not probe:
+            # Assert the file as not worth compressing.
+            return False
+
+        # Create a compressor for the probe.
+        compressor = CompressionCodec.create_compressor(compression, compression_level)
+
+        # Compress the probe and assign its compressed size.
+        compressed_size = len(compressor.compress(probe)) + len(compressor.flush())
+
+        # Assert if the probe shrinks below the ratio (in percent) deemed worth it.
+        return compressed_size * 100 < len(probe) * Integer.BACKUP_COMPRESSION_WORTHWHILE_RATIO
+
+
+    @staticmethod
+    def _decompress_chunk(decompressor: object, chunk: bytes) -> Iterator[bytes]:
+        """
+
+        Description:
+            Decompresses the chunk in pieces of bounded size, so that highly compressed content does not inflate into memory at once.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            decompressor(object): Incremental decompressor.
+            chunk(bytes): Chunk of compressed content.
+
+        Returns:
+            Iterator[bytes]: Decompressed pieces of the chunk.
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of the maximum size of a decompressed piece.
+        BACKUP_CHUNK_SIZE = Integer.BACKUP_CHUNK_SIZE
+
+        # Decompress and yield the first piece.
+        yield decompressor.decompress(chunk, BACKUP_CHUNK_SIZE)
+
+        # If the decompressor is a zlib decompressor:
+        if hasattr(decompressor, 'unconsumed_tail'):
+            # While compressed content is left over:
+            while decompressor.unconsumed_tail:
+                # Decompress and yield the next piece.
+                yield decompressor.decompress(decompressor.unconsumed_tail, BACKUP_CHUNK_SIZE)
+
+        # If the decompressor is a lzma or bz2 decompressor:
+        else:
+            # While decompressed content is buffered:
+            while not decompressor.eof and not decompressor.needs_input:
+                # Decompress and yield the next piece.
+                yield decompressor.decompress(b'', BACKUP_CHUNK_SIZE)
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,291 @@
+# Standard library imports.
+import hashlib
+import json
+import os
+
+# Standard library from imports.
+from pathlib import Path
+from typing import Union
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _storage.backup_restorer import BackupRestorer
+from _storage.delta_chain import DeltaChain
+from _storage.digest_writer import DigestWriter
+
+
+class ContentDigest:
+    """
+
+    ContentDigest tells whether the content of a modified target file differs from the newest version of its backup,
+    so that modifications which leave the content as is (touches, saves without changes, reverts) do not create backups.
+
+    The size and the digest of the newest version are recorded within a sidecar file next to the versions ({FILE NAME}.digest),
+    so that later comparisons merely hash the target file, rather than reading the backup again:
+        A target file whose size differs from the recorded one is changed, without hashing anything.
+        A target file of the same size is hashed with a fast hash function (BLAKE2b), streamed, and compared against the recorded digest.
+    A missing or stale sidecar file (e.g. the newest version was created before, or pruned since) is rebuilt by streaming the newest version,
+    regardless of how its content is stored.
+
+    """
+
+
+    @staticmethod
+    def compare(target_file_path: Union[str, Path], backup_file_path: Union[str, Path], size: int) -> tuple[bool, str]:
+        """
+
+        Description:
+            Retrieves the record of the newest version of the backed up file, rebuilding it if it is missing or stale.
+            Checks if the size of the target file matches the recorded one; If so, hashes the target file and compares the digests.
+
+        Args:
+            target_file_path(Union[str, Path]): Path for the target file.
+            backup_file_path(Union[str, Path]): Path for the backup file about to be created.
+            size(int): Size of the target file (in bytes).
+
+        Returns:
+            tuple[bool, str]: Whether the content of the target file matches the newest version, and the digest of the target file; None if it was not hashed.
+
+        Raises:
+            OSError | ValueError:
+                If the backup directory is missing, or the newest version cannot be read or fails its verification,
+                then consider the content as changed, so that the backup is created.
+
+        """
+
+        # Constants for the storage of string literals.
+        DIGEST = String.LITERAL_DIGEST
+        SIZE = String.LITERAL_SIZE
+
+        # Attempt to:
+        try:
+            # Assign the paths for the versions of the backed up file.
+            version_path_list = DeltaChain.get_version_paths(backup_file_path)
+
+            # If the file was never backed up:
+            if not version_path_list:
+                # Consider the content as changed.
+                return False, None
+
+            # Read and assign the record of the newest version.
+            record_dict = ContentDigest._read_record(backup_file_path)
+
+            # If the record is missing or stale, or it lacks the digest required to compare the content of the same size:
+            if record_dict is None or record_dict.get(String.LITERAL_BACKUP) != os.path.basename(version_path_list[-1]) or (record_dict.get(DIGEST) is None and record_dict.get(SIZE) in (None, size)):
+                # Rebuild the record from the content of the newest version.
+                record_dict = ContentDigest._derive_record(backup_file_path, version_path_list[-1])
+
+        # Handle: OSError, ValueError.
+        except (OSError, ValueError):
+            # Consider the content as changed.
+            return False, None
+
+        # If the size of the target file differs from the recorded one:
+        if record_dict[SIZE] != size:
+            # Consider the content as changed, without hashing it.
+            return False, None
+
+        # Hash and assign the digest of the target file.
+        digest = ContentDigest.hash_file(target_file_path)
+
+        # Return whether the digests match, and the digest of the target file.
+        return digest == record_dict[DIGEST], digest
+
+
+    @staticmethod
+    def hash_file(file_path: Union[str, Path]) -> str:
+        """
+
+        Description:
+            Streams the content of the file specified by the file path through the hash function of the content digests.
+
+        Args:
+            file_path(Union[str, Path]): Path for the file.
+
+        Returns:
+            str: Hexadecimal digest of the content of the file.
+
+        Raises:
+            None
+
+        """
+
+        # Create the hash object.
+        hash_object = hashlib.new(String.BACKUP_DIGEST_HASH_ALGORITHM)
+
+        # Open the file with the file mode read binary.
+        with open(file_path, String.FILE_MODE_READ_BINARY) as file:
+            # For every chunk of the file:
+            for chunk in iter(lambda: file.read(Integer.BACKUP_CHUNK_SIZE), b''):
+                # Feed the chunk to the hash object.
+                hash_object.update(chunk)
+
+        # Return the hexadecimal digest.
+        return hash_object.hexdigest()
+
+
+    @staticmethod
+    def record(backup_file_path: Union[str, Path], size: int, digest: str) -> None:
+        """
+
+        Description:
+            Records the size and the digest of the content of the backup file specified by the backup file path, as its newest version.
+            Replaces the sidecar file atomically, so that a crash never leaves a partially written record behind.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for the created backup file.
+            size(int): Size of the backed up content (in bytes); None if unknown.
+            digest(str): Digest of the backed up content; None if unknown, in which case it is derived from the backup file when required.
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the sidecar file cannot be written,
+                then forget it; The record is rebuilt from the backup file when required.
+
+        """
+
+        # Construct the path for the sidecar file.
+        sidecar_file_path = ContentDigest._get_sidecar_path(backup_file_path)
+
+        # Construct the path for the temporary sidecar file.
+        temporary_file_path = sidecar_file_path + String.BACKUP_TEMPORARY_FILE_EXTENSION
+
+        # Attempt to:
+        try:
+            # Open the temporary sidecar file with the file mode write.
+            with open(temporary_file_path, String.FILE_MODE_WRITE) as file:
+                # Write the record.
+                json.dump({
+                        String.LITERAL_BACKUP : os.path.basename(str(backup_file_path)),
+                        String.LITERAL_ALGORITHM : String.BACKUP_DIGEST_HASH_ALGORITHM,
+                        String.LITERAL_SIZE : size,
+                        String.LITERAL_DIGEST : digest
+                    }, file, indent=Integer.JSON_INDENT)
+
+            # Move the temporary sidecar file in place.
+            os.replace(temporary_file_path, sidecar_file_path)
+
+        # Handle: OSError.
+        except OSError:
+            # Attempt to:
+            try:
+                # Forget the stale sidecar file.
+                os.remove(sidecar_file_path)
+
+            # Handle: OSError.
+            except OSError:
+                # Ignore.
+                pass
+
+
+    @staticmethod
+    def _derive_record(backup_file_path: Union[str, Path], version_path: str) -> dict:
+        """
+
+        Description:
+            Streams the content of the version specified by the version path, regardless of how it is stored, through the hash function of the content digests.
+            Records its size and digest as the newest version.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for any version of the backed up file.
+            version_path(str): Path for the newest version.
+
+        Returns:
+            dict: Record of the newest version.
+
+        Raises:
+            None
+
+        """
+
+        # Create the destination file digesting the content.
+        digest_writer = DigestWriter(String.BACKUP_DIGEST_HASH_ALGORITHM)
+
+        # Stream the content of the version to the destination file.
+        BackupRestorer.write_backup_content(version_path, digest_writer)
+
+        # Record the size and the digest of the version.
+        ContentDigest.record(version_path, digest_writer.size, digest_writer.hash_object.hexdigest())
+
+        # Return the record of the version.
+        return {
+                String.LITERAL_SIZE : digest_writer.size,
+                String.LITERAL_DIGEST : digest_writer.hash_object.hexdigest()
+            }
+
+
+    @staticmethod
+    def _get_sidecar_path(backup_file_path: Union[str, Path]) -> str:
+        """
+
+        Description:
+            Constructs the path for the sidecar file shared by all versions of the backed up file specified by the backup file path.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for any version of the backed up file.
+
+        Returns:
+            str: Path for the sidecar file; Backup directory + File name + Digest file extension.
+
+        Raises:
+            None
+
+        """
+
+        # Assign the directory path and the file name of the version.
+        directory_path, filename = os.path.split(str(backup_file_path))
+
+        # Return the path for the sidecar file; The file name is the prefix shared by all versions.
+        return directory_path + os.path.sep + filename[:-len(String.BACKUP_FILE_EXTENSION)].rsplit('_', 2)[0] + String.BACKUP_DIGEST_FILE_EXTENSION
+
+
+    @staticmethod
+    def _read_record(backup_file_path: Union[str, Path]) -> dict:
+        """
+
+        Description:
+            Reads the record of the newest version from the sidecar file of the backed up file specified by the backup file path.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for any version of the backed up file.
+
+        Returns:
+            dict: Record of the newest version; None if it is missing, unreadable, or made with another hash function.
+
+        Raises:
+            OSError | ValueError:
+                If the sidecar file is missing or unreadable,
+                then return None.
+
+        """
+
+        # Attempt to:
+        try:
+            # Open the sidecar file with the file mode read.
+            with open(ContentDigest._get_sidecar_path(backup_file_path), String.FILE_MODE_READ) as file:
+                # Load and assign the record.
+                record_dict = json.load(file)
+
+        # Handle: OSError, ValueError.
+        except (OSError, ValueError):
+            # Return None.
+            return None
+
+        # Return the record, if it was made with the hash function of the content digests.
+        return record_dict if isinstance(record_dict, dict) and record_dict.get(String.LITERAL_ALGORITHM) == String.BACKUP_DIGEST_HASH_ALGORITHM else None
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
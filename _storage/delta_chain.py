@@ -0,0 +1,1006 @@
+# Standard library imports.
+import bisect
+import hashlib
+import os
+import struct
+import zlib
+
+# Standard library from imports.
+from pathlib import Path
+from typing import BinaryIO, Union
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _path.path_utils import PathUtils
+from _storage.backup_manifest import BackupManifest
+
+
+class DeltaChain:
+    """
+
+    DeltaChain provides methods for the management of reverse-delta version chains within the backup directory of a target file.
+
+    The newest version of a target file is always kept as a full copy.
+    Whenever a newer version is backed up, the version preceding it is turned into a delta against the newer version (its successor),
+    so that restoring a version means restoring its successor first, and applying its delta on top.
+
+    A delta is a backup manifest whose payload is a sequence of operations:
+        Copy: copies a range of the successor (the blocks that did not change),
+        Literal: holds bytes found nowhere in the successor (the blocks that did change).
+    Blocks of the successor are matched rsync-style, at any offset within the version, so that inserted and deleted bytes only cost the blocks around them:
+        A weak rolling checksum (Adler-32) of the window at the current offset is looked up among the checksums of the blocks of the successor,
+        and only a hit is confirmed by the strong digest (BLAKE2b) of the window; Otherwise, the window rolls forward by a single byte.
+
+    Every so often, a version is kept as a full keyframe instead, which bounds the number of deltas to apply upon restoration.
+
+    """
+
+
+    # Constant for the storage of the maximum length of a copy operation, as bound by its length field (in bytes).
+    _MAXIMUM_COPY_LENGTH: int = 2 ** (8 * struct.calcsize(String.BACKUP_DELTA_LITERAL_FORMAT)) - 1
+
+
+    @staticmethod
+    def append_version(backup_file_path: Union[str, Path], keyframe_interval: int) -> None:
+        """
+
+        Description:
+            Retrieves the version preceding the newly backed up version specified by the backup file path.
+            Turns the preceding version into a delta against the new version, unless:
+                It is not a full copy (e.g. already a delta),
+                It completes a run of deltas as long as the keyframe interval allows, so that it is kept as a full keyframe,
+                Its delta would not be smaller than itself.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for the newly backed up version, which must be a full copy.
+            keyframe_interval(int): Number of consecutive versions after which a version is kept as a full keyframe.
+
+        Returns:
+            None
+
+        Raises:
+            BaseException:
+                If the delta cannot be written (e.g. the disk is full),
+                then delete the temporary file and delegate handling to the caller.
+
+        """
+
+        # Constants for the storage of string literals.
+        FILE_MODE_READ_BINARY = String.FILE_MODE_READ_BINARY
+        FILE_MODE_WRITE_BINARY = String.FILE_MODE_WRITE_BINARY
+
+        # Assign the paths for all versions of the backed up file, oldest first.
+        version_path_list = DeltaChain.get_version_paths(backup_file_path)
+
+        # Assign the position of the new version.
+        position = version_path_list.index(str(backup_file_path))
+
+        # If no version precedes the new version:
+        if position == 0:
+            # Stop the appending.
+            return
+
+        # Assign the path for the preceding version.
+        preceding_version_path = version_path_list[position - 1]
+
+        # If the preceding version is not a full copy:
+        if BackupManifest.is_manifest(preceding_version_path):
+            # Stop the appending.
+            return
+
+        # Variable for the storage of the number of consecutive deltas preceding the preceding version.
+        delta_count = 0
+
+        # For every older version, newest first:
+        for version_path in reversed(version_path_list[:position - 1]):
+            # Read and assign the backup manifest of the older version.
+            manifest_dict = BackupManifest.read(version_path)
+
+            # If the older version is not a delta:
+            if manifest_dict is None or manifest_dict.get(String.LITERAL_STORAGE_MODE) != String.BACKUP_STORAGE_MODE_DELTA:
+                # Stop counting.
+                break
+
+            # Count the delta.
+            delta_count += 1
+
+        # If the preceding version completes a run of deltas:
+        if delta_count + 1 >= keyframe_interval:
+            # Keep the preceding version as a full keyframe.
+            return
+
+        # Assign the stat result of the preceding version.
+        stat_result = os.stat(preceding_version_path)
+
+        # Construct the path for the temporary file.
+        temporary_file_path = os.path.dirname(preceding_version_path) + os.path.sep + String.generate_random_string() + String.BACKUP_TEMPORARY_FILE_EXTENSION
+
+        # Attempt to:
+        try:
+            # Open the preceding version and the new version with the file mode read binary, and the temporary file with the file mode write binary.
+            with open(preceding_version_path, FILE_MODE_READ_BINARY) as version_file, open(backup_file_path, FILE_MODE_READ_BINARY) as base_file, open(temporary_file_path, FILE_MODE_WRITE_BINARY) as delta_file:
+                # Write the delta of the preceding version against the new version.
+                DeltaChain._write_delta(version_file, base_file, delta_file, os.path.basename(backup_file_path), stat_result.st_size, stat_result.st_mtime_ns)
+
+            # If the delta is not smaller than the preceding version:
+            if os.path.getsize(temporary_file_path) >= stat_result.st_size:
+                # Delete the temporary file, keeping the preceding version as a full copy.
+                os.remove(temporary_file_path)
+
+                # Stop the appending.
+                return
+
+            # Assign the last modified time of the preceding version to the delta, as the full copy preserved it.
+            os.utime(temporary_file_path, ns=(stat_result.st_mtime_ns, stat_result.st_mtime_ns))
+
+            # Move the delta in place of the preceding version.
+            os.replace(temporary_file_path, preceding_version_path)
+
+        # Handle: BaseException.
+        except BaseException:
+            # If the temporary file is left behind:
+            if PathUtils.is_path_exist(temporary_file_path):
+                # Delete the temporary file.
+                os.remove(temporary_file_path)
+
+            # Delegate handling to the caller.
+            raise
+
+
+    @staticmethod
+    def bypass_base(delta_path: Union[str, Path]) -> None:
+        """
+
+        Description:
+            Makes the delta specified by the delta path independent of its base, so that the base can be deleted:
+                If the base is itself a delta, composes both deltas into a delta against the base of the base,
+                If the base is a full copy, turns the delta into a full copy.
+            Writes the result to a temporary file, which is then moved in place of the delta.
+
+        Args:
+            delta_path(Union[str, Path]): Path for the delta.
+
+        Returns:
+            None
+
+        Raises:
+            BaseException:
+                If the result cannot be written (e.g. the disk is full),
+                then delete the temporary file and delegate handling to the caller.
+
+        """
+
+        # Constants for the storage of string literals.
+        BASE = String.LITERAL_BASE
+        FILE_MODE_WRITE_BINARY = String.FILE_MODE_WRITE_BINARY
+        MODIFIED_AT_NS = String.LITERAL_MODIFIED_AT_NS
+
+        # Read and assign the backup manifest of the delta.
+        manifest_dict = BackupManifest.read(delta_path)
+
+        # Construct the path for the base, within the same backup directory.
+        base_path = os.path.dirname(str(delta_path)) + os.path.sep + manifest_dict[BASE]
+
+        # Read and assign the backup manifest of the base.
+        base_manifest_dict = BackupManifest.read(base_path)
+
+        # Construct the path for the temporary file.
+        temporary_file_path = os.path.dirname(str(delta_path)) + os.path.sep + String.generate_random_string() + String.BACKUP_TEMPORARY_FILE_EXTENSION
+
+        # Attempt to:
+        try:
+            # Open the temporary file with the file mode write binary.
+            with open(temporary_file_path, FILE_MODE_WRITE_BINARY) as temporary_file:
+                # If the base is a delta:
+                if base_manifest_dict is not None and base_manifest_dict.get(String.LITERAL_STORAGE_MODE) == String.BACKUP_STORAGE_MODE_DELTA:
+                    # Compose the delta with its base.
+                    DeltaChain._compose_delta(delta_path, base_path, base_manifest_dict[BASE], temporary_file)
+
+                # If the base is a full copy:
+                else:
+                    # Rebuild the full content of the delta.
+                    DeltaChain.write_content(delta_path, temporary_file)
+
+            # Assign the last modified time of the backed up file to the result.
+            os.utime(temporary_file_path, ns=(manifest_dict[MODIFIED_AT_NS], manifest_dict[MODIFIED_AT_NS]))
+
+            # Move the result in place of the delta.
+            os.replace(temporary_file_path, delta_path)
+
+        # Handle: BaseException.
+        except BaseException:
+            # If the temporary file is left behind:
+            if PathUtils.is_path_exist(temporary_file_path):
+                # Delete the temporary file.
+                os.remove(temporary_file_path)
+
+            # Delegate handling to the caller.
+            raise
+
+
+    @staticmethod
+    def get_version_paths(backup_file_path: Union[str, Path]) -> list[str]:
+        """
+
+        Description:
+            Retrieves the paths for all versions of the backed up file specified by the backup file path, within its backup directory.
+            Versions are told apart by their modification timestamps, which sort chronologically.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for any version of the backed up file.
+
+        Returns:
+            list[str]: Paths for all versions of the backed up file, oldest first.
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of the backup file extension.
+        BACKUP_FILE_EXTENSION = String.BACKUP_FILE_EXTENSION
+
+        # Assign the directory path and the file name of the version.
+        directory_path, filename = os.path.split(str(backup_file_path))
+
+        # Assign the file name prefix shared by all versions; File name + "_".
+        prefix = filename[:-len(BACKUP_FILE_EXTENSION)].rsplit('_', 2)[0] + '_'
+
+        # Return the sorted paths for the versions.
+        return sorted(directory_path + os.path.sep + name for name in os.listdir(directory_path) if name.startswith(prefix) and name.endswith(BACKUP_FILE_EXTENSION) and len(name) == len(filename))
+
+
+    @staticmethod
+    def release_version(backup_file_path: Union[str, Path]) -> None:
+        """
+
+        Description:
+            Makes every delta against the version specified by the backup file path independent of it (see bypass_base),
+            so that the version can be overwritten (e.g. by a newer version backed up within the same second) or deleted.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for the version.
+
+        Returns:
+            None
+
+        Raises:
+            BaseException:
+                If a delta cannot be made independent (e.g. the disk is full),
+                then delegate handling to the caller.
+
+        """
+
+        # Constant for the storage of a string literal.
+        BASE = String.LITERAL_BASE
+
+        # Assign the file name of the version.
+        filename = os.path.basename(str(backup_file_path))
+
+        # For every version of the backed up file:
+        for version_path in DeltaChain.get_version_paths(backup_file_path):
+            # If the version is a delta against the released version:
+            if (BackupManifest.read(version_path) or {}).get(BASE) == filename:
+                # Make it independent of the released version.
+                DeltaChain.bypass_base(version_path)
+
+
+    @staticmethod
+    def resolve_chain(backup_file_path: Union[str, Path]) -> list[str]:
+        """
+
+        Description:
+            Follows the bases of the version specified by the backup file path, until a full copy is reached.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for the version.
+
+        Returns:
+            list[str]: Paths for the version, the deltas it depends on and the full copy ending the chain; Its length minus one is the depth of the version.
+
+        Raises:
+            ValueError:
+                If the chain loops,
+                then delegate handling to the caller.
+
+        """
+
+        # Constant for the storage of a string literal.
+        BASE = String.LITERAL_BASE
+
+        # Variable for the storage of the paths for the chain.
+        chain_path_list = [str(backup_file_path)]
+
+        # Read and assign the backup manifest of the version.
+        manifest_dict = BackupManifest.read(backup_file_path)
+
+        # While the last version of the chain is a delta:
+        while manifest_dict is not None and manifest_dict.get(String.LITERAL_STORAGE_MODE) == String.BACKUP_STORAGE_MODE_DELTA:
+            # Construct the path for its base, within the same backup directory.
+            base_path = os.path.dirname(chain_path_list[-1]) + os.path.sep + manifest_dict[BASE]
+
+            # If the base is already part of the chain:
+            if base_path in chain_path_list:
+                # Raise the respective error.
+                raise ValueError(base_path)
+
+            # Append the base to the chain.
+            chain_path_list.append(base_path)
+
+            # Read and assign the backup manifest of the base.
+            manifest_dict = BackupManifest.read(base_path)
+
+        # Return the paths for the chain.
+        return chain_path_list
+
+
+    @staticmethod
+    def write_content(backup_file_path: Union[str, Path], destination_file: BinaryIO) -> None:
+        """
+
+        Description:
+            Resolves the chain of the delta specified by the backup file path.
+            Applies the deltas of the chain one after the other, starting from the full copy ending it;
+            Intermediate versions are materialized in temporary files, at most two of which exist at any time.
+            Writes the content of the version to the destination file, while verifying its digest.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for the delta.
+            destination_file(BinaryIO): Destination file opened with the file mode write binary.
+
+        Returns:
+            None
+
+        Raises:
+            ValueError:
+                If the chain does not end with a full copy, or the digest of the version does not match its backup manifest,
+                then delegate handling to the caller.
+
+        """
+
+        # Constants for the storage of string literals.
+        ALGORITHM = String.LITERAL_ALGORITHM
+        DIGEST = String.LITERAL_DIGEST
+        FILE_MODE_WRITE_BINARY = String.FILE_MODE_WRITE_BINARY
+
+        # Resolve and assign the chain of the delta.
+        chain_path_list = DeltaChain.resolve_chain(backup_file_path)
+
+        # If the chain does not end with a full copy:
+        if BackupManifest.is_manifest(chain_path_list[-1]):
+            # Raise the respective error.
+            raise ValueError(chain_path_list[-1])
+
+        # Assign the full copy as the base of the deepest delta.
+        base_path = chain_path_list[-1]
+
+        # Variable for the storage of the path for the temporary file holding the current base.
+        temporary_file_path = None
+
+        # Attempt to:
+        try:
+            # For every intermediate delta of the chain, deepest first:
+            for delta_path in reversed(chain_path_list[1:-1]):
+                # Construct the path for the temporary file holding the intermediate version.
+                version_path = os.path.dirname(delta_path) + os.path.sep + String.generate_random_string() + String.BACKUP_TEMPORARY_FILE_EXTENSION
+
+                # Open the temporary file with the file mode write binary.
+                with open(version_path, FILE_MODE_WRITE_BINARY) as version_file:
+                    # Apply the delta to the current base.
+                    DeltaChain._apply_delta(delta_path, base_path, version_file, None)
+
+                # If the current base is a temporary file:
+                if temporary_file_path is not None:
+                    # Delete it, as it is no longer needed.
+                    os.remove(temporary_file_path)
+
+                # Assign the intermediate version as the current base.
+                base_path = temporary_file_path = version_path
+
+            # Read and assign the backup manifest of the delta.
+            manifest_dict = BackupManifest.read(backup_file_path)
+
+            # Create the hash object.
+            hash_object = hashlib.new(manifest_dict[ALGORITHM])
+
+            # Apply the delta to the current base, writing the version to the destination file.
+            DeltaChain._apply_delta(backup_file_path, base_path, destination_file, hash_object)
+
+        # Finally:
+        finally:
+            # If a temporary file is left behind:
+            if temporary_file_path is not None and PathUtils.is_path_exist(temporary_file_path):
+                # Delete the temporary file.
+                os.remove(temporary_file_path)
+
+        # If the digest of the version does not match the backup manifest:
+        if hash_object.hexdigest() != manifest_dict[DIGEST]:
+            # Raise the respective error.
+            raise ValueError(String.EXCEPTION_MESSAGE_DIGEST_MISMATCH_ERROR + ' ' + manifest_dict[DIGEST])
+
+
+    @staticmethod
+    def _apply_delta(delta_path: Union[str, Path], base_path: Union[str, Path], destination_file: BinaryIO, hash_object: object) -> None:
+        """
+
+        Description:
+            Executes the operations of the delta specified by the delta path against the base specified by the base path.
+            Writes the resulting version to the destination file, feeding it to the hash object, if any.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            delta_path(Union[str, Path]): Path for the delta.
+            base_path(Union[str, Path]): Path for the full content of the successor of the delta.
+            destination_file(BinaryIO): Destination file opened with the file mode write binary.
+            hash_object(object): Hash object to feed the version to.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of string literals.
+        BACKUP_DELTA_COPY_FORMAT = String.BACKUP_DELTA_COPY_FORMAT
+        BACKUP_DELTA_LITERAL_FORMAT = String.BACKUP_DELTA_LITERAL_FORMAT
+        BACKUP_DELTA_OPERATION_COPY = String.BACKUP_DELTA_OPERATION_COPY
+        FILE_MODE_READ_BINARY = String.FILE_MODE_READ_BINARY
+
+        # Constant for the storage of the size of the chunks in which content is streamed.
+        BACKUP_CHUNK_SIZE = Integer.BACKUP_CHUNK_SIZE
+
+        # Open the delta and the base with the file mode read binary.
+        with open(delta_path, FILE_MODE_READ_BINARY) as delta_file, open(base_path, FILE_MODE_READ_BINARY) as base_file:
+            # Skip the backup manifest of the delta.
+            BackupManifest.read_header(delta_file)
+
+            # For every operation of the delta:
+            for operation in iter(lambda: delta_file.read(1), b''):
+                # If the operation copies a range of the base:
+                if operation == BACKUP_DELTA_OPERATION_COPY:
+                    # Decode the offset and the length of the range.
+                    offset, length = struct.unpack(BACKUP_DELTA_COPY_FORMAT, delta_file.read(struct.calcsize(BACKUP_DELTA_COPY_FORMAT)))
+
+                    # Position the base at the start of the range.
+                    base_file.seek(offset)
+
+                    # Assign the source of the range.
+                    source_file = base_file
+
+                # If the operation holds literal bytes:
+                else:
+                    # Decode the length of the literal bytes.
+                    length, = struct.unpack(BACKUP_DELTA_LITERAL_FORMAT, delta_file.read(struct.calcsize(BACKUP_DELTA_LITERAL_FORMAT)))
+
+                    # Assign the source of the literal bytes.
+                    source_file = delta_file
+
+                # While bytes of the operation are left:
+                while length > 0:
+                    # Read the next chunk of the operation.
+                    chunk = source_file.read(min(length, BACKUP_CHUNK_SIZE))
+
+                    # If a hash object is given:
+                    if hash_object is not None:
+                        # Feed the chunk to the hash object.
+                        hash_object.update(chunk)
+
+                    # Write the chunk to the destination file.
+                    destination_file.write(chunk)
+
+                    # Account for the length of the chunk.
+                    length -= len(chunk)
+
+
+    @staticmethod
+    def _compose_delta(delta_path: Union[str, Path], base_path: Union[str, Path], base_of_base_filename: str, destination_file: BinaryIO) -> None:
+        """
+
+        Description:
+            Composes the delta specified by the delta path with its base, which is itself a delta, into a delta against the base of the base:
+                Literal operations of the delta are kept as they are,
+                Copy operations of the delta are mapped onto the operations of the base, becoming copies from the base of the base or literal bytes of the base.
+            Writes the composed delta to the destination file.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            delta_path(Union[str, Path]): Path for the delta.
+            base_path(Union[str, Path]): Path for the base of the delta, which is a delta.
+            base_of_base_filename(str): File name of the base of the base, which the composed delta references.
+            destination_file(BinaryIO): Destination file opened with the file mode write binary.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of string literals.
+        BACKUP_DELTA_COPY_FORMAT = String.BACKUP_DELTA_COPY_FORMAT
+        BACKUP_DELTA_LITERAL_FORMAT = String.BACKUP_DELTA_LITERAL_FORMAT
+        BACKUP_DELTA_OPERATION_COPY = String.BACKUP_DELTA_OPERATION_COPY
+        FILE_MODE_READ_BINARY = String.FILE_MODE_READ_BINARY
+
+        # Constant for the storage of the size of the chunks in which content is streamed.
+        BACKUP_CHUNK_SIZE = Integer.BACKUP_CHUNK_SIZE
+
+        # Open the delta and its base with the file mode read binary.
+        with open(delta_path, FILE_MODE_READ_BINARY) as delta_file, open(base_path, FILE_MODE_READ_BINARY) as base_file:
+            # Read and assign the backup manifest of the delta.
+            manifest_dict = BackupManifest.read_header(delta_file)
+
+            # Skip the backup manifest of the base.
+            BackupManifest.read_header(base_file)
+
+            # Read and assign the operations of the base.
+            operation_list = DeltaChain._read_operations(base_file)
+
+            # Assign the start offsets of the operations of the base, for lookups.
+            start_list = [operation[0] for operation in operation_list]
+
+            # Reference the base of the base.
+            manifest_dict[String.LITERAL_BASE] = base_of_base_filename
+
+            # Write the backup manifest of the composed delta.
+            BackupManifest.write_header(destination_file, manifest_dict)
+
+            # Variables for the storage of the pending copy operation; Offset within the base of the base and length.
+            copy_offset = None
+            copy_length = 0
+
+            # For every operation of the delta:
+            for operation in iter(lambda: delta_file.read(1), b''):
+                # If the operation holds literal bytes:
+                if operation != BACKUP_DELTA_OPERATION_COPY:
+                    # Decode the length of the literal bytes.
+                    length, = struct.unpack(BACKUP_DELTA_LITERAL_FORMAT, delta_file.read(struct.calcsize(BACKUP_DELTA_LITERAL_FORMAT)))
+
+                    # Write the pending copy operation, if any.
+                    copy_offset = DeltaChain._write_copy_operation(destination_file, copy_offset, copy_length)
+
+                    # While literal bytes are left:
+                    while length > 0:
+                        # Read the next chunk of literal bytes.
+                        chunk = delta_file.read(min(length, BACKUP_CHUNK_SIZE))
+
+                        # Write a literal operation holding the chunk.
+                        DeltaChain._write_literal_operation(destination_file, chunk)
+
+                        # Account for the length of the chunk.
+                        length -= len(chunk)
+
+                    # Continue with the next operation.
+                    continue
+
+                # Decode the offset and the length of the range of the base.
+                offset, length = struct.unpack(BACKUP_DELTA_COPY_FORMAT, delta_file.read(struct.calcsize(BACKUP_DELTA_COPY_FORMAT)))
+
+                # Assign the position of the operation of the base that the range starts within.
+                position = bisect.bisect_right(start_list, offset) - 1
+
+                # While bytes of the range are left:
+                while length > 0:
+                    # Assign the operation of the base; Start offset, length, offset within the base of the base (copy) and offset within the base (literal).
+                    start, operation_length, base_offset, literal_offset = operation_list[position]
+
+                    # Assign the number of bytes of the range covered by the operation of the base.
+                    covered_length = min(start + operation_length - offset, length)
+
+                    # If the operation of the base is a copy:
+                    if base_offset is not None:
+                        # If the covered bytes extend the pending copy operation:
+                        if copy_offset is not None and base_offset + offset - start == copy_offset + copy_length and copy_length + covered_length <= DeltaChain._MAXIMUM_COPY_LENGTH:
+                            # Extend the pending copy operation.
+                            copy_length += covered_length
+
+                        # If the covered bytes do not extend the pending copy operation:
+                        else:
+                            # Write the pending copy operation, if any.
+                            DeltaChain._write_copy_operation(destination_file, copy_offset, copy_length)
+
+                            # Start a pending copy operation.
+                            copy_offset, copy_length = base_offset + offset - start, covered_length
+
+                    # If the operation of the base is literal:
+                    else:
+                        # Write the pending copy operation, if any.
+                        copy_offset = DeltaChain._write_copy_operation(destination_file, copy_offset, copy_length)
+
+                        # Position the base at the covered literal bytes.
+                        base_file.seek(literal_offset + offset - start)
+
+                        # Write a literal operation holding the covered literal bytes.
+                        DeltaChain._write_literal_operation(destination_file, base_file.read(covered_length))
+
+                    # Advance within the range.
+                    offset += covered_length
+                    length -= covered_length
+                    position += 1
+
+            # Write the pending copy operation, if any.
+            DeltaChain._write_copy_operation(destination_file, copy_offset, copy_length)
+
+
+    @staticmethod
+    def _index_blocks(base_file: BinaryIO) -> tuple[set[int], dict[bytes, int]]:
+        """
+
+        Description:
+            Reads the base block by block, and indexes the weak rolling checksum of every block, and the offset of every block by its strong digest.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            base_file(BinaryIO): Base opened with the file mode read binary.
+
+        Returns:
+            tuple[set[int], dict[bytes, int]]: Weak rolling checksums of the blocks of the base, and their offsets (the first one, for repeated blocks), keyed by their strong digests.
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of the block parameters.
+        BACKUP_DELTA_BLOCK_DIGEST_SIZE = Integer.BACKUP_DELTA_BLOCK_DIGEST_SIZE
+        BACKUP_DELTA_BLOCK_SIZE = Integer.BACKUP_DELTA_BLOCK_SIZE
+
+        # Variable for the storage of the weak rolling checksums of the blocks.
+        checksum_set = set()
+
+        # Variable for the storage of the offsets of the blocks.
+        block_offset_dict = {}
+
+        # Variable for the storage of the offset of the current block.
+        offset = 0
+
+        # For every block of the base:
+        for block in iter(lambda: base_file.read(BACKUP_DELTA_BLOCK_SIZE), b''):
+            # Index the weak rolling checksum of the block.
+            checksum_set.add(zlib.adler32(block))
+
+            # Index the offset of the block by its strong digest, unless an identical block is indexed already.
+            block_offset_dict.setdefault(hashlib.blake2b(block, digest_size=BACKUP_DELTA_BLOCK_DIGEST_SIZE).digest(), offset)
+
+            # Advance the offset.
+            offset += len(block)
+
+        # Return the weak rolling checksums and the offsets of the blocks.
+        return checksum_set, block_offset_dict
+
+
+    @staticmethod
+    def _read_operations(delta_file: BinaryIO) -> list[tuple[int, int, int, int]]:
+        """
+
+        Description:
+            Reads the operations of the opened delta, without reading literal bytes.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            delta_file(BinaryIO): Delta opened with the file mode read binary, positioned at the start of the payload.
+
+        Returns:
+            list[tuple[int, int, int, int]]: Operations; Start offset within the version, length, offset within the base (copy, else None) and offset of the literal bytes within the delta (literal, else None).
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of string literals.
+        BACKUP_DELTA_COPY_FORMAT = String.BACKUP_DELTA_COPY_FORMAT
+        BACKUP_DELTA_LITERAL_FORMAT = String.BACKUP_DELTA_LITERAL_FORMAT
+        BACKUP_DELTA_OPERATION_COPY = String.BACKUP_DELTA_OPERATION_COPY
+
+        # Variable for the storage of the operations.
+        operation_list = []
+
+        # Variable for the storage of the start offset of the current operation within the version.
+        start = 0
+
+        # For every operation of the delta:
+        for operation in iter(lambda: delta_file.read(1), b''):
+            # If the operation copies a range of the base:
+            if operation == BACKUP_DELTA_OPERATION_COPY:
+                # Decode the offset and the length of the range.
+                offset, length = struct.unpack(BACKUP_DELTA_COPY_FORMAT, delta_file.read(struct.calcsize(BACKUP_DELTA_COPY_FORMAT)))
+
+                # Append the copy operation.
+                operation_list.append((start, length, offset, None))
+
+            # If the operation holds literal bytes:
+            else:
+                # Decode the length of the literal bytes.
+                length, = struct.unpack(BACKUP_DELTA_LITERAL_FORMAT, delta_file.read(struct.calcsize(BACKUP_DELTA_LITERAL_FORMAT)))
+
+                # Append the literal operation.
+                operation_list.append((start, length, None, delta_file.tell()))
+
+                # Skip the literal bytes.
+                delta_file.seek(length, os.SEEK_CUR)
+
+            # Advance the start offset.
+            start += length
+
+        # Return the operations.
+        return operation_list
+
+
+    @staticmethod
+    def _write_copy_operation(delta_file: BinaryIO, offset: int, length: int) -> None:
+        """
+
+        Description:
+            Writes a copy operation of the range specified by the offset and the length to the delta file, unless no range is given.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            delta_file(BinaryIO): Delta opened with the file mode write binary.
+            offset(int): Offset of the range within the base, or None if no copy operation is pending.
+            length(int): Length of the range.
+
+        Returns:
+            None: Always, so that callers can clear their pending copy operation with the result.
+
+        Raises:
+            None
+
+        """
+
+        # If a range is given:
+        if offset is not None:
+            # Write the copy operation.
+            delta_file.write(String.BACKUP_DELTA_OPERATION_COPY + struct.pack(String.BACKUP_DELTA_COPY_FORMAT, offset, length))
+
+        # Return nothing.
+        return None
+
+
+    @staticmethod
+    def _write_delta(version_file: BinaryIO, base_file: BinaryIO, delta_file: BinaryIO, base_filename: str, size: int, modified_at_ns: int) -> None:
+        """
+
+        Description:
+            Indexes the blocks of the base.
+            Writes a backup manifest to the delta file, with a placeholder for the digest of the version.
+            Scans the version with a window of the block size, which is read through a buffer:
+                If the weak rolling checksum of the window matches a block of the base, and its strong digest confirms the match,
+                the window becomes a copy operation, merged while contiguous within the base, and the scan jumps past it,
+                Otherwise, the window rolls forward by a single byte, and the byte it leaves becomes literal.
+            Writes the pending literal bytes once a copy operation follows them, or once the buffer is refilled, so that they take up a bounded amount of memory.
+            Rewrites the backup manifest with the digest of the version; Its length is unchanged, as digests are of fixed length.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            version_file(BinaryIO): Version opened with the file mode read binary.
+            base_file(BinaryIO): Successor of the version opened with the file mode read binary.
+            delta_file(BinaryIO): Delta file opened with the file mode write binary.
+            base_filename(str): File name of the successor, which the delta references.
+            size(int): Size of the version (in bytes).
+            modified_at_ns(int): Last modified time of the version (in nanoseconds).
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of a string literal.
+        BACKUP_OBJECT_HASH_ALGORITHM = String.BACKUP_OBJECT_HASH_ALGORITHM
+
+        # Constants for the storage of the block parameters.
+        BACKUP_DELTA_BLOCK_DIGEST_SIZE = Integer.BACKUP_DELTA_BLOCK_DIGEST_SIZE
+        BACKUP_DELTA_BLOCK_SIZE = Integer.BACKUP_DELTA_BLOCK_SIZE
+
+        # Constant for the storage of the modulus of the weak rolling checksum.
+        BACKUP_DELTA_CHECKSUM_MODULUS = Integer.BACKUP_DELTA_CHECKSUM_MODULUS
+
+        # Constant for the storage of the size of the chunks in which the version is read.
+        BACKUP_CHUNK_SIZE = Integer.BACKUP_CHUNK_SIZE
+
+        # Index and assign the weak rolling checksums and the offsets of the blocks of the base.
+        checksum_set, block_offset_dict = DeltaChain._index_blocks(base_file)
+
+        # Create the hash object.
+        hash_object = hashlib.new(BACKUP_OBJECT_HASH_ALGORITHM)
+
+        # Create the dictionary for the backup manifest of the delta.
+        manifest_dict = {
+                String.LITERAL_STORAGE_MODE : String.BACKUP_STORAGE_MODE_DELTA,
+                String.LITERAL_BASE : base_filename,
+                String.LITERAL_ALGORITHM : BACKUP_OBJECT_HASH_ALGORITHM,
+                String.LITERAL_DIGEST : '0' * hash_object.digest_size * 2,
+                String.LITERAL_SIZE : size,
+                String.LITERAL_MODIFIED_AT_NS : modified_at_ns
+            }
+
+        # Write the backup manifest with the placeholder digest.
+        BackupManifest.write_header(delta_file, manifest_dict)
+
+        # Variables for the storage of the pending copy operation; Offset within the base and length.
+        copy_offset = None
+        copy_length = 0
+
+        # Variables for the storage of the buffered bytes of the version, the position of the window within them, and the start of the pending literal bytes.
+        buffer = b''
+        position = 0
+        literal_start = 0
+
+        # Variable for the storage of whether the version is read completely.
+        is_end_reached = False
+
+        # Variable for the storage of the weak rolling checksum of the window; None until it is calculated for the current position.
+        checksum = None
+
+        # Loop until the version is scanned completely.
+        while True:
+            # If the buffer does not hold the window and the byte following it, and the version is not read completely:
+            if len(buffer) - position <= BACKUP_DELTA_BLOCK_SIZE and not is_end_reached:
+                # Write the pending copy operation, if any, and clear it.
+                copy_offset = DeltaChain._write_copy_operation(delta_file, copy_offset, copy_length)
+
+                # If literal bytes are pending:
+                if position > literal_start:
+                    # Write a literal operation holding them.
+                    DeltaChain._write_literal_operation(delta_file, buffer[literal_start:position])
+
+                # Read the next chunk of the version.
+                chunk = version_file.read(BACKUP_CHUNK_SIZE)
+
+                # Feed the chunk to the hash object.
+                hash_object.update(chunk)
+
+                # Assert the version as read completely, if the chunk is empty.
+                is_end_reached = not chunk
+
+                # Drop the scanned bytes from the buffer, and append the chunk.
+                buffer = buffer[position:] + chunk
+                position = 0
+                literal_start = 0
+
+                # Continue with the refilled buffer.
+                continue
+
+            # Assign the window at the position; Shorter than a block only at the end of the version.
+            window = buffer[position:position + BACKUP_DELTA_BLOCK_SIZE]
+
+            # If the version is scanned completely:
+            if not window:
+                # Stop the scanning.
+                break
+
+            # If the weak rolling checksum of the window is not calculated yet:
+            if checksum is None:
+                # Calculate it.
+                checksum = zlib.adler32(window)
+
+            # Assign the offset of an identical block within the base, if the weak rolling checksum matches and the strong digest confirms it.
+            offset = block_offset_dict.get(hashlib.blake2b(window, digest_size=BACKUP_DELTA_BLOCK_DIGEST_SIZE).digest()) if checksum in checksum_set else None
+
+            # If the window is found within the base:
+            if offset is not None:
+                # If literal bytes are pending:
+                if position > literal_start:
+                    # Write the pending copy operation, if any, and clear it.
+                    copy_offset = DeltaChain._write_copy_operation(delta_file, copy_offset, copy_length)
+
+                    # Write a literal operation holding the pending literal bytes.
+                    DeltaChain._write_literal_operation(delta_file, buffer[literal_start:position])
+
+                # If the window extends the pending copy operation:
+                if copy_offset is not None and offset == copy_offset + copy_length and copy_length + len(window) <= DeltaChain._MAXIMUM_COPY_LENGTH:
+                    # Extend the pending copy operation.
+                    copy_length += len(window)
+
+                # If the window does not extend the pending copy operation:
+                else:
+                    # Write the pending copy operation, if any.
+                    DeltaChain._write_copy_operation(delta_file, copy_offset, copy_length)
+
+                    # Start a pending copy operation.
+                    copy_offset, copy_length = offset, len(window)
+
+                # Jump past the window, and start the pending literal bytes after it.
+                position += len(window)
+                literal_start = position
+
+                # Recalculate the weak rolling checksum at the new position.
+                checksum = None
+
+                # Continue with the next window.
+                continue
+
+            # If the window is the last one, which cannot roll any further:
+            if position + BACKUP_DELTA_BLOCK_SIZE >= len(buffer):
+                # Leave the rest of the version as pending literal bytes.
+                position = len(buffer)
+
+                # Continue, so that the end of the version is confirmed.
+                continue
+
+            # Assign the components of the weak rolling checksum.
+            checksum_a, checksum_b = checksum & 0xFFFF, checksum >> 16
+
+            # Assign the position up to which the window can roll within the buffer.
+            end_position = len(buffer) - BACKUP_DELTA_BLOCK_SIZE
+
+            # While the window can roll:
+            while position < end_position:
+                # Assign the byte leaving the window, and the byte entering it.
+                leaving_byte = buffer[position]
+                entering_byte = buffer[position + BACKUP_DELTA_BLOCK_SIZE]
+
+                # Roll the components of the weak rolling checksum by a single byte.
+                checksum_a = (checksum_a - leaving_byte + entering_byte) % BACKUP_DELTA_CHECKSUM_MODULUS
+                checksum_b = (checksum_b - BACKUP_DELTA_BLOCK_SIZE * leaving_byte + checksum_a - 1) % BACKUP_DELTA_CHECKSUM_MODULUS
+
+                # Advance the window; The byte it left becomes a pending literal byte.
+                position += 1
+
+                # If the weak rolling checksum matches a block of the base:
+                if (checksum_b << 16 | checksum_a) in checksum_set:
+                    # Stop rolling, so that the match is confirmed.
+                    break
+
+            # Assign the weak rolling checksum at the position; It stays valid once the buffer is refilled, as the window is kept.
+            checksum = checksum_b << 16 | checksum_a
+
+        # Write the pending copy operation, if any.
+        DeltaChain._write_copy_operation(delta_file, copy_offset, copy_length)
+
+        # If literal bytes are pending:
+        if position > literal_start:
+            # Write a literal operation holding them.
+            DeltaChain._write_literal_operation(delta_file, buffer[literal_start:position])
+
+        # Assign the digest of the version.
+        manifest_dict[String.LITERAL_DIGEST] = hash_object.hexdigest()
+
+        # Rewind the delta file.
+        delta_file.seek(0)
+
+        # Rewrite the backup manifest with the digest of the version.
+        BackupManifest.write_header(delta_file, manifest_dict)
+
+
+    @staticmethod
+    def _write_literal_operation(delta_file: BinaryIO, data: bytes) -> None:
+        """
+
+        Description:
+            Writes a literal operation holding the data to the delta file.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            delta_file(BinaryIO): Delta opened with the file mode write binary.
+            data(bytes): Literal bytes.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Write the literal operation.
+        delta_file.write(String.BACKUP_DELTA_OPERATION_LITERAL + struct.pack(String.BACKUP_DELTA_LITERAL_FORMAT, len(data)) + data)
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,68 @@
+# Standard library imports.
+import hashlib
+
+
+class DigestWriter:
+    """
+
+    DigestWriter is a write-only destination file, which feeds the content written to it to a hash object and counts its size.
+    It lets the content of a backup file be digested by streaming it through BackupRestorer, without materializing it.
+
+    """
+
+
+    def __init__(self, algorithm: str) -> None:
+        """
+
+        Description:
+            Creates the hash object of the hash algorithm.
+
+        Args:
+            algorithm(str): Name of the hash algorithm (as known to hashlib).
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Variable for the storage of the hash object.
+        self.hash_object = hashlib.new(algorithm)
+
+        # Variable for the storage of the number of bytes written.
+        self.size = 0
+
+
+    def write(self, data: bytes) -> int:
+        """
+
+        Description:
+            Feeds the data to the hash object, and accounts for its size.
+
+        Args:
+            data(bytes): Data to write.
+
+        Returns:
+            int: Number of bytes written.
+
+        Raises:
+            None
+
+        """
+
+        # Feed the data to the hash object.
+        self.hash_object.update(data)
+
+        # Account for the size of the data.
+        self.size += len(data)
+
+        # Return the number of bytes written.
+        return len(data)
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
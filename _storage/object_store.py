@@ -0,0 +1,297 @@
+# Standard library imports.
+import hashlib
+import os
+import time
+
+# Standard library from imports.
+from pathlib import Path
+from typing import Union
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _path.path_utils import PathUtils
+from _storage.compression_codec import CompressionCodec
+
+
+class ObjectStore:
+    """
+
+    ObjectStore provides methods for the management of the content-addressed object store under the central backup directory.
+
+    Every object holds the content of a backed up file, and is named after the digest of that content.
+    Identical contents (touch-only modifications, reverts, the same file tracked through several targets) are therefore stored once,
+    while the backup directories merely hold backup manifests referencing the objects.
+
+    Objects are laid out as {OBJECT STORE}/{FIRST TWO DIGEST CHARACTERS}/{DIGEST}{COMPRESSION EXTENSION}, to keep directories small.
+    The digest is always the digest of the uncompressed content, so an object is shared regardless of the compression it was stored with.
+
+    """
+
+
+    @staticmethod
+    def delete_unreferenced_objects(object_store_directory_path: str, referenced_digest_set: set[str]) -> int:
+        """
+
+        Description:
+            Deletes the objects, and the temporary files left behind, that are not referenced by any backup manifest.
+            Spares the ones modified within the grace time, as their backup manifests may be underway.
+
+        Args:
+            object_store_directory_path(str): Path for the object store directory.
+            referenced_digest_set(set[str]): Digests referenced by the backup manifests.
+
+        Returns:
+            int: Number of deleted objects.
+
+        Raises:
+            FileNotFoundError:
+                If an object is deleted in the meantime,
+                then ignore it.
+
+        """
+
+        # Assign the last modified time before which unreferenced objects are deleted.
+        threshold_time = time.time() - Integer.BACKUP_OBJECT_GARBAGE_GRACE_TIME
+
+        # Variable for the storage of the number of deleted objects.
+        deleted_count = 0
+
+        # For every directory within the object store:
+        for directory_path, _, filename_list in os.walk(object_store_directory_path):
+            # For every file within the directory:
+            for filename in filename_list:
+                # Construct the path for the file.
+                file_path = directory_path + os.path.sep + filename
+
+                # Attempt to:
+                try:
+                    # If the file is referenced, or modified within the grace time:
+                    if filename.split('.')[0] in referenced_digest_set or os.path.getmtime(file_path) > threshold_time:
+                        # Spare the file.
+                        continue
+
+                    # Delete the file.
+                    os.remove(file_path)
+
+                # Handle: FileNotFoundError.
+                except FileNotFoundError:
+                    # Ignore.
+                    continue
+
+                # Count the deleted object.
+                deleted_count += 1
+
+        # Return the number of deleted objects.
+        return deleted_count
+
+
+    @staticmethod
+    def find_object_store_directory(backup_file_path: Union[str, Path]) -> str:
+        """
+
+        Description:
+            Walks up the directory tree of the backup file, until a directory holding an object store is found.
+            This allows backup manifests to be restored from the orphanage or from a relocated backup directory.
+
+        Args:
+            backup_file_path(Union[str, Path]): Path for the backup file.
+
+        Returns:
+            str: Path for the object store directory, or None if no object store is found.
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of the object store directory name.
+        BACKUP_OBJECT_STORE_DIRNAME = String.BACKUP_OBJECT_STORE_DIRNAME
+
+        # For every parent directory of the backup file:
+        for directory_path in Path(backup_file_path).resolve().parents:
+            # If the parent directory holds an object store:
+            if PathUtils.is_directory(directory_path / BACKUP_OBJECT_STORE_DIRNAME):
+                # Return the path for the object store directory.
+                return str(directory_path / BACKUP_OBJECT_STORE_DIRNAME)
+
+        # Return no object store directory.
+        return None
+
+
+    @staticmethod
+    def find_stored_compression(object_store_directory_path: str, digest: str) -> str:
+        """
+
+        Description:
+            Checks which compression, if any, an object holding the content specified by the digest is stored with.
+
+        Args:
+            object_store_directory_path(str): Path for the object store directory.
+            digest(str): Digest of the content.
+
+        Returns:
+            str: Compression of the stored object, or None if no object holds the content.
+
+        Raises:
+            None
+
+        """
+
+        # For every compression an object can be stored with:
+        for compression in (String.BACKUP_COMPRESSION_NONE, String.BACKUP_COMPRESSION_ZLIB, String.BACKUP_COMPRESSION_LZMA, String.BACKUP_COMPRESSION_BZ2):
+            # If an object holding the content is stored with the compression:
+            if PathUtils.is_path_exist(ObjectStore.get_object_path(object_store_directory_path, digest, compression)):
+                # Return the compression.
+                return compression
+
+        # Return no compression, as no object holds the content.
+        return None
+
+
+    @staticmethod
+    def get_object_path(object_store_directory_path: str, digest: str, compression: str) -> str:
+        """
+
+        Description:
+            Constructs the path for the object specified by the digest and the compression it is stored with.
+
+        Args:
+            object_store_directory_path(str): Path for the object store directory.
+            digest(str): Digest of the uncompressed content of the object.
+            compression(str): Compression the object is stored with.
+
+        Returns:
+            str: Path for the object.
+
+        Raises:
+            None
+
+        """
+
+        # Return the path for the object.
+        return object_store_directory_path + os.path.sep + digest[:2] + os.path.sep + digest + CompressionCodec.get_file_extension(compression)
+
+
+    @staticmethod
+    def hash_file(file_path: Union[str, Path]) -> str:
+        """
+
+        Description:
+            Streams the content of the file specified by the file path through the hash function of the object store.
+
+        Args:
+            file_path(Union[str, Path]): Path for the file.
+
+        Returns:
+            str: Hexadecimal digest of the content of the file.
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of the file mode read binary.
+        FILE_MODE_READ_BINARY = String.FILE_MODE_READ_BINARY
+
+        # Create the hash object.
+        hash_object = hashlib.new(String.BACKUP_OBJECT_HASH_ALGORITHM)
+
+        # Open the file with the file mode read binary.
+        with open(file_path, FILE_MODE_READ_BINARY) as file:
+            # For every chunk of the file:
+            for chunk in iter(lambda: file.read(Integer.BACKUP_CHUNK_SIZE), b''):
+                # Feed the chunk to the hash object.
+                hash_object.update(chunk)
+
+        # Return the hexadecimal digest.
+        return hash_object.hexdigest()
+
+
+    @staticmethod
+    def store_file(object_store_directory_path: str, file_path: Union[str, Path], compression: str, compression_level: int) -> tuple[str, int, str]:
+        """
+
+        Description:
+            Hashes the content of the file specified by the file path.
+            If no object holds that content yet, streams the file to a temporary file within the object store while hashing and compressing it,
+            and moves the temporary file in place under the digest of what was actually copied (the file may change in between).
+            Otherwise, writes nothing.
+
+        Args:
+            object_store_directory_path(str): Path for the object store directory.
+            file_path(Union[str, Path]): Path for the file to store.
+            compression(str): Compression to store a new object with.
+            compression_level(int): Compression level to store a new object with.
+
+        Returns:
+            tuple[str, int, str]: Hexadecimal digest and size of the uncompressed content, and the compression of the object holding it.
+
+        Raises:
+            BaseException:
+                If the content cannot be stored (e.g. the file is deleted or the disk is full),
+                then delete the temporary file and delegate handling to the caller.
+
+        """
+
+        # Constants for the storage of the file modes.
+        FILE_MODE_READ_BINARY = String.FILE_MODE_READ_BINARY
+        FILE_MODE_WRITE_BINARY = String.FILE_MODE_WRITE_BINARY
+
+        # Hash and assign the digest of the content of the file.
+        digest = ObjectStore.hash_file(file_path)
+
+        # Assign the compression of the object already holding the content, if any.
+        stored_compression = ObjectStore.find_stored_compression(object_store_directory_path, digest)
+
+        # If an object already holds the content of the file:
+        if stored_compression is not None:
+            # Refresh the last modified time of the object, so that the garbage collection spares it until the backup manifest referencing it is written.
+            os.utime(ObjectStore.get_object_path(object_store_directory_path, digest, stored_compression))
+
+            # Return the digest and size of the content, and the compression of the object.
+            return digest, os.path.getsize(file_path), stored_compression
+
+        # Create the object store directory tree.
+        PathUtils.create_directory_tree(object_store_directory_path)
+
+        # Construct the path for the temporary file.
+        temporary_file_path = object_store_directory_path + os.path.sep + String.generate_random_string() + String.BACKUP_TEMPORARY_FILE_EXTENSION
+
+        # Create the hash object.
+        hash_object = hashlib.new(String.BACKUP_OBJECT_HASH_ALGORITHM)
+
+        # Attempt to:
+        try:
+            # Open the file with the file mode read binary, and the temporary file with the file mode write binary.
+            with open(file_path, FILE_MODE_READ_BINARY) as source_file, open(temporary_file_path, FILE_MODE_WRITE_BINARY) as temporary_file:
+                # Stream, hash and compress the file to the temporary file; Assign the size of the copied content.
+                size = CompressionCodec.compress_stream(source_file, temporary_file, compression, compression_level, hash_object)
+
+            # Assign the digest of the copied content.
+            digest = hash_object.hexdigest()
+
+            # Create the directory for the object.
+            PathUtils.create_directory_tree(os.path.dirname(ObjectStore.get_object_path(object_store_directory_path, digest, compression)))
+
+            # Move the temporary file in place.
+            os.replace(temporary_file_path, ObjectStore.get_object_path(object_store_directory_path, digest, compression))
+
+        # Handle: BaseException.
+        except BaseException:
+            # If the temporary file is left behind:
+            if PathUtils.is_path_exist(temporary_file_path):
+                # Delete the temporary file.
+                os.remove(temporary_file_path)
+
+            # Delegate handling to the caller.
+            raise
+
+        # Return the digest and size of the content, and the compression of the object.
+        return digest, size, compression
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,541 @@
+# Standard library imports.
+import json
+import os
+import threading
+import time
+
+# Standard library from imports.
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Union
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _jsonx.properties_json_handler import PropertiesJsonHandler
+from _path.path_utils import PathUtils
+from _storage.backup_manifest import BackupManifest
+from _storage.delta_chain import DeltaChain
+from _storage.object_store import ObjectStore
+
+
+class RetentionPruner:
+    """
+
+    RetentionPruner applies grandfather-father-son retention policies to the versions kept within the central backup directory.
+
+    A retention policy keeps:
+        Every version younger than the keep-all time,
+        The newest version per hour, for versions younger than the hourly time,
+        The newest version per day, for versions younger than the daily time,
+    and then trims the kept versions, oldest first, down to the maximum number of versions and the maximum number of bytes (zero means unlimited).
+    The age of a version is read from the modification timestamp encoded in its file name.
+
+    Every target follows the global default policy, unless its entry in the backup json file overrides parts of it under the retention key.
+    The newest version of a tracked file is always kept; The orphanage follows the global default policy, without that exception.
+
+    RetentionPruner runs in a background thread of the backup service, so that it never blocks the detection loop.
+    It works incrementally, a few backup directories per step, and keeps delta chains valid by rebasing the deltas that depend on pruned versions.
+    Whenever deduplicated versions are pruned, it deletes the objects of the object store no longer referenced by any backup manifest.
+
+    """
+
+    # Variable for the storage of the background thread.
+    _thread: threading.Thread = None
+
+
+    @staticmethod
+    def collect_garbage(backup_directory_path: str) -> int:
+        """
+
+        Description:
+            Reads the backup manifests of all versions within the central backup directory, including the orphanage.
+            Deletes the objects of the object store that none of the deduplicated versions references.
+
+        Args:
+            backup_directory_path(str): Path for the central backup directory.
+
+        Returns:
+            int: Number of deleted objects.
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of string literals.
+        BACKUP_FILE_EXTENSION = String.BACKUP_FILE_EXTENSION
+        BACKUP_OBJECT_STORE_DIRNAME = String.BACKUP_OBJECT_STORE_DIRNAME
+
+        # Construct the path for the object store directory.
+        object_store_directory_path = backup_directory_path + os.path.sep + BACKUP_OBJECT_STORE_DIRNAME
+
+        # If there is no object store:
+        if not PathUtils.is_directory(object_store_directory_path):
+            # Return no deleted objects.
+            return 0
+
+        # Variable for the storage of the referenced digests.
+        referenced_digest_set = set()
+
+        # For every directory within the central backup directory:
+        for directory_path, directory_name_list, filename_list in os.walk(backup_directory_path):
+            # Skip the object store.
+            directory_name_list[:] = [name for name in directory_name_list if name != BACKUP_OBJECT_STORE_DIRNAME]
+
+            # For every backup file within the directory:
+            for filename in (name for name in filename_list if name.endswith(BACKUP_FILE_EXTENSION)):
+                # Attempt to:
+                try:
+                    # Read and assign the backup manifest of the backup file.
+                    manifest_dict = BackupManifest.read(directory_path + os.path.sep + filename)
+
+                # Handle: FileNotFoundError.
+                except FileNotFoundError:
+                    # Ignore.
+                    continue
+
+                # If the backup file references an object:
+                if manifest_dict is not None and manifest_dict.get(String.LITERAL_STORAGE_MODE) == String.BACKUP_STORAGE_MODE_DEDUPLICATED:
+                    # Mark its digest as referenced.
+                    referenced_digest_set.add(manifest_dict[String.LITERAL_DIGEST])
+
+        # Delete the unreferenced objects, and return their number.
+        return ObjectStore.delete_unreferenced_objects(object_store_directory_path, referenced_digest_set)
+
+
+    @staticmethod
+    def get_policy(json_entry: dict) -> dict:
+        """
+
+        Description:
+            Merges the retention settings of the target specified by the json entry into the global default policy.
+
+        Args:
+            json_entry(dict): Backup json entry of the target, or None for the global default policy.
+
+        Returns:
+            dict: Retention policy; Keep-all, hourly and daily times (in seconds), maximum number of versions and maximum number of bytes.
+
+        Raises:
+            None
+
+        """
+
+        # Create the dictionary for the global default policy.
+        policy_dict = {
+                String.LITERAL_KEEP_ALL_TIME : Integer.BACKUP_RETENTION_KEEP_ALL_TIME,
+                String.LITERAL_HOURLY_TIME : Integer.BACKUP_RETENTION_HOURLY_TIME,
+                String.LITERAL_DAILY_TIME : Integer.BACKUP_RETENTION_DAILY_TIME,
+                String.LITERAL_MAX_VERSIONS : Integer.BACKUP_RETENTION_MAX_VERSIONS,
+                String.LITERAL_MAX_BYTES : Integer.BACKUP_RETENTION_MAX_BYTES
+            }
+
+        # Override the global default policy with the retention settings of the target, if any.
+        policy_dict.update((json_entry or {}).get(String.LITERAL_RETENTION, {}))
+
+        # Return the retention policy.
+        return policy_dict
+
+
+    @staticmethod
+    def prune_directory(directory_path: Union[str, Path], policy_dict: dict, is_newest_kept: bool) -> bool:
+        """
+
+        Description:
+            Groups the versions within the backup directory by backed up file, based on their file names.
+            Selects the versions that the retention policy does not keep, and deletes them, oldest first.
+            Before a version is deleted, the nearest older version still kept is made independent of it, if it is a delta against it.
+            Deletes the temporary files left behind by crashes once they exceed their grace time.
+            Deletes the backup directory once it holds no versions (nor their digest sidecar files) anymore, unless the newest versions are kept.
+
+        Args:
+            directory_path(Union[str, Path]): Path for the backup directory.
+            policy_dict(dict): Retention policy.
+            is_newest_kept(bool): Whether the newest version of every backed up file is kept regardless of the retention policy.
+
+        Returns:
+            bool: Whether a deduplicated version was deleted, which calls for the garbage collection of the object store.
+
+        Raises:
+            None
+
+        """
+
+        # Constant for the storage of the backup file extension.
+        BACKUP_FILE_EXTENSION = String.BACKUP_FILE_EXTENSION
+
+        # Assign the current time.
+        current_time = datetime.now()
+
+        # Variable for the storage of the versions, keyed by the file names of the backed up files.
+        version_list_dict = {}
+
+        # For every item within the backup directory:
+        for entry in os.scandir(directory_path):
+            # If the item is a temporary file left behind by a crash; Its metadata change time is not preserved from the target file, unlike its last modified time:
+            if entry.name.endswith(String.BACKUP_TEMPORARY_FILE_EXTENSION) and entry.is_file() and time.time() - entry.stat().st_ctime > Integer.BACKUP_TEMPORARY_FILE_GRACE_TIME:
+                # Delete the temporary file.
+                os.remove(entry.path)
+
+                # Skip to the next item.
+                continue
+
+            # If the item is not a backup file:
+            if not entry.name.endswith(BACKUP_FILE_EXTENSION) or not entry.is_file():
+                # Skip it.
+                continue
+
+            # Parse and assign the modification timestamp of the version.
+            timestamp = RetentionPruner._parse_timestamp(entry.name)
+
+            # If the file name does not encode a modification timestamp:
+            if timestamp is None:
+                # Skip it.
+                continue
+
+            # Add the version to the versions of its backed up file.
+            version_list_dict.setdefault(entry.name[:-len(BACKUP_FILE_EXTENSION)].rsplit('_', 2)[0], []).append((entry.path, timestamp, entry.stat().st_size))
+
+        # Variable for the storage of whether a deduplicated version was deleted.
+        is_deduplicated_version_deleted = False
+
+        # For every backed up file:
+        for version_list in version_list_dict.values():
+            # Sort the versions, oldest first.
+            version_list.sort()
+
+            # Select the versions to prune.
+            pruned_path_set = RetentionPruner.select_versions_to_prune(version_list, policy_dict, current_time, is_newest_kept)
+
+            # Variable for the storage of the path for the nearest older version that is kept.
+            kept_path = None
+
+            # For every version, oldest first:
+            for version_path, _, _ in version_list:
+                # If the version is kept:
+                if version_path not in pruned_path_set:
+                    # Remember it as the nearest older version that is kept.
+                    kept_path = version_path
+
+                    # Continue with the next version.
+                    continue
+
+                # If the nearest older version that is kept is a delta against the version:
+                if kept_path is not None and (BackupManifest.read(kept_path) or {}).get(String.LITERAL_BASE) == os.path.basename(version_path):
+                    # Make it independent of the version.
+                    DeltaChain.bypass_base(kept_path)
+
+                # Read and assign the backup manifest of the version.
+                manifest_dict = BackupManifest.read(version_path)
+
+                # Remember whether the version is deduplicated.
+                is_deduplicated_version_deleted |= manifest_dict is not None and manifest_dict.get(String.LITERAL_STORAGE_MODE) == String.BACKUP_STORAGE_MODE_DEDUPLICATED
+
+                # Delete the version.
+                os.remove(version_path)
+
+        # If the newest versions are not kept:
+        if not is_newest_kept:
+            # Assign the names of the items left within the backup directory.
+            filename_list = os.listdir(directory_path)
+
+            # If only the sidecar files recording the digests of deleted versions are left:
+            if all(filename.endswith(String.BACKUP_DIGEST_FILE_EXTENSION) for filename in filename_list):
+                # For every sidecar file:
+                for filename in filename_list:
+                    # Delete the sidecar file.
+                    os.remove(os.path.join(directory_path, filename))
+
+                # Delete the backup directory, which is now empty.
+                os.rmdir(directory_path)
+
+        # Return whether a deduplicated version was deleted.
+        return is_deduplicated_version_deleted
+
+
+    @staticmethod
+    def select_versions_to_prune(version_list: list[tuple[str, datetime, int]], policy_dict: dict, current_time: datetime, is_newest_kept: bool) -> set[str]:
+        """
+
+        Description:
+            Walks the versions of a backed up file, newest first, and keeps:
+                Every version younger than the keep-all time,
+                The newest version per hour, for versions younger than the hourly time,
+                The newest version per day, for versions younger than the daily time.
+            Trims the kept versions down to the maximum number of versions and the maximum number of bytes, oldest first.
+
+        Args:
+            version_list(list[tuple[str, datetime, int]]): Versions, oldest first; Path, modification timestamp and size.
+            policy_dict(dict): Retention policy.
+            current_time(datetime): Current time.
+            is_newest_kept(bool): Whether the newest version is kept regardless of the retention policy.
+
+        Returns:
+            set[str]: Paths for the versions to prune.
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of the retention policy.
+        KEEP_ALL_TIME = policy_dict[String.LITERAL_KEEP_ALL_TIME]
+        HOURLY_TIME = policy_dict[String.LITERAL_HOURLY_TIME]
+        DAILY_TIME = policy_dict[String.LITERAL_DAILY_TIME]
+        MAX_VERSIONS = policy_dict[String.LITERAL_MAX_VERSIONS]
+        MAX_BYTES = policy_dict[String.LITERAL_MAX_BYTES]
+
+        # Variables for the storage of the kept versions, newest first, and of the buckets they fill.
+        kept_version_list = []
+        bucket_set = set()
+
+        # For every version, newest first:
+        for position, (version_path, timestamp, size) in enumerate(reversed(version_list)):
+            # Calculate the age of the version (in seconds).
+            age = (current_time - timestamp).total_seconds()
+
+            # If the version is the newest and newest versions are kept, or the version is younger than the keep-all time:
+            if (position == 0 and is_newest_kept) or age <= KEEP_ALL_TIME:
+                # Assign no bucket, as the version is kept regardless.
+                bucket = None
+
+            # If the version is younger than the hourly time:
+            elif age <= HOURLY_TIME:
+                # Assign the hour of the version as its bucket.
+                bucket = timestamp.replace(minute=0, second=0, microsecond=0)
+
+            # If the version is younger than the daily time:
+            elif age <= DAILY_TIME:
+                # Assign the day of the version as its bucket.
+                bucket = timestamp.date()
+
+            # If the version is older than the daily time:
+            else:
+                # Prune the version.
+                continue
+
+            # If a newer version already fills the bucket:
+            if bucket is not None and bucket in bucket_set:
+                # Prune the version.
+                continue
+
+            # Fill the bucket.
+            bucket_set.add(bucket)
+
+            # Keep the version.
+            kept_version_list.append((version_path, size))
+
+        # Variable for the storage of the bytes of the kept versions.
+        kept_size = 0
+
+        # For every kept version, newest first:
+        for position, (version_path, size) in enumerate(kept_version_list):
+            # Account for the size of the version.
+            kept_size += size
+
+            # If the version exceeds the maximum number of versions or the maximum number of bytes, and it may be pruned:
+            if ((MAX_VERSIONS and position >= MAX_VERSIONS) or (MAX_BYTES and kept_size > MAX_BYTES)) and not (position == 0 and is_newest_kept):
+                # Prune it, along with all older kept versions.
+                kept_version_list = kept_version_list[:position]
+
+                # Stop trimming.
+                break
+
+        # Return the paths for the versions that are not kept.
+        return {version_path for version_path, _, _ in version_list} - {version_path for version_path, _ in kept_version_list}
+
+
+    @staticmethod
+    def start() -> None:
+        """
+
+        Description:
+            Starts the background thread of the retention pruner, unless it is already running.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # If the background thread is already running:
+        if RetentionPruner._thread is not None and RetentionPruner._thread.is_alive():
+            # Stop the starting.
+            return
+
+        # Create the background thread; Daemonic, so that it ends along with the backup service.
+        RetentionPruner._thread = threading.Thread(target=RetentionPruner._run, name=String.BACKUP_RETENTION_THREAD_NAME, daemon=True)
+
+        # Start the background thread.
+        RetentionPruner._thread.start()
+
+
+    @staticmethod
+    def _iterate_directories(backup_directory_path: str) -> Iterator[tuple[str, dict, bool]]:
+        """
+
+        Description:
+            Reads the backup json file.
+            Yields every backup directory of every target, with the retention policy of the target.
+            Yields every directory within the orphanage, with the global default policy.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            backup_directory_path(str): Path for the central backup directory.
+
+        Returns:
+            Iterator[tuple[str, dict, bool]]: Path for the backup directory, its retention policy, and whether the newest versions are kept regardless.
+
+        Raises:
+            None
+
+        """
+
+        # Open the backup json file with the file mode read.
+        with open(backup_directory_path + os.path.sep + String.BACKUP_FILENAME, String.FILE_MODE_READ) as file:
+            # Assign the json data.
+            data = json.load(file)
+
+        # For every target:
+        for json_entry in data.values():
+            # Assign the retention policy of the target.
+            policy_dict = RetentionPruner.get_policy(json_entry)
+
+            # For every directory within the backup directory of the target:
+            for directory_path, _, _ in os.walk(backup_directory_path + os.path.sep + json_entry[String.LITERAL_BACKUP_DIRNAME]):
+                # Yield the directory with the retention policy of the target.
+                yield directory_path, policy_dict, True
+
+        # Assign the global default policy.
+        policy_dict = RetentionPruner.get_policy(None)
+
+        # Construct the path for the orphanage directory.
+        orphanage_directory_path = backup_directory_path + os.path.sep + String.LITERAL_ORPHANAGE
+
+        # For every directory within the orphanage, deepest first:
+        for directory_path, _, _ in os.walk(orphanage_directory_path, topdown=False):
+            # If the directory is not the orphanage itself:
+            if directory_path != orphanage_directory_path:
+                # Yield the directory with the global default policy.
+                yield directory_path, policy_dict, False
+
+
+    @staticmethod
+    def _parse_timestamp(filename: str) -> datetime:
+        """
+
+        Description:
+            Parses the modification timestamp encoded in the file name of a version; File name + "_" + Modification timestamp + Backup file extension.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            filename(str): File name of the version.
+
+        Returns:
+            datetime: Modification timestamp, or None if the file name does not encode one.
+
+        Raises:
+            ValueError:
+                If the file name does not encode a modification timestamp,
+                then return None.
+
+        """
+
+        # Split the file name into the backed up file name, the date and the time.
+        part_list = filename[:-len(String.BACKUP_FILE_EXTENSION)].rsplit('_', 2)
+
+        # Attempt to:
+        try:
+            # Return the parsed modification timestamp.
+            return datetime.strptime('_'.join(part_list[-2:]), String.FORMAT_LAST_MODIFIED_TIME)
+
+        # Handle: ValueError.
+        except ValueError:
+            # Return no modification timestamp.
+            return None
+
+
+    @staticmethod
+    def _run() -> None:
+        """
+
+        Description:
+            Passes over the central backup directory indefinitely, pruning a few backup directories per step.
+            Collects the garbage of the object store after the first pass, and after every pass that deleted deduplicated versions.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            OSError | ValueError:
+                If a backup directory or the backup json file changes underneath the retention pruner (e.g. the backup service moves an orphan directory),
+                then skip it until the next pass.
+
+        """
+
+        # Constants for the storage of the pacing of the retention pruner.
+        BACKUP_RETENTION_DIRECTORIES_PER_STEP = Integer.BACKUP_RETENTION_DIRECTORIES_PER_STEP
+        BACKUP_RETENTION_PASS_WAIT_TIME = Integer.BACKUP_RETENTION_PASS_WAIT_TIME
+        BACKUP_RETENTION_STEP_WAIT_TIME = Integer.BACKUP_RETENTION_STEP_WAIT_TIME
+
+        # Variable for the storage of whether the garbage of the object store must be collected.
+        is_garbage_collection_required = True
+
+        # Loop indefinitely.
+        while True:
+            # Attempt to:
+            try:
+                # Assign the central backup directory.
+                backup_directory_path = PropertiesJsonHandler.get_backup_directory()
+
+                # For every backup directory:
+                for count, (directory_path, policy_dict, is_newest_kept) in enumerate(RetentionPruner._iterate_directories(backup_directory_path), 1):
+                    # Attempt to:
+                    try:
+                        # Prune the backup directory.
+                        is_garbage_collection_required |= RetentionPruner.prune_directory(directory_path, policy_dict, is_newest_kept)
+
+                    # Handle: OSError, ValueError.
+                    except (OSError, ValueError):
+                        # Skip the backup directory until the next pass.
+                        pass
+
+                    # If the step is complete:
+                    if count % BACKUP_RETENTION_DIRECTORIES_PER_STEP == 0:
+                        # Wait before the next step.
+                        time.sleep(BACKUP_RETENTION_STEP_WAIT_TIME)
+
+                # If the garbage of the object store must be collected:
+                if is_garbage_collection_required:
+                    # Collect the garbage of the object store.
+                    RetentionPruner.collect_garbage(backup_directory_path)
+
+                    # Clear the requirement.
+                    is_garbage_collection_required = False
+
+            # Handle: OSError, ValueError.
+            except (OSError, ValueError):
+                # Skip the pass.
+                pass
+
+            # Wait before the next pass.
+            time.sleep(BACKUP_RETENTION_PASS_WAIT_TIME)
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
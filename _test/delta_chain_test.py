@@ -0,0 +1,219 @@
+# Standard library imports.
+import hashlib
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+# Standard library from imports.
+from datetime import datetime, timedelta
+
+# Project-specific module imports.
+from _constant.string import String
+from _jsonx.backup_json_handler import BackupJsonHandler
+from _storage.backup_manifest import BackupManifest
+from _storage.backup_restorer import BackupRestorer
+
+
+class DeltaChainTest(unittest.TestCase):
+    """
+
+    DeltaChainTest checks the delta storage mode against a temporary backup directory.
+
+    Developers can run it from the project root directory with:
+        python3 -m unittest _test.delta_chain_test
+
+    """
+
+
+    def setUp(self) -> None:
+        """
+
+        Description:
+            Creates the temporary directory, and the json entry of a target backed up in the delta storage mode.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Create the temporary directory.
+        self.directory_path = tempfile.mkdtemp()
+
+        # Create the dictionary for the json entry of the target.
+        self.json_entry = {
+                String.LITERAL_STORAGE_MODE : String.BACKUP_STORAGE_MODE_DELTA
+            }
+
+        # Construct the path for the target file.
+        self.target_file_path = self.directory_path + os.path.sep + 'target.bin'
+
+        # Create the random number generator; Seeded, so that runs are comparable.
+        self.generator = random.Random(0)
+
+
+    def tearDown(self) -> None:
+        """
+
+        Description:
+            Deletes the temporary directory.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Delete the temporary directory.
+        shutil.rmtree(self.directory_path)
+
+
+    def test_insertion_backup(self) -> None:
+        """
+
+        Description:
+            Backs up two versions of the target file, the second of which has bytes inserted near its start and deleted near its end,
+            so that no block of the first version is found at its original offset within the second version.
+            Checks that the first version is kept as a delta much smaller than itself, and that it is restored as it was backed up.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Assign the content of the first version.
+        content = self.generator.randbytes(32 * 65536)
+
+        # Assign the content of the second version; A few bytes inserted near the start, and a few bytes deleted near the end.
+        edited_content = content[:100] + self.generator.randbytes(8) + content[100:-1000] + content[-990:]
+
+        # Assign the timestamp of the first version.
+        timestamp = datetime.now()
+
+        # Variable for the storage of the paths for the backup files of the versions.
+        backup_file_path_list = []
+
+        # For every version:
+        for version_index, version_content in enumerate([content, edited_content]):
+            # Open the target file with the file mode write binary.
+            with open(self.target_file_path, String.FILE_MODE_WRITE_BINARY) as file:
+                # Write the content to the target file.
+                file.write(version_content)
+
+            # Construct the path for the backup file; File name + Modification timestamp + Backup file extension.
+            backup_file_path = self.directory_path + os.path.sep + 'target.bin_' + (timestamp + timedelta(seconds=version_index)).strftime(String.FORMAT_LAST_MODIFIED_TIME) + String.BACKUP_FILE_EXTENSION
+
+            # Back up the target file.
+            self.assertTrue(BackupJsonHandler.create_backup_file(self.target_file_path, backup_file_path, self.json_entry))
+
+            # Remember the path for the backup file.
+            backup_file_path_list.append(backup_file_path)
+
+        # Check that the first version was kept as a delta.
+        self.assertIsNotNone(BackupManifest.read(backup_file_path_list[0]))
+
+        # Check that the delta holds little more than the blocks around the edits.
+        self.assertLess(os.path.getsize(backup_file_path_list[0]), 4 * 65536)
+
+        # Construct the path for the restored file.
+        restored_file_path = self.directory_path + os.path.sep + 'restored.bin'
+
+        # Restore the first version.
+        BackupRestorer.restore_backup_file(backup_file_path_list[0], restored_file_path)
+
+        # Open the restored file with the file mode read binary.
+        with open(restored_file_path, String.FILE_MODE_READ_BINARY) as file:
+            # Check that the restored content matches the first version.
+            self.assertEqual(file.read(), content)
+
+
+    def test_same_second_backup(self) -> None:
+        """
+
+        Description:
+            Backs up three versions of the target file, the last two of which share the same timestamp (to the second),
+            so that the third version overwrites the second one, which is the base of the delta of the first one.
+            Checks that the first version and the overwriting version are both restored as they were backed up.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Assign the timestamps of the versions; The last two within the same second.
+        timestamp = datetime.now()
+        timestamp_list = [timestamp, timestamp + timedelta(seconds=1), timestamp + timedelta(seconds=1)]
+
+        # Variable for the storage of the digests of the versions, keyed by the paths for their backup files.
+        digest_dict = {}
+
+        # Variable for the storage of the content of the target file.
+        content = bytearray(self.generator.randbytes(16 * 65536))
+
+        # For every timestamp:
+        for version_timestamp in timestamp_list:
+            # Overwrite a few bytes of the content.
+            content[self.generator.randrange(len(content))] ^= 0xFF
+
+            # Open the target file with the file mode write binary.
+            with open(self.target_file_path, String.FILE_MODE_WRITE_BINARY) as file:
+                # Write the content to the target file.
+                file.write(content)
+
+            # Construct the path for the backup file; File name + Modification timestamp + Backup file extension.
+            backup_file_path = self.directory_path + os.path.sep + 'target.bin_' + version_timestamp.strftime(String.FORMAT_LAST_MODIFIED_TIME) + String.BACKUP_FILE_EXTENSION
+
+            # Back up the target file.
+            self.assertTrue(BackupJsonHandler.create_backup_file(self.target_file_path, backup_file_path, self.json_entry))
+
+            # Remember the digest of the version; The overwriting version replaces the overwritten one.
+            digest_dict[backup_file_path] = hashlib.sha256(content).hexdigest()
+
+        # Assign the path for the first version.
+        first_version_path = next(iter(digest_dict))
+
+        # Check that the first version was kept as a delta.
+        self.assertIsNotNone(BackupManifest.read(first_version_path))
+
+        # For every version left:
+        for backup_file_path, digest in digest_dict.items():
+            # Construct the path for the restored file.
+            restored_file_path = self.directory_path + os.path.sep + 'restored.bin'
+
+            # Restore the version.
+            BackupRestorer.restore_backup_file(backup_file_path, restored_file_path)
+
+            # Open the restored file with the file mode read binary.
+            with open(restored_file_path, String.FILE_MODE_READ_BINARY) as file:
+                # Check that the restored content matches the version.
+                self.assertEqual(hashlib.sha256(file.read()).hexdigest(), digest)
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Run the tests.
+    unittest.main()
\ No newline at end of file
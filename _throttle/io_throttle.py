@@ -0,0 +1,455 @@
+# Standard library imports.
+import os
+import threading
+import time
+
+# Project-specific module imports.
+from _constant.integer import Integer
+from _constant.string import String
+from _jsonx.properties_json_handler import PropertiesJsonHandler
+from _throttle.token_bucket import TokenBucket
+
+
+class IoThrottle:
+    """
+
+    IoThrottle paces the backup copies, so that bursts of modifications do not saturate the disks shared with production applications.
+
+    Backup workers acquire the throttle before every copy, with the number of bytes they are about to copy:
+        Token buckets limit the bytes and the files copied per second, both globally and per target; A copy waits for every bucket concerned.
+        In idle-only mode, a copy also waits while the utilization of any disk (as told by /proc/diskstats) exceeds the threshold,
+        for up to the maximum wait, so that backups are deferred rather than starved on disks that are never idle.
+
+    The throttle is configured with the "BACKUP_THROTTLE" attribute within the properties json file (global), and the "THROTTLE" key within backup json entries (per target):
+        "BYTES_PER_SECOND": Number of bytes copied per second; 0 is unlimited.
+        "FILES_PER_SECOND": Number of files copied per second; 0 is unlimited.
+        "IDLE_ONLY": Whether copies wait while the disks are busy.
+        "IDLE_THRESHOLD": Utilization above which a disk is busy (in percent).
+        "IDLE_MAX_WAIT": Maximum time a copy waits for the disks to become idle (in seconds).
+    Targets inherit the idle-only settings they do not set from the global ones, while their rates apply on top of the global rates.
+
+    The state of the throttle, the time copies waited and the sampled disk utilization are exposed for the metrics of the backup service.
+
+    """
+
+    # Constant for the storage of the key of the global token buckets within the bucket dictionary.
+    _GLOBAL_BUCKET_KEY: str = ''
+
+    # Variable for the storage of the token buckets, keyed by the paths of their targets (global buckets by an empty path) and the limited resources.
+    _bucket_dict: dict[tuple[str, str], TokenBucket] = {}
+
+    # Variable for the storage of the I/O time counters of the disks at the last sample (in milliseconds), keyed by the device names.
+    _disk_io_time_dict: dict[str, int] = {}
+
+    # Variable for the storage of the monotonic time of the last sample of the disk utilization.
+    _disk_sampled_at: float = float('-inf')
+
+    # Variable for the storage of the highest disk utilization at the last sample (in percent); None if not sampled yet.
+    _disk_utilization: float = None
+
+    # Variable for the storage of the number of copies waiting for the disks to become idle.
+    _idle_waiting_count: int = 0
+
+    # Variable for the storage of the lock guarding the token buckets, the disk samples and the counters.
+    _lock: threading.Lock = threading.Lock()
+
+    # Variable for the storage of the number of copies waiting for the token buckets.
+    _rate_waiting_count: int = 0
+
+    # Variable for the storage of the total time copies waited for the throttle (in seconds).
+    _wait_time: float = 0.0
+
+
+    @staticmethod
+    def acquire(json_entry: dict, byte_count: int) -> float:
+        """
+
+        Description:
+            Waits for the disks to become idle, if the target is copied in idle-only mode.
+            Waits until neither the global token buckets nor those of the target are in debt,
+            then consumes the number of bytes and a file from each of them.
+
+        Args:
+            json_entry(dict): Backup json entry of the target, holding its throttle settings.
+            byte_count(int): Number of bytes about to be copied.
+
+        Returns:
+            float: Time waited for the throttle (in seconds).
+
+        Raises:
+            None
+
+        """
+
+        # Constants for the storage of string literals.
+        BYTES_PER_SECOND = String.LITERAL_BYTES_PER_SECOND
+        FILES_PER_SECOND = String.LITERAL_FILES_PER_SECOND
+
+        # Assign the global throttle policy, and the throttle settings of the target.
+        global_policy_dict = IoThrottle.get_policy(None)
+        target_setting_dict = (json_entry or {}).get(String.LITERAL_THROTTLE, {})
+
+        # Assign the throttle policy of the target; The global one, overridden by the settings of the target.
+        policy_dict = dict(global_policy_dict, **target_setting_dict)
+
+        # Assign the start time of the acquisition.
+        start_time = time.monotonic()
+
+        # If the target is copied in idle-only mode:
+        if policy_dict[String.LITERAL_IDLE_ONLY]:
+            # Wait for the disks to become idle.
+            IoThrottle._wait_for_idle_disks(policy_dict[String.LITERAL_IDLE_THRESHOLD], policy_dict[String.LITERAL_IDLE_MAX_WAIT])
+
+        # Assign the path of the target.
+        target_path = (json_entry or {}).get(String.LITERAL_PATH, IoThrottle._GLOBAL_BUCKET_KEY)
+
+        # Variable for the storage of the token buckets concerned by the copy, along with the number of tokens to consume from each.
+        bucket_list = []
+
+        # With the lock acquired:
+        with IoThrottle._lock:
+            # For every scope, limited resource and number of tokens to consume:
+            for key, setting_dict, resource, amount in ((IoThrottle._GLOBAL_BUCKET_KEY, global_policy_dict, BYTES_PER_SECOND, byte_count),
+                                                        (IoThrottle._GLOBAL_BUCKET_KEY, global_policy_dict, FILES_PER_SECOND, 1),
+                                                        (target_path, target_setting_dict, BYTES_PER_SECOND, byte_count),
+                                                        (target_path, target_setting_dict, FILES_PER_SECOND, 1)):
+                # Assign the token bucket of the scope and resource.
+                bucket = IoThrottle._get_bucket(key, resource, setting_dict.get(resource, 0), start_time)
+
+                # If the resource is limited:
+                if bucket is not None:
+                    # Remember the token bucket along with the number of tokens to consume.
+                    bucket_list.append((bucket, amount))
+
+        # Variable for the storage of whether the copy is counted as waiting for the token buckets.
+        is_waiting = False
+
+        # Loop until the token buckets allow the copy.
+        while True:
+            # With the lock acquired:
+            with IoThrottle._lock:
+                # Assign the current monotonic time.
+                current_time = time.monotonic()
+
+                # Assign the time until every token bucket is out of debt.
+                wait_time = max((bucket.get_wait_time(current_time) for bucket, _ in bucket_list), default=0)
+
+                # If no token bucket is in debt:
+                if wait_time <= 0:
+                    # For every token bucket and number of tokens to consume:
+                    for bucket, amount in bucket_list:
+                        # Consume the tokens.
+                        bucket.consume(amount, current_time)
+
+                    # If the copy was counted as waiting:
+                    if is_waiting:
+                        # Uncount the copy.
+                        IoThrottle._rate_waiting_count -= 1
+
+                    # Assign the time waited, and account for it.
+                    wait_time = current_time - start_time
+                    IoThrottle._wait_time += wait_time
+
+                    # Return the time waited.
+                    return wait_time
+
+                # If the copy is not counted as waiting yet:
+                if not is_waiting:
+                    # Count the copy as waiting.
+                    IoThrottle._rate_waiting_count += 1
+                    is_waiting = True
+
+            # Wait for the debt to be repaid; At most for the poll time, so that changes of the settings take effect.
+            time.sleep(min(wait_time, Integer.BACKUP_THROTTLE_POLL_TIME))
+
+
+    @staticmethod
+    def get_metrics() -> dict:
+        """
+
+        Description:
+            Retrieves the metrics of the throttle.
+
+        Args:
+            None
+
+        Returns:
+            dict: State of the throttle, number of copies waiting, total time copies waited (in seconds), and the highest disk utilization at the last sample (in percent).
+
+        Raises:
+            None
+
+        """
+
+        # With the lock acquired:
+        with IoThrottle._lock:
+            # If copies wait for the disks to become idle:
+            if IoThrottle._idle_waiting_count:
+                # Assign the state as waiting for idle disks.
+                state = String.BACKUP_THROTTLE_STATE_IDLE_WAIT
+
+            # If copies wait for the token buckets:
+            elif IoThrottle._rate_waiting_count:
+                # Assign the state as rate limited.
+                state = String.BACKUP_THROTTLE_STATE_RATE_LIMITED
+
+            # If no copy waits:
+            else:
+                # Assign the state as unthrottled.
+                state = String.BACKUP_THROTTLE_STATE_UNTHROTTLED
+
+            # Return the metrics.
+            return {
+                    String.LITERAL_BACKUP_THROTTLE_STATE : state,
+                    String.LITERAL_BACKUP_THROTTLE_WAITING_COUNT : IoThrottle._idle_waiting_count + IoThrottle._rate_waiting_count,
+                    String.LITERAL_BACKUP_THROTTLE_WAIT_TIME : round(IoThrottle._wait_time, 3),
+                    String.LITERAL_DISK_UTILIZATION : None if IoThrottle._disk_utilization is None else round(IoThrottle._disk_utilization, 1)
+                }
+
+
+    @staticmethod
+    def get_policy(json_entry: dict) -> dict:
+        """
+
+        Description:
+            Merges the global throttle settings from the properties json file, and the throttle settings of the target specified by the json entry, into the default policy.
+
+        Args:
+            json_entry(dict): Backup json entry of the target, or None for the global policy.
+
+        Returns:
+            dict: Throttle policy; Bytes and files per second, idle-only mode, idle threshold (in percent) and maximum idle wait (in seconds).
+
+        Raises:
+            None
+
+        """
+
+        # Create the dictionary for the default policy.
+        policy_dict = {
+                String.LITERAL_BYTES_PER_SECOND : Integer.BACKUP_DEFAULT_BYTES_PER_SECOND,
+                String.LITERAL_FILES_PER_SECOND : Integer.BACKUP_DEFAULT_FILES_PER_SECOND,
+                String.LITERAL_IDLE_ONLY : Integer.BACKUP_DEFAULT_IDLE_ONLY,
+                String.LITERAL_IDLE_THRESHOLD : Integer.BACKUP_DEFAULT_IDLE_THRESHOLD,
+                String.LITERAL_IDLE_MAX_WAIT : Integer.BACKUP_DEFAULT_IDLE_MAX_WAIT
+            }
+
+        # Override the default policy with the global throttle settings, if any.
+        policy_dict.update(PropertiesJsonHandler.get_backup_throttle())
+
+        # Override the global policy with the throttle settings of the target, if any.
+        policy_dict.update((json_entry or {}).get(String.LITERAL_THROTTLE, {}))
+
+        # Return the throttle policy.
+        return policy_dict
+
+
+    @staticmethod
+    def _get_bucket(key: str, resource: str, rate: float, current_time: float) -> TokenBucket:
+        """
+
+        Description:
+            Retrieves the token bucket of the scope and resource, creating it if it does not exist or its rate changed.
+            Forgets the token bucket if the resource is not limited.
+
+            Be noted, the lock must be held by the caller.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            key(str): Path of the target the token bucket belongs to; Empty for the global token buckets.
+            resource(str): Limited resource.
+            rate(float): Number of tokens accrued per second; Zero or less if the resource is not limited.
+            current_time(float): Current monotonic time.
+
+        Returns:
+            TokenBucket: Token bucket, or None if the resource is not limited.
+
+        Raises:
+            None
+
+        """
+
+        # If the resource is not limited:
+        if rate <= 0:
+            # Forget the token bucket, if any.
+            IoThrottle._bucket_dict.pop((key, resource), None)
+
+            # Return no token bucket.
+            return None
+
+        # Assign the token bucket of the scope and resource.
+        bucket = IoThrottle._bucket_dict.get((key, resource))
+
+        # If the token bucket does not exist, or its rate changed:
+        if bucket is None or bucket.rate != rate:
+            # Create and remember a full token bucket for the rate.
+            bucket = IoThrottle._bucket_dict[(key, resource)] = TokenBucket(rate, current_time)
+
+        # Return the token bucket.
+        return bucket
+
+
+    @staticmethod
+    def _get_disk_utilization() -> float:
+        """
+
+        Description:
+            Samples the I/O time counters of the physical disks from /proc/diskstats, unless they were sampled less than the poll time ago.
+            Calculates the utilization of every disk since the previous sample, as the share of the elapsed time it spent doing I/O.
+            If the previous sample is missing or older than twice the poll time (e.g. after a quiet period), it would dilute the utilization of the disks right now;
+            Takes the sample as a new baseline instead, waits for the poll time, and samples again.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            float: Highest utilization among the disks (in percent), or None if it is unknown (e.g. on platforms without /proc/diskstats).
+
+        Raises:
+            OSError:
+                If the disk statistics cannot be read,
+                then report the utilization as unknown.
+
+        """
+
+        # Constant for the storage of the path for the directory listing the block devices.
+        BACKUP_DISK_DEVICE_DIRECTORY_PATH = String.BACKUP_DISK_DEVICE_DIRECTORY_PATH
+
+        # Constants for the storage of the interval between samples, and of the age after which a sample is too old to be a baseline (in seconds).
+        BACKUP_THROTTLE_POLL_TIME = Integer.BACKUP_THROTTLE_POLL_TIME
+        MAXIMUM_BASELINE_AGE = 2 * BACKUP_THROTTLE_POLL_TIME
+
+        # Loop until the utilization is known, or cannot be.
+        while True:
+            # With the lock acquired:
+            with IoThrottle._lock:
+                # Assign the current monotonic time, and the elapsed time since the previous sample.
+                current_time = time.monotonic()
+                elapsed_time = current_time - IoThrottle._disk_sampled_at
+
+                # If the disks were sampled less than the poll time ago:
+                if elapsed_time < BACKUP_THROTTLE_POLL_TIME:
+                    # If the last sample is a baseline, which lacks a utilization although disks were sampled:
+                    if IoThrottle._disk_utilization is None and IoThrottle._disk_io_time_dict:
+                        # Assign the wait time until the baseline can be compared against.
+                        wait_time = BACKUP_THROTTLE_POLL_TIME - elapsed_time
+
+                    # If the last sample holds a utilization, or no disk was sampled:
+                    else:
+                        # Return the utilization of the last sample.
+                        return IoThrottle._disk_utilization
+
+                # If the disks are due for sampling:
+                else:
+                    # Attempt to:
+                    try:
+                        # Assign the names of the physical disks; Virtual block devices (e.g. loop and RAM devices) lack a device link.
+                        disk_name_set = {name for name in os.listdir(BACKUP_DISK_DEVICE_DIRECTORY_PATH) if os.path.exists(os.path.join(BACKUP_DISK_DEVICE_DIRECTORY_PATH, name, String.BACKUP_DISK_DEVICE_LINK_NAME))}
+
+                        # Open the disk statistics file with the file mode read.
+                        with open(String.BACKUP_DISK_STATS_FILE_PATH, String.FILE_MODE_READ) as file:
+                            # Assign the I/O time counters of the physical disks; The tenth statistic after the device name.
+                            io_time_dict = {field_list[2] : int(field_list[12]) for field_list in (line.split() for line in file) if len(field_list) > 12 and field_list[2] in disk_name_set}
+
+                    # Handle: OSError.
+                    except OSError:
+                        # Report the utilization as unknown.
+                        return None
+
+                    # Assign whether the previous sample is too old to be compared against.
+                    is_baseline = elapsed_time >= MAXIMUM_BASELINE_AGE
+
+                    # If the previous sample is too old:
+                    if is_baseline:
+                        # Mark the utilization as unknown until the baseline is compared against.
+                        IoThrottle._disk_utilization = None
+
+                    # If the previous sample is recent:
+                    else:
+                        # Calculate the highest utilization among the disks sampled before.
+                        IoThrottle._disk_utilization = max((min((io_time - IoThrottle._disk_io_time_dict[name]) / (elapsed_time * 1000) * 100, 100) for name, io_time in io_time_dict.items() if name in IoThrottle._disk_io_time_dict), default=None)
+
+                    # Remember the counters and the time of the sample.
+                    IoThrottle._disk_io_time_dict = io_time_dict
+                    IoThrottle._disk_sampled_at = current_time
+
+                    # If the sample is not a baseline, or no disk was sampled:
+                    if not is_baseline or not io_time_dict:
+                        # Return the utilization.
+                        return IoThrottle._disk_utilization
+
+                    # Assign the wait time until the baseline can be compared against.
+                    wait_time = BACKUP_THROTTLE_POLL_TIME
+
+            # Wait for the baseline to be compared against, with the lock released.
+            time.sleep(wait_time)
+
+
+    @staticmethod
+    def _wait_for_idle_disks(threshold: float, maximum_wait_time: float) -> None:
+        """
+
+        Description:
+            Waits while the utilization of any disk exceeds the threshold, for up to the maximum wait time.
+            Does not wait if the utilization is unknown.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            threshold(float): Utilization above which a disk is busy (in percent).
+            maximum_wait_time(float): Maximum wait time (in seconds).
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Assign the deadline of the wait.
+        deadline = time.monotonic() + maximum_wait_time
+
+        # Variable for the storage of whether the copy is counted as waiting for the disks to become idle.
+        is_waiting = False
+
+        # Attempt to:
+        try:
+            # While the deadline is not reached:
+            while time.monotonic() < deadline:
+                # Assign the utilization of the disks.
+                utilization = IoThrottle._get_disk_utilization()
+
+                # If the utilization is unknown, or the disks are idle:
+                if utilization is None or utilization <= threshold:
+                    # Stop the waiting.
+                    break
+
+                # If the copy is not counted as waiting yet:
+                if not is_waiting:
+                    # Count the copy as waiting.
+                    with IoThrottle._lock:
+                        IoThrottle._idle_waiting_count += 1
+
+                    # Remember the copy as counted.
+                    is_waiting = True
+
+                # Wait for the next sample.
+                time.sleep(Integer.BACKUP_THROTTLE_POLL_TIME)
+
+        # Finally:
+        finally:
+            # If the copy was counted as waiting:
+            if is_waiting:
+                # Uncount the copy.
+                with IoThrottle._lock:
+                    IoThrottle._idle_waiting_count -= 1
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -0,0 +1,126 @@
+# Project-specific module imports.
+from _constant.integer import Integer
+
+
+class TokenBucket:
+    """
+
+    TokenBucket limits the rate of a resource (bytes or files copied) to a number of tokens per second.
+
+    Tokens accrue at the rate, up to the capacity (the burst the bucket allows), and are consumed by the copies.
+    A copy may consume more tokens than the bucket holds, leaving it in debt, so that copies larger than the capacity are not blocked forever;
+    The copies that follow wait until the debt is repaid, which keeps the average rate at the limit.
+
+    """
+
+
+    def __init__(self, rate: float, current_time: float) -> None:
+        """
+
+        Description:
+            Creates a full bucket for the rate.
+
+        Args:
+            rate(float): Number of tokens accrued per second.
+            current_time(float): Current monotonic time.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Variable for the storage of the number of tokens accrued per second.
+        self.rate = rate
+
+        # Variable for the storage of the maximum number of tokens the bucket holds.
+        self.capacity = rate * Integer.BACKUP_THROTTLE_BURST_TIME
+
+        # Variable for the storage of the number of tokens the bucket holds; Negative while in debt.
+        self.tokens = self.capacity
+
+        # Variable for the storage of the monotonic time the tokens were last accrued at.
+        self.updated_at = current_time
+
+
+    def consume(self, amount: float, current_time: float) -> None:
+        """
+
+        Description:
+            Accrues the tokens since the last update, and consumes the amount of tokens, going into debt if the bucket does not hold enough.
+
+        Args:
+            amount(float): Number of tokens to consume.
+            current_time(float): Current monotonic time.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Accrue the tokens since the last update.
+        self._accrue(current_time)
+
+        # Consume the tokens.
+        self.tokens -= amount
+
+
+    def get_wait_time(self, current_time: float) -> float:
+        """
+
+        Description:
+            Accrues the tokens since the last update, and calculates the time until the debt of the bucket is repaid.
+
+        Args:
+            current_time(float): Current monotonic time.
+
+        Returns:
+            float: Time until the bucket is out of debt (in seconds); Zero if it is not in debt.
+
+        Raises:
+            None
+
+        """
+
+        # Accrue the tokens since the last update.
+        self._accrue(current_time)
+
+        # Return the time until the debt is repaid.
+        return max(-self.tokens, 0) / self.rate
+
+
+    def _accrue(self, current_time: float) -> None:
+        """
+
+        Description:
+            Adds the tokens accrued since the last update, up to the capacity.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            current_time(float): Current monotonic time.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # Add the accrued tokens, up to the capacity.
+        self.tokens = min(self.tokens + (current_time - self.updated_at) * self.rate, self.capacity)
+
+        # Remember the time of the update.
+        self.updated_at = current_time
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
@@ -1,10 +1,14 @@
+# Standard library imports.
+import os
+
 # Standard library from imports.
 from datetime import datetime
 from pathlib import Path
-from typing import Union
+from typing import Iterable, Union
 
 # Project-specific module imports.
 from _constant.string import String
+from _timestamp.stat_snapshot import StatSnapshot
 
 
 class MetaTimeHandler:
@@ -14,9 +18,34 @@ class MetaTimeHandler:
     It enables the retrieval of the last access timestamp, and the last modified timestamp of files.
     Additionally, It enables the conversion of the timestamps into a human-readable format. 
 
+    For change detection, it takes snapshots (StatSnapshot) of all the metadata the services compare, with a single stat call per file,
+    and compares them in integer nanoseconds, so that sub-second modifications are detected.
+
     """
 
 
+    @staticmethod
+    def create_snapshot(stat_result: os.stat_result) -> StatSnapshot:
+        """
+        
+        Description:
+            Creates the snapshot of the metadata held by the stat result (e.g. of os.stat, or of os.DirEntry.stat).
+
+        Args:
+            stat_result(os.stat_result): Stat result of the target file.
+        
+        Returns:
+            StatSnapshot: Snapshot of the metadata of the target file.
+
+        Raises:
+            None
+                
+        """
+        
+        # Return the snapshot.
+        return StatSnapshot(stat_result.st_mtime_ns, stat_result.st_atime_ns, stat_result.st_ctime_ns, stat_result.st_size, stat_result.st_ino, stat_result.st_dev)
+
+
     @staticmethod
     def get_last_access_time_formatted(file_path: Union[str, Path]) -> str:
         """
@@ -117,6 +146,127 @@ class MetaTimeHandler:
         return Path(file_path).stat().st_mtime
 
 
+    @staticmethod
+    def get_snapshot(file_path: Union[str, Path]) -> StatSnapshot:
+        """
+        
+        Description:
+            Takes the snapshot of the metadata of the file specified by file path, with a single stat call.
+
+        Args:
+            file_path(Union[str, Path]): File path of the target file.
+        
+        Returns:
+            StatSnapshot: Snapshot of the metadata of the target file.
+
+        Raises:
+            FileNotFoundError:
+                If the target file does not exist,
+                then delegate handling to the caller.
+                
+        """
+        
+        # Return the snapshot of the file.
+        return MetaTimeHandler.create_snapshot(os.stat(file_path))
+
+
+    @staticmethod
+    def get_snapshots(file_path_list: Iterable[Union[str, Path]]) -> dict[Union[str, Path], StatSnapshot]:
+        """
+        
+        Description:
+            Takes the snapshots of the metadata of the files specified by the file paths, with a single stat call per file.
+            Files that do not exist are left out, so that callers can handle them as not found.
+
+        Args:
+            file_path_list(Iterable[Union[str, Path]]): File paths of the target files.
+        
+        Returns:
+            dict[Union[str, Path], StatSnapshot]: Snapshots of the metadata of the existing target files, keyed by their file paths.
+
+        Raises:
+            FileNotFoundError:
+                If a target file does not exist,
+                then leave it out.
+                
+        """
+
+        # Constant for the storage of the stat function; Bound once, as it is called for every file.
+        STAT = os.stat
+
+        # Constant for the storage of the snapshot creation function; Bound once, as it is called for every file.
+        CREATE_SNAPSHOT = MetaTimeHandler.create_snapshot
+
+        # Variable for the storage of the snapshots.
+        snapshot_dict = {}
+
+        # For every file path:
+        for file_path in file_path_list:
+            # Attempt to:
+            try:
+                # Take the snapshot of the file.
+                snapshot_dict[file_path] = CREATE_SNAPSHOT(STAT(file_path))
+
+            # Handle: FileNotFoundError.
+            except FileNotFoundError:
+                # Leave the file out.
+                continue
+
+        # Return the snapshots.
+        return snapshot_dict
+
+
+    @staticmethod
+    def is_accessed(previous_snapshot: StatSnapshot, current_snapshot: StatSnapshot) -> bool:
+        """
+        
+        Description:
+            Determines if the file was accessed between the snapshots, by comparing their last access times.
+
+        Args:
+            previous_snapshot(StatSnapshot): Previous snapshot of the target file.
+            current_snapshot(StatSnapshot): Current snapshot of the target file.
+        
+        Returns:
+            bool: Whether the file was accessed.
+
+        Raises:
+            None
+                
+        """
+        
+        # Assert if the last access time advanced.
+        return current_snapshot.accessed_at_ns > previous_snapshot.accessed_at_ns
+
+
+    @staticmethod
+    def is_modified(previous_snapshot: StatSnapshot, current_snapshot: StatSnapshot) -> bool:
+        """
+        
+        Description:
+            Determines if the file was modified between the snapshots, by comparing their last modified times, sizes and identities.
+            A replaced file (e.g. saved atomically by an editor) is detected through its identity, even if its last modified time was preserved.
+            Metadata changes alone (e.g. of permissions) are not modifications.
+
+        Args:
+            previous_snapshot(StatSnapshot): Previous snapshot of the target file.
+            current_snapshot(StatSnapshot): Current snapshot of the target file.
+        
+        Returns:
+            bool: Whether the file was modified.
+
+        Raises:
+            None
+                
+        """
+        
+        # Assert if the last modified time, the size or the identity changed.
+        return (current_snapshot.modified_at_ns != previous_snapshot.modified_at_ns
+                or current_snapshot.size != previous_snapshot.size
+                or current_snapshot.inode != previous_snapshot.inode
+                or current_snapshot.device != previous_snapshot.device)
+
+
 # If this module is executed as the main program:
 if __name__ == "__main__":
     # Ignore.
@@ -0,0 +1,35 @@
+# Standard library from imports.
+from typing import NamedTuple
+
+
+class StatSnapshot(NamedTuple):
+    """
+
+    StatSnapshot is the snapshot of the metadata of a file, taken with a single stat call (see MetaTimeHandler).
+    Timestamps are kept in integer nanoseconds, so that sub-second modifications are never lost to float precision.
+
+    """
+
+    # Last modified time of the file (in nanoseconds).
+    modified_at_ns: int
+
+    # Last access time of the file (in nanoseconds).
+    accessed_at_ns: int
+
+    # Last metadata change time of the file (in nanoseconds).
+    changed_at_ns: int
+
+    # Size of the file (in bytes).
+    size: int
+
+    # Inode number of the file.
+    inode: int
+
+    # Device number of the file system holding the file.
+    device: int
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
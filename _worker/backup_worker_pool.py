@@ -0,0 +1,312 @@
+# Standard library imports.
+import os
+import queue
+import threading
+
+# Standard library from imports.
+from pathlib import Path
+from typing import Union
+
+# Project-specific module imports.
+from _constant.string import String
+from _jsonx.backup_json_handler import BackupJsonHandler
+from _path.path_utils import PathUtils
+
+
+class BackupWorkerPool:
+    """
+
+    BackupWorkerPool decouples the detection of modifications from the copying of backup files.
+
+    The backup service submits the backups of modified target files, which are carried out by a pool of background worker threads:
+        Every worker owns a bounded queue; Once it is full, submitting to it waits (backpressure), rather than queuing without bound.
+        Every target file is routed to the same worker, based on the hash of its path, so that its backups are created in order (as delta chains require).
+        A target file whose backup is still queued is not queued again, as the queued backup copies its latest content anyway.
+
+    Counters of completed, skipped (unchanged content) and failed backups, of retried and inconsistent copies, and the depth of the queues, are exposed for the metrics of the backup service.
+
+    """
+
+    # Variable for the storage of the number of completed backups.
+    _completed_count: int = 0
+
+    # Variable for the storage of the number of failed backups.
+    _failed_count: int = 0
+
+    # Variable for the storage of the lock guarding the pending paths and the counters.
+    _lock: threading.Lock = threading.Lock()
+
+    # Variable for the storage of the maximum depth of the queues since the metrics were last retrieved.
+    _maximum_queue_depth: int = 0
+
+    # Variable for the storage of the paths of the target files whose backups are queued.
+    _pending_path_set: set[str] = set()
+
+    # Variable for the storage of the queues of the workers.
+    _queue_list: list[queue.Queue] = []
+
+    # Variable for the storage of the number of backups skipped, as the content of their target files did not change.
+    _skipped_count: int = 0
+
+
+    @staticmethod
+    def clear() -> None:
+        """
+
+        Description:
+            Discards every queued backup (e.g. when the backup service is disabled); Backups being carried out are completed.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            queue.Empty:
+                If a queue is emptied,
+                then continue with the next queue.
+
+        """
+
+        # For every queue:
+        for job_queue in BackupWorkerPool._queue_list:
+            # Attempt to:
+            try:
+                # Loop until the queue is empty.
+                while True:
+                    # Dequeue and discard the next backup.
+                    source_file_path, _, _ = job_queue.get_nowait()
+
+                    # Forget the target file as pending.
+                    with BackupWorkerPool._lock:
+                        BackupWorkerPool._pending_path_set.discard(source_file_path)
+
+                    # Mark the backup as done.
+                    job_queue.task_done()
+
+            # Handle: queue.Empty.
+            except queue.Empty:
+                # Continue with the next queue.
+                continue
+
+
+    @staticmethod
+    def get_metrics() -> dict:
+        """
+
+        Description:
+            Retrieves the metrics of the worker pool.
+            Resets the maximum depth of the queues, so that it covers the span between two retrievals.
+
+        Args:
+            None
+
+        Returns:
+            dict: Number of workers, capacity and depth of the queues, maximum depth since the last retrieval, numbers of completed, skipped and failed backups, and numbers of retried and inconsistent copies.
+
+        Raises:
+            None
+
+        """
+
+        # Assign the depth of the queues.
+        queue_depth = BackupWorkerPool.get_queue_depth()
+
+        # With the lock acquired:
+        with BackupWorkerPool._lock:
+            # Create the dictionary for the metrics.
+            metrics_dict = {
+                    String.LITERAL_BACKUP_WORKER_COUNT : len(BackupWorkerPool._queue_list),
+                    String.LITERAL_BACKUP_QUEUE_CAPACITY : sum(job_queue.maxsize for job_queue in BackupWorkerPool._queue_list),
+                    String.LITERAL_BACKUP_QUEUE_DEPTH : queue_depth,
+                    String.LITERAL_BACKUP_QUEUE_DEPTH_MAX : max(BackupWorkerPool._maximum_queue_depth, queue_depth),
+                    String.LITERAL_BACKUP_COMPLETED_COUNT : BackupWorkerPool._completed_count,
+                    String.LITERAL_BACKUP_SKIPPED_COUNT : BackupWorkerPool._skipped_count,
+                    String.LITERAL_BACKUP_FAILED_COUNT : BackupWorkerPool._failed_count
+                }
+
+            # Reset the maximum depth of the queues.
+            BackupWorkerPool._maximum_queue_depth = queue_depth
+
+        # Add the counters of the retried and inconsistent copies.
+        metrics_dict.update(BackupJsonHandler.get_copy_metrics())
+
+        # Return the metrics.
+        return metrics_dict
+
+
+    @staticmethod
+    def get_queue_depth() -> int:
+        """
+
+        Description:
+            Sums up the number of backups queued by every worker.
+
+        Args:
+            None
+
+        Returns:
+            int: Number of queued backups.
+
+        Raises:
+            None
+
+        """
+
+        # Return the number of queued backups.
+        return sum(job_queue.qsize() for job_queue in BackupWorkerPool._queue_list)
+
+
+    @staticmethod
+    def start(worker_count: int, queue_size: int) -> None:
+        """
+
+        Description:
+            Creates the queues and starts the worker threads, unless the worker pool is already started.
+
+        Args:
+            worker_count(int): Number of workers.
+            queue_size(int): Number of backups every worker can have queued.
+
+        Returns:
+            None
+
+        Raises:
+            None
+
+        """
+
+        # If the worker pool is already started:
+        if BackupWorkerPool._queue_list:
+            # Stop the starting.
+            return
+
+        # For every worker:
+        for index in range(max(worker_count, 1)):
+            # Create the queue of the worker.
+            job_queue = queue.Queue(max(queue_size, 1))
+
+            # Remember the queue.
+            BackupWorkerPool._queue_list.append(job_queue)
+
+            # Create and start the thread of the worker; Daemonic, so that it ends along with the backup service.
+            threading.Thread(target=BackupWorkerPool._run, args=(job_queue,), name=String.BACKUP_WORKER_THREAD_NAME % index, daemon=True).start()
+
+
+    @staticmethod
+    def submit(source_file_path: Union[str, Path], backup_file_path: str, json_entry: dict) -> bool:
+        """
+
+        Description:
+            Queues the backup of the target file specified by the source file path, unless its backup is already queued.
+            Routes it to the worker assigned to the target file; Waits while the queue of that worker is full.
+
+        Args:
+            source_file_path(Union[str, Path]): Path for the target file.
+            backup_file_path(str): Path for the backup file to create.
+            json_entry(dict): Backup json entry of the target, holding its storage settings.
+
+        Returns:
+            bool: Whether the backup was queued, rather than merged into an already queued backup.
+
+        Raises:
+            None
+
+        """
+
+        # With the lock acquired:
+        with BackupWorkerPool._lock:
+            # If the backup of the target file is already queued:
+            if str(source_file_path) in BackupWorkerPool._pending_path_set:
+                # Merge the backup into the queued one.
+                return False
+
+            # Remember the target file as pending.
+            BackupWorkerPool._pending_path_set.add(str(source_file_path))
+
+        # Queue the backup with the worker assigned to the target file; Waits while its queue is full.
+        BackupWorkerPool._queue_list[hash(str(source_file_path)) % len(BackupWorkerPool._queue_list)].put((str(source_file_path), backup_file_path, json_entry))
+
+        # With the lock acquired:
+        with BackupWorkerPool._lock:
+            # Account for the depth of the queues.
+            BackupWorkerPool._maximum_queue_depth = max(BackupWorkerPool._maximum_queue_depth, BackupWorkerPool.get_queue_depth())
+
+        # Assert the backup as queued.
+        return True
+
+
+    @staticmethod
+    def _run(job_queue: queue.Queue) -> None:
+        """
+
+        Description:
+            Dequeues and carries out the backups of the queue, one after the other, indefinitely.
+            Creates the backup directory and retries once, if it is missing.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            job_queue(queue.Queue): Queue of the worker.
+
+        Returns:
+            None
+
+        Raises:
+            OSError | ValueError:
+                If a backup cannot be created (e.g. the target file is deleted in the meantime),
+                then count it as failed; The backup service handles missing targets upon detection.
+
+        """
+
+        # Loop indefinitely.
+        while True:
+            # Dequeue the next backup; Waits while the queue is empty.
+            source_file_path, backup_file_path, json_entry = job_queue.get()
+
+            # Forget the target file as pending, so that modifications made from now on are queued again.
+            with BackupWorkerPool._lock:
+                BackupWorkerPool._pending_path_set.discard(source_file_path)
+
+            # Attempt to:
+            try:
+                # Attempt to:
+                try:
+                    # Create the backup file, unless the content of the target file did not change; Assign whether it was created.
+                    is_created = BackupJsonHandler.create_backup_file(source_file_path, backup_file_path, json_entry)
+
+                # Handle: FileNotFoundError.
+                except FileNotFoundError:
+                    # Create the backup directory.
+                    PathUtils.create_directory_tree(os.path.dirname(backup_file_path))
+
+                    # Create the backup file; Assign whether it was created.
+                    is_created = BackupJsonHandler.create_backup_file(source_file_path, backup_file_path, json_entry)
+
+                # With the lock acquired:
+                with BackupWorkerPool._lock:
+                    # If the backup file was created:
+                    if is_created:
+                        # Count the backup as completed.
+                        BackupWorkerPool._completed_count += 1
+
+                    # If the backup was skipped:
+                    else:
+                        # Count the backup as skipped.
+                        BackupWorkerPool._skipped_count += 1
+
+            # Handle: OSError, ValueError.
+            except (OSError, ValueError):
+                # Count the backup as failed.
+                with BackupWorkerPool._lock:
+                    BackupWorkerPool._failed_count += 1
+
+            # Mark the backup as done.
+            job_queue.task_done()
+
+
+# If this module is executed as the main program:
+if __name__ == "__main__":
+    # Ignore.
+    pass
\ No newline at end of file
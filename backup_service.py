@@ -1,9 +1,9 @@
 # Standard library imports.
-import json
 import os
 import time
 
 # Standard library from imports.
+from collections import OrderedDict, deque
 from datetime import datetime
 from pathlib import Path
 from typing import Union
@@ -13,13 +13,23 @@ from _autostart.linux_autostarter import LinuxAutostarter
 from _autostart.windows_autostarter import WindowsAutostarter
 from _constant.integer import Integer
 from _constant.string import String
+from _debouncer.change_debouncer import ChangeDebouncer
+from _event.inotify_handler import InotifyHandler
 from _jsonx.backup_json_handler import BackupJsonHandler
 from _jsonx.properties_json_handler import PropertiesJsonHandler
 from _manager.backup_manager import BackupManager
+from _metric.service_metrics import ServiceMetrics
 from _miscellaneous.platform_identifier import PlatformIdentifier
 from _path.path_utils import PathUtils
-from _timestamp.current_time_handler import CurrentTimeHandler
+from _reconciler.metadata_reconciler import MetadataReconciler
+from _resolver.target_resolver import TargetResolver
+from _scheduler.poll_scheduler import PollScheduler
+from _scheduler.tick_clock import TickClock
+from _storage.retention_pruner import RetentionPruner
+from _throttle.io_throttle import IoThrottle
 from _timestamp.meta_time_handler import MetaTimeHandler
+from _timestamp.stat_snapshot import StatSnapshot
+from _worker.backup_worker_pool import BackupWorkerPool
 
 
 class BackupService:
@@ -30,65 +40,124 @@ class BackupService:
     In a timely fashion, it:
         Creates or updates a preliminary dictionary for the storage of relevant metadata about target files and directories,
         Checks the historic last modified time with the newly queried to detect modification attempts.
+    Every target file is checked at the interval of its target, which adapts to how often the file changes (see PollScheduler).
+    Iterations are paced on fixed-rate ticks and bounded by a time budget, work left over being resumed on the next tick (see TickClock).
 
     Upon modification detection, it seeks to create a backup file at the respective backup directory within the central backup directory.
+    Modified files are only backed up once they settle (see ChangeDebouncer), so that files being written are not backed up mid-write,
+    and bursts of modifications are coalesced into a single version.
+    Backup files are created by a pool of worker threads (see BackupWorkerPool), so that copying never stalls the detection,
+    and their copies are paced by a throttle (see IoThrottle), so that they do not saturate the disks.
+    The depth of their queues is published to the metrics file (.metrics.json) within the central backup directory.
     
     BackupService employs exception handling to address the scenario when targets are not found,
     which ensures that the background process executing the BackupService does not terminate. 
 
-    Additionally, it routinely checks the central backup directory for orphan directories (previous backup directories of targets that are no longer tracked and non-backup directories).
-    Upon the detection of orphan directories, It moves them to the orphanage directory for safekeeping and for keeping the central backup directory clean and tidy.
+    Additionally, it checks the central backup directory for orphan directories (previous backup directories of targets that are no longer tracked and non-backup directories),
+    whenever the central backup directory or the backup json file changes.
+    Upon the detection of orphan directories, It moves (renames) them to the orphanage directory for safekeeping and for keeping the central backup directory clean and tidy.
+
+    Where the platform supports inotify, BackupService is event-driven:
+        It subscribes to close-after-write, moved-to and deletion events of the directories holding its targets,
+        and only queues the files reported by the kernel for backup, instead of querying the metadata of every target on every iteration.
+    If inotify is unavailable or the watch limit is hit, it falls back to the polling approach described above.
+
+    Meanwhile, a background thread prunes old versions according to the retention policies of the targets (see RetentionPruner).
 
     """
 
     # Constants for the storage of the wait time between backup iterations.
     _ITERATION_WAIT_TIME: int = Integer.BACKUP_SERVICE_ITERATION_WAIT_TIME
+
+    # Constant for the storage of the mask of the inotify events the backup service subscribes to.
+    _INOTIFY_MASK: int = (Integer.INOTIFY_IN_CLOSE_WRITE | Integer.INOTIFY_IN_MOVED_TO | Integer.INOTIFY_IN_DELETE | Integer.INOTIFY_IN_MOVED_FROM
+                          | Integer.INOTIFY_IN_CREATE | Integer.INOTIFY_IN_DELETE_SELF | Integer.INOTIFY_IN_MOVE_SELF)
+
+    # Variable for the storage of the queue of target files awaiting their backup, as an ordered set of their keys; A target file is queued at most once.
+    _backup_queue: OrderedDict = OrderedDict()
+
+    # Variable for the storage of the signature (backup directory, backup json file and backup items) the backup directory was last cleaned up with.
+    _cleanup_signature: tuple = None
+
+    # Variable for the storage of the listings (resolved file paths) of the target directory trees, keyed by the directory paths.
+    _directory_file_path_dict: dict[str, set[str]] = {}
+
+    # Variable for the storage of the stat signatures of the walked directories of the target directory trees, keyed by the directory paths.
+    _directory_signature_dict: dict[str, dict[str, tuple[int, int]]] = {}
+
+    # Variable for the storage of the dictionary mapping resolved file paths to their keys within the metadata dictionary.
+    _event_key_dict: dict[str, Union[str, Path]] = {}
+
+    # Variable for the storage of the file descriptor of the inotify instance.
+    _inotify_fd: int = None
+
+    # Variable for the storage of whether the backup service is event-driven.
+    _is_event_driven: bool = False
     
     # Variable for the storage of the metadata dictionary for all backed up targets.
     _metadata_dict: dict = {}
 
+    # Variable for the storage of the scheduler of the checks of the target files, while the backup service polls.
+    _poll_scheduler: PollScheduler = PollScheduler(Integer.BACKUP_SERVICE_ITERATION_WAIT_TIME)
+
+    # Variable for the storage of the keys of the backup json entries awaiting their preparation within the current pass over the backup json data.
+    _prepare_key_queue: deque = deque()
+
+    # Variable for the storage of the backup json data the metadata dictionary was reconciled with.
+    _registry_data: dict = {}
+
+    # Variable for the storage of the path of the backup json file the metadata dictionary was reconciled with.
+    _registry_file_path: str = None
+
+    # Variable for the storage of the stat signature of the backup json file the metadata dictionary was reconciled with.
+    _registry_signature: tuple[int, int] = None
+
+    # Variable for the storage of the clock pacing the iterations on fixed-rate ticks, within their time budgets.
+    _tick_clock: TickClock = TickClock(Integer.BACKUP_SERVICE_ITERATION_WAIT_TIME, Integer.BACKUP_SERVICE_ITERATION_BUDGET)
+
+    # Variable for the storage of the resolved paths of all target directories and of their walked sub directories.
+    _tracked_directory_path_set: set[str] = set()
+
+    # Variable for the storage of the watched directory paths, keyed by their watch descriptors.
+    _watch_descriptor_dict: dict[int, str] = {}
+
 
     @staticmethod
-    def _backup_single_file(file_path: Union[str, Path]) -> None:
+    def _backup_single_file(file_path: Union[str, Path], snapshot: StatSnapshot = None) -> bool:
         """
         
         Description:
-            Checks if the file specified by the file path is modified.
-            Creates the timestamped backup of the file at the target file path within the backup directory.
+            Checks if the file specified by the file path is modified, based on the snapshot of its metadata.
+            Hands the modification over to the debouncer, which defers the backup of the file until it settles, according to the settings of its target.
 
             Note: This method is not meant to be accessed from outside this class.
 
         Args:
             file_path(Union[str, Path]): Path for the file to track by the backup service.
+            snapshot(StatSnapshot): Current snapshot of the metadata of the file; Taken if not given.
 
         Returns:
-            None
+            bool: Whether the file is modified or not.
 
         Raises:
             None
                 
         """
 
-        # If the file is modified:
-        if BackupService._is_file_modified(file_path):
-            # Formulate and assign the file path for the backed up file.
-            target_file_path_for_backedup_file = BackupService._formulate_target_file_path_for_backedup_file(file_path)
-
-            # Attempt to:
-            try:
-                # Create the backup file at the target backup file path.
-                BackupJsonHandler.create_backup_file(file_path, target_file_path_for_backedup_file)
+        # Constants for the storage of string literals.
+        JSON_ENTRY = String.LITERAL_JSON_ENTRY
+        SNAPSHOT = String.LITERAL_SNAPSHOT
 
-            # Handle: FileNotFoundError.
-            except FileNotFoundError:
-                # Retrieve the directory path from the target file path for the backedup file.
-                target_directory_path_for_backedup_file = os.path.dirname(target_file_path_for_backedup_file)
+        # If the file is modified:
+        if BackupService._is_file_modified(file_path, snapshot):
+            # Defer the backup of the file until it settles; Coalesced with the pending modification of the file, if any.
+            ChangeDebouncer.observe(file_path, BackupService._metadata_dict[file_path][SNAPSHOT], *ChangeDebouncer.get_settings(BackupService._metadata_dict[file_path][JSON_ENTRY]))
 
-                # Create the directory for the backedup file.
-                PathUtils.create_directory_tree(target_directory_path_for_backedup_file)
+            # Assert the file as modified.
+            return True
 
-                # Create the backup file at the target backup file path.
-                BackupJsonHandler.create_backup_file(file_path, target_file_path_for_backedup_file)
+        # Assert the file as unmodified.
+        return False
 
 
     @staticmethod
@@ -96,10 +165,13 @@ class BackupService:
         """
         
         Description:
+            Checks if the backup directory, the backup json file or the backup directories of the targets changed since the last cleanup, otherwise skips it,
+            as orphan directories can only arise from such changes.
             Retrieves the paths of all directories within the backup directory.
             Retrieves the paths of all backup directories within the backup directory.
             Identifies paths of all orphan directories within the backup directory.
             Moves orphan directories to the orphanage directory located at the backup directory.
+            Remembers the signature of the cleanup, unless the backup directory or the backup json file were modified within the racy window.
 
             Note: This method is not meant to be accessed from outside this class.
 
@@ -114,26 +186,193 @@ class BackupService:
                 
         """
 
-        # Assign the list with directory paths of all directories within the backup directory.
-        directory_path_list = BackupService._get_directory_paths_of_all_directories_within_backup_directory()
-        
-        # Assign the list with directory paths of all backups.
-        backup_directory_path_list = BackupService._get_paths_of_all_backup_items()
+        # Assign the set with directory paths of all backups.
+        backup_directory_path_set = BackupService._get_paths_of_all_backup_items()
+
+        # Assign the stat signature of the backup directory.
+        directory_signature = MetadataReconciler.get_signature(PropertiesJsonHandler.get_backup_directory())
+
+        # Construct the signature of the cleanup.
+        cleanup_signature = (directory_signature, BackupService._registry_signature, frozenset(backup_directory_path_set))
 
-        # Assign the list with directory paths of orphan directories.
-        orphan_directory_path_list = BackupService._get_directory_paths_of_orphan_items(directory_path_list, backup_directory_path_list)
+        # If the signature did not change since the last cleanup:
+        if cleanup_signature == BackupService._cleanup_signature:
+            # Skip the cleanup.
+            return
+
+        # Assign the set with directory paths of all directories within the backup directory.
+        directory_path_set = BackupService._get_directory_paths_of_all_directories_within_backup_directory()
+
+        # Assign the set with directory paths of orphan directories.
+        orphan_directory_path_set = BackupService._get_directory_paths_of_orphan_items(directory_path_set, backup_directory_path_set)
         
         # Move the orphan directories to the orphanage directory.
-        BackupService._move_orphan_directories_to_orphanage(orphan_directory_path_list)
+        BackupService._move_orphan_directories_to_orphanage(orphan_directory_path_set)
+
+        # If the backup directory and the backup json file are settled (their signatures are trusted to change upon the next modification):
+        if BackupService._registry_signature is not None and MetadataReconciler.is_signature_settled(directory_signature):
+            # Remember the signature of the cleanup; Taken before the orphan directories were moved, so that a cleanup that moved any runs once more.
+            BackupService._cleanup_signature = cleanup_signature
+
+        # If the backup directory or the backup json file are not settled:
+        else:
+            # Forget the signature of the cleanup, so that the next iteration cleans up again.
+            BackupService._cleanup_signature = None
+
+
+    @staticmethod
+    def _drain_backup_queue() -> None:
+        """
+        
+        Description:
+            Submits the backup of every queued target file that is still tracked within the metadata dict to the worker pool,
+            until the time budget of the iteration is exhausted; The target files left are kept queued for the next iteration.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            FileNotFoundError:
+                If a target file is not found,
+                then delegate handling to other methods.
+                
+        """
+
+        # While the backup queue is not empty and the time budget is not exhausted:
+        while BackupService._backup_queue and not BackupService._tick_clock.is_budget_exhausted():
+            # Dequeue the next target file.
+            key, _ = BackupService._backup_queue.popitem(last=False)
+
+            # If the target file is no longer tracked:
+            if key not in BackupService._metadata_dict:
+                # Skip it.
+                continue
+
+            # Attempt to:
+            try:
+                # Backup the target file.
+                BackupService._backup_single_file(key)
+
+            # Handle: FileNotFoundError.
+            except FileNotFoundError:
+                # Handle the file not found error for the target.
+                BackupService._handle_file_not_found_exception(key)
 
 
     @staticmethod
-    def _establish_backup_directory_for_target_directory_files(path: str, backup_directory_path: Union[str, Path], backup_parent_directory_path: str) -> None:
+    def _enqueue_modified_files_from_events() -> bool:
+        """
+        
+        Description:
+            Waits for file system events until the next tick, or until the next pending target file is due to settle.
+            Queues the target files reported as written, moved in, moved out or deleted.
+            Queues every target file if the events cannot be trusted (event queue overflow, or a watched directory was deleted or moved).
+            Determines whether the metadata dict must be re-prepared (registry modification, new files within target directories, deletions).
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            bool: Whether the metadata dict must be re-prepared.
+
+        Raises:
+            None
+                
+        """
+
+        # Constants for the storage of integer literals.
+        IN_CREATE = Integer.INOTIFY_IN_CREATE
+        IN_DELETE = Integer.INOTIFY_IN_DELETE
+        IN_DELETE_SELF = Integer.INOTIFY_IN_DELETE_SELF
+        IN_IGNORED = Integer.INOTIFY_IN_IGNORED
+        IN_ISDIR = Integer.INOTIFY_IN_ISDIR
+        IN_MOVE_SELF = Integer.INOTIFY_IN_MOVE_SELF
+        IN_MOVED_FROM = Integer.INOTIFY_IN_MOVED_FROM
+        IN_Q_OVERFLOW = Integer.INOTIFY_IN_Q_OVERFLOW
+
+        # Constant for the storage of the resolved backup directory path.
+        BACKUP_DIRECTORY_PATH = str(Path(PropertiesJsonHandler.get_backup_directory()).resolve())
+
+        # Variable for the storage of whether the metadata dict must be re-prepared.
+        is_reprepare_required = False
+
+        # For every watch descriptor, mask and name of the pending events; Waits no longer than until the next pending target file is due to settle:
+        for watch_descriptor, mask, name in InotifyHandler.read_events(BackupService._inotify_fd, ChangeDebouncer.get_wait_time(BackupService._tick_clock.get_wait_time(BackupService._ITERATION_WAIT_TIME))):
+            # If the event queue overflowed, or a watched directory was deleted or moved:
+            if mask & IN_Q_OVERFLOW or (mask & (IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF) and watch_descriptor in BackupService._watch_descriptor_dict):
+                # If the watch was removed by the kernel:
+                if mask & IN_IGNORED:
+                    # Forget the watch.
+                    del BackupService._watch_descriptor_dict[watch_descriptor]
+
+                # Queue every target file, unless already queued; Events may have been lost.
+                BackupService._backup_queue.update(dict.fromkeys(BackupService._metadata_dict))
+
+                # Require the re-preparation of the metadata dict.
+                is_reprepare_required = True
+
+                # Skip to the next event.
+                continue
+
+            # Assign the path of the watched directory.
+            directory_path = BackupService._watch_descriptor_dict.get(watch_descriptor)
+
+            # If the watch is unknown, or the event concerns the watched directory itself:
+            if directory_path is None or name == '':
+                # Skip to the next event.
+                continue
+
+            # If the event concerns a sub directory:
+            if mask & IN_ISDIR:
+                # If the sub directory was created, deleted or moved within a target directory tree:
+                if directory_path in BackupService._tracked_directory_path_set:
+                    # Require the re-preparation of the metadata dict, so that the sub directory is walked and watched, or forgotten.
+                    is_reprepare_required = True
+
+                # Skip to the next event.
+                continue
+
+            # Assign the key of the concerned file within the metadata dict.
+            key = BackupService._event_key_dict.get(directory_path + os.path.sep + name)
+
+            # If the concerned file is a target:
+            if key is not None:
+                # Queue the target file, unless already queued.
+                BackupService._backup_queue[key] = None
+
+                # If the target file was deleted or moved away:
+                if mask & (IN_DELETE | IN_MOVED_FROM):
+                    # Require the re-preparation of the metadata dict.
+                    is_reprepare_required = True
+
+            # If the concerned file is the backup json file:
+            elif directory_path == BACKUP_DIRECTORY_PATH and name == BackupJsonHandler.BACKUP_FILENAME:
+                # Require the re-preparation of the metadata dict.
+                is_reprepare_required = True
+
+            # If the concerned file is a new file within a target directory tree; Backed up once written:
+            elif directory_path in BackupService._tracked_directory_path_set and not mask & (IN_CREATE | IN_DELETE | IN_MOVED_FROM):
+                # Require the re-preparation of the metadata dict.
+                is_reprepare_required = True
+
+        # Return whether the metadata dict must be re-prepared.
+        return is_reprepare_required
+
+
+    @staticmethod
+    def _establish_backup_directory_for_target_directory_files(path: str, backup_directory_path: Union[str, Path], backup_parent_directory_path: str, json_entry: dict) -> None:
         """
         
         Description:
             Creates the parent backup directory for files that are within the tracked directory.
-            Creates the backup for the file specified by the path in its backup directory that is located in its backup parent directory.
+            Hands the backup for the file specified by the path over to the debouncer, so that files that are still being written are backed up once they settle.
             
             Note: This method is not meant to be accessed from outside this class.
 
@@ -141,6 +380,7 @@ class BackupService:
             path(str): Path of the file that is being tracked by the backup service.
             backup_directory_path(Union[str, Path]): Path of the backup directory respective to the file being tracked.
             backup_parent_directory_path(str): Path of the backup parent directory respective to the file being tracked.
+            json_entry(dict): Backup json entry of the tracked directory, holding its storage settings.
 
         Returns:
             None
@@ -150,22 +390,16 @@ class BackupService:
                 
         """
 
+        # Constant for the storage of a string literal.
+        SNAPSHOT = String.LITERAL_SNAPSHOT
+
         # If the backup directory does not exist:
         if not PathUtils.is_path_exist(backup_directory_path):
-            # Assign the current time; Formatted.
-            current_time_formatted = CurrentTimeHandler.get_current_time_formatted()
-
-            # Construct the backup file path.
-            #backup_file_path = backup_parent_directory_path + backup_directory_path + os.path.sep + BackupJsonHandler.prepare_backup_filename(path, current_time_formatted)
-
-            backup_file_path = backup_directory_path + os.path.sep + BackupJsonHandler.prepare_backup_filename(path, current_time_formatted)
-
-
             # Create the parent directory tree for the backup directory.
             PathUtils.create_directory_tree(backup_directory_path)
             
-            # Create the backup directory and the backup file; Timestamped.
-            BackupJsonHandler.create_backup_file(path, backup_file_path)
+            # Defer the creation of the backup file until the file settles; Timestamped upon submission.
+            ChangeDebouncer.observe(path, BackupService._metadata_dict[path][SNAPSHOT], *ChangeDebouncer.get_settings(json_entry))
 
 
     @staticmethod
@@ -175,6 +409,7 @@ class BackupService:
         Description:
             Tracks all target files and files of target directories for modification attempts in a timely fashion.
             Backups all target files and files of target directories upon modification detection in the backup directory.
+            Based on the availability of inotify, executes either event-driven or polling iterations.
 
             Note: This method is not meant to be accessed from outside this class.
 
@@ -185,91 +420,312 @@ class BackupService:
             None
 
         Raises:
-            FileNotFoundError:
-                If a target file is not found,
-                then delegate handling to other methods.
+            None
                 
         """
-        
-        # Constants for the storage of the string literals.
-        BACKUP_DIRPATH = String.LITERAL_BACKUP_DIRPATH
-        BACKUP_PARENT_DIRPATH = String.LITERAL_BACKUP_PARENT_DIRPATH
-        ENABLED = String.LITERAL_ENABLED
-        ORPHANAGE = String.LITERAL_ORPHANAGE
-        PARENT_DIRPATH = String.LITERAL_PARENT_DIRPATH
-        AS_DIRECTORY = String.LITERAL_AS_DIRECTORY
+
+        # Start the worker pool carrying out the backups.
+        BackupWorkerPool.start(Integer.BACKUP_WORKER_COUNT, Integer.BACKUP_WORKER_QUEUE_SIZE)
 
         # Prepare the metadata dict.
         BackupService._prepare_metadata()
+
+        # Attempt to switch the backup service to the event-driven approach.
+        BackupService._initialize_event_driven_mode()
+
+        # Start pruning old versions in the background.
+        RetentionPruner.start()
         
         # Loop indefinitely.
         while True:
-            # If the backup lock exists and the backup autostart status attribute is set to enabled:
-            if BackupService._is_lock_exist() and PropertiesJsonHandler.get_backup_autostart_status() == ENABLED:
-                # For every key in the metadata dict:
-                for key in BackupService._metadata_dict:
+            # If the backup service is event-driven:
+            if BackupService._is_event_driven:
+                # Execute an event-driven iteration.
+                BackupService._execute_event_driven_iteration()
+
+            # If the backup service is not event-driven:
+            else:
+                # Execute a polling iteration.
+                BackupService._execute_polling_iteration()
+
+
+    @staticmethod
+    def _execute_event_driven_iteration() -> None:
+        """
+        
+        Description:
+            Waits for file system events until the next tick and queues the reported target files.
+            Backups the queued target files once they settle, if the backup service is enabled.
+            Re-prepares the metadata dict if the events require it; Once the re-preparation is complete, cleans up the backup directory and re-synchronizes the watches.
+            Work left once the time budget of the iteration is exhausted is resumed on the next iteration.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Constant for the storage of a string literal.
+        ENABLED = String.LITERAL_ENABLED
+
+        # Queue the target files reported by the pending events and assign whether the metadata dict must be re-prepared.
+        is_reprepare_required = BackupService._enqueue_modified_files_from_events()
+
+        # Start the iteration, granting it the time budget.
+        BackupService._tick_clock.begin_iteration()
+
+        # If the backup lock exists and the backup autostart status attribute is set to enabled:
+        if BackupService._is_lock_exist() and PropertiesJsonHandler.get_backup_autostart_status() == ENABLED:
+            # Backup the queued target files.
+            BackupService._drain_backup_queue()
+
+            # Submit the backups of the target files that settled.
+            BackupService._submit_settled_files()
+
+        # If the backup lock does not exist or the backup autostart status attribute is set to disabled:
+        else:
+            # Discard the queued target files.
+            BackupService._backup_queue.clear()
+
+            # Discard the target files awaiting to settle.
+            ChangeDebouncer.clear()
+
+            # Discard the backups queued by the worker pool.
+            BackupWorkerPool.clear()
+
+        # If the metadata dict must be re-prepared:
+        if is_reprepare_required:
+            # Restart the pass over the backup json data, as targets already prepared within the current pass may be concerned.
+            BackupService._prepare_key_queue.clear()
+
+        # If the metadata dict must be re-prepared, or its re-preparation is underway, and the re-preparation completes within the time budget:
+        if (is_reprepare_required or BackupService._prepare_key_queue) and BackupService._prepare_metadata(BackupService._tick_clock.deadline):
+            # Cleanup the backup directory for orphan directories.
+            BackupService._cleanup_backup_directory()
+
+            # Re-synchronize the watches with the re-prepared metadata dict.
+            BackupService._synchronize_watches()
+
+        # Count the iteration as an overrun, if queued target files or the re-preparation are left for the next iteration.
+        BackupService._tick_clock.end_iteration(bool(BackupService._backup_queue or BackupService._prepare_key_queue))
+
+        # Publish the metrics of the backup service.
+        BackupService._publish_metrics()
+
+
+    @staticmethod
+    def _execute_polling_iteration() -> None:
+        """
+        
+        Description:
+            Checks the targets within the metadata dict whose checks are due for modification attempts and backups the modified ones.
+            Reports the outcome of every check to the poll scheduler, which adapts the interval of the target to how often it changes.
+            Re-prepares the metadata dict on every tick; Once the re-preparation is complete, cleans up the backup directory.
+            Work left once the time budget of the iteration is exhausted (due checks, targets awaiting their preparation) is resumed on the next tick.
+            Waits until the next check is due, a target file settles or the next tick, whichever comes first; Until the next tick, if work is left.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            FileNotFoundError:
+                If a target file is not found,
+                then delegate handling to other methods.
+                
+        """
+        
+        # Constant for the storage of a string literal.
+        ENABLED = String.LITERAL_ENABLED
+
+        # Constant for the storage of an integer literal.
+        POLL_BATCH_SIZE = Integer.POLL_BATCH_SIZE
+
+        # Start the iteration, granting it the time budget; Assign whether a tick is due.
+        is_tick = BackupService._tick_clock.begin_iteration()
+
+        # If the backup lock exists and the backup autostart status attribute is set to enabled:
+        if BackupService._is_lock_exist() and PropertiesJsonHandler.get_backup_autostart_status() == ENABLED:
+            # While checks are due and the time budget is not exhausted:
+            while BackupService._poll_scheduler.is_check_due() and not BackupService._tick_clock.is_budget_exhausted():
+                # Assign the keys of the next batch of targets whose checks are due.
+                due_key_list = BackupService._poll_scheduler.pop_due_keys(BackupService._metadata_dict, POLL_BATCH_SIZE)
+
+                # Take the snapshots of the due targets at once; Targets that are not found are left out.
+                snapshot_dict = MetaTimeHandler.get_snapshots(due_key_list)
+
+                # For every due key:
+                for key in due_key_list:
                     # Attempt to:
                     try:
-                        # Backup every target.
-                        BackupService._backup_single_file(key)
+                        # Backup the target; Assign whether it is modified.
+                        is_changed = BackupService._backup_single_file(key, snapshot_dict.get(key))
                     
                     # Handle: FileNotFoundError.
                     except FileNotFoundError:
-                        # Assign the backup directory of the target.
-                        backup_directory_path = BackupService._metadata_dict[key][BACKUP_DIRPATH]
-                        # Assign the backup parent directory of the target.
-                        backup_parent_directory_path = BackupService._metadata_dict[key][BACKUP_PARENT_DIRPATH]
-                        # Assign the parent directory of the target.
-                        parent_directory_path = BackupService._metadata_dict[key][PARENT_DIRPATH]
-                        # Construct the orphanage directory path.
-                        orphanage_directory_path = PropertiesJsonHandler.get_backup_directory() + os.path.sep + ORPHANAGE
-
-                        # If the target is part of a directory:
-                        if BackupService._metadata_dict[key][AS_DIRECTORY]:
-                            # Construct the backup directory path within the orphanage directory.
-                            backup_directory_path_within_orphanage_directory = orphanage_directory_path + os.path.sep + os.path.split(BackupService._metadata_dict[key][BACKUP_PARENT_DIRPATH])[1]
-                        
-                        # If the target is not part of a directory: 
-                        else:
-                            # Ignore.
-                            backup_directory_path_within_orphanage_directory = None
-
-                        # Handle the file not found error for the backed up file.
-                        BackupService._handle_file_not_found_exception_for_file(key, backup_directory_path, orphanage_directory_path)
-                        
-                        # Handle the file not found error for a single file within the backed up directory.
-                        BackupService._handle_file_not_found_exception_for_file_within_target_directory(key, parent_directory_path, backup_directory_path, backup_directory_path_within_orphanage_directory)
-
-                        # Handle the file not found error for a non-existing directory.
-                        BackupService._handle_file_not_found_exception_for_non_existing_target_directory(key, parent_directory_path, backup_directory_path, backup_parent_directory_path, backup_directory_path_within_orphanage_directory)
-                
-                # Re-prepare the metadata dict.
-                BackupService._prepare_metadata()
-            
-            # If the backup lock does not exist or the backup autostart status attribute is set to disabled:
-            else:
-                # Re-prepare the metadata dict.
-                BackupService._prepare_metadata()
-            
+                        # Handle the file not found error for the target.
+                        BackupService._handle_file_not_found_exception(key)
+
+                        # Forget the polling schedule of the target, as it is handled already; It is scheduled anew if it is prepared again.
+                        BackupService._poll_scheduler.remove(key)
+
+                        # Skip to the next due key.
+                        continue
+
+                    # Reschedule the check of the target according to its outcome.
+                    BackupService._poll_scheduler.report(key, is_changed)
+
+            # Submit the backups of the target files that settled.
+            BackupService._submit_settled_files()
+        
+        # If the backup lock does not exist or the backup autostart status attribute is set to disabled:
+        else:
+            # Discard the target files awaiting to settle.
+            ChangeDebouncer.clear()
+
+            # Discard the backups queued by the worker pool.
+            BackupWorkerPool.clear()
+
+        # If a tick is due, or the re-preparation is underway, and the re-preparation completes within the time budget:
+        if (is_tick or BackupService._prepare_key_queue) and BackupService._prepare_metadata(BackupService._tick_clock.deadline):
             # Cleanup the backup directory for orphan directories.
             BackupService._cleanup_backup_directory()
-            
-            # Wait for a few seconds.
-            time.sleep(BackupService._ITERATION_WAIT_TIME)
+
+        # Assign whether work is left for the next tick.
+        is_overrun = BackupService._tick_clock.is_budget_exhausted() and (BackupService._poll_scheduler.is_check_due() or bool(BackupService._prepare_key_queue))
+
+        # Count the iteration as an overrun, if work is left.
+        BackupService._tick_clock.end_iteration(is_overrun)
+
+        # Publish the metrics of the backup service.
+        BackupService._publish_metrics()
+
+        # If work is left:
+        if is_overrun:
+            # Wait until the next tick, so that the iterations keep to their time budget.
+            time.sleep(BackupService._tick_clock.get_wait_time(BackupService._ITERATION_WAIT_TIME))
+
+        # If no work is left:
+        else:
+            # Wait until the next check is due, a target file settles or the next tick.
+            time.sleep(BackupService._poll_scheduler.get_wait_time(ChangeDebouncer.get_wait_time(BackupService._tick_clock.get_wait_time(BackupService._ITERATION_WAIT_TIME))))
+
+
+    @staticmethod
+    def _fall_back_to_polling_mode() -> None:
+        """
+        
+        Description:
+            Closes the inotify instance and forgets all of its watches.
+            Schedules the checks of all targets.
+            Switches the backup service to the polling approach.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Constant for the storage of a string literal.
+        JSON_ENTRY = String.LITERAL_JSON_ENTRY
+
+        # If the inotify instance is initialized:
+        if BackupService._inotify_fd is not None:
+            # Close the inotify instance.
+            InotifyHandler.close(BackupService._inotify_fd)
+
+        # Reset the file descriptor of the inotify instance.
+        BackupService._inotify_fd = None
+
+        # Forget all watches.
+        BackupService._watch_descriptor_dict.clear()
+
+        # Discard the queued target files; The polling approach checks every target anyway.
+        BackupService._backup_queue.clear()
+
+        # For every key in the metadata dict:
+        for key, metadata in BackupService._metadata_dict.items():
+            # Schedule the check of the target.
+            BackupService._poll_scheduler.add(key, metadata[JSON_ENTRY])
+
+        # Assert the backup service as not event-driven.
+        BackupService._is_event_driven = False
 
 
     @staticmethod
-    def _formulate_target_file_path_for_backedup_file(file_path: Union[str, Path]) -> str:
+    def _forget_metadata_for_target(json_entry_dict: dict) -> None:
+        """
+        
+        Description:
+            Removes the metadata dictionary entries of the target specified by the backup json entry.
+            For a target directory, additionally forgets its stat signature and listing.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            json_entry_dict(dict): Backup json entry for the target.
+
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Constants for the storage of string literals.
+        IS_DIRECTORY = String.LITERAL_IS_DIRECTORY
+        PATH = String.LITERAL_PATH
+
+        # If the target is a directory:
+        if json_entry_dict[IS_DIRECTORY]:
+            # For every file within the last listing of the directory:
+            for path in BackupService._directory_file_path_dict.pop(json_entry_dict[PATH], set()):
+                # Remove the metadata dictionary entry for the file.
+                BackupService._metadata_dict.pop(path, None)
+
+            # Forget the stat signatures of the directory tree, and remove the resolved paths of its walked directories from the set of target directory paths.
+            BackupService._tracked_directory_path_set.difference_update(BackupService._directory_signature_dict.pop(json_entry_dict[PATH], {}))
+
+        # If the target is a file:
+        else:
+            # Remove the metadata dictionary entry for the file.
+            BackupService._metadata_dict.pop(json_entry_dict[PATH], None)
+
+
+    @staticmethod
+    def _formulate_target_file_path_for_backedup_file(file_path: Union[str, Path], snapshot: StatSnapshot) -> str:
         """
         
         Description:
             Constructs the backup file path for the target file that is tracked by the backup service.
+            Timestamps it with the time the target file was last modified, as told by its settled snapshot,
+            so that the timestamp neither depends on how late the modification was detected, nor on how long the target file took to settle.
             Returns the backup file path.
 
             Note: This method is not meant to be accessed from outside this class.
 
         Args:
             file_path(Union[str, Path]): Path of the file that is tracked by the backup service.
+            snapshot(StatSnapshot): Settled snapshot of the metadata of the file.
 
         Returns:
             str: Constructed backup file path for the target file.
@@ -285,11 +741,8 @@ class BackupService:
         BACKUP_FILE_EXTENSION = String.BACKUP_FILE_EXTENSION
         FORMAT_LAST_MODIFIED_TIME = String.FORMAT_LAST_MODIFIED_TIME
 
-        # Assign the current time; Raw.
-        current_time_raw = CurrentTimeHandler.get_current_time_raw()
-
-        # Calculate the actual modification time by subtracting the backup iteration wait time.
-        modification_time = current_time_raw - BackupService._ITERATION_WAIT_TIME
+        # Assign the modification time (in seconds); The later of the last modified and last metadata change times, as the former can be set back by applications (e.g. restoring an older file).
+        modification_time = max(snapshot.modified_at_ns, snapshot.changed_at_ns) / Integer.NANOSECONDS_PER_SECOND
 
         # Construct the backed up file path; Backup parent directory.
         target_file_path_for_backedup_file = BackupService._metadata_dict[file_path][BACKUP_DIRPATH] + os.path.sep + Path(file_path).name
@@ -305,12 +758,12 @@ class BackupService:
 
 
     @staticmethod
-    def _get_directory_paths_of_all_directories_within_backup_directory() -> list[Path]:
+    def _get_directory_paths_of_all_directories_within_backup_directory() -> set[str]:
         """
         
         Description:
-            Retrieves and appends the paths of all directories within the backup directory.
-            Returns the list of directory paths.
+            Retrieves and adds the resolved paths of all directories within the backup directory, except the orphanage and object store directories.
+            Returns the set of directory paths.
 
             Note: This method is not meant to be accessed from outside this class.
 
@@ -318,66 +771,69 @@ class BackupService:
             None
 
         Returns:
-            list[Path]: List of paths of all directories within the backup directory.
+            set[str]: Set of resolved paths of all directories within the backup directory.
 
         Raises:
             None
                 
         """
 
-        # Constant for the storage of a string literal.
+        # Constants for the storage of string literals.
+        BACKUP_OBJECT_STORE_DIRNAME = String.BACKUP_OBJECT_STORE_DIRNAME
         ORPHANAGE = String.LITERAL_ORPHANAGE
 
         # Constant for the storage of the backup directory path.
         BACKUP_DIRECTORY_PATH = PropertiesJsonHandler.get_backup_directory()
        
-        # Variable for the storage of a list of directory paths.
-        directory_path_list = []
-       
-        # For every item in the backup directory path:
-        for item in Path(BACKUP_DIRECTORY_PATH).iterdir():
-            # If the item is not a file and the item name is not equal to the orphanage directory name:
-            if not item.is_file() and Path(item).name != ORPHANAGE:
-                # Resolve and append the directory path to the list of directory paths.
-                directory_path_list.append(item.resolve())
+        # Variable for the storage of a set of directory paths.
+        directory_path_set = set()
+
+        # With the iterator over the entries of the backup directory:
+        with os.scandir(BACKUP_DIRECTORY_PATH) as iterator:
+            # For every entry in the backup directory:
+            for entry in iterator:
+                # If the entry is not a file and the entry name is neither equal to the orphanage directory name nor to the object store directory name:
+                if not entry.is_file() and entry.name not in (ORPHANAGE, BACKUP_OBJECT_STORE_DIRNAME):
+                    # Resolve and add the directory path to the set of directory paths.
+                    directory_path_set.add(os.path.realpath(entry.path))
         
-        # Return the list of directory paths.
-        return directory_path_list
+        # Return the set of directory paths.
+        return directory_path_set
 
 
     @staticmethod
-    def _get_directory_paths_of_orphan_items(directory_path_list: list[Path], backedup_directory_path_list: list[Path]) -> list[Path]:
+    def _get_directory_paths_of_orphan_items(directory_path_set: set[str], backedup_directory_path_set: set[str]) -> set[str]:
         """
         
         Description:
-            Retrieves and appends file paths of all orphan directories within the backup directory.
-            Returns the list of directory paths.
+            Retrieves the paths of all orphan directories within the backup directory, as the difference of both sets of resolved paths.
+            Returns the set of directory paths.
 
             Note: This method is not meant to be accessed from outside this class.
 
         Args:
-            directory_path_list(list[Path]): List of all directory paths within the backup directory.
-            backedup_directory_path_list(list[Path]): List of all directory paths for backups.
+            directory_path_set(set[str]): Set of all resolved directory paths within the backup directory.
+            backedup_directory_path_set(set[str]): Set of all resolved directory paths for backups.
 
         Returns:
-            list[Path]: List of directory paths of all orphan items within the backup directory.
+            set[str]: Set of directory paths of all orphan items within the backup directory.
 
         Raises:
             None
                 
         """
         
-        # Create and return a list of orphan directories that are not being backed up.
-        return [directory_path for directory_path in directory_path_list if directory_path not in backedup_directory_path_list]
+        # Return the set of orphan directories that are not being backed up.
+        return directory_path_set - backedup_directory_path_set
 
 
     @staticmethod
-    def _get_paths_of_all_backup_items() -> list[Path]:
+    def _get_paths_of_all_backup_items() -> set[str]:
         """
         
         Description:
-            Retrieves and appends file paths of all backup directories within the backup directory.
-            Returns the list of directory paths.
+            Retrieves and adds the resolved paths of all backup directories within the backup directory.
+            Returns the set of directory paths.
 
             Note: This method is not meant to be accessed from outside this class.
 
@@ -385,7 +841,7 @@ class BackupService:
             None
 
         Returns:
-            list[Path]: List of directory paths of all backups within the backup directory.
+            set[str]: Set of resolved directory paths of all backups within the backup directory.
 
         Raises:
             None
@@ -395,24 +851,90 @@ class BackupService:
         # Constants for the storage of string literals.
         AS_DIRECTORY = String.LITERAL_AS_DIRECTORY
         BACKUP_DIRPATH = String.LITERAL_BACKUP_DIRPATH
+        BACKUP_PARENT_DIRPATH = String.LITERAL_BACKUP_PARENT_DIRPATH
 
-        # Variable for the storage of a list of backed up directory paths.
-        backedup_directory_path_list = []
+        # Variable for the storage of a set of backed up directory paths.
+        backedup_directory_path_set = set()
         
         # For every item in the metadata dict:
         for item in BackupService._metadata_dict.values():
             # If the file is backed up as part of a directory:
             if item[AS_DIRECTORY]:
-                # Append the path of the parent backup directory.
-                backedup_directory_path_list.append(Path(os.path.dirname(item[BACKUP_DIRPATH])))
+                # Add the path of the parent backup directory; Files within sub directories are backed up in nested directories of it.
+                backedup_directory_path_set.add(item[BACKUP_PARENT_DIRPATH])
             
             # If the file is not backed up as part of a directory:
             else:
-                # Append the path of the backup directory.
-                backedup_directory_path_list.append(Path(item[BACKUP_DIRPATH]))
+                # Add the path of the backup directory.
+                backedup_directory_path_set.add(item[BACKUP_DIRPATH])
+
+        # Resolve and return the set of backed up directory paths; Only the distinct paths are resolved.
+        return {os.path.realpath(directory_path) for directory_path in backedup_directory_path_set}
+
+
+    @staticmethod
+    def _handle_file_not_found_exception(key: Union[str, Path]) -> None:
+        """
+        
+        Description:
+            Retrieves the backup directory, backup parent directory and parent directory of the target that is not found.
+            Constructs the orphanage directory path and the backup directory path within the orphanage directory.
+            Delegates the handling of the scenario to the respective methods.
+            Forgets the target within the metadata dict and the event key dict, so that the scenario is handled only once.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            key(Union[str, Path]): Key of the target within the metadata dict.
+
+        Returns:
+            None
 
-        # Return the list of backed up directory paths.
-        return backedup_directory_path_list
+        Raises:
+            None
+                
+        """
+
+        # Constants for the storage of the string literals.
+        AS_DIRECTORY = String.LITERAL_AS_DIRECTORY
+        BACKUP_DIRPATH = String.LITERAL_BACKUP_DIRPATH
+        BACKUP_PARENT_DIRPATH = String.LITERAL_BACKUP_PARENT_DIRPATH
+        ORPHANAGE = String.LITERAL_ORPHANAGE
+        PARENT_DIRPATH = String.LITERAL_PARENT_DIRPATH
+
+        # Assign the backup directory of the target.
+        backup_directory_path = BackupService._metadata_dict[key][BACKUP_DIRPATH]
+        # Assign the backup parent directory of the target.
+        backup_parent_directory_path = BackupService._metadata_dict[key][BACKUP_PARENT_DIRPATH]
+        # Assign the parent directory of the target.
+        parent_directory_path = BackupService._metadata_dict[key][PARENT_DIRPATH]
+        # Construct the orphanage directory path.
+        orphanage_directory_path = PropertiesJsonHandler.get_backup_directory() + os.path.sep + ORPHANAGE
+
+        # If the target is part of a directory:
+        if BackupService._metadata_dict[key][AS_DIRECTORY]:
+            # Construct the backup directory path within the orphanage directory.
+            backup_directory_path_within_orphanage_directory = orphanage_directory_path + os.path.sep + os.path.split(BackupService._metadata_dict[key][BACKUP_PARENT_DIRPATH])[1]
+        
+        # If the target is not part of a directory: 
+        else:
+            # Ignore.
+            backup_directory_path_within_orphanage_directory = None
+
+        # Handle the file not found error for the backed up file.
+        BackupService._handle_file_not_found_exception_for_file(key, backup_directory_path, orphanage_directory_path)
+        
+        # Handle the file not found error for a single file within the backed up directory.
+        BackupService._handle_file_not_found_exception_for_file_within_target_directory(key, parent_directory_path, backup_directory_path, backup_directory_path_within_orphanage_directory)
+
+        # Handle the file not found error for a non-existing directory.
+        BackupService._handle_file_not_found_exception_for_non_existing_target_directory(key, parent_directory_path, backup_directory_path, backup_parent_directory_path, backup_directory_path_within_orphanage_directory)
+
+        # Forget the target file, so that further events for it are ignored until the metadata dict is re-prepared; Its watch is dropped once the watches are re-synchronized.
+        BackupService._metadata_dict.pop(key, None)
+
+        # Forget the mapping of its resolved file path to its key.
+        BackupService._event_key_dict.pop(str(Path(key).resolve()), None)
 
 
     @staticmethod
@@ -442,11 +964,8 @@ class BackupService:
 
         # If the file is not backed up as part of a directory:
         if not BackupService._metadata_dict[path][AS_DIRECTORY]:
-            # Copy the backup directory to the orphanage directory.
-            PathUtils.copy_directory(backup_directory_path, orphanage_directory_path)
-            
-            # Delete the backup directory.
-            PathUtils.delete_directory_tree(backup_directory_path)
+            # Move the backup directory to the orphanage directory.
+            PathUtils.move_directory(backup_directory_path, orphanage_directory_path)
 
 
     @staticmethod
@@ -483,11 +1002,8 @@ class BackupService:
         if BackupService._metadata_dict[path][AS_DIRECTORY]:
             # If the parent directory path exists:
             if PathUtils.is_path_exist(parent_directory_path):
-                # Copy the backup directory to the backup parent directory within the orphanage directory.
-                PathUtils.copy_directory(backup_directory_path, backup_parent_directory_path_within_orphanage_directory)
-                
-                # Delete the backup directory.
-                PathUtils.delete_directory_tree(backup_directory_path)
+                # Move the backup directory to the backup parent directory within the orphanage directory.
+                PathUtils.move_directory(backup_directory_path, backup_parent_directory_path_within_orphanage_directory)
 
 
     @staticmethod
@@ -526,43 +1042,98 @@ class BackupService:
         if BackupService._metadata_dict[path][AS_DIRECTORY]:
             # If the parent directory does not exist:
             if not PathUtils.is_path_exist(parent_directory_path):
-                # Copy the backup directory to the backup directory within the orphanage directory.
-                PathUtils.copy_directory(backup_directory_path, backup_directory_path_within_orphanage_directory)
+                # Move the backup directory to the backup directory within the orphanage directory.
+                PathUtils.move_directory(backup_directory_path, backup_directory_path_within_orphanage_directory)
                 
                 # Delete the backup json entry from the backup json file.
                 BackupManager.delete_backup_json_entry(path)
 
 
     @staticmethod
-    def _is_file_modified(file_path: Union[str, Path]) -> bool:
+    def _initialize_event_driven_mode() -> None:
         """
         
         Description:
-            Determines if a file is modified by comparing the last modified timestamp with the newly queried.
+            Checks if inotify is available on the current platform.
+            Initializes the inotify instance and watches the directories holding the targets.
+            Switches the backup service to the event-driven approach, or falls back to the polling approach upon failure.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the inotify instance cannot be initialized,
+                then fall back to the polling approach.
+                
+        """
+
+        # If inotify is not available on the current platform:
+        if not InotifyHandler.is_supported():
+            # Keep the polling approach.
+            return
+
+        # Attempt to:
+        try:
+            # Initialize the inotify instance.
+            BackupService._inotify_fd = InotifyHandler.initialize()
+
+        # Handle: OSError.
+        except OSError:
+            # Fall back to the polling approach.
+            BackupService._fall_back_to_polling_mode()
+
+            # Stop the initialization.
+            return
+
+        # Discard the scheduled checks; The kernel reports the modifications instead.
+        BackupService._poll_scheduler.clear()
+
+        # Assert the backup service as event-driven.
+        BackupService._is_event_driven = True
+
+        # Watch the directories holding the targets.
+        BackupService._synchronize_watches()
+
+
+    @staticmethod
+    def _is_file_modified(file_path: Union[str, Path], snapshot: StatSnapshot = None) -> bool:
+        """
+        
+        Description:
+            Determines if a file is modified by comparing the snapshot of its metadata with the newly taken.
 
             Note: This method is not meant to be accessed from outside this class.
 
         Args:
             file_path(Union[str, Path]): Path for the file for which modification attempts must be determined.
+            snapshot(StatSnapshot): Current snapshot of the metadata of the file; Taken if not given.
 
         Returns:
             bool: Whether the file specified by the file path is modified or not.
 
         Raises:
-            None
+            FileNotFoundError:
+                If the file is not found,
+                then delegate handling to the caller.
                 
         """
 
         # Constants for the storage of string literals.
-        MODIFIED_AT = String.LITERAL_MODIFIED_AT
+        SNAPSHOT = String.LITERAL_SNAPSHOT
 
-        # Variable for the storage of the new last modified time; Raw.
-        last_modified_time_new = MetaTimeHandler.get_last_modified_time_raw(file_path)
+        # Variable for the storage of the new snapshot; Taken with a single stat call, unless given.
+        snapshot_new = snapshot if snapshot is not None else MetaTimeHandler.get_snapshot(file_path)
 
-        # If the last modified time within the metadata dict is lower than the new last modified time:
-        if BackupService._metadata_dict[file_path][MODIFIED_AT] < last_modified_time_new:
-            # Update the last modified time within the metadata dict to the new last modified time.
-            BackupService._metadata_dict[file_path][MODIFIED_AT] = last_modified_time_new
+        # If the file was modified since the snapshot within the metadata dict:
+        if MetaTimeHandler.is_modified(BackupService._metadata_dict[file_path][SNAPSHOT], snapshot_new):
+            # Update the snapshot within the metadata dict to the new snapshot.
+            BackupService._metadata_dict[file_path][SNAPSHOT] = snapshot_new
         
             # Assert file as modified.
             return True
@@ -606,18 +1177,18 @@ class BackupService:
 
 
     @staticmethod
-    def _move_orphan_directories_to_orphanage(orphan_directory_path_list: list[Path]) -> None:
+    def _move_orphan_directories_to_orphanage(orphan_directory_path_set: set[str]) -> None:
         """
         
         Description:
             For every orphan directory in the backup directory:
-                Copies the orphan directory to the orphanage directory.
-                Deletes the orphan directory from the backup directory.
+                Moves the orphan directory to the orphanage directory; Renamed, unless the orphanage directory is on another file system.
+                Deletes the orphan directory from the backup directory, if it is empty.
 
             Note: This method is not meant to be accessed from outside this class.    
 
         Args:
-            orphan_directory_path_list(list[Path]): List of paths for all orphan directories.
+            orphan_directory_path_set(set[str]): Set of paths for all orphan directories.
 
         Returns:
             None
@@ -635,25 +1206,17 @@ class BackupService:
         # Constant for the storage of the orphanage directory path.
         ORPHANAGE_DIRECTORY_PATH = PropertiesJsonHandler.get_backup_directory() + os.path.sep + ORPHANAGE
 
-        # For every orphan directory in the orphan directory path list:
-        for directory_path in orphan_directory_path_list:
+        # For every orphan directory in the orphan directory path set:
+        for directory_path in orphan_directory_path_set:
             # If the orphan directory is not empty:
             if not PathUtils.is_directory_empty(directory_path):
                 # Attempt to:
                 try:
-                    # For every item in the directory:
-                    for item in directory_path.iterdir():
-                        # If the item is a directory:
-                        if item.is_dir():
-                            # Construct the orphanage directory path for the sub directory.
-                            ORPHANAGE_DIRECTORY_PATH_FOR_SUB_DIRECTORY = ORPHANAGE_DIRECTORY_PATH + os.path.sep + PathUtils.get_filename(str(directory_path))
-                            # Copy the orphan sub directory to the orphanage directory.
-                            PathUtils.copy_directory(item.resolve(), ORPHANAGE_DIRECTORY_PATH_FOR_SUB_DIRECTORY)
-                        
-                        # If the item is a file:
-                        if item.is_file():
-                            # Copy the orphan directory to the orphanage directory.
-                            PathUtils.copy_directory(directory_path, ORPHANAGE_DIRECTORY_PATH)
+                    # Move the orphan directory to the orphanage directory.
+                    PathUtils.move_directory(directory_path, ORPHANAGE_DIRECTORY_PATH)
+
+                    # Continue with the next orphan directory.
+                    continue
                 
                 # Handle: PermissionError.
                 except PermissionError:
@@ -665,24 +1228,27 @@ class BackupService:
 
 
     @staticmethod
-    def _prepare_metadata() -> None:
+    def _prepare_metadata(deadline: float = float('inf')) -> bool:
         """
         
         Description:
-            Clears the _metadata_dict dictionary.
-            Opens the backup json file and serializes its backup json data.
-            For every item in the backup json data:
-                Checks if the item path exists, otherwise deletes the corresponding backup json entry.
-                Checks if the item is a directory to prepare and append metadata dictionary entries for its files to _metadata_dict.
-                Checks if the item is a file to prepare and append its metadata dictionary entry to _metadata_dict.
+            Reconciles the _metadata_dict dictionary with the backup json file and the target directories, instead of rebuilding it:
+                Re-reads the backup json file only if its stat signature changed, and forgets the targets whose backup json entries were removed or changed.
+                Starts a pass over the backup json data, unless one is underway; A pass is restarted if the backup json file changed.
+                For every item of the pass, until the deadline is reached:
+                    Checks if the item path exists, otherwise forgets the target and deletes the corresponding backup json entry.
+                    Checks if the item is a directory to reconcile the metadata dictionary entries for its files with its current listing.
+                    Checks if the item is a file to prepare and append its metadata dictionary entry to _metadata_dict, unless already present.
+            Existing metadata dictionary entries are kept along with their timestamps.
+            Items left once the deadline is reached are resumed by the next call.
 
             Note: This method is not meant to be accessed from outside this class.    
 
         Args:
-            None
+            deadline(float): Monotonic time after which no further item is prepared; Unbounded if not given.
 
         Returns:
-            None
+            bool: Whether the pass is complete.
 
         Raises:
             None
@@ -690,33 +1256,75 @@ class BackupService:
         """
         
         # Constants for the storage of string literals.
-        FILE_MODE_READ = String.FILE_MODE_READ
         IS_DIRECTORY = String.LITERAL_IS_DIRECTORY
         PATH = String.LITERAL_PATH
 
         # Constant for the storage of the backup json file path.
         BACKUP_JSON_FILE_PATH = PropertiesJsonHandler.get_backup_directory() + os.path.sep + BackupJsonHandler.BACKUP_FILENAME
 
-        # Variable for the storage of the backup json file data.
-        data = {}
-        
-        # Clear the metadata dictionary.
-        BackupService._metadata_dict.clear()
+        # If the backup json file path changed (e.g. the backup directory was switched):
+        if BACKUP_JSON_FILE_PATH != BackupService._registry_file_path:
+            # For every backup json entry the metadata dictionary was reconciled with:
+            for value in BackupService._registry_data.values():
+                # Forget the target.
+                BackupService._forget_metadata_for_target(value)
+
+            # Reset the backup json data and signature.
+            BackupService._registry_data = {}
+            BackupService._registry_signature = None
 
-        # Open the backup json file path with the file mode read.
-        with open(BACKUP_JSON_FILE_PATH, FILE_MODE_READ) as file:
-            # Assign the json data.
-            data = json.load(file)
-            # Close the file.
-            file.close()
+            # Discard the pass underway.
+            BackupService._prepare_key_queue.clear()
+
+            # Remember the backup json file path.
+            BackupService._registry_file_path = BACKUP_JSON_FILE_PATH
+
+        # Re-read the backup json file if its signature changed; Assign the signature to remember and the json data.
+        BackupService._registry_signature, data = MetadataReconciler.read_json_if_changed(BACKUP_JSON_FILE_PATH, BackupService._registry_signature)
+
+        # If the backup json file changed:
+        if data is not None:
+            # For every key and value the metadata dictionary was reconciled with:
+            for key, value in BackupService._registry_data.items():
+                # If the backup json entry was removed or changed:
+                if data.get(key) != value:
+                    # Forget the target.
+                    BackupService._forget_metadata_for_target(value)
+
+            # Remember the backup json data.
+            BackupService._registry_data = data
+
+            # Discard the pass underway, so that it is restarted over the changed backup json data.
+            BackupService._prepare_key_queue.clear()
+
+        # If no pass is underway:
+        if not BackupService._prepare_key_queue:
+            # Start a pass over the keys of the backup json data.
+            BackupService._prepare_key_queue.extend(BackupService._registry_data)
+
+        # While keys await their preparation:
+        while BackupService._prepare_key_queue:
+            # If the deadline is reached:
+            if time.monotonic() >= deadline:
+                # Assert the pass as incomplete; The next call resumes it.
+                return False
+
+            # Dequeue the next key.
+            key = BackupService._prepare_key_queue.popleft()
+
+            # Assign the backup json entry.
+            value = BackupService._registry_data.get(key)
+
+            # If the backup json entry was forgotten meanwhile:
+            if value is None:
+                # Skip it.
+                continue
 
-        # For every key and value in the data dictionary:
-        for key, value in data.items():
             # If the path exists:
             if PathUtils.is_path_exist(value[PATH]):
                 # If the path represents a directory:
                 if value[IS_DIRECTORY]:
-                    # Prepare the metadata dict entry for the directory.
+                    # Reconcile the metadata dict entries for the directory.
                     BackupService._prepare_metadata_for_directories(value)
 
                 # If the path does not represent a directory:
@@ -726,20 +1334,32 @@ class BackupService:
 
             # If the path does not exist:
             else:
+                # Forget the target.
+                BackupService._forget_metadata_for_target(value)
+
+                # Forget the backup json entry.
+                del BackupService._registry_data[key]
+
                 # Delete the backup json entry from the backup json file.
                 BackupManager.delete_backup_json_entry(key)
 
+        # Assert the pass as complete.
+        return True
+
 
     @staticmethod
     def _prepare_metadata_for_directories(directory_json_entry_dict: dict) -> None:
         """
         
         Description:
-            For every file within the target directory:
+            Re-walks the target directory tree only if a stat signature of its walked directories changed, otherwise keeps the metadata dictionary entries for its files.
+            Updates the set of target directory paths with the walked directories.
+            Removes the metadata dictionary entries of the files that were removed from the target directory tree.
+            For every file that was added to the target directory tree:
                 Prepares attribute values for the file.
                 Constructs the metadata dictionary entry by assigning values to attributes.
                 Updates the _metadata_dict to include the constructed metadata dictionary entry.
-                Creates the backup directory tree.
+                Creates the backup directory tree; Mirroring the sub directories of the target directory.
                 Creates the backup for the file within the respective backup directory.
 
             Note: This method is not meant to be accessed from outside this class.
@@ -760,36 +1380,77 @@ class BackupService:
         BACKUP_DIRNAME = String.LITERAL_BACKUP_DIRNAME
         BACKUP_DIRPATH = String.LITERAL_BACKUP_DIRPATH
         BACKUP_PARENT_DIRPATH = String.LITERAL_BACKUP_PARENT_DIRPATH
-        MODIFIED_AT = String.LITERAL_MODIFIED_AT
+        JSON_ENTRY = String.LITERAL_JSON_ENTRY
         PARENT_DIRPATH = String.LITERAL_PARENT_DIRPATH
         PATH = String.LITERAL_PATH
+        SNAPSHOT = String.LITERAL_SNAPSHOT
 
-        # For every item in the directory path:
-        for item in Path(directory_json_entry_dict[PATH]).iterdir():
-           # If the item is a file:
-            if item.is_file():
-                # Resolve and assign the file path.
-                path = item.resolve()
-                # Assign the last modified time; Raw.
-                modified_at = MetaTimeHandler.get_last_modified_time_raw(path)
-                # Construct the backup parent directory path for the directory.
-                backup_parent_directory_path = PropertiesJsonHandler.get_backup_directory() + os.path.sep + directory_json_entry_dict[BACKUP_DIRNAME]
-                # Construct the backup directory path for the file.
-                backup_directory_path = backup_parent_directory_path + os.path.sep + PathUtils.get_filename(str(path)) + '_' + directory_json_entry_dict[BACKUP_DIRNAME].split('_')[-1]
-                # Assign the directory path to be the parent directory path for the file.
-                parent_directory_path = directory_json_entry_dict[PATH]
-                
-                # Construct and assign the metadata dictionary entry for the file.
-                BackupService._metadata_dict[path] = {
-                        MODIFIED_AT : modified_at,
-                        BACKUP_PARENT_DIRPATH : backup_parent_directory_path,
-                        BACKUP_DIRPATH : backup_directory_path,
-                        PARENT_DIRPATH : parent_directory_path,
-                        AS_DIRECTORY : True
-                    } 
+        # Assign the maximum depth and the symbolic link policy of the directory.
+        max_depth, symlink_policy = TargetResolver.get_walk_settings(directory_json_entry_dict)
+
+        # Assign the resolved central backup directory path, which is skipped if it lies within the directory tree.
+        central_backup_directory_path = str(Path(PropertiesJsonHandler.get_backup_directory()).resolve())
+
+        # Assign the resolved paths of the directories walked last time.
+        previous_directory_path_set = set(BackupService._directory_signature_dict.get(directory_json_entry_dict[PATH], {}))
+
+        # Re-walk the directory tree if a signature changed; Assign the added and removed files.
+        difference = MetadataReconciler.reconcile_directory(directory_json_entry_dict[PATH], BackupService._directory_signature_dict, BackupService._directory_file_path_dict, max_depth, symlink_policy, {central_backup_directory_path})
+
+        # If the directory tree is unchanged:
+        if difference is None:
+            # Keep the metadata dictionary entries for its files.
+            return
+
+        # Assign the records of the added files and the resolved paths of the removed files.
+        added_file_record_list, removed_file_path_set = difference
+
+        # Assign the resolved paths of the walked directories.
+        current_directory_path_set = set(BackupService._directory_signature_dict[directory_json_entry_dict[PATH]])
+
+        # Replace the resolved paths of the directories walked last time with those of the walked directories, within the set of target directory paths.
+        BackupService._tracked_directory_path_set.difference_update(previous_directory_path_set - current_directory_path_set)
+        BackupService._tracked_directory_path_set.update(current_directory_path_set)
+
+        # For every removed file:
+        for path in removed_file_path_set:
+            # Remove the metadata dictionary entry for the file.
+            BackupService._metadata_dict.pop(path, None)
+
+        # Construct the backup parent directory path for the directory.
+        backup_parent_directory_path = PropertiesJsonHandler.get_backup_directory() + os.path.sep + directory_json_entry_dict[BACKUP_DIRNAME]
+
+        # Assign the suffix shared by the backup directories of the directory.
+        suffix = '_' + directory_json_entry_dict[BACKUP_DIRNAME].split('_')[-1]
+
+        # For every added file:
+        for record in added_file_record_list:
+            # Assign the path of the file.
+            path = record.path
+            # Assign the snapshot of the file; As taken during the walk.
+            snapshot = record.snapshot
+            # Construct the backup directory path for the file; Sub directories are mirrored, suffixed like the backup directories of files, so that their names never collide.
+            backup_directory_path = backup_parent_directory_path + os.path.sep + ''.join(name + suffix + os.path.sep for name in record.relative_directory_path.split(os.path.sep) if name) + os.path.basename(path) + suffix
+            # Assign the directory path to be the parent directory path for the file.
+            parent_directory_path = directory_json_entry_dict[PATH]
+            
+            # Construct and assign the metadata dictionary entry for the file.
+            BackupService._metadata_dict[path] = {
+                    SNAPSHOT : snapshot,
+                    BACKUP_PARENT_DIRPATH : backup_parent_directory_path,
+                    BACKUP_DIRPATH : backup_directory_path,
+                    PARENT_DIRPATH : parent_directory_path,
+                    AS_DIRECTORY : True,
+                    JSON_ENTRY : directory_json_entry_dict
+                } 
+
+            # If the backup service polls:
+            if not BackupService._is_event_driven:
+                # Schedule the check of the file.
+                BackupService._poll_scheduler.add(path, directory_json_entry_dict)
 
-                # Create the backup directory tree and the backup file.
-                BackupService._establish_backup_directory_for_target_directory_files(str(path), backup_directory_path, backup_parent_directory_path)
+            # Create the backup directory tree and the backup file.
+            BackupService._establish_backup_directory_for_target_directory_files(path, backup_directory_path, backup_parent_directory_path, directory_json_entry_dict)
 
 
     @staticmethod
@@ -797,6 +1458,7 @@ class BackupService:
         """
         
         Description:
+            Checks if the metadata dictionary entry for the file is already present, to keep it along with its timestamps.
             Prepares attribute values for the file.
             Constructs the metadata dictionary entry by assigning values to attributes.
             Updates the _metadata_dict to include the constructed metadata dictionary entry.
@@ -819,26 +1481,176 @@ class BackupService:
         BACKUP_DIRNAME = String.LITERAL_BACKUP_DIRNAME
         BACKUP_DIRPATH = String.LITERAL_BACKUP_DIRPATH
         BACKUP_PARENT_DIRPATH = String.LITERAL_BACKUP_PARENT_DIRPATH
-        MODIFIED_AT = String.LITERAL_MODIFIED_AT
+        JSON_ENTRY = String.LITERAL_JSON_ENTRY
         PARENT_DIRPATH = String.LITERAL_PARENT_DIRPATH
         PATH = String.LITERAL_PATH
+        SNAPSHOT = String.LITERAL_SNAPSHOT
 
         # Variable for the storage of the path value.
         path = file_json_entry_dict[PATH]
-        # Variable for the storage of the last modified time; Raw.
-        modified_at = MetaTimeHandler.get_last_modified_time_raw(path)
+
+        # If the metadata dictionary entry for the file is already present:
+        if path in BackupService._metadata_dict:
+            # Keep it.
+            return
+
+        # Variable for the storage of the snapshot of the file.
+        snapshot = MetaTimeHandler.get_snapshot(path)
         # Variable for the storage of the backup directory path.
         backup_directory_path = PropertiesJsonHandler.get_backup_directory() + os.path.sep + file_json_entry_dict[BACKUP_DIRNAME]
 
         # Construct and assign the metadata dictionary entry for the file.
         BackupService._metadata_dict[path] = {
-                MODIFIED_AT : modified_at,
+                SNAPSHOT : snapshot,
                 BACKUP_PARENT_DIRPATH : None,
                 BACKUP_DIRPATH : backup_directory_path,
                 PARENT_DIRPATH : None,
-                AS_DIRECTORY : False
+                AS_DIRECTORY : False,
+                JSON_ENTRY : file_json_entry_dict
             }
 
+        # If the backup service polls:
+        if not BackupService._is_event_driven:
+            # Schedule the check of the file.
+            BackupService._poll_scheduler.add(path, file_json_entry_dict)
+
+
+    @staticmethod
+    def _publish_metrics() -> None:
+        """
+        
+        Description:
+            Publishes the depth of the detection queue, and the metrics of the debouncer, of the throttle, of the poll scheduler, of the tick clock and of the worker pool, to the metrics file within the central backup directory.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Assign the metrics of the worker pool.
+        metrics_dict = BackupWorkerPool.get_metrics()
+
+        # Add the depth of the detection queue.
+        metrics_dict[String.LITERAL_DETECTION_QUEUE_DEPTH] = len(BackupService._backup_queue)
+
+        # Add the metrics of the debouncer.
+        metrics_dict.update(ChangeDebouncer.get_metrics())
+
+        # Add the metrics of the throttle.
+        metrics_dict.update(IoThrottle.get_metrics())
+
+        # Add the metrics of the poll scheduler.
+        metrics_dict.update(BackupService._poll_scheduler.get_metrics())
+
+        # Add the metrics of the tick clock.
+        metrics_dict.update(BackupService._tick_clock.get_metrics())
+
+        # Publish the metrics.
+        ServiceMetrics.publish(PropertiesJsonHandler.get_backup_directory(), metrics_dict)
+
+
+    @staticmethod
+    def _submit_settled_files() -> None:
+        """
+        
+        Description:
+            Submits the timestamped backup of every target file that settled, or exceeded its maximum delay, to the worker pool,
+            according to the storage settings of its target, unless it is no longer tracked within the metadata dict.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Constant for the storage of a string literal.
+        JSON_ENTRY = String.LITERAL_JSON_ENTRY
+
+        # For every target file whose backup is due:
+        for key, snapshot in ChangeDebouncer.pop_settled_snapshots().items():
+            # If the target file is no longer tracked:
+            if key not in BackupService._metadata_dict:
+                # Skip it.
+                continue
+
+            # Submit the creation of the backup file at the formulated backup file path; The worker creates the backup directory if it is missing.
+            BackupWorkerPool.submit(key, BackupService._formulate_target_file_path_for_backedup_file(key, snapshot), BackupService._metadata_dict[key][JSON_ENTRY])
+
+
+    @staticmethod
+    def _synchronize_watches() -> None:
+        """
+        
+        Description:
+            Maps the resolved path of every target file to its key within the metadata dict.
+            Determines the directories to watch: the backup directory, the target directories and the parent directories of all target files.
+            Synchronizes the watches of the inotify instance with these directories.
+            Falls back to the polling approach if the watches cannot be added (e.g. the watch limit is hit).
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If a watch cannot be added,
+                then fall back to the polling approach.
+                
+        """
+
+        # If the backup service is not event-driven:
+        if not BackupService._is_event_driven:
+            # Ignore.
+            return
+
+        # Variable for the storage of the set of directory paths to watch; Starting with the backup directory for registry modifications.
+        directory_path_set = {str(Path(PropertiesJsonHandler.get_backup_directory()).resolve())}
+
+        # Add the target directory paths to the set of directory paths to watch.
+        directory_path_set.update(BackupService._tracked_directory_path_set)
+
+        # Clear the dictionary mapping resolved file paths to their keys.
+        BackupService._event_key_dict.clear()
+
+        # For every key in the metadata dict:
+        for key in BackupService._metadata_dict:
+            # Resolve and assign the file path.
+            resolved_file_path = str(Path(key).resolve())
+
+            # Map the resolved file path to the key.
+            BackupService._event_key_dict[resolved_file_path] = key
+
+            # Add the parent directory path to the set of directory paths to watch.
+            directory_path_set.add(os.path.dirname(resolved_file_path))
+
+        # Attempt to:
+        try:
+            # Synchronize the watches with the set of directory paths to watch.
+            InotifyHandler.synchronize_watches(BackupService._inotify_fd, BackupService._watch_descriptor_dict, directory_path_set, BackupService._INOTIFY_MASK)
+
+        # Handle: OSError.
+        except OSError:
+            # Fall back to the polling approach.
+            BackupService._fall_back_to_polling_mode()
 
 # If this module is executed as the main program:
 if __name__ == "__main__":
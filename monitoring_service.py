@@ -1,9 +1,9 @@
 # Standard library imports.
-import json
 import os
 import time
 
 # Standard library from imports.
+from collections import deque
 from pathlib import Path
 from typing import Union
 
@@ -12,13 +12,22 @@ from _autostart.linux_autostarter import LinuxAutostarter
 from _autostart.windows_autostarter import WindowsAutostarter
 from _constant.integer import Integer
 from _constant.string import String
+from _event.inotify_handler import InotifyHandler
 from _jsonx.monitoring_json_handler import MonitoringJsonHandler
 from _jsonx.properties_json_handler import PropertiesJsonHandler
+from _log.monitoring_log_format import MonitoringLogFormat
+from _log.monitoring_log_rotator import MonitoringLogRotator
+from _log.monitoring_log_writer import MonitoringLogWriter
 from _manager.monitoring_manager import MonitoringManager
+from _metric.service_metrics import ServiceMetrics
 from _miscellaneous.platform_identifier import PlatformIdentifier
 from _path.path_utils import PathUtils
-from _timestamp.current_time_handler import CurrentTimeHandler
+from _reconciler.metadata_reconciler import MetadataReconciler
+from _resolver.target_resolver import TargetResolver
+from _scheduler.poll_scheduler import PollScheduler
+from _scheduler.tick_clock import TickClock
 from _timestamp.meta_time_handler import MetaTimeHandler
+from _timestamp.stat_snapshot import StatSnapshot
 from _user.logged_on_users_retriever import LoggedOnUsersRetriever
 
 
@@ -31,6 +40,9 @@ class MonitoringService:
         Creates or updates a preliminary dictionary for the storage of relevant metadata about target files and directories,
         Checks the historic last access time with the newly queried to detect access attempts.
         Checks the historic last modified time with the newly queried to detect modification attempts.
+    Every target file is checked at the interval of its target, which adapts to how often the file changes (see PollScheduler).
+    Iterations are paced on fixed-rate ticks and bounded by a time budget, work left over being resumed on the next tick (see TickClock);
+    Their lag and overruns are published to the metrics file (.metrics.json) within the central monitoring directory.
 
     Upon access detection, it seeks to update the respective log file for the target with an access entry.
     Upon modification detection, it seeks to update the respective log file for the target with a modified entry.
@@ -38,8 +50,14 @@ class MonitoringService:
     MonitoringService employs exception handling to address the scenario when targets are not found,
     which ensures that the background process executing the MonitoringService does not terminate. 
 
-    Additionally, it routinely checks the central monitoring directory for orphan files (previous log files of targets that are no longer tracked and non-log files).
-    Upon the detection of orphan files, It moves them to the orphanage directory for safekeeping and for keeping the central monitoring directory clean and tidy.
+    Additionally, it checks the central monitoring directory for orphan files (previous log files of targets that are no longer tracked and non-log files),
+    whenever the central monitoring directory or the monitoring json file changes.
+    Upon the detection of orphan files, It moves (renames) them to the orphanage directory for safekeeping and for keeping the central monitoring directory clean and tidy.
+
+    Where the platform supports inotify, MonitoringService is event-driven:
+        It subscribes to access, open and modification events of the directories holding its targets,
+        and logs the events reported by the kernel, which neither depends on strict access time nor requires querying the metadata of every target.
+    If inotify is unavailable or the watch limit is hit, it falls back to the polling approach described above.
 
     """
     
@@ -47,125 +65,161 @@ class MonitoringService:
     # Constants for the storage of the wait time between monitoring iterations.
     _ITERATION_WAIT_TIME: str = Integer.MONITORING_SERVICE_ITERATION_WAIT_TIME
 
+    # Constant for the storage of the time during which the events of a burst are coalesced (in seconds).
+    _EVENT_COALESCING_TIME: float = Integer.MONITORING_SERVICE_EVENT_COALESCING_TIME
+
+    # Constant for the storage of the mask of the inotify events the monitoring service subscribes to.
+    _INOTIFY_MASK: int = (Integer.INOTIFY_IN_ACCESS | Integer.INOTIFY_IN_OPEN | Integer.INOTIFY_IN_MODIFY | Integer.INOTIFY_IN_CLOSE_WRITE
+                          | Integer.INOTIFY_IN_MOVED_TO | Integer.INOTIFY_IN_DELETE | Integer.INOTIFY_IN_MOVED_FROM
+                          | Integer.INOTIFY_IN_CREATE | Integer.INOTIFY_IN_DELETE_SELF | Integer.INOTIFY_IN_MOVE_SELF)
+
+    # Variable for the storage of the signature (monitoring directory, monitoring json file and log files) the monitoring directory was last cleaned up with.
+    _cleanup_signature: tuple = None
+
+    # Variable for the storage of the listings (resolved file paths) of the target directory trees, keyed by the directory paths.
+    _directory_file_path_dict: dict[str, set[str]] = {}
+
+    # Variable for the storage of the stat signatures of the walked directories of the target directory trees, keyed by the directory paths.
+    _directory_signature_dict: dict[str, dict[str, tuple[int, int]]] = {}
+
+    # Variable for the storage of the dictionary mapping resolved file paths to their keys within the metadata dictionary.
+    _event_key_dict: dict[str, Union[str, Path]] = {}
+
+    # Variable for the storage of the file descriptor of the inotify instance.
+    _inotify_fd: int = None
+
+    # Variable for the storage of whether the monitoring service is event-driven.
+    _is_event_driven: bool = False
+
+    # Variable for the storage of the format new entries of the monitoring log files are written in; Read once per iteration.
+    _log_format: str = String.MONITORING_LOG_DEFAULT_FORMAT
+
     # Variable for the storage of the metadata dictionary for all monitoring targets.
     _metadata_dict: dict = {}
+
+    # Variable for the storage of the coalesced event masks left to log by the previous iterations, keyed by the keys of the target files.
+    _pending_event_mask_dict: dict[Union[str, Path], int] = {}
+
+    # Variable for the storage of the scheduler of the checks of the target files, while the monitoring service polls.
+    _poll_scheduler: PollScheduler = PollScheduler(Integer.MONITORING_SERVICE_ITERATION_WAIT_TIME)
+
+    # Variable for the storage of the keys of the monitoring json entries awaiting their preparation within the current pass over the monitoring json data.
+    _prepare_key_queue: deque = deque()
+
+    # Variable for the storage of the monitoring json data the metadata dictionary was reconciled with.
+    _registry_data: dict = {}
+
+    # Variable for the storage of the path of the monitoring json file the metadata dictionary was reconciled with.
+    _registry_file_path: str = None
+
+    # Variable for the storage of the stat signature of the monitoring json file the metadata dictionary was reconciled with.
+    _registry_signature: tuple[int, int] = None
+
+    # Variable for the storage of the clock pacing the iterations on fixed-rate ticks, within their time budgets.
+    _tick_clock: TickClock = TickClock(Integer.MONITORING_SERVICE_ITERATION_WAIT_TIME, Integer.MONITORING_SERVICE_ITERATION_BUDGET)
+
+    # Variable for the storage of the resolved paths of all target directories and of their walked sub directories.
+    _tracked_directory_path_set: set[str] = set()
     
     # Variable for the storage of the currently logged on users.
     _user_list: list[str] = []
 
+    # Variable for the storage of the watched directory paths, keyed by their watch descriptors.
+    _watch_descriptor_dict: dict[int, str] = {}
+
 
     @staticmethod
-    def _add_access_entry_to_monitoring_log_file(file_path: Union[str, Path]) -> None:
+    def _add_access_entry_to_monitoring_log_file(file_path: Union[str, Path], snapshot: StatSnapshot = None) -> None:
         """
         
         Description:
-            Retrieves the formatted current timestamp.
-            Retrieves the list of currently logged-on users.
-            Opens the monitoring log file based on the specified file path.
-            Appends an access entry to the respective monitoring log file.
-            Flushes the buffer to reflect changes to the monitoring log file immediately.
+            Buffers an access entry for the respective monitoring log file, which is written once the iteration is done (see MonitoringLogWriter).
+            The entry is created in the format of the monitoring log files (see MonitoringLogFormat), along with the currently logged-on users;
+            JSON entries also record the size of the file, taken from its snapshot, or with a stat call if no snapshot is given.
 
             Note: This method is not meant to be accessed from outside this class.
 
         Args:
             file_path(Union[str, Path]): Path of the file that is tracked by the monitoring service.
+            snapshot(StatSnapshot): Current snapshot of the metadata of the file; Optional.
 
         Returns:
             None
 
         Raises:
-            None
+            OSError:
+                If the size of the file cannot be retrieved (e.g. it was deleted in the meantime),
+                then record it as unknown.
                 
         """
 
-        # Constants for the storage of string literals.
-        ACCESSED_AT = String.LITERAL_ACCESSED_AT
-        DELIMITER = String.DELIMITER_MONITORING_LOG_FILE
-        FILE_MODE_APPEND = String.FILE_MODE_APPEND
+        # Constant for the storage of a string literal.
         LOG_FILEPATH = String.LITERAL_LOG_FILEPATH
-        POTENTIALLY_BY = String.LITERAL_POTENTIALLY_BY
-        TARGET = String.LITERAL_TARGET
-        
-        # Assign the current time; Formatted.
-        current_time_formatted = CurrentTimeHandler.get_current_time_formatted()
-        
-        # Update the formatted current time for better display.
-        current_time_formatted = current_time_formatted.replace('-', ':').replace('_', ' ')
 
-        # Assign the formatted string of logged on users.
-        logged_on_users_list = MonitoringService._format_logged_on_users_list()
-        
-        # Assign the target file name.
-        target_file_name = Path(file_path).name
-        
-        # Open the log file path with the file mode append and assign its file descriptor.
-        file = open(MonitoringService._metadata_dict[file_path][LOG_FILEPATH], FILE_MODE_APPEND)
-        
-        # Write the access entry to the monitoring log file.
-        file.write('\n' + TARGET + target_file_name + DELIMITER + ACCESSED_AT + current_time_formatted + DELIMITER + POTENTIALLY_BY + logged_on_users_list)
-        
-        # Flush the buffer to reflect changes immediately.
-        file.flush()
-        
-        # Close the file.
-        file.close()
+        # If the entry records the size of the file and the snapshot is not given:
+        if MonitoringService._log_format == String.MONITORING_LOG_FORMAT_JSON and snapshot is None:
+            # Attempt to:
+            try:
+                # Take the snapshot of the file.
+                snapshot = MetaTimeHandler.get_snapshot(file_path)
+
+            # Handle: OSError.
+            except OSError:
+                # Record the size of the file as unknown.
+                pass
+
+        # Assign the time of the event (in nanoseconds since the epoch).
+        timestamp_ns = time.time_ns()
+
+        # Buffer the access entry for the monitoring log file, along with its time for the time index.
+        MonitoringLogWriter.append(MonitoringService._metadata_dict[file_path][LOG_FILEPATH], MonitoringLogFormat.create_entry(MonitoringService._log_format, timestamp_ns, String.MONITORING_LOG_EVENT_ACCESSED, str(file_path), MonitoringService._user_list, None if snapshot is None else snapshot.size), timestamp_ns)
 
 
     @staticmethod
-    def _add_modified_entry_to_monitoring_log_file(file_path: Union[str, Path]) -> None:
+    def _add_modified_entry_to_monitoring_log_file(file_path: Union[str, Path], snapshot: StatSnapshot = None) -> None:
         """
         
         Description:
-            Retrieves the formatted current timestampt.
-            Retrieves the list of currently logged on users.
-            Opens the monitoring log file based on the specified file path.
-            Appends a modified entry to the respective monitoring log file.
-            Flushes the buffer to reflect changes to the monitoring log file immediately.
+            Buffers a modified entry for the respective monitoring log file, which is written once the iteration is done (see MonitoringLogWriter).
+            The entry is created in the format of the monitoring log files (see MonitoringLogFormat), along with the currently logged-on users;
+            JSON entries also record the size of the file, taken from its snapshot, or with a stat call if no snapshot is given.
 
             Note: This method is not meant to be accessed from outside this class.
 
         Args:
             file_path(Union[str, Path]): Path of the file that is tracked by the monitoring service.
+            snapshot(StatSnapshot): Current snapshot of the metadata of the file; Optional.
 
         Returns:
             None
 
         Raises:
-            None
+            OSError:
+                If the size of the file cannot be retrieved (e.g. it was deleted in the meantime),
+                then record it as unknown.
                 
         """
 
-        # Constants for the storage of string literals.
-        DELIMITER = String.DELIMITER_MONITORING_LOG_FILE
-        FILE_MODE_APPEND = String.FILE_MODE_APPEND
+        # Constant for the storage of a string literal.
         LOG_FILEPATH = String.LITERAL_LOG_FILEPATH
-        MODIFIED_AT = String.LITERAL_MODIFIED_AT
-        POTENTIALLY_BY = String.LITERAL_POTENTIALLY_BY
-        TARGET = String.LITERAL_TARGET
-        
-        # Assign the current time; Formatted.
-        current_time_formatted = CurrentTimeHandler.get_current_time_formatted()
-        
-        # Update the formatted current time for better display.
-        current_time_formatted = current_time_formatted.replace('-', ':').replace('_', ' ')
 
-        # Assign the formatted string of logged on users.
-        logged_on_users_list = MonitoringService._format_logged_on_users_list()
-        
-        # Assign the target file name.
-        target_file_name = Path(file_path).name
-        
-        # Open the log file path with the file mode append and assign its file descriptor.
-        file = open(MonitoringService._metadata_dict[file_path][LOG_FILEPATH], FILE_MODE_APPEND)
-        
-        # Write the modified entry to the monitoring log file.
-        file.write('\n' + TARGET + target_file_name + DELIMITER + MODIFIED_AT + current_time_formatted + DELIMITER + POTENTIALLY_BY + logged_on_users_list)
-        
-        # Flush the buffer to reflect changes immediately.
-        file.flush()
-        
-        # Close the file.
-        file.close()
+        # If the entry records the size of the file and the snapshot is not given:
+        if MonitoringService._log_format == String.MONITORING_LOG_FORMAT_JSON and snapshot is None:
+            # Attempt to:
+            try:
+                # Take the snapshot of the file.
+                snapshot = MetaTimeHandler.get_snapshot(file_path)
+
+            # Handle: OSError.
+            except OSError:
+                # Record the size of the file as unknown.
+                pass
+
+        # Assign the time of the event (in nanoseconds since the epoch).
+        timestamp_ns = time.time_ns()
+
+        # Buffer the modified entry for the monitoring log file, along with its time for the time index.
+        MonitoringLogWriter.append(MonitoringService._metadata_dict[file_path][LOG_FILEPATH], MonitoringLogFormat.create_entry(MonitoringService._log_format, timestamp_ns, String.MONITORING_LOG_EVENT_MODIFIED, str(file_path), MonitoringService._user_list, None if snapshot is None else snapshot.size), timestamp_ns)
 
 
     @staticmethod
@@ -173,10 +227,13 @@ class MonitoringService:
         """
         
         Description:
+            Checks if the monitoring directory, the monitoring json file or the log files of the targets changed since the last cleanup, otherwise skips it,
+            as orphan files can only arise from such changes.
             Retrieves file paths of all files within the monitoring directory.
             Retrieves file paths of all monitoring log files within the monitoring directory.
             Identifies file paths of all orphan files within the monitoring directory.
             Moves orphan files to the orphanage directory located at the monitoring directory.
+            Remembers the signature of the cleanup, unless the monitoring directory or the monitoring json file were modified within the racy window.
 
             Note: This method is not meant to be accessed from outside this class.
 
@@ -191,17 +248,38 @@ class MonitoringService:
                 
         """
         
-        # Assign the list with file paths of all files within the monitoring directory.
-        file_path_list = MonitoringService._get_file_paths_for_all_files_within_monitoring_directory()
+        # Assign the set with file paths of all monitoring log files.
+        monitoring_log_file_path_set = MonitoringService._get_file_paths_of_all_monitoring_log_files()
 
-        # Assign the list with file paths of all monitoring log files.
-        monitoring_log_file_path_list = MonitoringService._get_file_paths_of_all_monitoring_log_files()
+        # Assign the stat signature of the monitoring directory.
+        directory_signature = MetadataReconciler.get_signature(PropertiesJsonHandler.get_monitoring_directory())
 
-        # Assign the list with file paths of orphan files.
-        orphan_file_path_list = MonitoringService._get_file_paths_of_orphan_files(file_path_list, monitoring_log_file_path_list)
+        # Construct the signature of the cleanup.
+        cleanup_signature = (directory_signature, MonitoringService._registry_signature, frozenset(monitoring_log_file_path_set))
+
+        # If the signature did not change since the last cleanup:
+        if cleanup_signature == MonitoringService._cleanup_signature:
+            # Skip the cleanup.
+            return
+
+        # Assign the set with file paths of all files within the monitoring directory.
+        file_path_set = MonitoringService._get_file_paths_for_all_files_within_monitoring_directory()
+
+        # Assign the set with file paths of orphan files.
+        orphan_file_path_set = MonitoringService._get_file_paths_of_orphan_files(file_path_set, monitoring_log_file_path_set)
 
         # Move the orphan files to the orphanage directory.
-        MonitoringService._move_orphan_files_to_orphanage(orphan_file_path_list)
+        MonitoringService._move_orphan_files_to_orphanage(orphan_file_path_set)
+
+        # If the monitoring directory and the monitoring json file are settled (their signatures are trusted to change upon the next modification):
+        if MonitoringService._registry_signature is not None and MetadataReconciler.is_signature_settled(directory_signature):
+            # Remember the signature of the cleanup; Taken before the orphan files were moved, so that a cleanup that moved any runs once more.
+            MonitoringService._cleanup_signature = cleanup_signature
+
+        # If the monitoring directory or the monitoring json file are not settled:
+        else:
+            # Forget the signature of the cleanup, so that the next iteration cleans up again.
+            MonitoringService._cleanup_signature = None
 
 
     @staticmethod
@@ -211,6 +289,7 @@ class MonitoringService:
         Description:
             Tracks all target files and files of target directories for access and modification attempts in a timely fashion.
             Logs the access and modification entries to the respective monitoring log files in the monitoring directory.
+            Based on the availability of inotify, executes either event-driven or polling iterations.
             
             Note: This method is not meant to be accessed from outside this class.
 
@@ -221,71 +300,233 @@ class MonitoringService:
             None
 
         Raises:
-            FileNotFoundError:
-                If a target file is not found,
-                then delegate handling to other methods.
+            None
                 
         """
         
-        # Constants for the storage of the string literals.
-        ENABLED = String.LITERAL_ENABLED
-        LOG_FILEPATH = String.LITERAL_LOG_FILEPATH
-        ORPHANAGE = String.LITERAL_ORPHANAGE
-        PARENT_DIRPATH = String.LITERAL_PARENT_DIRPATH
-        
         # Prepare the metadata dict.
         MonitoringService._prepare_metadata()
+
+        # Attempt to switch the monitoring service to the event-driven approach.
+        MonitoringService._initialize_event_driven_mode()
         
         # Loop indefinitely.
         while True:
-            # If the monitoring lock exists and the monitoring autostart status attribute is set to enabled:
-            if MonitoringService._is_lock_exist() and PropertiesJsonHandler.get_monitoring_autostart_status() == ENABLED:
+            # If the monitoring service is event-driven:
+            if MonitoringService._is_event_driven:
+                # Execute an event-driven iteration.
+                MonitoringService._execute_event_driven_iteration()
+
+            # If the monitoring service is not event-driven:
+            else:
+                # Execute a polling iteration.
+                MonitoringService._execute_polling_iteration()
+
+
+    @staticmethod
+    def _execute_event_driven_iteration() -> None:
+        """
+        
+        Description:
+            Waits for file system events until the next tick and coalesces them per target file, along with those left by the previous iterations.
+            Logs an access or modified entry for every concerned target file if the monitoring service is enabled.
+            Writes the logged entries to the monitoring log files at once, according to the durability policy.
+            Re-prepares the metadata dict if the events require it; Once the re-preparation is complete, cleans up the monitoring directory and re-synchronizes the watches.
+            Work left once the time budget of the iteration is exhausted is resumed on the next iteration.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Constant for the storage of a string literal.
+        ENABLED = String.LITERAL_ENABLED
+
+        # Read and coalesce the pending events; Assign them along with whether the metadata dict must be re-prepared.
+        event_mask_dict, is_reprepare_required = MonitoringService._read_coalesced_events()
+
+        # Start the iteration, granting it the time budget.
+        MonitoringService._tick_clock.begin_iteration()
+
+        # Assign the coalesced event masks left by the previous iterations.
+        pending_event_mask_dict = MonitoringService._pending_event_mask_dict
+
+        # For every key and coalesced event mask:
+        for key, mask in event_mask_dict.items():
+            # Coalesce the event mask with the one left for the target file, if any.
+            pending_event_mask_dict[key] = pending_event_mask_dict.get(key, 0) | mask
+
+        # If there are events to log, the monitoring lock exists and the monitoring autostart status attribute is set to enabled:
+        if pending_event_mask_dict and MonitoringService._is_lock_exist() and PropertiesJsonHandler.get_monitoring_autostart_status() == ENABLED:
+            # Assign the currently logged-on users to the user list.
+            MonitoringService._user_list = LoggedOnUsersRetriever.get_logged_on_users()
+
+            # Assign the format of the monitoring log files.
+            MonitoringService._log_format = PropertiesJsonHandler.get_monitoring_log_format()
+
+            # While there are events to log and the time budget is not exhausted:
+            while pending_event_mask_dict and not MonitoringService._tick_clock.is_budget_exhausted():
+                # Assign the earliest target file with events to log.
+                key = next(iter(pending_event_mask_dict))
+
+                # Remove its coalesced event mask.
+                mask = pending_event_mask_dict.pop(key)
+
+                # If the target file is no longer tracked:
+                if key not in MonitoringService._metadata_dict:
+                    # Skip it.
+                    continue
+
+                # Log the coalesced events of the target file.
+                MonitoringService._log_events_of_single_file(key, mask)
+
+        # If there are no events to log, the monitoring lock does not exist or the monitoring autostart status attribute is set to disabled:
+        else:
+            # Discard the events left to log.
+            pending_event_mask_dict.clear()
+
+        # If the metadata dict must be re-prepared:
+        if is_reprepare_required:
+            # Restart the pass over the monitoring json data, as targets already prepared within the current pass may be concerned.
+            MonitoringService._prepare_key_queue.clear()
+
+        # If the metadata dict must be re-prepared, or its re-preparation is underway, and the re-preparation completes within the time budget:
+        if (is_reprepare_required or MonitoringService._prepare_key_queue) and MonitoringService._prepare_metadata(MonitoringService._tick_clock.deadline):
+            # Cleanup the monitoring directory for orphan files.
+            MonitoringService._cleanup_monitoring_directory()
+
+            # Re-synchronize the watches with the re-prepared metadata dict.
+            MonitoringService._synchronize_watches()
+
+        # Write the buffered entries to the monitoring log files, according to the durability policy, and rotate them according to the rotation policy.
+        MonitoringLogWriter.flush(PropertiesJsonHandler.get_monitoring_log_durability(), MonitoringLogRotator.get_policy())
+
+        # Count the iteration as an overrun, if events to log or the re-preparation are left for the next iteration.
+        MonitoringService._tick_clock.end_iteration(bool(pending_event_mask_dict or MonitoringService._prepare_key_queue))
+
+        # Publish the metrics of the monitoring service.
+        MonitoringService._publish_metrics()
+
+
+    @staticmethod
+    def _execute_polling_iteration() -> None:
+        """
+        
+        Description:
+            Checks the targets within the metadata dict whose checks are due for access and modification attempts and logs them.
+            Writes the logged entries to the monitoring log files at once, according to the durability policy.
+            Reports the outcome of every check to the poll scheduler, which adapts the interval of the target to how often it changes.
+            Re-prepares the metadata dict on every tick; Once the re-preparation is complete, cleans up the monitoring directory.
+            Work left once the time budget of the iteration is exhausted (due checks, targets awaiting their preparation) is resumed on the next tick.
+            Waits until the next check is due or the next tick, whichever comes first; Until the next tick, if work is left.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            FileNotFoundError:
+                If a target file is not found,
+                then delegate handling to other methods.
+                
+        """
+        
+        # Constant for the storage of a string literal.
+        ENABLED = String.LITERAL_ENABLED
+
+        # Constant for the storage of an integer literal.
+        POLL_BATCH_SIZE = Integer.POLL_BATCH_SIZE
+
+        # Start the iteration, granting it the time budget; Assign whether a tick is due.
+        is_tick = MonitoringService._tick_clock.begin_iteration()
+
+        # If the monitoring lock exists and the monitoring autostart status attribute is set to enabled:
+        if MonitoringService._is_lock_exist() and PropertiesJsonHandler.get_monitoring_autostart_status() == ENABLED:
+            # If any check is due:
+            if MonitoringService._poll_scheduler.is_check_due():
                 # Assign the currently logged-on users to the user list.
                 MonitoringService._user_list = LoggedOnUsersRetriever.get_logged_on_users()
-                
-                # For every key in the metadata dict:
-                for key in MonitoringService._metadata_dict:
+
+                # Assign the format of the monitoring log files.
+                MonitoringService._log_format = PropertiesJsonHandler.get_monitoring_log_format()
+
+            # While checks are due and the time budget is not exhausted:
+            while MonitoringService._poll_scheduler.is_check_due() and not MonitoringService._tick_clock.is_budget_exhausted():
+                # Assign the keys of the next batch of targets whose checks are due.
+                due_key_list = MonitoringService._poll_scheduler.pop_due_keys(MonitoringService._metadata_dict, POLL_BATCH_SIZE)
+
+                # Take the snapshots of the due targets at once; Targets that are not found are left out.
+                snapshot_dict = MetaTimeHandler.get_snapshots(due_key_list)
+
+                # For every due key:
+                for key in due_key_list:
                     # Attempt to:
                     try:
-                        # Monitor every target.
-                        MonitoringService._monitor_single_file(key)
+                        # Monitor the target; Assign whether it is modified or accessed.
+                        is_changed = MonitoringService._monitor_single_file(key, snapshot_dict.get(key))
                     
                     # Handle: FileNotFoundError.
                     except FileNotFoundError:
-                        # Assign the log file path of the target.
-                        log_file_path = MonitoringService._metadata_dict[key][LOG_FILEPATH]
-                        # Assign the parent directory path of the target.
-                        parent_directory_path = MonitoringService._metadata_dict[key][PARENT_DIRPATH]
-                        # Construct the orphanage directory path.
-                        orphanage_directory_path = PropertiesJsonHandler.get_monitoring_directory() + os.path.sep + ORPHANAGE
-
-                        # Handle the file not found error for the monitored file.
-                        MonitoringService._handle_file_not_found_exception_for_file(key, log_file_path, orphanage_directory_path)
-                        
-                        # Handle the file not found error for a single file within the monitored directory.
-                        MonitoringService._handle_file_not_found_exception_for_file_within_target_directory(key, log_file_path, parent_directory_path, orphanage_directory_path)
-                
-                # Re-prepare the metadata dict.
-                MonitoringService._prepare_metadata()
-            
-            # If the monitoring lock does not exist or the monitoring autostart status attribute is set to disabled:
-            else:
-                # Re-prepare the metadata dict.
-                MonitoringService._prepare_metadata()
-            
+                        # Handle the file not found error for the target.
+                        MonitoringService._handle_file_not_found_exception(key)
+
+                        # Forget the polling schedule of the target, as it is handled already; It is scheduled anew if it is prepared again.
+                        MonitoringService._poll_scheduler.remove(key)
+
+                        # Skip to the next due key.
+                        continue
+
+                    # Reschedule the check of the target according to its outcome.
+                    MonitoringService._poll_scheduler.report(key, is_changed)
+
+            # Write the buffered entries to the monitoring log files, according to the durability policy, and rotate them according to the rotation policy.
+            MonitoringLogWriter.flush(PropertiesJsonHandler.get_monitoring_log_durability(), MonitoringLogRotator.get_policy())
+
+        # If a tick is due, or the re-preparation is underway, and the re-preparation completes within the time budget:
+        if (is_tick or MonitoringService._prepare_key_queue) and MonitoringService._prepare_metadata(MonitoringService._tick_clock.deadline):
             # Cleanup the monitoring directory for orphan files.
             MonitoringService._cleanup_monitoring_directory()
-            
-            # Wait for a few seconds.
-            time.sleep(MonitoringService._ITERATION_WAIT_TIME)
+
+        # Assign whether work is left for the next tick.
+        is_overrun = MonitoringService._tick_clock.is_budget_exhausted() and (MonitoringService._poll_scheduler.is_check_due() or bool(MonitoringService._prepare_key_queue))
+
+        # Count the iteration as an overrun, if work is left.
+        MonitoringService._tick_clock.end_iteration(is_overrun)
+
+        # Publish the metrics of the monitoring service.
+        MonitoringService._publish_metrics()
+
+        # If work is left:
+        if is_overrun:
+            # Wait until the next tick, so that the iterations keep to their time budget.
+            time.sleep(MonitoringService._tick_clock.get_wait_time(MonitoringService._ITERATION_WAIT_TIME))
+
+        # If no work is left:
+        else:
+            # Wait until the next check is due or the next tick.
+            time.sleep(MonitoringService._poll_scheduler.get_wait_time(MonitoringService._tick_clock.get_wait_time(MonitoringService._ITERATION_WAIT_TIME)))
 
 
     @staticmethod
-    def _format_logged_on_users_list() -> str:
+    def _fall_back_to_polling_mode() -> None:
         """
         
         Description:
-            Converts and returns the list of logged-on users as a string format.
+            Closes the inotify instance and forgets all of its watches.
+            Schedules the checks of all targets.
+            Switches the monitoring service to the polling approach.
 
             Note: This method is not meant to be accessed from outside this class.
 
@@ -293,24 +534,84 @@ class MonitoringService:
             None
 
         Returns:
-            str: List of currently logged-on users in a string format.
+            None
 
         Raises:
             None
                 
         """
+
+        # Constant for the storage of a string literal.
+        JSON_ENTRY = String.LITERAL_JSON_ENTRY
+
+        # If the inotify instance is initialized:
+        if MonitoringService._inotify_fd is not None:
+            # Close the inotify instance.
+            InotifyHandler.close(MonitoringService._inotify_fd)
+
+        # Reset the file descriptor of the inotify instance.
+        MonitoringService._inotify_fd = None
+
+        # Forget all watches.
+        MonitoringService._watch_descriptor_dict.clear()
+
+        # For every key in the metadata dict:
+        for key, metadata in MonitoringService._metadata_dict.items():
+            # Schedule the check of the target.
+            MonitoringService._poll_scheduler.add(key, metadata[JSON_ENTRY])
+
+        # Assert the monitoring service as not event-driven.
+        MonitoringService._is_event_driven = False
+
+
+    @staticmethod
+    def _forget_metadata_for_target(json_entry_dict: dict) -> None:
+        """
         
-        # Construct and return the string of the currently logged on users.
-        return '[' + ', '.join(MonitoringService._user_list) + ']'
+        Description:
+            Removes the metadata dictionary entries of the target specified by the monitoring json entry.
+            For a target directory, additionally forgets its stat signature and listing.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            json_entry_dict(dict): Monitoring json entry for the target.
+
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Constants for the storage of string literals.
+        IS_DIRECTORY = String.LITERAL_IS_DIRECTORY
+        PATH = String.LITERAL_PATH
+
+        # If the target is a directory:
+        if json_entry_dict[IS_DIRECTORY]:
+            # For every file within the last listing of the directory:
+            for path in MonitoringService._directory_file_path_dict.pop(json_entry_dict[PATH], set()):
+                # Remove the metadata dictionary entry for the file.
+                MonitoringService._metadata_dict.pop(path, None)
+
+            # Forget the stat signatures of the directory tree, and remove the resolved paths of its walked directories from the set of target directory paths.
+            MonitoringService._tracked_directory_path_set.difference_update(MonitoringService._directory_signature_dict.pop(json_entry_dict[PATH], {}))
+
+        # If the target is a file:
+        else:
+            # Remove the metadata dictionary entry for the file.
+            MonitoringService._metadata_dict.pop(json_entry_dict[PATH], None)
 
 
     @staticmethod
-    def _get_file_paths_for_all_files_within_monitoring_directory() -> list[Path]:
+    def _get_file_paths_for_all_files_within_monitoring_directory() -> set[str]:
         """
         
         Description:
-            Retrieves and appends file paths of all files within the monitoring directory.
-            Returns the list of file paths.
+            Retrieves and adds the resolved file paths of all files within the monitoring directory, except the monitoring json file and the metrics files.
+            Returns the set of file paths.
 
             Note: This method is not meant to be accessed from outside this class.
 
@@ -318,40 +619,42 @@ class MonitoringService:
             None
 
         Returns:
-            list[Path]: List of file paths of all files within the monitoring directory.
+            set[str]: Set of resolved file paths of all files within the monitoring directory.
 
         Raises:
             None
                 
         """
 
-        # Constant for the storage of a string literal.
-        MONITORING_FILENAME = String.MONITORING_FILENAME
+        # Constant for the storage of the names of the files within the monitoring directory that are not log files.
+        EXCLUDED_FILENAME_SET = {String.MONITORING_FILENAME, String.METRICS_FILENAME, String.METRICS_TEMPORARY_FILENAME}
 
         # Constant for the storage of the monitoring directory path.
         MONITORING_DIRECTORY_PATH = PropertiesJsonHandler.get_monitoring_directory()
     
-        # Variable for the storage of a list of file paths.
-        file_path_list = []
+        # Variable for the storage of a set of file paths.
+        file_path_set = set()
 
-        # For every item in the monitoring directory path:
-        for item in Path(MONITORING_DIRECTORY_PATH).iterdir():
-            # If the item is a file and the name of the item is not equal to the monitoring file name:
-            if item.is_file() and Path(item).name != MONITORING_FILENAME:
-                # Resolve and append the file path to the list of the file paths.
-                file_path_list.append(item.resolve())
+        # With the iterator over the entries of the monitoring directory:
+        with os.scandir(MONITORING_DIRECTORY_PATH) as iterator:
+            # For every entry in the monitoring directory:
+            for entry in iterator:
+                # If the entry is a file and the name of the entry is not excluded:
+                if entry.is_file() and entry.name not in EXCLUDED_FILENAME_SET:
+                    # Resolve and add the file path to the set of the file paths.
+                    file_path_set.add(os.path.realpath(entry.path))
 
-        # Return the list of file paths.
-        return file_path_list
+        # Return the set of file paths.
+        return file_path_set
 
 
     @staticmethod
-    def _get_file_paths_of_all_monitoring_log_files() -> list[Path]:
+    def _get_file_paths_of_all_monitoring_log_files() -> set[str]:
         """
         
         Description:
-            Retrieves and appends file paths of all monitoring log files within the monitoring directory.
-            Returns the list of file paths.
+            Retrieves and adds the resolved file paths of all monitoring log files within the monitoring directory.
+            Returns the set of file paths.
 
             Note: This method is not meant to be accessed from outside this class.
 
@@ -359,7 +662,7 @@ class MonitoringService:
             None
 
         Returns:
-            list[Path]: List of file paths of all monitoring log files within the monitoring directory.
+            set[str]: Set of resolved file paths of all monitoring log files within the monitoring directory.
 
         Raises:
             None
@@ -369,42 +672,90 @@ class MonitoringService:
         # Constant for the storage of a string literal.
         LOG_FILEPATH = String.LITERAL_LOG_FILEPATH
 
-        # Variable for the storage of a list of monitoring log file paths.
-        monitoring_log_file_path_list = []
+        # Assign the set of monitoring log file paths; Files within a directory share its log file.
+        monitoring_log_file_path_set = {item[LOG_FILEPATH] for item in MonitoringService._metadata_dict.values()}
+
+        # Resolve and return the set of monitoring log file paths; Only the distinct paths are resolved.
+        return {os.path.realpath(log_file_path) for log_file_path in monitoring_log_file_path_set}
+
 
-        # For every item in the metadata dict values:
-        for item in MonitoringService._metadata_dict.values():
-            # Append the log file path of the item to the monitoring log file path list.
-            monitoring_log_file_path_list.append(Path(item[LOG_FILEPATH]))
+    @staticmethod
+    def _get_file_paths_of_orphan_files(file_path_set: set[str], monitoring_log_file_path_set: set[str]) -> set[str]:
+        """
+        
+        Description:
+            Retrieves the file paths of all orphan files within the monitoring directory, as the files that do not belong to any monitoring log file;
+            Segments and segment manifests belong to their log files (see MonitoringLogRotator), so that whole segment sets are orphaned at once.
+            Returns the set of file paths.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            file_path_set(set[str]): Set of all resolved file paths within the monitoring directory.
+            monitoring_log_file_path_set(set[str]): Set of all resolved file paths for monitoring log files.
+
+        Returns:
+            set[str]: Set of file paths of all orphan files within the monitoring directory.
+
+        Raises:
+            None
+                
+        """
 
-        # Return the list of monitoring log file paths.
-        return monitoring_log_file_path_list
+        # Return the set of orphan files that do not belong to a monitoring log file that is being monitored.
+        return {file_path for file_path in file_path_set if MonitoringLogRotator.get_log_file_path(file_path) not in monitoring_log_file_path_set}
 
 
     @staticmethod
-    def _get_file_paths_of_orphan_files(file_path_list: list[Path], monitoring_log_file_path_list: list[Path]) -> list[Path]:
+    def _handle_file_not_found_exception(key: Union[str, Path]) -> None:
         """
         
         Description:
-            Retrieves and appends file paths of all orphan files within the monitoring directory.
-            Returns the list of file paths.
+            Retrieves the log file path and parent directory path of the target that is not found.
+            Writes the buffered entries of the log file and closes its handle, before the log file may be moved.
+            Constructs the orphanage directory path.
+            Delegates the handling of the scenario to the respective methods.
+            Forgets the target within the metadata dict and the event key dict, so that the scenario is handled only once.
 
             Note: This method is not meant to be accessed from outside this class.
 
         Args:
-            file_path_list(list[Path]): List of all file paths within the monitoring directory.
-            monitoring_log_file_path_list(list[Path]): List of all file paths for monitoring log files.
+            key(Union[str, Path]): Key of the target within the metadata dict.
 
         Returns:
-            list[Path]: List of file paths of all orphan files within the monitoring directory.
+            None
 
         Raises:
             None
                 
         """
 
-        # Create and return a list of orphan files that are not being monitored.
-        return [file_path for file_path in file_path_list if file_path not in monitoring_log_file_path_list]
+        # Constants for the storage of the string literals.
+        LOG_FILEPATH = String.LITERAL_LOG_FILEPATH
+        ORPHANAGE = String.LITERAL_ORPHANAGE
+        PARENT_DIRPATH = String.LITERAL_PARENT_DIRPATH
+
+        # Assign the log file path of the target.
+        log_file_path = MonitoringService._metadata_dict[key][LOG_FILEPATH]
+
+        # Write the buffered entries of the monitoring log file and close its handle, as it may be moved to the orphanage.
+        MonitoringLogWriter.close(log_file_path)
+        # Assign the parent directory path of the target.
+        parent_directory_path = MonitoringService._metadata_dict[key][PARENT_DIRPATH]
+        # Construct the orphanage directory path.
+        orphanage_directory_path = PropertiesJsonHandler.get_monitoring_directory() + os.path.sep + ORPHANAGE
+
+        # Handle the file not found error for the monitored file.
+        MonitoringService._handle_file_not_found_exception_for_file(key, log_file_path, orphanage_directory_path)
+        
+        # Handle the file not found error for a single file within the monitored directory.
+        MonitoringService._handle_file_not_found_exception_for_file_within_target_directory(key, log_file_path, parent_directory_path, orphanage_directory_path)
+
+        # Forget the target file, so that further checks or events for it are ignored until the metadata dict is re-prepared.
+        MonitoringService._metadata_dict.pop(key, None)
+
+        # Forget the mapping of its resolved file path to its key.
+        MonitoringService._event_key_dict.pop(str(Path(key).resolve()), None)
 
 
     @staticmethod
@@ -434,11 +785,8 @@ class MonitoringService:
 
         # If the file is not monitored as part of a directory:
         if not MonitoringService._metadata_dict[file_path][AS_DIRECTORY]:
-            # Copy the log file to the orphanage directory.
-            PathUtils.copy_file(log_file_path, orphanage_directory_path)
-            
-            # Delete the log file.
-            PathUtils.delete_file(log_file_path)
+            # Move the segment set of the log file to the orphanage directory.
+            MonitoringLogRotator.move_segment_set(log_file_path, orphanage_directory_path)
 
 
     @staticmethod
@@ -478,11 +826,8 @@ class MonitoringService:
             if not PathUtils.is_path_exist(parent_directory_path):
                 # Attempt to:
                 try:
-                    # Copy the log file to the orphanage directory.
-                    PathUtils.copy_file(log_file_path, orphanage_directory_path)
-                    
-                    # Delete the log file.
-                    PathUtils.delete_file(log_file_path)
+                    # Move the segment set of the log file to the orphanage directory.
+                    MonitoringLogRotator.move_segment_set(log_file_path, orphanage_directory_path)
                     
                     # Delete the monitoring json entry from the monitoring json file.
                     MonitoringManager.delete_monitoring_json_entry(file_path)
@@ -494,16 +839,69 @@ class MonitoringService:
 
 
     @staticmethod
-    def _is_file_accessed(file_path: Union[str, Path]) -> bool:
+    def _initialize_event_driven_mode() -> None:
         """
         
         Description:
-            Determines if a file is accessed by comparing the last access timestamp with the newly queried.
+            Checks if inotify is available on the current platform.
+            Initializes the inotify instance and watches the directories holding the targets.
+            Switches the monitoring service to the event-driven approach, or falls back to the polling approach upon failure.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If the inotify instance cannot be initialized,
+                then fall back to the polling approach.
+                
+        """
+
+        # If inotify is not available on the current platform:
+        if not InotifyHandler.is_supported():
+            # Keep the polling approach.
+            return
+
+        # Attempt to:
+        try:
+            # Initialize the inotify instance.
+            MonitoringService._inotify_fd = InotifyHandler.initialize()
+
+        # Handle: OSError.
+        except OSError:
+            # Fall back to the polling approach.
+            MonitoringService._fall_back_to_polling_mode()
+
+            # Stop the initialization.
+            return
+
+        # Discard the scheduled checks; The kernel reports the accesses and modifications instead.
+        MonitoringService._poll_scheduler.clear()
+
+        # Assert the monitoring service as event-driven.
+        MonitoringService._is_event_driven = True
+
+        # Watch the directories holding the targets.
+        MonitoringService._synchronize_watches()
+
+
+    @staticmethod
+    def _is_file_accessed(file_path: Union[str, Path], snapshot: StatSnapshot) -> bool:
+        """
+        
+        Description:
+            Determines if a file is accessed by comparing the snapshot of its metadata with the newly taken.
 
             Note: This method is not meant to be accessed from outside this class.
 
         Args:
             file_path(Union[str, Path]): Path for the file for which access attempts must be determined.
+            snapshot(StatSnapshot): Current snapshot of the metadata of the file.
 
         Returns:
             bool: Whether the file specified by the file path is accessed or not.
@@ -514,36 +912,34 @@ class MonitoringService:
         """
         
         # Constant for the storage of string literal.
-        ACCESSED_AT = String.LITERAL_ACCESSED_AT
-        
-        # Variable for the storage of the new last access time; Raw.
-        last_access_time_new = MetaTimeHandler.get_last_access_time_raw(file_path)
+        SNAPSHOT = String.LITERAL_SNAPSHOT
 
-        # If the last access time within the metadata dict is lower than the new last access time:
-        if MonitoringService._metadata_dict[file_path][ACCESSED_AT] < last_access_time_new:
-            # Update the last access time within the metadata dict to the new last access time.
-            MonitoringService._metadata_dict[file_path][ACCESSED_AT] = last_access_time_new
+        # If the file was accessed since the snapshot within the metadata dict:
+        if MetaTimeHandler.is_accessed(MonitoringService._metadata_dict[file_path][SNAPSHOT], snapshot):
+            # Update the snapshot within the metadata dict to the new snapshot.
+            MonitoringService._metadata_dict[file_path][SNAPSHOT] = snapshot
 
             # Assert file as accessed.
             return True
     
-        # If the last access time within the metadata dict is not lower than the new last access time:
+        # If the file was not accessed since the snapshot within the metadata dict:
         else:
             # Assert file as unaccessed.
             return False
 
 
     @staticmethod
-    def _is_file_modified(file_path: Union[str, Path]) -> bool:
+    def _is_file_modified(file_path: Union[str, Path], snapshot: StatSnapshot) -> bool:
         """
         
         Description:
-            Determines if a file is modified by comparing the last modified timestamp with the newly queried.
+            Determines if a file is modified by comparing the snapshot of its metadata with the newly taken.
 
             Note: This method is not meant to be accessed from outside this class.
 
         Args:
             file_path(Union[str, Path]): Path for the file for which modification attempts must be determined.
+            snapshot(StatSnapshot): Current snapshot of the metadata of the file.
 
         Returns:
             bool: Whether the file specified by the file path is modified or not.
@@ -554,27 +950,17 @@ class MonitoringService:
         """
 
         # Constants for the storage of string literals.
-        ACCESSED_AT = String.LITERAL_ACCESSED_AT
-        MODIFIED_AT = String.LITERAL_MODIFIED_AT
+        SNAPSHOT = String.LITERAL_SNAPSHOT
 
-        # Variable for the storage of the new last modified time; Raw.
-        last_modified_time_new = MetaTimeHandler.get_last_modified_time_raw(file_path)
-
-        # If the last modified time within the metadata dict is lower than the new last modified time:
-        if MonitoringService._metadata_dict[file_path][MODIFIED_AT] < last_modified_time_new:
-            # Assign the new last access time; Raw.
-            last_access_time_new = MetaTimeHandler.get_last_access_time_raw(file_path)
-            
-            # Update the last modified time within the metadata dict to the new last modified time.
-            MonitoringService._metadata_dict[file_path][MODIFIED_AT] = last_modified_time_new
-            
-            # Update the last access time within the metadata dict to the new last access time.
-            MonitoringService._metadata_dict[file_path][ACCESSED_AT] = last_access_time_new
+        # If the file was modified since the snapshot within the metadata dict:
+        if MetaTimeHandler.is_modified(MonitoringService._metadata_dict[file_path][SNAPSHOT], snapshot):
+            # Update the snapshot within the metadata dict to the new snapshot; Along with the last access time, as the modification accessed the file.
+            MonitoringService._metadata_dict[file_path][SNAPSHOT] = snapshot
         
             # Assert file as modified.
             return True
         
-        # If the last modified time within the metadata dict is not lower than the new last modified time:
+        # If the file was not modified since the snapshot within the metadata dict:
         else:
             # Assert file as unmodified.
             return False
@@ -613,10 +999,58 @@ class MonitoringService:
 
 
     @staticmethod
-    def _monitor_single_file(file_path: Union[str, Path]) -> None:
+    def _log_events_of_single_file(file_path: Union[str, Path], mask: int) -> None:
         """
         
         Description:
+            Based on the coalesced events of the file specified by the file path:
+                Handles the scenario when the file was deleted or moved away.
+                Modifies the corresponding monitoring log file to include the modified entry, if the file was modified.
+                Modifies the corresponding monitoring log file to include the access entry, if the file was accessed or opened.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            file_path(Union[str, Path]): Path for the file that is tracked by the monitoring service.
+            mask(int): Coalesced mask of all events reported for the file.
+
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Constants for the storage of integer literals.
+        IN_ACCESS = Integer.INOTIFY_IN_ACCESS
+        IN_DELETE = Integer.INOTIFY_IN_DELETE
+        IN_MODIFY = Integer.INOTIFY_IN_MODIFY
+        IN_MOVED_FROM = Integer.INOTIFY_IN_MOVED_FROM
+        IN_OPEN = Integer.INOTIFY_IN_OPEN
+
+        # If the file was deleted or moved away and no longer exists:
+        if mask & (IN_DELETE | IN_MOVED_FROM) and not PathUtils.is_path_exist(file_path):
+            # Handle the file not found error for the target.
+            MonitoringService._handle_file_not_found_exception(file_path)
+
+        # If the file was modified:
+        elif mask & IN_MODIFY:
+            # Add the modified entry to the monitoring log file.
+            MonitoringService._add_modified_entry_to_monitoring_log_file(file_path)
+
+        # If the file was accessed or opened:
+        elif mask & (IN_ACCESS | IN_OPEN):
+            # Add the access entry to the monitoring log file.
+            MonitoringService._add_access_entry_to_monitoring_log_file(file_path)
+
+
+    @staticmethod
+    def _monitor_single_file(file_path: Union[str, Path], snapshot: StatSnapshot = None) -> bool:
+        """
+        
+        Description:
+            Takes the snapshot of the metadata of the file specified by the file path with a single stat call, unless given.
             Checks if the file specified by the file path is modified.
             Modifies the corresponding monitoring log file to include the modified entry.
             Checks if the file specified by the file path is accessed.
@@ -626,39 +1060,54 @@ class MonitoringService:
 
         Args:
             file_path(Union[str, Path]): Path for the file to monitor by the monitoring service.
+            snapshot(StatSnapshot): Current snapshot of the metadata of the file; Taken if not given.
 
         Returns:
-            None
+            bool: Whether the file is modified or accessed.
 
         Raises:
-            None
+            FileNotFoundError:
+                If the file is not found,
+                then delegate handling to the caller.
                 
         """
+
+        # If the snapshot is not given:
+        if snapshot is None:
+            # Take the snapshot of the file.
+            snapshot = MetaTimeHandler.get_snapshot(file_path)
             
         # If the file is modified:
-        if MonitoringService._is_file_modified(file_path):
+        if MonitoringService._is_file_modified(file_path, snapshot):
             # Add the modified entry to the monitoring log file.
-            MonitoringService._add_modified_entry_to_monitoring_log_file(file_path)
+            MonitoringService._add_modified_entry_to_monitoring_log_file(file_path, snapshot)
 
         # If the file is accessed:
-        elif MonitoringService._is_file_accessed(file_path):
+        elif MonitoringService._is_file_accessed(file_path, snapshot):
             # Add the access entry to the monitoring log file.
-            MonitoringService._add_access_entry_to_monitoring_log_file(file_path)
+            MonitoringService._add_access_entry_to_monitoring_log_file(file_path, snapshot)
+
+        # If the file is neither modified nor accessed:
+        else:
+            # Assert the file as unchanged.
+            return False
+
+        # Assert the file as changed.
+        return True
 
 
     @staticmethod
-    def _move_orphan_files_to_orphanage(orphan_file_path_list: list[Path]) -> None:
+    def _move_orphan_files_to_orphanage(orphan_file_path_set: set[str]) -> None:
         """
         
         Description:
             For every orphan file in the monitoring directory:
-                Copies the orphan file to the orphanage directory.
-                Deletes the orphan file from the monitoring directory.
+                Moves the orphan file to the orphanage directory; Renamed, unless the orphanage directory is on another file system.
 
             Note: This method is not meant to be accessed from outside this class.    
 
         Args:
-            orphan_file_path_list(list[Path]): List of file paths for all orphan files.
+            orphan_file_path_set(set[str]): Set of file paths for all orphan files.
 
         Returns:
             None
@@ -674,87 +1123,147 @@ class MonitoringService:
         # Constant for the storage of the orphanage directory path.
         ORPHANAGE_DIRECTORY_PATH = PropertiesJsonHandler.get_monitoring_directory() + os.path.sep + ORPHANAGE
 
-        # For every orphan file in the orphan file path list:
-        for file_path in orphan_file_path_list:
-            # Copy the orphan file to the orphanage directory.
-            PathUtils.copy_file(file_path, ORPHANAGE_DIRECTORY_PATH)
-            
-            # Delete the orphan file.
-            PathUtils.delete_file(file_path)
+        # For every orphan file in the orphan file path set:
+        for file_path in orphan_file_path_set:
+            # Close the handle of the orphan file, if the log writer holds one.
+            MonitoringLogWriter.close(file_path)
+
+            # Forget the creation time of the orphan file, if the log rotator remembers one.
+            MonitoringLogRotator.forget(file_path)
+
+            # Move the orphan file to the orphanage directory.
+            PathUtils.move_file(file_path, ORPHANAGE_DIRECTORY_PATH)
 
 
     @staticmethod
-    def _prepare_metadata() -> None:
+    def _prepare_metadata(deadline: float = float('inf')) -> bool:
         """
         
         Description:
-            Clears the _metadata_dict dictionary.
-            Opens the monitoring json file and serializes its monitoring json data.
-            For every item in the monitoring json data:
-                Checks if the item path exists, otherwise deletes the corresponding monitoring json entry.
-                Checks if the item is a directory to prepare and append metadata dictionary entries for its files to _metadata_dict.
-                Checks if the item is a file to prepare and append its metadata dictionary entry to _metadata_dict.
+            Reconciles the _metadata_dict dictionary with the monitoring json file and the target directories, instead of rebuilding it:
+                Re-reads the monitoring json file only if its stat signature changed, and forgets the targets whose monitoring json entries were removed or changed.
+                Starts a pass over the monitoring json data, unless one is underway; A pass is restarted if the monitoring json file changed.
+                For every item of the pass, until the deadline is reached:
+                    Checks if the item path exists, otherwise forgets the target and deletes the corresponding monitoring json entry.
+                    Checks if the item is a directory to reconcile the metadata dictionary entries for its files with its current listing.
+                    Checks if the item is a file to prepare and append its metadata dictionary entry to _metadata_dict, unless already present.
+            Existing metadata dictionary entries are kept along with their timestamps.
+            Items left once the deadline is reached are resumed by the next call.
 
-            Note: This method is not meant to be accessed from outside this class.
+            Note: This method is not meant to be accessed from outside this class.    
 
         Args:
-            None
+            deadline(float): Monotonic time after which no further item is prepared; Unbounded if not given.
 
         Returns:
-            None
+            bool: Whether the pass is complete.
 
         Raises:
             None
                 
         """
-
+        
         # Constants for the storage of string literals.
-        FILE_MODE_READ = String.FILE_MODE_READ
         IS_DIRECTORY = String.LITERAL_IS_DIRECTORY
         PATH = String.LITERAL_PATH
 
         # Constant for the storage of the monitoring json file path.
         MONITORING_JSON_FILE_PATH = PropertiesJsonHandler.get_monitoring_directory() + os.path.sep + MonitoringJsonHandler.MONITORING_FILENAME
 
-        # Clear the metadata dictionary.
-        MonitoringService._metadata_dict.clear()
-        
-        # Variable for the storage of the monitoring json file data.
-        data = {}
-        
-        # Open the monitoring json file path with the file mode read.
-        with open(MONITORING_JSON_FILE_PATH, FILE_MODE_READ) as file:
-            # Assign the json data.
-            data = json.load(file)
-            # Close the file.
-            file.close()
-        
-        # For every key and value in the data dictionary:
-        for key, value in data.items():
+        # If the monitoring json file path changed (e.g. the monitoring directory was switched):
+        if MONITORING_JSON_FILE_PATH != MonitoringService._registry_file_path:
+            # For every monitoring json entry the metadata dictionary was reconciled with:
+            for value in MonitoringService._registry_data.values():
+                # Forget the target.
+                MonitoringService._forget_metadata_for_target(value)
+
+            # Reset the monitoring json data and signature.
+            MonitoringService._registry_data = {}
+            MonitoringService._registry_signature = None
+
+            # Discard the pass underway.
+            MonitoringService._prepare_key_queue.clear()
+
+            # Remember the monitoring json file path.
+            MonitoringService._registry_file_path = MONITORING_JSON_FILE_PATH
+
+        # Re-read the monitoring json file if its signature changed; Assign the signature to remember and the json data.
+        MonitoringService._registry_signature, data = MetadataReconciler.read_json_if_changed(MONITORING_JSON_FILE_PATH, MonitoringService._registry_signature)
+
+        # If the monitoring json file changed:
+        if data is not None:
+            # For every key and value the metadata dictionary was reconciled with:
+            for key, value in MonitoringService._registry_data.items():
+                # If the monitoring json entry was removed or changed:
+                if data.get(key) != value:
+                    # Forget the target.
+                    MonitoringService._forget_metadata_for_target(value)
+
+            # Remember the monitoring json data.
+            MonitoringService._registry_data = data
+
+            # Discard the pass underway, so that it is restarted over the changed monitoring json data.
+            MonitoringService._prepare_key_queue.clear()
+
+        # If no pass is underway:
+        if not MonitoringService._prepare_key_queue:
+            # Start a pass over the keys of the monitoring json data.
+            MonitoringService._prepare_key_queue.extend(MonitoringService._registry_data)
+
+        # While keys await their preparation:
+        while MonitoringService._prepare_key_queue:
+            # If the deadline is reached:
+            if time.monotonic() >= deadline:
+                # Assert the pass as incomplete; The next call resumes it.
+                return False
+
+            # Dequeue the next key.
+            key = MonitoringService._prepare_key_queue.popleft()
+
+            # Assign the monitoring json entry.
+            value = MonitoringService._registry_data.get(key)
+
+            # If the monitoring json entry was forgotten meanwhile:
+            if value is None:
+                # Skip it.
+                continue
+
             # If the path exists:
             if PathUtils.is_path_exist(value[PATH]):
                 # If the path represents a directory:
                 if value[IS_DIRECTORY]:
-                    # Prepare the metadata dict entry for the directory.
+                    # Reconcile the metadata dict entries for the directory.
                     MonitoringService._prepare_metadata_for_directories(value)
-                
+
                 # If the path does not represent a directory:
                 else:
                     # Prepare the metadata dict entry for the file.
                     MonitoringService._prepare_metadata_for_file(value)
-            
+
             # If the path does not exist:
             else:
+                # Forget the target.
+                MonitoringService._forget_metadata_for_target(value)
+
+                # Forget the monitoring json entry.
+                del MonitoringService._registry_data[key]
+
                 # Delete the monitoring json entry from the monitoring json file.
                 MonitoringManager.delete_monitoring_json_entry(key)
 
+        # Assert the pass as complete.
+        return True
+
 
     @staticmethod
     def _prepare_metadata_for_directories(directory_json_entry_dict: dict) -> None:
         """
         
         Description:
-            For every file within the target directory:
+            Re-walks the target directory tree only if a stat signature of its walked directories changed, otherwise keeps the metadata dictionary entries for its files.
+            Updates the set of target directory paths with the walked directories.
+            Removes the metadata dictionary entries of the files that were removed from the target directory tree.
+            For every file that was added to the target directory tree:
                 Prepares attribute values for the file.
                 Constructs the metadata dictionary entry by assigning values to attributes.
                 Updates the _metadata_dict to include the constructed metadata dictionary entry.
@@ -773,37 +1282,69 @@ class MonitoringService:
         """
         
         # Constants for the storage of string literals.
-        ACCESSED_AT = String.LITERAL_ACCESSED_AT
         AS_DIRECTORY = String.LITERAL_AS_DIRECTORY
+        JSON_ENTRY = String.LITERAL_JSON_ENTRY
         LOG_FILENAME = String.LITERAL_LOG_FILENAME
         LOG_FILEPATH = String.LITERAL_LOG_FILEPATH
-        MODIFIED_AT = String.LITERAL_MODIFIED_AT
         PARENT_DIRPATH = String.LITERAL_PARENT_DIRPATH
         PATH = String.LITERAL_PATH
+        SNAPSHOT = String.LITERAL_SNAPSHOT
 
-        # For every item in the directory path:
-        for item in Path(directory_json_entry_dict[PATH]).iterdir():
-            # If the item is a file:
-            if item.is_file():
-                # Resolve and assign the file path.
-                path = item.resolve()
-                # Assign the last modified time; Raw.
-                modified_at = MetaTimeHandler.get_last_modified_time_raw(path)
-                # Assign the last access time; Raw.
-                accessed_at = MetaTimeHandler.get_last_access_time_raw(path)
-                # Construct the log file path for the directory.
-                log_file_path = PropertiesJsonHandler.get_monitoring_directory() + os.path.sep + directory_json_entry_dict[LOG_FILENAME]
-                # Assign the directory path to be the parent directory path for the file.
-                parent_directory_path = directory_json_entry_dict[PATH]
-
-                # Construct and assign the metadata dictionary entry for the file.
-                MonitoringService._metadata_dict[path] = {
-                    MODIFIED_AT : modified_at,
-                    ACCESSED_AT : accessed_at,
-                    LOG_FILEPATH : log_file_path,
-                    PARENT_DIRPATH : parent_directory_path,
-                    AS_DIRECTORY : True
-                }
+        # Assign the maximum depth and the symbolic link policy of the directory.
+        max_depth, symlink_policy = TargetResolver.get_walk_settings(directory_json_entry_dict)
+
+        # Assign the resolved monitoring directory path, which is skipped if it lies within the directory tree.
+        monitoring_directory_path = str(Path(PropertiesJsonHandler.get_monitoring_directory()).resolve())
+
+        # Assign the resolved paths of the directories walked last time.
+        previous_directory_path_set = set(MonitoringService._directory_signature_dict.get(directory_json_entry_dict[PATH], {}))
+
+        # Re-walk the directory tree if a signature changed; Assign the added and removed files.
+        difference = MetadataReconciler.reconcile_directory(directory_json_entry_dict[PATH], MonitoringService._directory_signature_dict, MonitoringService._directory_file_path_dict, max_depth, symlink_policy, {monitoring_directory_path})
+
+        # If the directory tree is unchanged:
+        if difference is None:
+            # Keep the metadata dictionary entries for its files.
+            return
+
+        # Assign the records of the added files and the resolved paths of the removed files.
+        added_file_record_list, removed_file_path_set = difference
+
+        # Assign the resolved paths of the walked directories.
+        current_directory_path_set = set(MonitoringService._directory_signature_dict[directory_json_entry_dict[PATH]])
+
+        # Replace the resolved paths of the directories walked last time with those of the walked directories, within the set of target directory paths.
+        MonitoringService._tracked_directory_path_set.difference_update(previous_directory_path_set - current_directory_path_set)
+        MonitoringService._tracked_directory_path_set.update(current_directory_path_set)
+
+        # For every removed file:
+        for path in removed_file_path_set:
+            # Remove the metadata dictionary entry for the file.
+            MonitoringService._metadata_dict.pop(path, None)
+
+        # Construct the log file path for the directory.
+        log_file_path = PropertiesJsonHandler.get_monitoring_directory() + os.path.sep + directory_json_entry_dict[LOG_FILENAME]
+
+        # For every added file:
+        for record in added_file_record_list:
+            # Assign the snapshot of the file; As taken during the walk.
+            snapshot = record.snapshot
+            # Assign the directory path to be the parent directory path for the file.
+            parent_directory_path = directory_json_entry_dict[PATH]
+
+            # Construct and assign the metadata dictionary entry for the file.
+            MonitoringService._metadata_dict[record.path] = {
+                SNAPSHOT : snapshot,
+                LOG_FILEPATH : log_file_path,
+                PARENT_DIRPATH : parent_directory_path,
+                AS_DIRECTORY : True,
+                JSON_ENTRY : directory_json_entry_dict
+            }
+
+            # If the monitoring service polls:
+            if not MonitoringService._is_event_driven:
+                # Schedule the check of the file.
+                MonitoringService._poll_scheduler.add(record.path, directory_json_entry_dict)
 
 
     @staticmethod
@@ -811,6 +1352,7 @@ class MonitoringService:
         """
         
         Description:
+            Checks if the metadata dictionary entry for the file is already present, to keep it along with its timestamps.
             Prepares attribute values for the file.
             Constructs the metadata dictionary entry by assigning values to attributes.
             Updates the _metadata_dict to include the constructed metadata dictionary entry.
@@ -829,32 +1371,259 @@ class MonitoringService:
         """
 
         # Constants for the storage of string literals.
-        ACCESSED_AT = String.LITERAL_ACCESSED_AT
         AS_DIRECTORY = String.LITERAL_AS_DIRECTORY
+        JSON_ENTRY = String.LITERAL_JSON_ENTRY
         LOG_FILENAME = String.LITERAL_LOG_FILENAME
         LOG_FILEPATH = String.LITERAL_LOG_FILEPATH
-        MODIFIED_AT = String.LITERAL_MODIFIED_AT
         PARENT_DIRPATH = String.LITERAL_PARENT_DIRPATH
         PATH = String.LITERAL_PATH
+        SNAPSHOT = String.LITERAL_SNAPSHOT
 
         # Variable for the storage of the path value.
         path = file_json_entry_dict[PATH]
-        # Variable for the storage of the last modified time; Raw.
-        modified_at = MetaTimeHandler.get_last_modified_time_raw(path)
-        # Variable for the storage of the last access time; Raw.
-        accessed_at = MetaTimeHandler.get_last_access_time_raw(path)
+
+        # If the metadata dictionary entry for the file is already present:
+        if path in MonitoringService._metadata_dict:
+            # Keep it.
+            return
+
+        # Variable for the storage of the snapshot of the file.
+        snapshot = MetaTimeHandler.get_snapshot(path)
         # Variable for the storage of the log file path.
         log_file_path = PropertiesJsonHandler.get_monitoring_directory() + os.path.sep + file_json_entry_dict[LOG_FILENAME]
 
         # Construct and assign the metadata dictionary entry for the file.
         MonitoringService._metadata_dict[path] = {
-                MODIFIED_AT : modified_at,
-                ACCESSED_AT : accessed_at,
+                SNAPSHOT : snapshot,
                 LOG_FILEPATH : log_file_path,
                 PARENT_DIRPATH : None,
-                AS_DIRECTORY : False
+                AS_DIRECTORY : False,
+                JSON_ENTRY : file_json_entry_dict
             }
 
+        # If the monitoring service polls:
+        if not MonitoringService._is_event_driven:
+            # Schedule the check of the file.
+            MonitoringService._poll_scheduler.add(path, file_json_entry_dict)
+
+
+    @staticmethod
+    def _publish_metrics() -> None:
+        """
+        
+        Description:
+            Publishes the number of events left to log, and the metrics of the poll scheduler, of the tick clock and of the log writer, to the metrics file within the central monitoring directory.
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            None
+                
+        """
+
+        # Assign the metrics of the tick clock.
+        metrics_dict = MonitoringService._tick_clock.get_metrics()
+
+        # Add the number of target files with events left to log.
+        metrics_dict[String.LITERAL_DETECTION_QUEUE_DEPTH] = len(MonitoringService._pending_event_mask_dict)
+
+        # Add the metrics of the poll scheduler.
+        metrics_dict.update(MonitoringService._poll_scheduler.get_metrics())
+
+        # Add the metrics of the log writer.
+        metrics_dict.update(MonitoringLogWriter.get_metrics())
+
+        # Add the metrics of the log rotator.
+        metrics_dict.update(MonitoringLogRotator.get_metrics())
+
+        # Publish the metrics.
+        ServiceMetrics.publish(PropertiesJsonHandler.get_monitoring_directory(), metrics_dict)
+
+
+
+    @staticmethod
+    def _read_coalesced_events() -> tuple[dict, bool]:
+        """
+        
+        Description:
+            Waits for file system events until the next tick.
+            Once events are pending, keeps reading them for the event coalescing time, so that a burst of events yields a single log entry per file.
+            Coalesces the masks of the events per target file.
+            Determines whether the metadata dict must be re-prepared (registry modification, new files within target directories, deletions, lost events).
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            tuple[dict, bool]: Dictionary of the coalesced event masks keyed by the keys of the target files, and whether the metadata dict must be re-prepared.
+
+        Raises:
+            None
+                
+        """
+
+        # Constants for the storage of integer literals.
+        IN_DELETE = Integer.INOTIFY_IN_DELETE
+        IN_DELETE_SELF = Integer.INOTIFY_IN_DELETE_SELF
+        IN_IGNORED = Integer.INOTIFY_IN_IGNORED
+        IN_ISDIR = Integer.INOTIFY_IN_ISDIR
+        IN_MOVE_SELF = Integer.INOTIFY_IN_MOVE_SELF
+        IN_MOVED_FROM = Integer.INOTIFY_IN_MOVED_FROM
+        IN_Q_OVERFLOW = Integer.INOTIFY_IN_Q_OVERFLOW
+        IN_REGISTRY_MODIFIED = Integer.INOTIFY_IN_CLOSE_WRITE | Integer.INOTIFY_IN_MOVED_TO
+        IN_TREE_MODIFIED = Integer.INOTIFY_IN_CREATE | Integer.INOTIFY_IN_DELETE | Integer.INOTIFY_IN_MOVED_FROM | Integer.INOTIFY_IN_MOVED_TO
+
+        # Constant for the storage of the resolved monitoring directory path.
+        MONITORING_DIRECTORY_PATH = str(Path(PropertiesJsonHandler.get_monitoring_directory()).resolve())
+
+        # Variable for the storage of the coalesced event masks keyed by the keys of the target files.
+        event_mask_dict = {}
+
+        # Variable for the storage of whether the metadata dict must be re-prepared.
+        is_reprepare_required = False
+
+        # Read the pending events; Wait until the next tick.
+        event_list = InotifyHandler.read_events(MonitoringService._inotify_fd, MonitoringService._tick_clock.get_wait_time(MonitoringService._ITERATION_WAIT_TIME))
+
+        # If events are pending:
+        if event_list:
+            # Calculate the deadline of the coalescing.
+            coalescing_deadline = time.monotonic() + MonitoringService._EVENT_COALESCING_TIME
+
+            # While the deadline of the coalescing is not reached:
+            while time.monotonic() < coalescing_deadline:
+                # Read and append the events that are pending until the deadline.
+                event_list.extend(InotifyHandler.read_events(MonitoringService._inotify_fd, max(coalescing_deadline - time.monotonic(), 0)))
+
+        # For every watch descriptor, mask and name of the pending events:
+        for watch_descriptor, mask, name in event_list:
+            # If the event queue overflowed, or a watched directory was deleted or moved:
+            if mask & IN_Q_OVERFLOW or (mask & (IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF) and watch_descriptor in MonitoringService._watch_descriptor_dict):
+                # If the watch was removed by the kernel:
+                if mask & IN_IGNORED:
+                    # Forget the watch.
+                    del MonitoringService._watch_descriptor_dict[watch_descriptor]
+
+                # Require the re-preparation of the metadata dict.
+                is_reprepare_required = True
+
+                # Skip to the next event.
+                continue
+
+            # Assign the path of the watched directory.
+            directory_path = MonitoringService._watch_descriptor_dict.get(watch_descriptor)
+
+            # If the watch is unknown, or the event concerns the watched directory itself:
+            if directory_path is None or name == '':
+                # Skip to the next event.
+                continue
+
+            # If the event concerns a sub directory:
+            if mask & IN_ISDIR:
+                # If the sub directory was created, deleted or moved within a target directory tree; Mere accesses (e.g. by the walk itself) are disregarded:
+                if directory_path in MonitoringService._tracked_directory_path_set and mask & IN_TREE_MODIFIED:
+                    # Require the re-preparation of the metadata dict, so that the sub directory is walked and watched, or forgotten.
+                    is_reprepare_required = True
+
+                # Skip to the next event.
+                continue
+
+            # Assign the key of the concerned file within the metadata dict.
+            key = MonitoringService._event_key_dict.get(directory_path + os.path.sep + name)
+
+            # If the concerned file is a target:
+            if key is not None:
+                # Coalesce the mask of the event with the masks of the previous events of the file.
+                event_mask_dict[key] = event_mask_dict.get(key, 0) | mask
+
+                # If the target file was deleted or moved away:
+                if mask & (IN_DELETE | IN_MOVED_FROM):
+                    # Require the re-preparation of the metadata dict.
+                    is_reprepare_required = True
+
+            # If the concerned file is the monitoring json file:
+            elif directory_path == MONITORING_DIRECTORY_PATH and name == MonitoringJsonHandler.MONITORING_FILENAME:
+                # If the monitoring json file was written or moved in:
+                if mask & IN_REGISTRY_MODIFIED:
+                    # Require the re-preparation of the metadata dict.
+                    is_reprepare_required = True
+
+            # If the concerned file is a new file within a target directory tree:
+            elif directory_path in MonitoringService._tracked_directory_path_set and mask & IN_REGISTRY_MODIFIED:
+                # Require the re-preparation of the metadata dict.
+                is_reprepare_required = True
+
+        # Return the coalesced event masks and whether the metadata dict must be re-prepared.
+        return event_mask_dict, is_reprepare_required
+
+
+    @staticmethod
+    def _synchronize_watches() -> None:
+        """
+        
+        Description:
+            Maps the resolved path of every target file to its key within the metadata dict.
+            Determines the directories to watch: the monitoring directory, the target directories and the parent directories of all target files.
+            Synchronizes the watches of the inotify instance with these directories.
+            Falls back to the polling approach if the watches cannot be added (e.g. the watch limit is hit).
+
+            Note: This method is not meant to be accessed from outside this class.
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        Raises:
+            OSError:
+                If a watch cannot be added,
+                then fall back to the polling approach.
+                
+        """
+
+        # If the monitoring service is not event-driven:
+        if not MonitoringService._is_event_driven:
+            # Ignore.
+            return
+
+        # Variable for the storage of the set of directory paths to watch; Starting with the monitoring directory for registry modifications.
+        directory_path_set = {str(Path(PropertiesJsonHandler.get_monitoring_directory()).resolve())}
+
+        # Add the target directory paths to the set of directory paths to watch.
+        directory_path_set.update(MonitoringService._tracked_directory_path_set)
+
+        # Clear the dictionary mapping resolved file paths to their keys.
+        MonitoringService._event_key_dict.clear()
+
+        # For every key in the metadata dict:
+        for key in MonitoringService._metadata_dict:
+            # Resolve and assign the file path.
+            resolved_file_path = str(Path(key).resolve())
+
+            # Map the resolved file path to the key.
+            MonitoringService._event_key_dict[resolved_file_path] = key
+
+            # Add the parent directory path to the set of directory paths to watch.
+            directory_path_set.add(os.path.dirname(resolved_file_path))
+
+        # Attempt to:
+        try:
+            # Synchronize the watches with the set of directory paths to watch.
+            InotifyHandler.synchronize_watches(MonitoringService._inotify_fd, MonitoringService._watch_descriptor_dict, directory_path_set, MonitoringService._INOTIFY_MASK)
+
+        # Handle: OSError.
+        except OSError:
+            # Fall back to the polling approach.
+            MonitoringService._fall_back_to_polling_mode()
 
 # If this module is executed as the main program:
 if __name__ == "__main__":